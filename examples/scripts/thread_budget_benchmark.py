@@ -0,0 +1,101 @@
+# Copyright 2022 NNAISENSE SA
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import time
+from argparse import ArgumentParser
+from typing import Optional, Union
+
+from evotorch.algorithms import PGPE
+from evotorch.neuroevolution import GymNE
+
+# The thread budget settings to compare: (label, threads_per_actor, pin_actors)
+SETTINGS = [
+    ("unlimited", None, False),
+    ("auto", "auto", False),
+    ("auto+pinned", "auto", True),
+]
+
+
+def measure(
+    env_name: str,
+    policy: str,
+    num_actors: int,
+    popsize: int,
+    num_generations: int,
+    threads_per_actor: Optional[Union[int, str]],
+    pin_actors: bool,
+) -> float:
+    problem = GymNE(
+        env_name=env_name,
+        network=policy,
+        num_actors=num_actors,
+        threads_per_actor=threads_per_actor,
+        pin_actors=pin_actors,
+    )
+    searcher = PGPE(
+        problem,
+        popsize=popsize,
+        center_learning_rate=0.01,
+        stdev_learning_rate=0.1,
+        radius_init=0.27,
+        distributed=True,
+    )
+
+    try:
+        # The first generation creates the actors, so, it is excluded from the measurement
+        searcher.step()
+
+        interactions_before = problem.interaction_count
+        time_before = time.perf_counter()
+        searcher.run(num_generations)
+        elapsed = time.perf_counter() - time_before
+        return (problem.interaction_count - interactions_before) / elapsed
+    finally:
+        problem.kill_actors()
+
+
+def main(env_name: str, policy: str, num_actors: int, popsize: int, num_generations: int, repeats: int):
+    for label, threads_per_actor, pin_actors in SETTINGS:
+        steps_per_sec = [
+            measure(env_name, policy, num_actors, popsize, num_generations, threads_per_actor, pin_actors)
+            for _ in range(repeats)
+        ]
+        best = max(steps_per_sec)
+        mean = sum(steps_per_sec) / len(steps_per_sec)
+        print(f"{label:>12}: best {best:12.1f} steps/sec, mean {mean:12.1f} steps/sec")
+
+
+if __name__ == "__main__":
+    parser = ArgumentParser(
+        description=(
+            "This is a command-line tool for measuring the environment steps per second obtained by GymNE"
+            " with and without a per-actor CPU thread budget (see the arguments `threads_per_actor`"
+            " and `pin_actors` of GymNE)."
+        )
+    )
+
+    parser.add_argument("--env", type=str, default="CartPole-v1", help="ID of the gym environment")
+    parser.add_argument(
+        "--policy",
+        type=str,
+        default="Linear(obs_length, 64) >> Tanh() >> Linear(64, act_length)",
+        help="The policy network, expressed as a string",
+    )
+    parser.add_argument("--actors", type=int, default=4, help="Number of remote actors")
+    parser.add_argument("--popsize", type=int, default=64, help="Population size")
+    parser.add_argument("--generations", type=int, default=5, help="Number of measured generations per repeat")
+    parser.add_argument("--repeats", type=int, default=3, help="Number of repeats for each setting")
+
+    args = parser.parse_args()
+    main(args.env, args.policy, args.actors, args.popsize, args.generations, args.repeats)
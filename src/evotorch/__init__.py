@@ -29,6 +29,7 @@ __all__ = (
     "optimizers",
     "testing",
     "neuroevolution",
+    "worker",
 )
 __author__ = "Nihat Engin Toklu, Timothy Atkinson, Vojtech Micka, Rupesh Kumar Srivastava"
 __email__ = "engin@nnaisense.com, timothy@nnaisense.com, vojtech@nnaisense.com, rupesh@nnaisense.com"
@@ -47,4 +48,4 @@ from . import tools  # isort: skip
 from . import core  # isort: skip
 from .core import Problem, Solution, SolutionBatch  # isort: skip
 
-from . import algorithms, distributions, logging, neuroevolution, optimizers, testing
+from . import algorithms, distributions, logging, neuroevolution, optimizers, testing, worker
@@ -23,13 +23,17 @@ __all__ = (
     "PGPE",
     "SNES",
     "XNES",
+    "LowRankXNES",
+    "LimitedMemoryXNES",
     "SteadyStateGA",
     "SearchAlgorithm",
+    "TorchCMAES",
 )
 
 
-from . import cmaes, distributed, ga, searchalgorithm
+from . import cmaes, distributed, ga, searchalgorithm, torchcmaes
 from .cmaes import CMAES
-from .distributed import CEM, PGPE, SNES, XNES
+from .distributed import CEM, PGPE, SNES, XNES, LimitedMemoryXNES, LowRankXNES
 from .ga import Cosyne, SteadyStateGA
 from .searchalgorithm import SearchAlgorithm
+from .torchcmaes import TorchCMAES
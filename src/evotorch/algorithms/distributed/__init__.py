@@ -17,8 +17,10 @@ __all__ = (
     "PGPE",
     "SNES",
     "XNES",
+    "LowRankXNES",
+    "LimitedMemoryXNES",
     "GaussianSearchAlgorithm",
 )
 
 
-from .gaussian import CEM, PGPE, SNES, XNES, GaussianSearchAlgorithm
+from .gaussian import CEM, PGPE, SNES, XNES, GaussianSearchAlgorithm, LimitedMemoryXNES, LowRankXNES
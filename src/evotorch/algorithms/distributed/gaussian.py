@@ -24,11 +24,13 @@ from ...distributions import (
     Distribution,
     ExpGaussian,
     ExpSeparableGaussian,
+    LimitedMemoryGaussian,
+    LowRankGaussian,
     SeparableGaussian,
     SymmetricSeparableGaussian,
 )
 from ...optimizers import get_optimizer_class
-from ...tools import RealOrVector, modify_tensor, to_stdev_init
+from ...tools import NoiseTable, RealOrVector, modify_tensor, split_workload, to_stdev_init
 from ..searchalgorithm import SearchAlgorithm, SinglePopulationAlgorithmMixin
 
 
@@ -62,6 +64,11 @@ class GaussianSearchAlgorithm(SearchAlgorithm, SinglePopulationAlgorithmMixin):
         distributed: bool = False,
         popsize_weighted_grad_avg: Optional[bool] = None,
         ensure_even_popsize: bool = False,
+        asynchronous: bool = False,
+        max_staleness: Optional[int] = None,
+        staleness_decay: Optional[float] = None,
+        noise_table: Optional[Union[int, NoiseTable]] = None,
+        tree_reduction: bool = False,
     ):
         # Ensure that the problem is numeric
         problem.ensure_numeric()
@@ -146,7 +153,60 @@ class GaussianSearchAlgorithm(SearchAlgorithm, SinglePopulationAlgorithmMixin):
 
         self._obj_index = problem.normalize_obj_index(obj_index)
 
-        if distributed and (problem.num_actors > 0):
+        if asynchronous and not (distributed and (problem.num_actors > 0)):
+            raise ValueError(
+                "The asynchronous mode can only be used in distributed mode"
+                " (i.e. when the argument `distributed` is given as True, and the problem is parallelized)."
+            )
+
+        if (not asynchronous) and ((max_staleness is not None) or (staleness_decay is not None)):
+            raise ValueError(
+                "The arguments `max_staleness` and `staleness_decay` can only be used in asynchronous mode."
+                " (i.e. when the argument `asynchronous` is given as True)."
+            )
+
+        if isinstance(noise_table, NoiseTable) or (noise_table is None):
+            self._noise_table = noise_table
+        else:
+            # If the noise table is given as an integer, we create a new noise table of that size, using a seed
+            # generated by the problem object (so that the noise table is affected by the problem's seed).
+            self._noise_table = NoiseTable(
+                int(noise_table), seed=int(problem.make_randint(tuple(), n=2**31 - 1)), dtype=problem.dtype
+            )
+
+        if asynchronous and (self._noise_table is not None):
+            raise ValueError("The asynchronous mode does not support noise tables.")
+
+        if tree_reduction and (asynchronous or not (distributed and (problem.num_actors > 0))):
+            raise ValueError(
+                "The tree reduction can only be used in the synchronous distributed mode"
+                " (i.e. when the argument `distributed` is given as True, the argument `asynchronous` is left as False,"
+                " and the problem is parallelized)."
+            )
+        if tree_reduction and (self._noise_table is not None):
+            raise ValueError("The tree reduction cannot be used together with a noise table.")
+        self._tree_reduction = bool(tree_reduction)
+
+        if (
+            distributed
+            and (problem.parallel_backend != "ray")
+            and (asynchronous or tree_reduction or (self._noise_table is not None))
+        ):
+            raise ValueError(
+                "The asynchronous mode, the tree reduction, and the noise tables are not supported in distributed mode"
+                f" when the parallelization backend of the problem is {repr(problem.parallel_backend)}."
+                " Please use the `ray` backend for these features."
+            )
+
+        self._max_staleness = None if max_staleness is None else int(max_staleness)
+        self._staleness_decay = None if staleness_decay is None else float(staleness_decay)
+
+        if distributed and (problem.num_actors > 0) and asynchronous:
+            # If the algorithm is initialized in asynchronous distributed mode, then the _step method becomes an alias
+            # for _step_asynchronous
+            self._step = self._step_asynchronous
+            self.add_status_getters({"staleness": self._get_staleness})
+        elif distributed and (problem.num_actors > 0):
             # If the algorithm is initialized in distributed mode, and also if the problem is configured
             # for parallelization, then the _step method becomes an alias for _step_distributed
             self._step = self._step_distributed
@@ -169,6 +229,14 @@ class GaussianSearchAlgorithm(SearchAlgorithm, SinglePopulationAlgorithmMixin):
         self._population: Optional[SolutionBatch] = None
         self._first_iter: bool = True
 
+        # The following attributes are used only in asynchronous mode.
+        # `_async_tasks` maps each running remote task to the index of the actor running it, and `_async_versions`
+        # maps each running remote task to the number of distribution updates made before the task was started.
+        self._async_tasks: Optional[dict] = None
+        self._async_versions: dict = {}
+        self._num_updates: int = 0
+        self._staleness: Optional[float] = None
+
         # We would like to add the reporting capabilities of the mixin class `singlePopulationAlgorithmMixin`.
         # However, we exclude "mean_eval" from the reporting services requested from `SinglePopulationAlgorithmMixin`
         # because this class has its own reporting mechanism for `mean_eval`.
@@ -208,12 +276,17 @@ class GaussianSearchAlgorithm(SearchAlgorithm, SinglePopulationAlgorithmMixin):
             num_interactions=self._num_interactions,
             ranking_method=self._ranking_method,
             ensure_even_popsize=self._ensure_even_popsize,
+            noise_table=self._noise_table,
+            tree_reduction=self._tree_reduction,
+            popsize_weighted_grad_avg=self._popsize_weighted_grad_avg,
         )
 
         # The method `sample_and_compute_gradients(...)` returns a list of dictionaries, each dictionary being
         # the result of a different remote computation.
         # For each remote computation, the list will contain a dictionary that looks like this:
         # {"gradients": <gradients dictionary here>, "num_solutions": ..., "mean_eval": ...}
+        # In the case of tree reduction, the list contains only one dictionary, which stores the already averaged
+        # gradients.
 
         # We will now accumulate all the gradients, num_solutions, and mean_evals in their own lists.
         # So, in the end, we will have a list of gradients, a list of num_solutions, and a list of
@@ -245,9 +318,11 @@ class GaussianSearchAlgorithm(SearchAlgorithm, SinglePopulationAlgorithmMixin):
         avg_mean_eval = total_weighted_eval / total_num_solutions
 
         # For each gradient (in most cases among 'mu' and 'sigma'), we allocate a new 0-filled tensor.
+        # The shape of each allocated tensor follows the shape of its gradient, because not every gradient is a vector
+        # (e.g. the gradient for a low-rank factor of a covariance matrix is a matrix).
         avg_gradients = {}
         for key in grad_keys:
-            avg_gradients[key] = self._distribution.make_zeros(num_solutions=1).reshape(-1)
+            avg_gradients[key] = torch.zeros_like(list_of.gradients[0][key])
 
         # Below, we iterate over all collected results and add their gradients, in a weighted manner, onto the
         # `avg_gradients` we allocated above.
@@ -272,6 +347,103 @@ class GaussianSearchAlgorithm(SearchAlgorithm, SinglePopulationAlgorithmMixin):
         self._update_distribution(avg_gradients)
         self._mean_eval = avg_mean_eval
 
+    def _async_task_sizes(self) -> list:
+        # Split the population size (and, if given, the interaction and population size limits) among the actors,
+        # in the same way as done by the problem's `sample_and_compute_gradients(...)` method.
+        popsize = self._popsize
+        popsize_per_task = split_workload(popsize, len(self.problem.actors))
+        if self._ensure_even_popsize:
+            popsize_per_task = [n + (n % 2) for n in popsize_per_task]
+
+        def share(n: int, total: Optional[int]) -> Optional[int]:
+            return None if total is None else math.ceil((n / popsize) * total)
+
+        return [(n, share(n, self._num_interactions), share(n, self._popsize_max)) for n in popsize_per_task]
+
+    def _start_async_task(self, actor_index: int):
+        task_popsize, task_num_interactions, task_popsize_max = self._async_task_sizes()[actor_index]
+        task = self.problem.start_gradient_task(
+            actor_index,
+            self._distribution,
+            task_popsize,
+            num_interactions=task_num_interactions,
+            popsize_max=task_popsize_max,
+            obj_index=self._obj_index,
+            ranking_method=self._ranking_method,
+        )
+        self._async_tasks[task] = actor_index
+        self._async_versions[task] = self._num_updates
+
+    def _step_asynchronous(self):
+        # In asynchronous mode, each remote actor continuously samples solutions from the most recent distribution it
+        # received and computes gradients. At each step, we wait until at least one actor is done, follow the
+        # gradients of all the finished actors, and immediately give new tasks (with the most recent distribution)
+        # to the finished actors, so that no actor waits for the slowest one.
+        if self._async_tasks is None:
+            # This is the first step. We start a task on each actor.
+            self.problem._parallelize()
+            self._async_tasks = {}
+            self._async_versions = {}
+            for actor_index in range(len(self.problem.actors)):
+                self._start_async_task(actor_index)
+
+        try:
+            self._follow_async_gradients()
+        except BaseException:
+            # The step has failed. We do not leave the remote tasks running in the background: we wait for them
+            # to end (ignoring their results), and the next step (if any) starts new tasks on all the actors.
+            self.problem.drain_gradient_tasks(self._async_tasks)
+            self._async_tasks = None
+            raise
+
+    def _follow_async_gradients(self):
+        # Each gradient is weighted by the fraction of the population size it represents, so that following the
+        # gradients of all the actors once is comparable to a single step in synchronous distributed mode.
+        total_num_solutions = sum(n for n, _, _ in self._async_task_sizes())
+
+        stalenesses = []
+        weighted_evals = 0.0
+        num_solutions_of_evals = 0
+        sum_of_gradients = None
+        finished_actors = []
+        for task, actor_index, result in self.problem.wait_gradient_tasks(self._async_tasks):
+            del self._async_tasks[task]
+            finished_actors.append(actor_index)
+            staleness = self._num_updates - self._async_versions.pop(task)
+
+            weighted_evals += result["num_solutions"] * result["mean_eval"]
+            num_solutions_of_evals += result["num_solutions"]
+
+            if (self._max_staleness is None) or (staleness <= self._max_staleness):
+                # The gradient is fresh enough. We will follow it.
+                weight = result["num_solutions"] / total_num_solutions
+                if self._staleness_decay is not None:
+                    weight *= self._staleness_decay**staleness
+                if sum_of_gradients is None:
+                    sum_of_gradients = {key: weight * grad for key, grad in result["gradients"].items()}
+                else:
+                    for key, grad in result["gradients"].items():
+                        sum_of_gradients[key] = sum_of_gradients[key] + weight * grad
+                stalenesses.append(staleness)
+
+        if sum_of_gradients is not None:
+            # The gradients which arrived together are followed via a single update, so that the optimizer (if any)
+            # makes one step per wait, and not one step per finished task.
+            self._update_distribution(sum_of_gradients)
+            self._num_updates += 1
+
+        # The finished actors are now idle. We give them new tasks, using the most recent distribution.
+        for actor_index in finished_actors:
+            self._start_async_task(actor_index)
+
+        if num_solutions_of_evals > 0:
+            self._mean_eval = weighted_evals / num_solutions_of_evals
+        if len(stalenesses) > 0:
+            self._staleness = sum(stalenesses) / len(stalenesses)
+
+    def _get_staleness(self) -> Optional[float]:
+        return self._staleness
+
     def _step_non_distributed(self):
         # First, we define an inner function which fills the current population by sampling from the distribution.
         def fill_and_eval_pop():
@@ -289,11 +461,32 @@ class GaussianSearchAlgorithm(SearchAlgorithm, SinglePopulationAlgorithmMixin):
                         self.problem, popsize=self._popsize, device=self._distribution.device, empty=True
                     )
 
-                # Now, we do in-place sampling on the population.
-                self._distribution.sample(out=self._population.access_values(), generator=self.problem)
+                if self._noise_table is None:
+                    # Now, we do in-place sampling on the population.
+                    self._distribution.sample(out=self._population.access_values(), generator=self.problem)
+
+                    # Finally, here, the solutions are evaluated.
+                    self.problem.evaluate(self._population)
+                else:
+                    # If we have a noise table, we sample the indices of the noise vectors, and generate the
+                    # population from them.
+                    noise_table = self._noise_table
+                    solution_length = self.problem.solution_length
+                    offsets, signs = noise_table.sample_indices(
+                        self._popsize,
+                        solution_length,
+                        symmetric=self._distribution.SYMMETRIC_SAMPLING,
+                        generator=self.problem,
+                    )
+                    distribution = self._distribution
+                    noise = noise_table.noise(
+                        offsets, signs, solution_length, dtype=distribution.dtype, device=distribution.device
+                    )
+                    self._population.access_values()[:] = distribution.transform_noise(noise)
 
-                # Finally, here, the solutions are evaluated.
-                self.problem.evaluate(self._population)
+                    # The solutions are evaluated. If the problem is parallelized, only the distribution and the
+                    # indices of the noise vectors are sent to the remote actors.
+                    self.problem.evaluate_from_noise_table(self._population, distribution, noise_table, offsets, signs)
             else:
                 # If num_interactions is not None, then this means that we have a threshold for the number
                 # of simulator interactions to reach before declaring the phase of sampling complete.
@@ -359,14 +552,34 @@ class GaussianSearchAlgorithm(SearchAlgorithm, SinglePopulationAlgorithmMixin):
             # generation, sample a new population, and evaluate the new population's solutions.
             samples = self._population.access_values(keep_evals=True)
             fitnesses = self._population.access_evals()[:, self._obj_index]
-            obj_sense = self.problem.senses[self._obj_index]
-            ranking_method = self._ranking_method
-            gradients = self._distribution.compute_gradients(
-                samples, fitnesses, objective_sense=obj_sense, ranking_method=ranking_method
-            )
-            self._update_distribution(gradients)
+
+            unevaluated = torch.isnan(fitnesses)
+            if torch.any(unevaluated):
+                # Some solutions were left unevaluated (e.g. because they missed the evaluation deadline of the
+                # problem). These solutions are left out of the gradient estimation. With symmetric sampling,
+                # a solution and its mirrored counterpart are left out together.
+                if self._distribution.SYMMETRIC_SAMPLING:
+                    unevaluated = torch.any(unevaluated.reshape(-1, 2), dim=-1).repeat_interleave(2)
+                samples = samples[~unevaluated]
+                fitnesses = fitnesses[~unevaluated]
+
+            if len(fitnesses) >= 2:
+                obj_sense = self.problem.senses[self._obj_index]
+                ranking_method = self._ranking_method
+                gradients = self._distribution.compute_gradients(
+                    samples, fitnesses, objective_sense=obj_sense, ranking_method=ranking_method
+                )
+                self._update_distribution(gradients)
+            # Otherwise, too few solutions were evaluated (e.g. only the first piece of the population arrived
+            # before the evaluation deadline) for a meaningful gradient estimate. In that case, the distribution
+            # is kept as it is, and a new population is sampled from it.
             fill_and_eval_pop()
 
+    def _additional_learning_rates(self) -> dict:
+        # Learning rates for the distribution parameters other than "mu" and "sigma".
+        # To be overriden by the inheriting classes whose distributions have such parameters.
+        return {}
+
     def _update_distribution(self, gradients: dict):
         # This is where we follow the gradients with the help of the stored Distribution object.
 
@@ -397,6 +610,9 @@ class GaussianSearchAlgorithm(SearchAlgorithm, SinglePopulationAlgorithmMixin):
         # Here, we declare that "sigma" has a learning rate
         learning_rates["sigma"] = self._stdev_learning_rate
 
+        # Here, we declare the learning rates of the additional distribution parameters (if any)
+        learning_rates.update(self._additional_learning_rates())
+
         # With the help of the Distribution object's `update_parameters(...)` method, we follow the gradients
         updated_dist = self._distribution.update_parameters(
             gradients, learning_rates=learning_rates, optimizers=optimizers
@@ -524,6 +740,11 @@ class PGPE(GaussianSearchAlgorithm):
         obj_index: Optional[int] = None,
         distributed: bool = False,
         popsize_weighted_grad_avg: Optional[bool] = None,
+        asynchronous: bool = False,
+        max_staleness: Optional[int] = None,
+        staleness_decay: Optional[float] = None,
+        noise_table: Optional[Union[int, NoiseTable]] = None,
+        tree_reduction: bool = False,
     ):
         """
         `__init__(...)`: Initialize the PGPE algorithm.
@@ -674,6 +895,63 @@ class PGPE(GaussianSearchAlgorithm):
                 When the distributed mode is disabled (i.e. when `distributed`
                 is False), then the argument `popsize_weighted_grad_avg` is
                 expected as None.
+            asynchronous: Only to be used in distributed mode.
+                If `asynchronous` is True, the remote actors will not wait
+                for each other. Instead, each remote actor will continuously
+                sample solutions from the most recent search distribution
+                it received and compute its gradient, and the main process
+                will follow each gradient as soon as it arrives, and then
+                send the updated search distribution to the actor which
+                computed that gradient.
+                This is useful when the evaluation times of the solutions
+                vary significantly (e.g. in reinforcement learning tasks
+                with varying episode lengths), because the remote actors
+                do not stay idle while waiting for the slowest one.
+                Each gradient is weighted by the fraction of the population
+                size it represents. The gradients which arrive together
+                are summed and followed via a single update, so that an
+                optimizer (e.g. Adam or ClipUp) makes one step per received
+                group of gradients (and not one step per gradient).
+                The default is False.
+            max_staleness: Only to be used in asynchronous mode.
+                The staleness of a gradient is the number of updates the
+                search distribution received since the distribution that
+                was used for computing that gradient.
+                If `max_staleness` is given as an integer, the gradients
+                whose staleness exceed this value are discarded.
+                If left as None, no gradient is discarded.
+            staleness_decay: Only to be used in asynchronous mode.
+                If given as a float `c`, each gradient is multiplied by
+                `c ** staleness`, so that staler gradients have less effect.
+                Note that, if an optimizer which normalizes the gradients
+                (e.g. 'clipup' or 'adam') is used, this down-weighting does
+                not affect the update of the center point.
+                If left as None, there is no staleness-based down-weighting.
+            noise_table: Optionally a NoiseTable, or an integer (in which
+                case a new NoiseTable with that many noise values is
+                created). If a noise table is given and the problem is
+                parallelized, the noise table is shared with the remote
+                actors via the ray object store (one copy per node), and
+                the solutions are communicated as offsets and signs into
+                the noise table (instead of full decision vectors), and the
+                gradients are reconstructed by the main process from the
+                fitnesses (instead of being sent by the remote actors).
+                This reduces the per-generation interprocess communication
+                from `O(popsize * n)` to `O(popsize)`, `n` being the
+                solution length, which is useful for problems with very
+                large numbers of decision variables.
+                The noise table is not supported in asynchronous mode.
+                If left as None, no noise table is used.
+            tree_reduction: Only to be used in distributed mode.
+                If `tree_reduction` is True, the gradients computed by the
+                remote actors are averaged within the ray cluster by a tree
+                of pairwise reduction tasks, and the main process receives
+                only the final averaged gradient (instead of receiving and
+                averaging one gradient per remote actor). This reduces the
+                amount of data received by the main process when there are
+                many remote actors and the solution length is large.
+                Tree reduction cannot be used together with a noise table.
+                The default is False.
         """
 
         if symmetric:
@@ -704,6 +982,11 @@ class PGPE(GaussianSearchAlgorithm):
             obj_index=obj_index,
             distributed=distributed,
             popsize_weighted_grad_avg=popsize_weighted_grad_avg,
+            asynchronous=asynchronous,
+            max_staleness=max_staleness,
+            staleness_decay=staleness_decay,
+            noise_table=noise_table,
+            tree_reduction=tree_reduction,
             ensure_even_popsize=symmetric,
         )
 
@@ -747,6 +1030,11 @@ class SNES(GaussianSearchAlgorithm):
         obj_index: Optional[int] = None,
         distributed: bool = False,
         popsize_weighted_grad_avg: Optional[bool] = None,
+        asynchronous: bool = False,
+        max_staleness: Optional[int] = None,
+        staleness_decay: Optional[float] = None,
+        noise_table: Optional[Union[int, NoiseTable]] = None,
+        tree_reduction: bool = False,
     ):
         """
         `__init__(...)`: Initialize the SNES algorithm.
@@ -909,6 +1197,63 @@ class SNES(GaussianSearchAlgorithm):
                 When the distributed mode is disabled (i.e. when `distributed`
                 is False), then the argument `popsize_weighted_grad_avg` is
                 expected as None.
+            asynchronous: Only to be used in distributed mode.
+                If `asynchronous` is True, the remote actors will not wait
+                for each other. Instead, each remote actor will continuously
+                sample solutions from the most recent search distribution
+                it received and compute its gradient, and the main process
+                will follow each gradient as soon as it arrives, and then
+                send the updated search distribution to the actor which
+                computed that gradient.
+                This is useful when the evaluation times of the solutions
+                vary significantly (e.g. in reinforcement learning tasks
+                with varying episode lengths), because the remote actors
+                do not stay idle while waiting for the slowest one.
+                Each gradient is weighted by the fraction of the population
+                size it represents. The gradients which arrive together
+                are summed and followed via a single update, so that an
+                optimizer (e.g. Adam or ClipUp) makes one step per received
+                group of gradients (and not one step per gradient).
+                The default is False.
+            max_staleness: Only to be used in asynchronous mode.
+                The staleness of a gradient is the number of updates the
+                search distribution received since the distribution that
+                was used for computing that gradient.
+                If `max_staleness` is given as an integer, the gradients
+                whose staleness exceed this value are discarded.
+                If left as None, no gradient is discarded.
+            staleness_decay: Only to be used in asynchronous mode.
+                If given as a float `c`, each gradient is multiplied by
+                `c ** staleness`, so that staler gradients have less effect.
+                Note that, if an optimizer which normalizes the gradients
+                (e.g. 'clipup' or 'adam') is used, this down-weighting does
+                not affect the update of the center point.
+                If left as None, there is no staleness-based down-weighting.
+            noise_table: Optionally a NoiseTable, or an integer (in which
+                case a new NoiseTable with that many noise values is
+                created). If a noise table is given and the problem is
+                parallelized, the noise table is shared with the remote
+                actors via the ray object store (one copy per node), and
+                the solutions are communicated as offsets and signs into
+                the noise table (instead of full decision vectors), and the
+                gradients are reconstructed by the main process from the
+                fitnesses (instead of being sent by the remote actors).
+                This reduces the per-generation interprocess communication
+                from `O(popsize * n)` to `O(popsize)`, `n` being the
+                solution length, which is useful for problems with very
+                large numbers of decision variables.
+                The noise table is not supported in asynchronous mode.
+                If left as None, no noise table is used.
+            tree_reduction: Only to be used in distributed mode.
+                If `tree_reduction` is True, the gradients computed by the
+                remote actors are averaged within the ray cluster by a tree
+                of pairwise reduction tasks, and the main process receives
+                only the final averaged gradient (instead of receiving and
+                averaging one gradient per remote actor). This reduces the
+                amount of data received by the main process when there are
+                many remote actors and the solution length is large.
+                Tree reduction cannot be used together with a noise table.
+                The default is False.
         """
 
         if popsize is None:
@@ -947,6 +1292,11 @@ class SNES(GaussianSearchAlgorithm):
             obj_index=obj_index,
             distributed=distributed,
             popsize_weighted_grad_avg=popsize_weighted_grad_avg,
+            asynchronous=asynchronous,
+            max_staleness=max_staleness,
+            staleness_decay=staleness_decay,
+            noise_table=noise_table,
+            tree_reduction=tree_reduction,
         )
 
 
@@ -1004,6 +1354,11 @@ class CEM(GaussianSearchAlgorithm):
         obj_index: Optional[int] = None,
         distributed: bool = False,
         popsize_weighted_grad_avg: Optional[bool] = None,
+        asynchronous: bool = False,
+        max_staleness: Optional[int] = None,
+        staleness_decay: Optional[float] = None,
+        noise_table: Optional[Union[int, NoiseTable]] = None,
+        tree_reduction: bool = False,
     ):
         """
         `__init__(...)`: Initialize the search algorithm.
@@ -1121,6 +1476,63 @@ class CEM(GaussianSearchAlgorithm):
                 When the distributed mode is disabled (i.e. when `distributed`
                 is False), then the argument `popsize_weighted_grad_avg` is
                 expected as None.
+            asynchronous: Only to be used in distributed mode.
+                If `asynchronous` is True, the remote actors will not wait
+                for each other. Instead, each remote actor will continuously
+                sample solutions from the most recent search distribution
+                it received and compute its gradient, and the main process
+                will follow each gradient as soon as it arrives, and then
+                send the updated search distribution to the actor which
+                computed that gradient.
+                This is useful when the evaluation times of the solutions
+                vary significantly (e.g. in reinforcement learning tasks
+                with varying episode lengths), because the remote actors
+                do not stay idle while waiting for the slowest one.
+                Each gradient is weighted by the fraction of the population
+                size it represents. The gradients which arrive together
+                are summed and followed via a single update, so that an
+                optimizer (e.g. Adam or ClipUp) makes one step per received
+                group of gradients (and not one step per gradient).
+                The default is False.
+            max_staleness: Only to be used in asynchronous mode.
+                The staleness of a gradient is the number of updates the
+                search distribution received since the distribution that
+                was used for computing that gradient.
+                If `max_staleness` is given as an integer, the gradients
+                whose staleness exceed this value are discarded.
+                If left as None, no gradient is discarded.
+            staleness_decay: Only to be used in asynchronous mode.
+                If given as a float `c`, each gradient is multiplied by
+                `c ** staleness`, so that staler gradients have less effect.
+                Note that, if an optimizer which normalizes the gradients
+                (e.g. 'clipup' or 'adam') is used, this down-weighting does
+                not affect the update of the center point.
+                If left as None, there is no staleness-based down-weighting.
+            noise_table: Optionally a NoiseTable, or an integer (in which
+                case a new NoiseTable with that many noise values is
+                created). If a noise table is given and the problem is
+                parallelized, the noise table is shared with the remote
+                actors via the ray object store (one copy per node), and
+                the solutions are communicated as offsets and signs into
+                the noise table (instead of full decision vectors), and the
+                gradients are reconstructed by the main process from the
+                fitnesses (instead of being sent by the remote actors).
+                This reduces the per-generation interprocess communication
+                from `O(popsize * n)` to `O(popsize)`, `n` being the
+                solution length, which is useful for problems with very
+                large numbers of decision variables.
+                The noise table is not supported in asynchronous mode.
+                If left as None, no noise table is used.
+            tree_reduction: Only to be used in distributed mode.
+                If `tree_reduction` is True, the gradients computed by the
+                remote actors are averaged within the ray cluster by a tree
+                of pairwise reduction tasks, and the main process receives
+                only the final averaged gradient (instead of receiving and
+                averaging one gradient per remote actor). This reduces the
+                amount of data received by the main process when there are
+                many remote actors and the solution length is large.
+                Tree reduction cannot be used together with a noise table.
+                The default is False.
         """
 
         self.DISTRIBUTION_PARAMS = {"parenthood_ratio": float(parenthood_ratio)}
@@ -1144,6 +1556,11 @@ class CEM(GaussianSearchAlgorithm):
             obj_index=obj_index,
             distributed=distributed,
             popsize_weighted_grad_avg=popsize_weighted_grad_avg,
+            asynchronous=asynchronous,
+            max_staleness=max_staleness,
+            staleness_decay=staleness_decay,
+            noise_table=noise_table,
+            tree_reduction=tree_reduction,
         )
 
 
@@ -1380,3 +1797,387 @@ class XNES(GaussianSearchAlgorithm):
             distributed=distributed,
             popsize_weighted_grad_avg=popsize_weighted_grad_avg,
         )
+
+
+class LowRankXNES(GaussianSearchAlgorithm):
+    """
+    LowRankXNES: Natural evolution strategy with a diagonal plus low-rank
+    covariance matrix.
+
+    The search distribution of this algorithm is a `LowRankGaussian`,
+    whose covariance matrix is `diag(sigma) (I + V V^T) diag(sigma)`,
+    `V` being a `(n, k)` matrix, `n` being the solution length, and `k`
+    being the rank.
+    The standard deviation vector `sigma` is adapted in the same manner as
+    done by SNES (with the default learning rate of SNES), and
+    additionally, the low-rank factor `V` is adapted
+    so that the search distribution can capture the correlations between
+    the decision variables along `k` directions.
+    Unlike XNES, whose computational cost per generation is `O(n^3)`,
+    the cost of this algorithm is `O(popsize * k * n)`, which makes it
+    suitable for problems with large numbers of decision variables
+    (e.g. for neuroevolution).
+
+    References:
+
+        Tom Schaul, Tobias Glasmachers, Jürgen Schmidhuber (2011).
+        High Dimensions and Heavy Tails for Natural Evolution Strategies.
+
+        Yi Sun, Tom Schaul, Faustino Gomez, Jürgen Schmidhuber (2013).
+        A Linear Time Natural Evolution Strategy for Non-Separable Functions.
+    """
+
+    DISTRIBUTION_TYPE = LowRankGaussian
+    DISTRIBUTION_PARAMS = NotImplemented  # To be filled by the LowRankXNES instance
+
+    def __init__(
+        self,
+        problem: Problem,
+        *,
+        rank: int = 1,
+        stdev_init: Optional[RealOrVector] = None,
+        radius_init: Optional[RealOrVector] = None,
+        popsize: Optional[int] = None,
+        center_learning_rate: Optional[float] = None,
+        stdev_learning_rate: Optional[float] = None,
+        lowrank_learning_rate: Optional[float] = None,
+        scale_learning_rate: bool = True,
+        num_interactions: Optional[int] = None,
+        popsize_max: Optional[int] = None,
+        optimizer=None,
+        optimizer_config: Optional[dict] = None,
+        ranking_method: Optional[str] = "nes",
+        center_init: Optional[RealOrVector] = None,
+        obj_index: Optional[int] = None,
+        distributed: bool = False,
+        popsize_weighted_grad_avg: Optional[bool] = None,
+    ):
+        """
+        `__init__(...)`: Initialize the LowRankXNES algorithm.
+
+        Args:
+            problem: The problem object which is being worked on.
+            rank: Rank of the low-rank part of the covariance matrix,
+                i.e. the number of directions along which the search
+                distribution can capture correlations. Default is 1.
+            stdev_init: The initial standard deviation of the search
+                distribution, expressed as a scalar or as an array.
+                Determines the initial coverage area of the search
+                distribution.
+                If one wishes to configure the coverage area via the
+                argument `radius_init` instead, then `stdev_init` is expected
+                as None.
+            radius_init: The initial radius of the search distribution,
+                expressed as a scalar.
+                Determines the initial coverage area of the search
+                distribution.
+                Here, "radius" is defined as the norm of the search
+                distribution.
+                If one wishes to configure the coverage area via the
+                argument `stdev_init` instead, then `radius_init` is expected
+                as None.
+            popsize: Population size. Can be specified as an int,
+                or can be left as None, in which case the default `popsize`
+                will be computed as `4 + floor(3 * log(n))` where `n` is the
+                length of a solution.
+            center_learning_rate: Learning rate for updating the mean
+                of the search distribution. Default value is 1.0
+            stdev_learning_rate: Learning rate for updating the standard
+                deviation vector of the search distribution.
+                The default value is `0.2 * (3 + log(n)) / sqrt(n)`
+                where `n` is the length of a solution.
+            lowrank_learning_rate: Learning rate for updating the low-rank
+                factor of the covariance matrix.
+                The default value is `min(0.5, 0.6 * (3 + log(n)) / sqrt(n))`
+                where `n` is the length of a solution.
+            scale_learning_rate: If `scale_learning_rate` is True (which is
+                the default), then the effective learning rates for the
+                standard deviation and for the low-rank factor become the
+                provided `stdev_learning_rate` and `lowrank_learning_rate`
+                multiplied by their default values.
+                If `scale_learning_rate` is False, then the effective
+                learning rates become equal to the provided values.
+            num_interactions: When given as an integer n,
+                it is ensured that a population has interacted with
+                the GymProblem's environment n times. If this target
+                has not been reached yet, then the population is declared
+                too small, and gets extended with more samples,
+                until n amount of interactions is reached.
+                When given as None, popsize is the only configuration
+                affecting the size of a population.
+            popsize_max: Having `num_interactions` set as an integer
+                might cause the effective population size jump to
+                unnecesarily large numbers. To prevent this,
+                one can set `popsize_max` to specify an upper
+                bound for the effective population size.
+            optimizer: The optimizer to be used while following the
+                estimated the gradients.
+                Can be given as None if a momentum-based optimizer
+                is not required.
+                Otherwise, can be given as a str containing the name
+                of the optimizer (e.g. 'adam', 'clipup');
+                or as an instance of evotorch.optimizers.TorchOptimizer
+                or evotorch.optimizers.ClipUp.
+            optimizer_config: Configuration which will be passed
+                to the optimizer as keyword arguments.
+                See `evotorch.optimizers` for details about
+                which optimizer accepts which keyword arguments.
+            ranking_method: Which ranking method will be used for
+                fitness shaping. See the documentation of
+                `evotorch.ranking.rank(...)` for details.
+                The default is 'nes'.
+                Can be given as None if no such ranking is required.
+            center_init: The initial center solution.
+                Can be left as None.
+            obj_index: Index of the objective according to which the
+                gradient estimations will be done.
+                For single-objective problems, this can be left as None.
+            distributed: Whether or not the gradient computation will
+                be distributed. See the documentation of XNES for details.
+            popsize_weighted_grad_avg: Only to be used in distributed mode.
+                See the documentation of XNES for details.
+        """
+
+        n = problem.solution_length
+
+        if popsize is None:
+            popsize = int(4 + math.floor(3 * math.log(n)))
+
+        if center_learning_rate is None:
+            center_learning_rate = 1.0
+
+        default_stdev_lr = 0.2 * (3 + math.log(n)) / math.sqrt(n)
+        default_lowrank_lr = min(0.5, 0.6 * (3 + math.log(n)) / math.sqrt(n))
+
+        if stdev_learning_rate is None:
+            stdev_learning_rate = default_stdev_lr
+        else:
+            stdev_learning_rate = float(stdev_learning_rate)
+            if scale_learning_rate:
+                stdev_learning_rate *= default_stdev_lr
+
+        if lowrank_learning_rate is None:
+            lowrank_learning_rate = default_lowrank_lr
+        else:
+            lowrank_learning_rate = float(lowrank_learning_rate)
+            if scale_learning_rate:
+                lowrank_learning_rate *= default_lowrank_lr
+
+        self._lowrank_learning_rate = lowrank_learning_rate
+
+        rank = int(rank)
+        if rank < 1:
+            raise ValueError(f"`rank` was expected as a positive integer, but got {rank}")
+
+        # The low-rank factor is initialized with small random values (instead of zeros, because the gradient with
+        # respect to the low-rank factor is proportional to the factor itself).
+        # The random values are generated via the problem object, so that they are affected by the problem's seed.
+        self.DISTRIBUTION_PARAMS = {"V": problem.make_gaussian(n, rank) * (0.1 / math.sqrt(n))}
+
+        super().__init__(
+            problem,
+            popsize=popsize,
+            center_learning_rate=center_learning_rate,
+            stdev_learning_rate=stdev_learning_rate,
+            stdev_init=stdev_init,
+            radius_init=radius_init,
+            popsize_max=popsize_max,
+            num_interactions=num_interactions,
+            optimizer=optimizer,
+            optimizer_config=optimizer_config,
+            ranking_method=ranking_method,
+            center_init=center_init,
+            stdev_min=None,
+            stdev_max=None,
+            stdev_max_change=None,
+            obj_index=obj_index,
+            distributed=distributed,
+            popsize_weighted_grad_avg=popsize_weighted_grad_avg,
+        )
+
+    def _additional_learning_rates(self) -> dict:
+        return {"V": self._lowrank_learning_rate}
+
+
+class LimitedMemoryXNES(GaussianSearchAlgorithm):
+    """
+    LimitedMemoryXNES: Natural evolution strategy with a limited-memory
+    matrix adaptation, in the style of LM-MA-ES.
+
+    The search distribution of this algorithm is a `LimitedMemoryGaussian`,
+    whose samples are generated by transforming standard normal noise
+    vectors with a sequence of `m` rank-one transformations, each of them
+    defined by a direction vector.
+    The standard deviation vector is adapted in the same manner as done by
+    SNES (with the default learning rate of SNES), and the direction vectors are adapted as evolution paths with
+    different rates, as done by LM-MA-ES.
+    No `n x n` matrix is ever stored, and the cost of a generation is
+    `O(popsize * m * n)`, `n` being the solution length, which makes this
+    algorithm suitable for problems with large numbers of decision
+    variables (e.g. for neuroevolution).
+
+    Note that, unlike LM-MA-ES, this algorithm does not use cumulative
+    step-size adaptation. Instead, the standard deviation vector is updated
+    by following its natural gradient, like in SNES.
+
+    Reference:
+
+        Ilya Loshchilov, Tobias Glasmachers, Hans-Georg Beyer (2018).
+        Large Scale Black-box Optimization by Limited-Memory Matrix
+        Adaptation.
+    """
+
+    DISTRIBUTION_TYPE = LimitedMemoryGaussian
+    DISTRIBUTION_PARAMS = NotImplemented  # To be filled by the LimitedMemoryXNES instance
+
+    def __init__(
+        self,
+        problem: Problem,
+        *,
+        num_directions: Optional[int] = None,
+        stdev_init: Optional[RealOrVector] = None,
+        radius_init: Optional[RealOrVector] = None,
+        popsize: Optional[int] = None,
+        center_learning_rate: Optional[float] = None,
+        stdev_learning_rate: Optional[float] = None,
+        scale_learning_rate: bool = True,
+        num_interactions: Optional[int] = None,
+        popsize_max: Optional[int] = None,
+        optimizer=None,
+        optimizer_config: Optional[dict] = None,
+        ranking_method: Optional[str] = "nes",
+        center_init: Optional[RealOrVector] = None,
+        obj_index: Optional[int] = None,
+        distributed: bool = False,
+        popsize_weighted_grad_avg: Optional[bool] = None,
+    ):
+        """
+        `__init__(...)`: Initialize the LimitedMemoryXNES algorithm.
+
+        Args:
+            problem: The problem object which is being worked on.
+            num_directions: Number of direction vectors to be stored.
+                If left as None, the default is `4 + floor(3 * log(n))`
+                where `n` is the length of a solution.
+            stdev_init: The initial standard deviation of the search
+                distribution, expressed as a scalar or as an array.
+                Determines the initial coverage area of the search
+                distribution.
+                If one wishes to configure the coverage area via the
+                argument `radius_init` instead, then `stdev_init` is expected
+                as None.
+            radius_init: The initial radius of the search distribution,
+                expressed as a scalar.
+                Determines the initial coverage area of the search
+                distribution.
+                Here, "radius" is defined as the norm of the search
+                distribution.
+                If one wishes to configure the coverage area via the
+                argument `stdev_init` instead, then `radius_init` is expected
+                as None.
+            popsize: Population size. Can be specified as an int,
+                or can be left as None, in which case the default `popsize`
+                will be computed as `4 + floor(3 * log(n))` where `n` is the
+                length of a solution.
+            center_learning_rate: Learning rate for updating the mean
+                of the search distribution. Default value is 1.0
+            stdev_learning_rate: Learning rate for updating the standard
+                deviation vector of the search distribution.
+                The default value is `0.2 * (3 + log(n)) / sqrt(n)`
+                where `n` is the length of a solution.
+            scale_learning_rate: If `scale_learning_rate` is True (which is
+                the default), then the effective learning rate for the
+                standard deviation becomes the provided `stdev_learning_rate`
+                multiplied by its default value.
+                If `scale_learning_rate` is False, then the effective
+                learning rate becomes equal to the provided
+                `stdev_learning_rate`.
+            num_interactions: When given as an integer n,
+                it is ensured that a population has interacted with
+                the GymProblem's environment n times. If this target
+                has not been reached yet, then the population is declared
+                too small, and gets extended with more samples,
+                until n amount of interactions is reached.
+                When given as None, popsize is the only configuration
+                affecting the size of a population.
+            popsize_max: Having `num_interactions` set as an integer
+                might cause the effective population size jump to
+                unnecesarily large numbers. To prevent this,
+                one can set `popsize_max` to specify an upper
+                bound for the effective population size.
+            optimizer: The optimizer to be used while following the
+                estimated the gradients.
+                Can be given as None if a momentum-based optimizer
+                is not required.
+                Otherwise, can be given as a str containing the name
+                of the optimizer (e.g. 'adam', 'clipup');
+                or as an instance of evotorch.optimizers.TorchOptimizer
+                or evotorch.optimizers.ClipUp.
+            optimizer_config: Configuration which will be passed
+                to the optimizer as keyword arguments.
+                See `evotorch.optimizers` for details about
+                which optimizer accepts which keyword arguments.
+            ranking_method: Which ranking method will be used for
+                fitness shaping. See the documentation of
+                `evotorch.ranking.rank(...)` for details.
+                The default is 'nes'.
+                Can be given as None if no such ranking is required.
+            center_init: The initial center solution.
+                Can be left as None.
+            obj_index: Index of the objective according to which the
+                gradient estimations will be done.
+                For single-objective problems, this can be left as None.
+            distributed: Whether or not the gradient computation will
+                be distributed. See the documentation of XNES for details.
+            popsize_weighted_grad_avg: Only to be used in distributed mode.
+                See the documentation of XNES for details.
+        """
+
+        n = problem.solution_length
+
+        if popsize is None:
+            popsize = int(4 + math.floor(3 * math.log(n)))
+
+        if center_learning_rate is None:
+            center_learning_rate = 1.0
+
+        default_stdev_lr = 0.2 * (3 + math.log(n)) / math.sqrt(n)
+
+        if stdev_learning_rate is None:
+            stdev_learning_rate = default_stdev_lr
+        else:
+            stdev_learning_rate = float(stdev_learning_rate)
+            if scale_learning_rate:
+                stdev_learning_rate *= default_stdev_lr
+
+        if num_directions is None:
+            num_directions = int(4 + math.floor(3 * math.log(n)))
+        num_directions = int(num_directions)
+        if num_directions < 1:
+            raise ValueError(f"`num_directions` was expected as a positive integer, but got {num_directions}")
+
+        # The path rates suggested by Loshchilov et al. (2018) depend on the population size
+        j = torch.arange(num_directions, dtype=problem.dtype, device=problem.device)
+        path_rates = torch.clamp(popsize / ((4.0**j) * n), max=1.0)
+        self.DISTRIBUTION_PARAMS = {"num_directions": num_directions, "path_rates": path_rates}
+
+        super().__init__(
+            problem,
+            popsize=popsize,
+            center_learning_rate=center_learning_rate,
+            stdev_learning_rate=stdev_learning_rate,
+            stdev_init=stdev_init,
+            radius_init=radius_init,
+            popsize_max=popsize_max,
+            num_interactions=num_interactions,
+            optimizer=optimizer,
+            optimizer_config=optimizer_config,
+            ranking_method=ranking_method,
+            center_init=center_init,
+            stdev_min=None,
+            stdev_max=None,
+            stdev_max_change=None,
+            obj_index=obj_index,
+            distributed=distributed,
+            popsize_weighted_grad_avg=popsize_weighted_grad_avg,
+        )
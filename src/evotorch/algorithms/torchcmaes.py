@@ -0,0 +1,304 @@
+# Copyright 2022 NNAISENSE SA
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+This namespace contains the TorchCMAES class, which is an implementation
+of CMA-ES built directly on PyTorch.
+"""
+
+import math
+from typing import Optional
+
+import torch
+
+from ..core import Problem, SolutionBatch
+from ..tools.misc import RealOrVector, Vector, clip_tensor, is_sequence
+from .searchalgorithm import SearchAlgorithm, SinglePopulationAlgorithmMixin
+
+
+class TorchCMAES(SearchAlgorithm, SinglePopulationAlgorithmMixin):
+    """
+    TorchCMAES: Covariance Matrix Adaptation Evolution Strategy,
+    implemented with PyTorch.
+
+    Unlike the class `CMAES`, which is an interface to the pycma library,
+    this class implements CMA-ES directly on PyTorch tensors.
+    The solutions are sampled directly into the storage of the population
+    (on the device of the problem), and the distribution updates are
+    performed with vectorized tensor operations.
+
+    With `separable=False`, the full covariance matrix is adapted, and
+    its eigendecomposition is updated lazily (i.e. not at every generation,
+    but only once its cost is amortized over a sufficient number of
+    generations, as recommended by Hansen (2016)).
+    With `separable=True`, only the diagonal of the covariance matrix is
+    adapted (sep-CMA-ES, Ros & Hansen (2008)), which brings the cost of
+    a generation down to linear in the solution length, and makes this
+    variant suitable for high-dimensional problems.
+
+    References:
+
+        Nikolaus Hansen (2016).
+        The CMA Evolution Strategy: A Tutorial.
+
+        Raymond Ros, Nikolaus Hansen (2008).
+        A Simple Modification in CMA-ES Achieving Linear Time and Space
+        Complexity.
+
+        Nikolaus Hansen, Andreas Ostermeier (2001).
+        Completely Derandomized Self-Adaptation in Evolution Strategies.
+    """
+
+    def __init__(
+        self,
+        problem: Problem,
+        *,
+        stdev_init: RealOrVector,
+        popsize: Optional[int] = None,
+        center_init: Optional[Vector] = None,
+        center_learning_rate: Optional[float] = None,
+        cov_learning_rate: Optional[float] = None,
+        rankmu_learning_rate: Optional[float] = None,
+        rankone_learning_rate: Optional[float] = None,
+        separable: bool = False,
+        obj_index: Optional[int] = None,
+    ):
+        """
+        `__init__(...)`: Initialize the TorchCMAES solver.
+
+        Args:
+            problem: The problem object which is being worked on.
+            stdev_init: Initial standard deviation as a scalar or
+                as a 1-dimensional array.
+            popsize: Population size. Can be specified as an int,
+                or can be left as None, in which case the population size
+                will be `4 + floor(3 * ln(n))`, `n` being the length of a
+                solution.
+            center_init: Initial center point of the search distribution.
+                Can be given as a SolutionVector or as a 1-D array.
+                If left as None, an initial center point is generated
+                with the help of the problem object's `generate_values(...)`
+                method.
+            center_learning_rate: Learning rate for updating the mean
+                of the search distribution. Leaving this as None
+                means that the default, which is 1.0, is to be used.
+            cov_learning_rate: Learning rate for updating the covariance
+                matrix of the search distribution. This hyperparameter
+                acts as a common multiplier for rank_one update and rank_mu
+                update of the covariance matrix. Leaving this as None
+                means that the default, which is 1.0, is to be used.
+            rankmu_learning_rate: Multiplier for the learning rate of the
+                rank_mu update of the covariance matrix.
+                Leaving this as None means that the default, which is 1.0,
+                is to be used.
+            rankone_learning_rate: Multiplier for the learning rate of the
+                rank_one update of the covariance matrix.
+                Leaving this as None means that the default, which is 1.0,
+                is to be used.
+            separable: Provide this as True if you would like the problem
+                to be treated as a separable one, i.e. if only the diagonal
+                of the covariance matrix is to be adapted.
+            obj_index: Objective index according to which evaluation
+                of the solution will be done.
+        """
+
+        # Initialize the base class
+        SearchAlgorithm.__init__(self, problem, center=self._get_center)
+
+        # Ensure that the problem is numeric
+        problem.ensure_numeric()
+
+        # Store the objective index
+        self._obj_index = problem.normalize_obj_index(obj_index)
+
+        d = problem.solution_length
+        dtype = problem.dtype
+        device = problem.device
+        self._separable = bool(separable)
+
+        # Determine the population size, the number of parents, and the recombination weights
+        if popsize is None:
+            popsize = 4 + int(math.floor(3 * math.log(d)))
+        popsize = int(popsize)
+        if popsize < 2:
+            raise ValueError(f"`popsize` was expected as an integer bigger than 1, but got {popsize}")
+        self._popsize = popsize
+        self._mu = popsize // 2
+
+        weights = math.log((popsize + 1) / 2) - torch.log(
+            torch.arange(1, self._mu + 1, dtype=torch.float64, device=device)
+        )
+        weights = weights / torch.sum(weights)
+        mueff = float(1.0 / torch.sum(weights**2))
+        self._weights = weights.to(dtype)
+        self._mueff = mueff
+
+        # Compute the default learning rates, and then apply the given multipliers
+        self._cm = 1.0 if center_learning_rate is None else float(center_learning_rate)
+        self._cc = (4 + mueff / d) / (d + 4 + 2 * mueff / d)
+        self._cs = (mueff + 2) / (d + mueff + 5)
+        c1 = 2 / ((d + 1.3) ** 2 + mueff)
+        cmu = 2 * (mueff - 2 + 1 / mueff) / ((d + 2) ** 2 + mueff)
+        if self._separable:
+            # As suggested by Ros & Hansen (2008), the learning rates are increased for the separable variant
+            c1 *= (d + 2) / 3
+            cmu *= (d + 2) / 3
+        cmu = min(1 - c1, cmu)
+
+        cov_multiplier = 1.0 if cov_learning_rate is None else float(cov_learning_rate)
+        self._c1 = c1 * cov_multiplier * (1.0 if rankone_learning_rate is None else float(rankone_learning_rate))
+        self._cmu = cmu * cov_multiplier * (1.0 if rankmu_learning_rate is None else float(rankmu_learning_rate))
+        self._damps = 1 + 2 * max(0.0, math.sqrt((mueff - 1) / (d + 1)) - 1) + self._cs
+        self._chi_n = math.sqrt(d) * (1 - 1 / (4 * d) + 1 / (21 * d**2))
+
+        # Initialize the center point of the search distribution
+        if center_init is None:
+            self._m = problem.generate_values(1).reshape(-1).to(dtype=dtype, device=device)
+        else:
+            self._m = torch.as_tensor(center_init, dtype=dtype, device=device).clone().reshape(-1)
+
+        # Initialize the step size and the covariance matrix.
+        # When the initial standard deviation is given as a vector, the step size is set as the largest
+        # standard deviation, and the differences between the standard deviations are expressed
+        # by the initial (diagonal) covariance matrix.
+        if is_sequence(stdev_init):
+            stdev_init = torch.as_tensor(stdev_init, dtype=dtype, device=device).reshape(-1)
+            self._sigma = float(torch.max(stdev_init))
+            diag_c = (stdev_init / self._sigma) ** 2
+        else:
+            self._sigma = float(stdev_init)
+            diag_c = torch.ones(d, dtype=dtype, device=device)
+
+        if self._separable:
+            self._C = diag_c
+            self._B = None
+            self._D = torch.sqrt(diag_c)
+        else:
+            self._C = torch.diag(diag_c)
+            self._B = torch.eye(d, dtype=dtype, device=device)
+            self._D = torch.sqrt(diag_c)
+
+        # Initialize the evolution paths
+        self._pc = torch.zeros(d, dtype=dtype, device=device)
+        self._ps = torch.zeros(d, dtype=dtype, device=device)
+
+        # Generation count at which the eigendecomposition was last updated
+        self._eigen_update_gen = 0
+
+        # Initialize the population
+        self._population: SolutionBatch = problem.generate_batch(popsize, empty=True)
+
+        # Use the SinglePopulationAlgorithmMixin to enable additional status reports regarding the population.
+        SinglePopulationAlgorithmMixin.__init__(self)
+
+    @property
+    def population(self) -> SolutionBatch:
+        """Population generated by the CMA-ES algorithm"""
+        return self._population
+
+    @property
+    def obj_index(self) -> int:
+        """Index of the objective being focused on"""
+        return self._obj_index
+
+    @property
+    def separable(self) -> bool:
+        """Whether or not only the diagonal of the covariance matrix is adapted"""
+        return self._separable
+
+    @property
+    def sigma(self) -> float:
+        """The current step size"""
+        return self._sigma
+
+    @torch.no_grad()
+    def _update_eigensystem(self):
+        # Compute the eigendecomposition of the (symmetrized) covariance matrix
+        C = (self._C + self._C.T) / 2
+        eigvals, eigvecs = torch.linalg.eigh(C)
+        self._C = C
+        self._B = eigvecs
+        self._D = torch.sqrt(torch.clamp(eigvals, min=1e-20))
+
+    @torch.no_grad()
+    def _step(self):
+        """Perform a step of the CMA-ES solver"""
+        problem = self._problem
+        population = self._population
+        d = problem.solution_length
+        generation = self._steps_count + 1
+
+        # Sample the solutions directly into the storage of the population
+        values = population.access_values()
+        z = problem.make_gaussian(self._popsize, d)
+        if self._separable:
+            torch.mul(z, self._D, out=values)
+        else:
+            torch.matmul(z * self._D, self._B.T, out=values)
+        values.mul_(self._sigma).add_(self._m)
+
+        # If the problem has bounds, repair the solutions by clipping them
+        if (problem.lower_bounds is not None) or (problem.upper_bounds is not None):
+            values[:] = clip_tensor(values, problem.lower_bounds, problem.upper_bounds)
+
+        problem.evaluate(population)
+
+        # Take the best `mu` solutions, and their steps in the normalized coordinate system
+        parent_indices = torch.argsort(population.utility(self._obj_index), descending=True)[: self._mu]
+        ys = (values[parent_indices] - self._m) / self._sigma
+        y_w = self._weights @ ys
+
+        # Update the center point
+        self._m = self._m + (self._cm * self._sigma) * y_w
+
+        # Update the evolution path for the step size, using C^(-1/2) * y_w
+        if self._separable:
+            inv_sqrt_c_y_w = y_w / self._D
+        else:
+            inv_sqrt_c_y_w = self._B @ ((self._B.T @ y_w) / self._D)
+        cs = self._cs
+        self._ps = (1 - cs) * self._ps + math.sqrt(cs * (2 - cs) * self._mueff) * inv_sqrt_c_y_w
+        ps_norm = float(torch.linalg.norm(self._ps))
+
+        # Update the evolution path for the covariance matrix
+        cc = self._cc
+        hsig = (ps_norm / math.sqrt(1 - (1 - cs) ** (2 * generation)) / self._chi_n) < (1.4 + 2 / (d + 1))
+        self._pc = (1 - cc) * self._pc
+        if hsig:
+            self._pc = self._pc + math.sqrt(cc * (2 - cc) * self._mueff) * y_w
+
+        # Update the covariance matrix
+        c1 = self._c1
+        cmu = self._cmu
+        decay = 1 - c1 - cmu + (0.0 if hsig else c1 * cc * (2 - cc))
+        if self._separable:
+            rank_one = self._pc**2
+            rank_mu = self._weights @ (ys**2)
+            self._C = decay * self._C + c1 * rank_one + cmu * rank_mu
+            self._D = torch.sqrt(self._C)
+        else:
+            rank_one = torch.outer(self._pc, self._pc)
+            rank_mu = (ys * self._weights.reshape(-1, 1)).T @ ys
+            self._C = decay * self._C + c1 * rank_one + cmu * rank_mu
+
+            # Update the eigendecomposition lazily, so that its O(n^3) cost is amortized over the generations
+            if (generation - self._eigen_update_gen) * (c1 + cmu) * d * 10 > 1:
+                self._update_eigensystem()
+                self._eigen_update_gen = generation
+
+        # Update the step size
+        self._sigma = self._sigma * math.exp((cs / self._damps) * (ps_norm / self._chi_n - 1))
+
+    def _get_center(self) -> torch.Tensor:
+        return self._m
@@ -19,17 +19,30 @@ Definitions of the core classes:
 Problem, Solution, and SolutionBatch.
 """
 
+import asyncio
+import inspect
 import io
 import math
 import os
+import pickle
 import random
+import socket
+import threading
+import time
+import traceback
+import weakref
+from collections import deque
 from collections.abc import Mapping, Sequence
+from concurrent.futures import ThreadPoolExecutor
 from copy import deepcopy
+from queue import Empty
 from typing import Any, Callable, Iterable, List, NamedTuple, Optional, Tuple, Union
 
 import numpy as np
 import ray
 import torch
+import torch.multiprocessing
+from ray import cloudpickle
 
 try:
     from numba import njit
@@ -69,8 +82,6 @@ except ImportError:
                 warnings.warn(msg)
 
 
-from ray.util import ActorPool
-
 from .tools import (
     Device,
     DType,
@@ -91,9 +102,13 @@ from .tools import (
     split_workload,
     to_torch_dtype,
 )
+from .tools.evalcache import EvaluationCache
 from .tools.hook import Hook
+from .tools.noisetable import NoiseTable
 from .tools.objectarray import ObjectArray
+from .tools.subbatchtuner import SubbatchSizeTuner
 from .tools.tensormaker import TensorMakerMixin
+from .worker import SocketWorkerPool
 
 ObjectiveSense = Union[str, Iterable[str]]
 Bounds = RealOrVector
@@ -106,16 +121,78 @@ MaybeIndicesOrSlice = Optional[IndicesOrSlice]
 ActorSeeds = NamedTuple("ActorSeeds", py_global=int, np_global=int, torch_global=int, problem=int)
 
 
-@ray.remote
-class EvaluationActor:
-    """An actor class for remotely evaluating solutions"""
+# Environment variables which determine the number of threads used by the OpenMP, MKL, and BLAS backends
+_THREAD_ENV_VARS = ("OMP_NUM_THREADS", "MKL_NUM_THREADS", "OPENBLAS_NUM_THREADS", "NUMEXPR_NUM_THREADS")
+
+# The CPU affinity of this process before it was pinned to a block of cores (if it was pinned at all)
+_original_affinity: Optional[list] = None
+
+
+def _apply_thread_budget(num_threads: int, pin_index: Optional[int] = None):
+    # Limit the number of CPU threads used by the current process. If `pin_index` is given, also pin the process to
+    # the `pin_index`-th block of `num_threads` cores.
+    global _original_affinity
+    for var in _THREAD_ENV_VARS:
+        os.environ[var] = str(num_threads)
+    torch.set_num_threads(num_threads)
+    if pin_index is not None:
+        if _original_affinity is None:
+            _original_affinity = sorted(os.sched_getaffinity(0))
+        cores = _original_affinity
+        start = (pin_index * num_threads) % len(cores)
+        os.sched_setaffinity(0, [cores[(start + j) % len(cores)] for j in range(min(num_threads, len(cores)))])
+
+
+def _process_identity() -> tuple:
+    # Identify the current process across hosts
+    return socket.gethostname(), os.getpid()
+
+
+def _initialize_remote_problem(problem: "Problem", index: int, seeds: Union[ActorSeeds, tuple], state: dict):
+    # Prepare a copy of a Problem object which has just been placed into a remote actor (or into a worker process)
+    problem._actor_index = index
+    # A remote copy can live in the main process (e.g. when ray runs in local mode), in which case the thread budget
+    # is not applied, so that the thread settings and the CPU affinity of the main process stay intact.
+    if (problem._actor_num_threads is not None) and (_process_identity() != problem._main_process):
+        _apply_thread_budget(problem._actor_num_threads, index if problem._pin_actors else None)
+    py_global, np_global, torch_global, probseed = seeds
+    random.seed(py_global)
+    np.random.seed(np_global)
+    torch.manual_seed(torch_global)
+    if problem.has_own_generator:
+        problem.manual_seed(probseed)
+    problem._use_pickle_data_from_main(state)
+    problem.remote_hook(problem)
+    if isinstance(problem._num_gpus_per_actor, str) and (problem._num_gpus_per_actor == "all"):
+        if "CUDA_VISIBLE_DEVICES" in os.environ:
+            del os.environ["CUDA_VISIBLE_DEVICES"]
+
+
+class EvaluationWorker:
+    """
+    Holder of a remote copy of a Problem object, which serves the requests
+    of the main Problem object.
 
-    def __init__(self, problem: "Problem", index: int, seeds: Union[ActorSeeds, tuple], state: dict):
+    This class is not used directly. Instead, it is used as a ray actor
+    (see `EvaluationActor`), or it is served over a socket by a standalone
+    worker process (see `evotorch.worker`).
+    """
+
+    def __init__(
+        self,
+        problem: Optional["Problem"],
+        index: Optional[int] = None,
+        seeds: Optional[Union[ActorSeeds, tuple]] = None,
+        state: Optional[dict] = None,
+    ):
         """
         `__init__(...)`: Initialize the actor.
 
         Args:
             problem: The problem object to be stored by the actor.
+                Can also be given as None, in which case the actor starts
+                empty, and a problem object is to be loaded later via
+                `load_problem(...)` (see `WarmActorPool`).
             index: Index of this actor
             seed: An integer which is bigger than or equal to 0
                 and less than 2**32, to be used as the seed
@@ -124,19 +201,33 @@ class EvaluationActor:
             state: The state dictionary to be loaded by the stored
                 problem object.
         """
+        self._problem: Optional["Problem"] = None
+        if problem is not None:
+            self.load_problem(problem, index, seeds, state)
+
+    def load_problem(self, problem: "Problem", index: int, seeds: Union[ActorSeeds, tuple], state: dict):
+        """
+        Load a problem object into this actor, replacing the previous one
+        (if any), and reseed the random number generators.
+
+        Args:
+            problem: The problem object to be stored by the actor.
+            index: Index of this actor
+            seeds: The seeds of the random number generators,
+                as an `ActorSeeds` tuple.
+            state: The state dictionary to be loaded by the stored
+                problem object.
+        """
         self._problem = problem
-        self._problem._actor_index = index
-        py_global, np_global, torch_global, probseed = seeds
-        random.seed(py_global)
-        np.random.seed(np_global)
-        torch.manual_seed(torch_global)
-        if self._problem.has_own_generator:
-            self._problem.seed(probseed)
-        self._problem._use_pickle_data_from_main(state)
-        self._problem.remote_hook(self._problem)
-        if isinstance(self._problem._num_gpus_per_actor, str) and (self._problem._num_gpus_per_actor == "all"):
-            if "CUDA_VISIBLE_DEVICES" in os.environ:
-                del os.environ["CUDA_VISIBLE_DEVICES"]
+        _initialize_remote_problem(self._problem, index, seeds, state)
+
+    def unload_problem(self):
+        """
+        Release the problem object stored by this actor.
+        The actor itself stays alive, and can receive a new problem object
+        via `load_problem(...)`.
+        """
+        self._problem = None
 
     def evaluate_batch(self, solution_batch: "SolutionBatch") -> torch.Tensor:
         """Evaluate a solution batch.
@@ -147,7 +238,7 @@ class EvaluationActor:
             Evaluation results
         """
         self._problem.evaluate(solution_batch)
-        return solution_batch.access_evals()
+        return _compact_tensor(solution_batch.access_evals())
 
     def evaluate_batch_piece(self, piece_index: int, batch_piece: "SolutionBatch") -> tuple:
         """Evaluate a solution batch, which is considered to be a piece
@@ -164,6 +255,35 @@ class EvaluationActor:
         """
         return piece_index, self.evaluate_batch(batch_piece)
 
+    def timed(self, method_name: str, *args) -> tuple:
+        """Call a method of this worker, and measure how long it takes.
+
+        Args:
+            method_name: Name of the method of this worker (e.g.
+                "evaluate_batch" or "call").
+            args: The positional arguments to be passed to the method.
+        Returns:
+            A tuple `(result, elapsed, num_interactions)`, where `result`
+            is the return value of the method, `elapsed` is the duration
+            of the call in seconds, and `num_interactions` is the number
+            of simulator interactions made during the call (or None if
+            the problem does not count its interactions).
+        """
+        interactions_at_first = self._local_interaction_count()
+        time_at_first = time.perf_counter()
+        result = getattr(self, method_name)(*args)
+        elapsed = time.perf_counter() - time_at_first
+        num_interactions = (
+            None if interactions_at_first is None else self._local_interaction_count() - interactions_at_first
+        )
+        return result, elapsed, num_interactions
+
+    def _local_interaction_count(self) -> Optional[int]:
+        try:
+            return self._problem._get_local_interaction_count()
+        except NotImplementedError:
+            return None
+
     def call(self, method_name: str, args: list, kwargs: dict) -> object:
         """Call a method of the contained Problem object.
 
@@ -264,6 +384,11 @@ class EvaluationActor:
         return getattr(self._problem.get_env(), method_name)(*args, **kwargs)
 
 
+@ray.remote
+class EvaluationActor(EvaluationWorker):
+    """An actor class for remotely evaluating solutions"""
+
+
 class AllRemoteProblems:
     """
     Representation of all remote problem instances stored by the ray actors.
@@ -283,6 +408,11 @@ class AllRemoteProblems:
     An alternative to the example above is like this:
 
         results = my_problem.all_remote_problems().f()
+
+    The arguments of such calls are put into the ray object store only
+    once, and the actors receive them by reference (instead of each actor
+    receiving its own serialized copy). The collective methods
+    `broadcast(...)` and `gather(...)` can also be used explicitly.
     """
 
     def __init__(self, actors: list):
@@ -291,6 +421,41 @@ class AllRemoteProblems:
     def __getattr__(self, attr_name: str) -> Any:
         return RemoteMethod(attr_name, self._actors)
 
+    def broadcast(self, method_name: str, *args, **kwargs):
+        """
+        Call a method on all remote problem instances with the same
+        arguments, and wait until all the calls are complete.
+
+        The arguments are serialized and put into the ray object store
+        only once, regardless of the number of actors.
+
+        Args:
+            method_name: Name of the method to be called on the remote
+                problem instances.
+            args: The positional arguments to be passed to the method.
+            kwargs: The keyword arguments to be passed to the method.
+        """
+        ray.get(_call_on_actors(self._actors, method_name, args, kwargs))
+
+    def gather(self, method_name: str, *args, **kwargs) -> list:
+        """
+        Call a method on all remote problem instances with the same
+        arguments, and collect the results.
+
+        The arguments are serialized and put into the ray object store
+        only once, regardless of the number of actors.
+
+        Args:
+            method_name: Name of the method to be called on the remote
+                problem instances.
+            args: The positional arguments to be passed to the method.
+            kwargs: The keyword arguments to be passed to the method.
+        Returns:
+            A list whose i-th item is the result of the method call on
+            the i-th actor.
+        """
+        return ray.get(_call_on_actors(self._actors, method_name, args, kwargs))
+
 
 class AllRemoteEnvs:
     """
@@ -333,13 +498,7 @@ class RemoteMethod:
         self._on_env = bool(on_env)
 
     def __call__(self, *args, **kwargs) -> Any:
-        def invoke(actor):
-            if self._on_env:
-                return actor.call_on_env.remote(self._method_name, args, kwargs)
-            else:
-                return actor.call.remote(self._method_name, args, kwargs)
-
-        return ray.get([invoke(actor) for actor in self._actors])
+        return ray.get(_call_on_actors(self._actors, self._method_name, args, kwargs, on_env=self._on_env))
 
     def __repr__(self) -> str:
         if self._on_env:
@@ -349,6 +508,752 @@ class RemoteMethod:
         return f"<{type(self).__name__} {repr(self._method_name)}{further}>"
 
 
+def _call_on_actors(actors: list, method_name: str, args: Iterable, kwargs: dict, *, on_env: bool = False) -> list:
+    # Call a method on the problems (or on the environments) of all the given actors. When there are multiple actors,
+    # the arguments are put into the ray object store only once. Since ray resolves the ObjectRefs which are given
+    # directly as arguments, each actor receives the arguments themselves (and not their references).
+    args = list(args)
+    kwargs = dict(kwargs)
+    if (len(actors) > 1) and ((len(args) > 0) or (len(kwargs) > 0)):
+        args = ray.put(args)
+        kwargs = ray.put(kwargs)
+
+    if on_env:
+        return [actor.call_on_env.remote(method_name, args, kwargs) for actor in actors]
+    else:
+        return [actor.call.remote(method_name, args, kwargs) for actor in actors]
+
+
+class PipelinedActorPool:
+    """
+    A pool of ray actors which keeps multiple tasks in flight per actor.
+
+    Unlike `ray.util.ActorPool`, which hands an actor its next task only
+    after the result of its previous task has arrived, this pool keeps up
+    to `tasks_per_actor` tasks outstanding per actor. This way, while an
+    actor is working on its current task, its next task(s) are already
+    queued on its side, and the round trip between the actor and the main
+    process does not leave the actor idle.
+
+    An instance of this class is not meant to be created manually.
+    Instead, a Problem object creates it when its parallelization is
+    triggered.
+    """
+
+    def __init__(self, actors: list, *, tasks_per_actor: int = 2):
+        """
+        `__init__(...)`: Initialize the PipelinedActorPool.
+
+        Args:
+            actors: The ray actors.
+            tasks_per_actor: Maximum number of tasks which can be
+                outstanding per actor at the same time.
+        """
+        if int(tasks_per_actor) < 1:
+            raise ValueError(f"`tasks_per_actor` was expected as a positive integer, but got {tasks_per_actor}")
+        self._actors = list(actors)
+        self._tasks_per_actor = int(tasks_per_actor)
+
+        # Mapping from the ObjectRefs of the abandoned tasks (which might still be running) to their actor indices
+        self._abandoned = {}
+
+        # Measurements of the most recent call to `map_unordered(...)` or `map_on_actors(...)`
+        self._metrics: Optional[dict] = None
+
+    def __len__(self) -> int:
+        return len(self._actors)
+
+    @property
+    def metrics(self) -> Optional[dict]:
+        """
+        Measurements of the most recent call to `map_unordered(...)` or
+        `map_on_actors(...)`, as a dictionary with the keys "utilization"
+        (the fraction of time the actors were busy, as observed by the main
+        process), "queue_wait" (the average number of seconds a task waited
+        for a free actor before being submitted), "wall_time" (the duration
+        of the call, in seconds), and "num_tasks".
+        None if nothing was measured yet.
+        """
+        return self._metrics
+
+    def clear_metrics(self):
+        """Forget the measurements of the most recent call"""
+        self._metrics = None
+
+    def add_actors(self, actors: list):
+        """
+        Add new actors to the pool.
+
+        Args:
+            actors: The new ray actors, to be indexed after the existing
+                ones.
+        """
+        self._actors.extend(actors)
+
+    def remove_actors(self, num_actors: int) -> list:
+        """
+        Remove the actors with the highest indices from the pool.
+        The unfinished tasks of these actors (e.g. the tasks which were
+        abandoned because of a deadline) are waited for.
+
+        Args:
+            num_actors: Number of actors to remove.
+        Returns:
+            The removed actors.
+        """
+        first_removed = len(self._actors) - int(num_actors)
+        draining = [ref for ref, actor_index in self._abandoned.items() if actor_index >= first_removed]
+        if len(draining) > 0:
+            ray.wait(draining, num_returns=len(draining))
+        for ref in draining:
+            del self._abandoned[ref]
+        removed = self._actors[first_removed:]
+        del self._actors[first_removed:]
+        return removed
+
+    def _record_metrics(self, time_at_first: float, busy_time: list, busy_since: list, queue_wait: float, n: int):
+        # Store the measurements of a call which is finishing
+        now = time.perf_counter()
+        wall_time = max(now - time_at_first, 1e-9)
+        total_busy = sum(busy_time) + sum(now - t for t in busy_since if t is not None)
+        self._metrics = {
+            "utilization": min(1.0, total_busy / (wall_time * max(1, len(busy_time)))),
+            "queue_wait": queue_wait / max(1, n),
+            "wall_time": wall_time,
+            "num_tasks": n,
+        }
+
+    def map_unordered(
+        self,
+        fn: Callable,
+        values: Iterable,
+        *,
+        prefetch: bool = False,
+        speculative: bool = False,
+        deadline: Optional[float] = None,
+        min_results: int = 0,
+    ) -> Iterable[tuple]:
+        """
+        Run a task for each value, yielding the results as they arrive.
+
+        Args:
+            fn: A function `fn(actor, value)` which submits a task to the
+                given actor (e.g. via `actor.some_method.remote(value)`)
+                and returns the ObjectRef of the task's result.
+            values: The values for which the tasks will be submitted.
+            prefetch: If True, each value is put into the ray object store
+                ahead of the submission of its task (while the previously
+                submitted tasks are being waited for), and `fn` receives
+                the ObjectRef of the value instead of the value itself.
+                Because ray resolves the ObjectRefs given as arguments to
+                remote methods, the remote method receives the value.
+            speculative: If True, once all the tasks are submitted, each
+                actor which becomes idle receives a copy of a task which is
+                still outstanding (the task with the fewest copies and,
+                among those, the earliest one). Whichever copy of a task
+                finishes first provides the result of that task.
+            deadline: Optionally a point in time (as returned by
+                `time.perf_counter()`) after which the outstanding tasks
+                are abandoned, i.e. their results are not yielded.
+                The actors running abandoned tasks (or leftover copies of
+                finished tasks) are not given new tasks, in this call or
+                in the later calls, until those tasks finish.
+            min_results: The deadline is not enforced until at least this
+                many results are yielded.
+        Returns:
+            An iterator of `(i, result)` pairs, in the order of completion,
+            `i` being the index of the value for which the result was
+            computed. If the deadline is reached, some indices might be
+            missing.
+        """
+        values = list(values)
+        num_values = len(values)
+        num_actors = len(self._actors)
+
+        # Each actor has `tasks_per_actor` slots, minus the slots still occupied by previously abandoned tasks.
+        # The free slots are listed in a round-robin manner, so that the first tasks are spread across all the actors.
+        self._collect_abandoned()
+        num_occupied = [0] * num_actors
+        for actor_index in self._abandoned.values():
+            num_occupied[actor_index] += 1
+        free_slots = deque(
+            actor_index
+            for slot in range(self._tasks_per_actor)
+            for actor_index in range(num_actors)
+            if slot >= num_occupied[actor_index]
+        )
+
+        # Mapping from the ObjectRef of each submitted task to the index of its value and to the actor running it
+        pending = {}
+
+        # The payloads of the submitted tasks (kept for submitting copies of the tasks), and the ObjectRefs of the
+        # values which were put into the object store but whose tasks are not submitted yet
+        payloads = {}
+        prefetched = {}
+
+        finished = set()
+        next_to_submit = 0
+        next_to_prefetch = 0
+
+        # For the measurements: the number of tasks in flight per actor, since when each actor is busy, how long
+        # each actor was busy, and how long the tasks waited for free slots
+        time_at_first = time.perf_counter()
+        in_flight = [0] * num_actors
+        busy_since = [None] * num_actors
+        busy_time = [0.0] * num_actors
+        queue_wait = 0.0
+
+        def submit(i: int, actor_index: int):
+            nonlocal queue_wait
+            now = time.perf_counter()
+            if i not in payloads:
+                queue_wait += now - time_at_first
+                if prefetch:
+                    payload = prefetched.pop(i, None)
+                    payloads[i] = ray.put(values[i]) if payload is None else payload
+                else:
+                    payloads[i] = values[i]
+            pending[fn(self._actors[actor_index], payloads[i])] = (i, actor_index)
+            if in_flight[actor_index] == 0:
+                busy_since[actor_index] = now
+            in_flight[actor_index] += 1
+
+        def task_done(actor_index: int):
+            in_flight[actor_index] -= 1
+            if in_flight[actor_index] == 0:
+                busy_time[actor_index] += time.perf_counter() - busy_since[actor_index]
+                busy_since[actor_index] = None
+
+        while len(finished) < num_values:
+            while (len(free_slots) > 0) and (next_to_submit < num_values):
+                submit(next_to_submit, free_slots.popleft())
+                next_to_submit += 1
+
+            if prefetch:
+                # While the actors are busy, put the payloads of the upcoming tasks into the object store,
+                # so that they can be submitted without serialization delay as soon as slots become free.
+                next_to_prefetch = max(next_to_prefetch, next_to_submit)
+                while next_to_prefetch < min(num_values, next_to_submit + num_actors):
+                    prefetched[next_to_prefetch] = ray.put(values[next_to_prefetch])
+                    next_to_prefetch += 1
+
+            if speculative and (next_to_submit == num_values):
+                # All the tasks are submitted. The idle actors receive copies of the outstanding tasks.
+                busy_actors = {actor_index for _, actor_index in pending.values()} | set(self._abandoned.values())
+                num_copies = {}
+                for i, _ in pending.values():
+                    num_copies[i] = num_copies.get(i, 0) + 1
+                outstanding = sorted((i for i in num_copies if i not in finished), key=lambda i: (num_copies[i], i))
+                for actor_index in range(num_actors):
+                    if len(outstanding) == 0:
+                        break
+                    if actor_index not in busy_actors:
+                        free_slots.remove(actor_index)
+                        submit(outstanding.pop(0), actor_index)
+
+            if len(pending) == 0:
+                # All the slots are occupied by previously abandoned tasks. We wait for one of them to finish.
+                ready, _ = ray.wait(list(self._abandoned.keys()), num_returns=1)
+                for ref in ready:
+                    free_slots.append(self._abandoned.pop(ref))
+                continue
+
+            if (deadline is not None) and (len(finished) >= min_results):
+                timeout = max(0.0, deadline - time.perf_counter())
+            else:
+                timeout = None
+
+            ready, _ = ray.wait(list(pending.keys()), num_returns=1, timeout=timeout)
+            if len(ready) == 0:
+                # The deadline is reached
+                break
+
+            for ref in ready:
+                i, actor_index = pending.pop(ref)
+                free_slots.append(actor_index)
+                task_done(actor_index)
+                if i not in finished:
+                    finished.add(i)
+                    yield i, ray.get(ref)
+
+        if num_values > 0:
+            self._record_metrics(time_at_first, busy_time, busy_since, queue_wait, num_values)
+
+        # The tasks which are still running (abandoned tasks, or leftover copies of finished tasks) are remembered,
+        # so that their actors are not considered free until they finish.
+        for ref, (_, actor_index) in pending.items():
+            self._abandoned[ref] = actor_index
+
+    def _collect_abandoned(self):
+        # Forget about the abandoned tasks which are finished by now
+        if len(self._abandoned) > 0:
+            ready, _ = ray.wait(list(self._abandoned.keys()), num_returns=len(self._abandoned), timeout=0)
+            for ref in ready:
+                del self._abandoned[ref]
+
+    def map_on_actors(self, fn: Callable, assignments: Iterable[tuple]) -> Iterable[tuple]:
+        """
+        Run tasks on specific actors, yielding the results as they arrive.
+
+        Args:
+            fn: A function `fn(actor, value)` which submits a task to the
+                given actor and returns the ObjectRef of the task's result.
+            assignments: A sequence of `(actor_index, value)` pairs.
+                All the tasks are submitted immediately, in the given order.
+        Returns:
+            An iterator of `(j, result)` pairs, in the order of completion,
+            `j` being the index of the assignment for which the result was
+            computed.
+        """
+        time_at_first = time.perf_counter()
+        num_actors = len(self._actors)
+        in_flight = [0] * num_actors
+        busy_since = [None] * num_actors
+        busy_time = [0.0] * num_actors
+
+        pending = {}
+        for j, (actor_index, value) in enumerate(assignments):
+            pending[fn(self._actors[actor_index], value)] = (j, actor_index)
+            if in_flight[actor_index] == 0:
+                busy_since[actor_index] = time.perf_counter()
+            in_flight[actor_index] += 1
+        num_tasks = len(pending)
+
+        while len(pending) > 0:
+            ready, _ = ray.wait(list(pending.keys()), num_returns=1)
+            for ref in ready:
+                j, actor_index = pending.pop(ref)
+                in_flight[actor_index] -= 1
+                if in_flight[actor_index] == 0:
+                    busy_time[actor_index] += time.perf_counter() - busy_since[actor_index]
+                    busy_since[actor_index] = None
+                yield j, ray.get(ref)
+
+        # All the tasks are submitted at once, so, they do not wait for free actors on the side of the main process
+        if num_tasks > 0:
+            self._record_metrics(time_at_first, busy_time, busy_since, 0.0, num_tasks)
+
+
+_warm_actor_pools: dict = {}
+
+
+class WarmActorPool:
+    """
+    A named pool of ray actors which can be reused by multiple Problem
+    objects, one after another.
+
+    Creating the ray actors of a parallelized Problem has a cost: each
+    new actor is a new process which has to import torch (and possibly
+    other heavy libraries such as gym). When many short experiments are
+    run one after another (e.g. within a hyperparameter sweep, or when
+    restarting a search), this cost can exceed the cost of the experiments
+    themselves. A WarmActorPool keeps its actors alive across Problem
+    objects, so that this cost is paid only once.
+
+    Usage:
+
+        pool = WarmActorPool("my_pool", 8)
+
+        for i in range(100):
+            problem = MyProblem(..., actor_pool="my_pool")
+            problem.warm_up()  # optional: prepare the remote problems now
+            searcher = SNES(problem, ...)
+            searcher.run(10)
+            problem.kill_actors()  # detaches the problem, keeps the actors alive
+
+        pool.shutdown()
+
+    When a Problem attaches itself to the pool (which happens when it is
+    parallelized), its serialized copy is put into the ray object store
+    once, and each actor replaces its stored problem object with this new
+    copy, and reseeds its random number generators with the seeds
+    (see `ActorSeeds`) generated by the new Problem.
+    Only one Problem object can be attached to a pool at a time.
+    The pool refers to the attached Problem weakly, so, if a Problem is
+    garbage collected without calling `kill_actors()`, the next Problem
+    can still attach itself to the pool.
+    """
+
+    def __init__(self, name: str, num_actors: int, *, actor_config: Optional[dict] = None, detached: bool = False):
+        """
+        `__init__(...)`: Initialize the WarmActorPool, and create its actors.
+
+        Args:
+            name: Name of the pool, via which the Problem objects can refer
+                to it (see the argument `actor_pool` of `Problem`).
+            num_actors: Number of actors to create.
+            actor_config: A dictionary, representing the keyword arguments
+                to be passed to the options(...) used when creating the
+                ray actor objects (e.g. `dict(num_gpus=1)`).
+            detached: If True, the actors are created as named, detached
+                ray actors, which survive the end of this driver program
+                (given that ray is connected to a cluster which outlives
+                the program). If such actors already exist (e.g. created
+                by a previous run with the same pool name), they are
+                reused instead of being created again.
+        """
+        name = str(name)
+        if name in _warm_actor_pools:
+            raise ValueError(f"There is already a WarmActorPool named {repr(name)}")
+        num_actors = int(num_actors)
+        if num_actors < 1:
+            raise ValueError(f"`num_actors` was expected as a positive integer, but got {num_actors}")
+
+        ensure_ray()
+
+        config = {} if actor_config is None else dict(actor_config)
+        actors = []
+        for i in range(num_actors):
+            if detached:
+                actor_name = f"evotorch.WarmActorPool.{name}.{i}"
+                try:
+                    actor = ray.get_actor(actor_name)
+                except ValueError:
+                    actor = EvaluationActor.options(name=actor_name, lifetime="detached", **config).remote(None)
+            else:
+                actor = EvaluationActor.options(**config).remote(None)
+            actors.append(actor)
+
+        self._name = name
+        self._actors = actors
+        self._attached: Optional[weakref.ref] = None
+        _warm_actor_pools[name] = self
+
+    @staticmethod
+    def get(name: str) -> "WarmActorPool":
+        """
+        Get the WarmActorPool with the given name.
+
+        Args:
+            name: Name of the pool.
+        Returns:
+            The WarmActorPool.
+        """
+        if name not in _warm_actor_pools:
+            raise ValueError(f"There is no WarmActorPool named {repr(name)}")
+        return _warm_actor_pools[name]
+
+    @property
+    def name(self) -> str:
+        """Name of the pool"""
+        return self._name
+
+    @property
+    def num_actors(self) -> int:
+        """Number of actors in the pool"""
+        return len(self._actors)
+
+    @property
+    def actors(self) -> list:
+        """The ray actors of the pool"""
+        return list(self._actors)
+
+    @property
+    def attached_problem(self) -> Optional["Problem"]:
+        """The Problem object which is currently using the pool, or None"""
+        return None if self._attached is None else self._attached()
+
+    def _attach(self, problem: "Problem", all_seeds: list, remote_states: list) -> list:
+        # Load the given problem into all the actors, and return the actors
+        if self.attached_problem is not None:
+            raise RuntimeError(
+                f"The WarmActorPool {repr(self._name)} is already being used by another Problem object."
+                f" Please call `kill_actors()` on that Problem object first, so that it detaches from the pool."
+            )
+        if self._actors is None:
+            raise RuntimeError(f"The WarmActorPool {repr(self._name)} was shut down.")
+
+        problem_ref = ray.put(problem)
+        ray.get(
+            [
+                actor.load_problem.remote(problem_ref, i, ActorSeeds(*all_seeds[i]), remote_states[i])
+                for i, actor in enumerate(self._actors)
+            ]
+        )
+        self._attached = weakref.ref(problem)
+        return list(self._actors)
+
+    def _detach(self, problem: "Problem"):
+        # Release the problem objects stored by the actors. Since an actor runs its tasks in order, this waits for
+        # the unfinished tasks of the detached problem (if any).
+        if self.attached_problem is not problem:
+            return
+        ray.get([actor.unload_problem.remote() for actor in self._actors])
+        self._attached = None
+
+    def shutdown(self):
+        """
+        Kill the actors of the pool, and remove the pool from the registry
+        of named pools.
+        """
+        if self.attached_problem is not None:
+            raise RuntimeError(
+                f"The WarmActorPool {repr(self._name)} cannot be shut down while it is being used by a Problem object."
+            )
+        if self._actors is not None:
+            for actor in self._actors:
+                ray.kill(actor)
+            self._actors = None
+        if _warm_actor_pools.get(self._name) is self:
+            del _warm_actor_pools[self._name]
+
+
+def _multiprocessing_worker_main(
+    pickled_problem: bytes,
+    index: int,
+    seeds: tuple,
+    state: dict,
+    commands: torch.multiprocessing.Queue,
+    results: torch.multiprocessing.Queue,
+):
+    # Entry point of a worker process of a MultiprocessingPool.
+    # Each message put into the `results` queue is a tuple (task_id, worker_index, success, payload), where the
+    # payload is the result of the task, or, in the case of an error, the formatted traceback.
+    try:
+        problem = pickle.loads(pickled_problem)
+        _initialize_remote_problem(problem, index, seeds, state)
+    except Exception:
+        results.put((None, index, False, traceback.format_exc()))
+        return
+    results.put((None, index, True, None))
+
+    # This SolutionBatch will be a view of the shared memory buffers of the main process
+    shared_batch: Optional[SolutionBatch] = None
+
+    while True:
+        command = commands.get()
+        kind = command[0]
+        if kind == "stop":
+            break
+
+        task_id = command[1]
+        try:
+            if kind == "buffers":
+                values, evdata = command[2:]
+                shared_batch = SolutionBatch(problem, values.shape[0], device="cpu", empty=True)
+                shared_batch._data = values
+                shared_batch._evdata = evdata
+                result = None
+            elif kind == "evaluate":
+                row_begin, row_end = command[2:]
+                # The evaluation results are written directly into the shared memory
+                problem.evaluate(shared_batch[row_begin:row_end])
+                result = None
+            elif kind == "call":
+                method_name, args, kwargs = command[2:]
+                result = getattr(problem, method_name)(*args, **kwargs)
+            else:
+                raise ValueError(f"Unknown command: {repr(kind)}")
+        except Exception:
+            results.put((task_id, index, False, traceback.format_exc()))
+        else:
+            results.put((task_id, index, True, result))
+
+
+class MultiprocessingPool:
+    """
+    A pool of local worker processes, serving as an alternative to the ray
+    actors for parallelizing the evaluations of a Problem.
+
+    Each worker process stores its own copy of the Problem object, which is
+    prepared in the same way a ray actor prepares its copy (i.e. the seeds
+    are set, the remote states are loaded, and the `remote_hook` is called).
+
+    The decision values of the population and the evaluation results are
+    kept in shared memory buffers, which are sent to the workers only when
+    they need to grow. Therefore, to evaluate a population, the main
+    process only copies the decision values into the shared memory, and
+    sends to each worker the range of rows it is responsible for.
+    The workers then write the evaluation results directly into the shared
+    memory.
+
+    An instance of this class is not meant to be created manually.
+    Instead, a Problem object creates it when it is initialized with
+    `parallel_backend="multiprocessing"`, and when its parallelization is
+    triggered.
+    """
+
+    def __init__(
+        self,
+        problem: "Problem",
+        seeds: list,
+        states: list,
+        *,
+        start_method: Optional[str] = None,
+        poll_interval: float = 1.0,
+    ):
+        """
+        `__init__(...)`: Initialize the MultiprocessingPool.
+
+        Args:
+            problem: The Problem object to be copied into the worker processes.
+            seeds: A list of seed tuples, one per worker.
+            states: A list of state dictionaries, one per worker, to be
+                loaded by the Problem copies of the workers.
+            start_method: The start method of the worker processes
+                (e.g. "fork", "spawn", "forkserver"). If left as None,
+                the default start method of the platform is used.
+            poll_interval: The interval (in seconds) in which the liveness
+                of the workers is checked while waiting for their results.
+        """
+        num_workers = len(seeds)
+        context = torch.multiprocessing.get_context(start_method)
+        pickled_problem = cloudpickle.dumps(problem)
+
+        self._poll_interval = float(poll_interval)
+        self._results = context.Queue()
+        self._commands = [context.Queue() for _ in range(num_workers)]
+        self._processes = [
+            context.Process(
+                target=_multiprocessing_worker_main,
+                args=(pickled_problem, i, seeds[i], states[i], self._commands[i], self._results),
+                daemon=True,
+            )
+            for i in range(num_workers)
+        ]
+        for process in self._processes:
+            process.start()
+
+        self._next_task_id = 0
+        self._values: Optional[torch.Tensor] = None
+        self._evdata: Optional[torch.Tensor] = None
+
+        # Wait until all the workers are initialized
+        for _ in range(num_workers):
+            self._get_result()
+
+    def __len__(self) -> int:
+        return len(self._processes)
+
+    def _get_result(self) -> tuple:
+        while True:
+            try:
+                task_id, worker_index, success, payload = self._results.get(timeout=self._poll_interval)
+                break
+            except Empty:
+                for i, process in enumerate(self._processes):
+                    if not process.is_alive():
+                        raise RuntimeError(f"The worker process {i} has terminated unexpectedly")
+        if not success:
+            raise RuntimeError(f"The following error occurred in the worker process {worker_index}:\n{payload}")
+        return task_id, worker_index, payload
+
+    def _submit(self, worker_index: int, kind: str, *args) -> int:
+        task_id = self._next_task_id
+        self._next_task_id += 1
+        self._commands[worker_index].put((kind, task_id, *args))
+        return task_id
+
+    def _run_on_all(self, kind: str, *args) -> list:
+        # Run the same command on each worker, and return the results, the i-th result belonging to the i-th worker
+        waiting = {self._submit(i, kind, *args): i for i in range(len(self))}
+        results = [None] * len(self)
+        while len(waiting) > 0:
+            task_id, _, result = self._get_result()
+            if task_id in waiting:
+                results[waiting.pop(task_id)] = result
+        return results
+
+    def _run(self, kind: str, args_per_task: list) -> list:
+        # Run the given tasks, each time giving the next task to the next idle worker.
+        # The results are returned in the order of the tasks.
+        results = [None] * len(args_per_task)
+        pending = list(reversed(list(enumerate(args_per_task))))
+        idle_workers = list(range(len(self)))
+        running = {}
+        while (len(pending) > 0) or (len(running) > 0):
+            while (len(pending) > 0) and (len(idle_workers) > 0):
+                i, args = pending.pop()
+                running[self._submit(idle_workers.pop(), kind, *args)] = i
+            task_id, worker_index, result = self._get_result()
+            if task_id in running:
+                results[running.pop(task_id)] = result
+                idle_workers.append(worker_index)
+        return results
+
+    def call_all(self, method_name: str, args: list, kwargs: dict) -> list:
+        """
+        Call a method on the Problem copy of each worker.
+
+        Args:
+            method_name: Name of the method.
+            args: Positional arguments to be passed to the method.
+            kwargs: Keyword arguments to be passed to the method.
+        Returns:
+            A list whose i-th element is the result of the i-th worker.
+        """
+        return self._run_on_all("call", method_name, args, kwargs)
+
+    def map_calls(self, method_name: str, args_and_kwargs: list) -> list:
+        """
+        Call a method of the Problem copies, once for each given pair of
+        arguments, distributing the calls across the workers.
+
+        Args:
+            method_name: Name of the method.
+            args_and_kwargs: A list of tuples, each tuple being in the form
+                `(args, kwargs)`, `args` being a list of positional arguments
+                and `kwargs` being a dictionary of keyword arguments.
+        Returns:
+            A list whose i-th element is the result of the i-th call.
+        """
+        return self._run("call", [(method_name, args, kwargs) for args, kwargs in args_and_kwargs])
+
+    def _ensure_buffers(self, batch: "SolutionBatch"):
+        num_solutions = len(batch)
+        values_shape = tuple(batch._data.shape[1:])
+        evdata_shape = tuple(batch._evdata.shape[1:])
+
+        if (
+            (self._values is not None)
+            and (self._values.shape[0] >= num_solutions)
+            and (tuple(self._values.shape[1:]) == values_shape)
+            and (tuple(self._evdata.shape[1:]) == evdata_shape)
+            and (self._values.dtype == batch._data.dtype)
+            and (self._evdata.dtype == batch._evdata.dtype)
+        ):
+            return
+
+        self._values = torch.empty((num_solutions,) + values_shape, dtype=batch._data.dtype).share_memory_()
+        self._evdata = torch.empty((num_solutions,) + evdata_shape, dtype=batch._evdata.dtype).share_memory_()
+        self._run_on_all("buffers", self._values, self._evdata)
+
+    def evaluate(self, batch: "SolutionBatch", pieces: "SolutionBatchPieces"):
+        """
+        Evaluate the given SolutionBatch using the worker processes.
+
+        Args:
+            batch: The SolutionBatch to be evaluated. Its decision values
+                must be stored by a tensor (i.e. its dtype cannot be
+                `object`).
+            pieces: The pieces of the batch, each piece to be evaluated
+                by a worker. The worker processes receive only the row
+                ranges of the pieces, and read and write the shared memory.
+        """
+        num_solutions = len(batch)
+        self._ensure_buffers(batch)
+        self._values[:num_solutions] = batch._data
+        self._run("evaluate", [pieces.indices_of(i) for i in range(len(pieces))])
+        batch._evdata[:] = self._evdata[:num_solutions]
+
+    def shutdown(self, timeout: float = 5.0):
+        """
+        Stop all the worker processes.
+
+        Args:
+            timeout: Number of seconds to wait for each worker to stop
+                gracefully, after which the worker is terminated.
+        """
+        for commands in self._commands:
+            commands.put(("stop",))
+        for process in self._processes:
+            process.join(timeout)
+            if process.is_alive():
+                process.terminate()
+        self._values = None
+        self._evdata = None
+
+
 class Problem(TensorMakerMixin):
     """
     Representation of a problem to be optimized.
@@ -413,9 +1318,27 @@ class Problem(TensorMakerMixin):
         actor_config: Optional[dict] = None,
         num_gpus_per_actor: Optional[Union[int, float, str]] = None,
         num_subbatches: Optional[int] = None,
-        subbatch_size: Optional[int] = None,
+        subbatch_size: Optional[Union[int, str]] = None,
         store_solution_stats: Optional[bool] = None,
         vectorized: bool = False,
+        eval_cache_size: Optional[int] = None,
+        parallel_backend: str = "ray",
+        num_threads: Optional[int] = None,
+        intra_op_threads: Optional[int] = None,
+        max_concurrency: Optional[int] = None,
+        eval_timeout: Optional[float] = None,
+        worker_addresses: Optional[Iterable[str]] = None,
+        worker_authkey: Optional[Union[str, bytes]] = None,
+        tasks_per_actor: int = 2,
+        throughput_aware: bool = False,
+        throughput_smoothing: float = 0.2,
+        speculative_execution: bool = False,
+        eval_deadline: Optional[float] = None,
+        deadline_penalty: Optional[Union[float, Iterable[float]]] = None,
+        actor_pool: Optional[Union[str, WarmActorPool]] = None,
+        threads_per_actor: Optional[Union[int, str]] = None,
+        pin_actors: bool = False,
+        scaling_policy: Optional[Callable[[dict], Optional[int]]] = None,
     ):
         """
         `__init__(...)`: Initialize the Problem object.
@@ -584,6 +1507,15 @@ class Problem(TensorMakerMixin):
                 remote actor for computing a gradient.
                 In distributed mode, it is expected that the population size
                 is divisible by `subbatch_size`.
+                `subbatch_size` can also be given as the string "auto",
+                in which case the sub-batch size is chosen and adapted
+                automatically, by measuring the per-task dispatch overhead
+                and the per-solution evaluation time, and by trying to
+                minimize the wall-clock time per generation (see
+                `evotorch.tools.SubbatchSizeTuner`). The chosen sub-batch
+                sizes are reported in the `status` dictionary.
+                In distributed mode with "auto", the population size does
+                not have to be divisible by the sub-batch size.
             store_solution_stats: Whether or not the problem object should
                 keep track of the best and worst solutions.
                 Can also be left as None (which is the default behavior),
@@ -593,6 +1525,206 @@ class Problem(TensorMakerMixin):
                 transfer between the cpu and a foreign computation device
                 (like the gpu) just for the sake of keeping the best and
                 the worst solutions.
+            eval_cache_size: If given as an integer `n`, the evaluation
+                results of the last `n` distinct solutions encountered
+                will be cached, and, whenever a solution with exactly the
+                same decision values is to be evaluated again (e.g. a
+                re-evaluated elite, or a duplicate within the same
+                population), its cached fitness(es) and evaluation data
+                will be reused instead of re-computing them.
+                Duplicates are detected in the main process before the
+                population is split and sent to the remote actors,
+                therefore, no actor re-computes an evaluation known
+                to the main process.
+                The numbers of cache hits and misses are reported in the
+                status dictionary of the problem object.
+                This is meant only for problems whose evaluation results
+                are deterministic.
+                If left as None (which is the default), no caching
+                will be done.
+            parallel_backend: The backend to be used for parallelization,
+                relevant only when `num_actors` is set.
+                The default is "ray", which means that the remote copies
+                of the problem will live in ray actors.
+                Alternatively, "multiprocessing" can be given, in which case
+                the remote copies of the problem will live in local worker
+                processes created via `torch.multiprocessing`, without
+                starting a ray cluster. With this backend, the decision
+                values and the evaluation results of the populations are
+                exchanged with the workers via shared memory, and only the
+                row ranges are sent to the workers.
+                The "multiprocessing" backend is limited to a single
+                computer, does not support GPU allocation (i.e. the
+                arguments `actor_config` and `num_gpus_per_actor`),
+                requires a numeric `dtype`, and does not support the
+                features which rely on the ray object store (e.g. the
+                asynchronous mode, tree reduction, and noise tables of the
+                distributed search algorithms, and the methods
+                `all_remote_problems()` and `all_remote_envs()`).
+                Another alternative is "socket", in which case the remote
+                copies of the problem will live in standalone worker
+                processes (started via `python -m evotorch.worker`,
+                possibly on other hosts), whose addresses are given via
+                `worker_addresses`. The "socket" backend has the same
+                limitations as the "multiprocessing" backend, except that
+                it also supports the `object` dtype.
+            num_threads: If given as an integer `n` greater than 1, the
+                solution batches will be evaluated by a pool of `n` threads
+                within the evaluating process (i.e. within the main process
+                if the problem is not parallelized, or within each remote
+                actor otherwise). Each solution batch to be evaluated is
+                split into `n` sub-batches, and each thread evaluates its
+                sub-batch via `_evaluate_batch(...)`, writing the results
+                into its own rows of the evaluation data.
+                This is useful for objective functions which are not
+                vectorized, but whose computations are dominated by
+                heavy PyTorch or NumPy kernels which release the GIL.
+                If left as None (which is the default), the solutions
+                are evaluated by the evaluating thread itself.
+            intra_op_threads: Only to be used together with `num_threads`.
+                Number of threads each evaluation thread can use for the
+                intra-op parallelism of PyTorch (see `torch.set_num_threads`).
+                If left as None, the number of intra-op threads available
+                to the evaluating process is divided equally among the
+                evaluation threads.
+                Because this is a process-wide setting of PyTorch, it is
+                applied only while a batch is being evaluated by the
+                threads, and the previous setting is restored afterwards.
+            max_concurrency: Relevant only for asynchronous objectives,
+                i.e. when `objective_func` is an `async def` function, or
+                when the method `_evaluate_async(...)` is overriden.
+                Such objectives are evaluated concurrently by an event loop
+                which lives as long as the problem object (so that, for
+                example, the connections opened by the objective can be
+                reused across evaluations), and `max_concurrency` is the
+                maximum number of evaluations allowed to be in progress at
+                the same time within the evaluating process.
+                If the problem is parallelized, each actor has its own
+                limit (i.e. with `n` actors, up to `n * max_concurrency`
+                evaluations can be in progress).
+                If left as None, there is no limit.
+            eval_timeout: Relevant only for asynchronous objectives.
+                The maximum number of seconds an evaluation of a single
+                solution (or, for a vectorized asynchronous objective, of
+                a batch) can take. If an evaluation does not finish in
+                time, `asyncio.TimeoutError` is raised.
+                If left as None, there is no timeout.
+            worker_addresses: Required when `parallel_backend` is "socket".
+                The addresses of the standalone workers, each address being
+                in the form "host:port" or "unix:/path/to/socket".
+                If `num_actors` is left as None, one remote copy of the
+                problem is created per address. If `num_actors` is given
+                as an integer, that many remote copies are created,
+                distributed across the addresses in a round-robin manner.
+            worker_authkey: The authentication key of the standalone
+                workers (relevant only when `parallel_backend` is "socket").
+            tasks_per_actor: Maximum number of tasks (e.g. sub-batches to
+                evaluate) which can be outstanding per actor at the same
+                time. With the default value 2, an actor receives its next
+                task while it is still working on its current one, so that
+                the round trip between the actor and the main process does
+                not leave the actor idle. This is especially helpful when
+                `subbatch_size` or `num_subbatches` is used for load
+                balancing, and the pieces are small. Setting this to 1
+                makes each actor wait for its result to be collected before
+                receiving its next task.
+                With the "socket" backend, this determines how many requests
+                are kept in flight per connection.
+            throughput_aware: If True, the main Problem object measures the
+                throughput (solutions per second, and simulator interactions
+                per second if the problem counts its interactions) of each
+                actor, and, when splitting the work without `subbatch_size`
+                or `num_subbatches`, gives each actor a share of the work
+                proportional to its throughput (and submits the tasks in
+                the order of their expected durations, longest first).
+                This is useful when the actors run on heterogeneous
+                hardware, or when the costs of the solutions differ
+                across the actors systematically.
+                The measured throughputs are reported in the `status`
+                dictionary as lists (one item per actor), under the keys
+                "actor_solutions_per_sec" and "actor_interactions_per_sec".
+                Supported only by the "ray" parallelization backend.
+            throughput_smoothing: The coefficient of the exponential moving
+                average used for tracking the throughputs of the actors
+                (relevant only when `throughput_aware` is True).
+                The closer this value is to 1, the more weight is given to
+                the most recent measurements.
+            speculative_execution: If True, when the last pieces of a
+                population are still being evaluated and some actors are
+                idle, copies of these outstanding pieces are given to the
+                idle actors, and whichever copy finishes first provides
+                the evaluation results. This mitigates the slowdown caused
+                by straggling actors. Supported only by the "ray"
+                parallelization backend.
+            eval_deadline: Optionally a per-generation deadline, in seconds.
+                When evaluating a population, the pieces which are not
+                evaluated within this many seconds are abandoned (at least
+                one piece is always waited for). The solutions of the
+                abandoned pieces receive `deadline_penalty` as their
+                evaluation results. If `deadline_penalty` is None, those
+                solutions are left unevaluated (i.e. with NaN evaluation
+                results), and the Gaussian search algorithms (e.g. SNES,
+                PGPE) leave them out of their gradient estimates.
+                In distributed mode (when the actors compute the
+                gradients), the gradients of the tasks which miss the
+                deadline are left out. The number of solutions missing the
+                deadline is reported in the `status` dictionary under the
+                key "eval_deadline_misses".
+                Supported only by the "ray" parallelization backend, and
+                cannot be used together with `eval_cache_size`.
+            deadline_penalty: The evaluation result to be assigned to the
+                solutions which miss `eval_deadline`. Can be a scalar, or
+                a sequence with one value per objective.
+            actor_pool: A `WarmActorPool`, or the name of a `WarmActorPool`.
+                If given, instead of creating its own actors, the problem
+                attaches itself to the actors of the pool when it is
+                parallelized (and detaches from them when `kill_actors()`
+                is called), so that the actors can be reused by the
+                Problem objects which follow. The number of actors is then
+                determined by the pool. If `num_actors` is given as an
+                integer, it must match the size of the pool.
+                Supported only by the "ray" parallelization backend, and
+                cannot be used together with `actor_config` and
+                `num_gpus_per_actor` (the actors being already created).
+            threads_per_actor: Number of CPU threads each remote actor (or
+                worker process) is allowed to use. If given, each actor
+                calls `torch.set_num_threads(...)` with this number, and
+                sets the environment variables `OMP_NUM_THREADS`,
+                `MKL_NUM_THREADS`, `OPENBLAS_NUM_THREADS`, and
+                `NUMEXPR_NUM_THREADS` (with the "ray" backend, these
+                environment variables are set already when the actor
+                process is started, so that they are in effect when the
+                libraries are imported).
+                Can also be given as "auto", in which case the available
+                CPUs (of the ray cluster, or of the local machine for the
+                "multiprocessing" backend) are divided equally among the
+                actors. When the number of actors changes (see
+                `resize_actors(...)`), the CPUs are divided again.
+                If left as None (which is the default), the actors are not
+                limited, which means that, with many actors, each of them
+                might try to use all the cores of the machine.
+            pin_actors: If True, each remote actor (or worker process) is
+                pinned (via `os.sched_setaffinity(...)`) to its own block
+                of `threads_per_actor` cores, the i-th actor getting the
+                i-th block. This assumes that the actors share a single
+                host. Requires `threads_per_actor`, and is supported only
+                on the platforms providing `os.sched_setaffinity`.
+            scaling_policy: Optionally a function which decides, before
+                each generation, how many actors the problem should have
+                (see `resize_actors(...)`). The function receives a
+                dictionary with the keys "num_actors" (the current number
+                of actors), "utilization" (the fraction of time the actors
+                were busy during the previous parallel operation),
+                "queue_wait" (the average number of seconds a task of
+                the previous parallel operation waited for a free actor),
+                "wall_time" (the duration of the previous parallel
+                operation, in seconds), and "num_tasks". The function is
+                expected to return the desired number of actors, or None
+                if no change is desired. These measurements are also
+                reported in the status dictionary under the keys
+                "num_actors", "actor_utilization", and "actor_queue_wait".
+                Supported only by the "ray" parallelization backend, and
+                cannot be used together with `actor_pool`.
         """
 
         # Set the dtype for the decision variables of the Problem
@@ -792,6 +1924,39 @@ class Problem(TensorMakerMixin):
         # Store the information which indicates whether or not the given objective function is vectorized
         self._vectorized: bool = bool(vectorized)
 
+        # Store the number of evaluation threads and their intra-op thread budgets.
+        # The thread pool itself is created when it is first needed, in the process which does the evaluations.
+        if (num_threads is not None) and (int(num_threads) < 1):
+            raise ValueError(f"`num_threads` was expected as None or as a positive integer, but got {num_threads}")
+        if (num_threads is None) and (intra_op_threads is not None):
+            raise ValueError("The argument `intra_op_threads` can only be used together with `num_threads`.")
+        if (intra_op_threads is not None) and (int(intra_op_threads) < 1):
+            raise ValueError(
+                f"`intra_op_threads` was expected as None or as a positive integer, but got {intra_op_threads}"
+            )
+        if (num_threads is None) or (int(num_threads) == 1):
+            # A single evaluation thread would not bring any benefit, so, we do not create a thread pool at all
+            self._num_threads: Optional[int] = None
+        else:
+            self._num_threads: Optional[int] = int(num_threads)
+        self._intra_op_threads: Optional[int] = None if intra_op_threads is None else int(intra_op_threads)
+        self._thread_pool: Optional[ThreadPoolExecutor] = None
+
+        # Store the configuration for asynchronous objectives.
+        # The event loop (and the semaphore which limits the concurrency) are created when they are first needed,
+        # in the process which does the evaluations.
+        if (max_concurrency is not None) and (int(max_concurrency) < 1):
+            raise ValueError(
+                f"`max_concurrency` was expected as None or as a positive integer, but got {max_concurrency}"
+            )
+        if (eval_timeout is not None) and (float(eval_timeout) <= 0):
+            raise ValueError(f"`eval_timeout` was expected as None or as a positive number, but got {eval_timeout}")
+        self._max_concurrency: Optional[int] = None if max_concurrency is None else int(max_concurrency)
+        self._eval_timeout: Optional[float] = None if eval_timeout is None else float(eval_timeout)
+        self._event_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._event_loop_finalizer: Optional[weakref.finalize] = None
+        self._async_semaphore: Optional[asyncio.Semaphore] = None
+
         # If the evaluation data length is explicitly stated, then convert it to an integer and store it.
         # Otherwise, store the evaluation data length as 0.
         self._eval_data_length = 0 if eval_data_length is None else int(eval_data_length)
@@ -807,10 +1972,177 @@ class Problem(TensorMakerMixin):
         # instance).
         self._actors: Optional[list] = None
 
-        # Initialize the variable that might store the ray ActorPool.
+        # Store the parallelization backend
+        if parallel_backend not in ("ray", "multiprocessing", "socket"):
+            raise ValueError(
+                f"Invalid value for `parallel_backend`: {repr(parallel_backend)}."
+                f" The acceptable values for `parallel_backend` are 'ray', 'multiprocessing', and 'socket'."
+            )
+        self._parallel_backend: str = parallel_backend
+
+        if parallel_backend != "ray":
+            # Make sure that the configuration does not require any of the features supported only by ray
+            if (actor_config is not None) or (num_gpus_per_actor is not None):
+                raise ValueError(
+                    f"The {repr(parallel_backend)} parallelization backend does not support the arguments"
+                    f" `actor_config` and `num_gpus_per_actor`. Please leave them as None, or use the `ray` backend."
+                )
+
+        if parallel_backend == "multiprocessing":
+            if isinstance(num_actors, str) and (num_actors not in ("max", "num_cpus")):
+                raise ValueError(
+                    f"With the `multiprocessing` parallelization backend, the acceptable string values for"
+                    f" `num_actors` are 'max' and 'num_cpus'. However, received {repr(num_actors)}."
+                )
+            if self._dtype is object:
+                raise ValueError("The `multiprocessing` parallelization backend requires a numeric `dtype`.")
+
+        if parallel_backend == "socket":
+            if worker_addresses is None:
+                raise ValueError("The `socket` parallelization backend requires the argument `worker_addresses`.")
+            if isinstance(num_actors, str):
+                raise ValueError(
+                    f"With the `socket` parallelization backend, `num_actors` is expected as None or as an integer."
+                    f" However, received {repr(num_actors)}."
+                )
+            worker_addresses = [str(address) for address in worker_addresses]
+            if len(worker_addresses) == 0:
+                raise ValueError("Received `worker_addresses` as an empty sequence.")
+            if num_actors is None:
+                num_actors = len(worker_addresses)
+        elif worker_addresses is not None:
+            raise ValueError(
+                "The argument `worker_addresses` can only be used with the `socket` parallelization backend."
+            )
+
+        if actor_pool is not None:
+            if (parallel_backend != "ray") or (actor_config is not None) or (num_gpus_per_actor is not None):
+                raise ValueError(
+                    "`actor_pool` is supported only by the `ray` parallelization backend,"
+                    " and cannot be used together with `actor_config` and `num_gpus_per_actor`."
+                )
+            if not isinstance(actor_pool, WarmActorPool):
+                actor_pool = WarmActorPool.get(actor_pool)
+            if (
+                (num_actors is not None)
+                and (not isinstance(num_actors, str))
+                and (int(num_actors) != actor_pool.num_actors)
+            ):
+                raise ValueError(
+                    f"`num_actors` was given as {num_actors},"
+                    f" but the WarmActorPool {repr(actor_pool.name)} has {actor_pool.num_actors} actors."
+                )
+            num_actors = actor_pool.num_actors
+
+        # Store the CPU thread budget of the remote actors
+        if (threads_per_actor is not None) and (threads_per_actor != "auto"):
+            if isinstance(threads_per_actor, str) or (int(threads_per_actor) < 1):
+                raise ValueError(
+                    f"`threads_per_actor` was expected as None, as a positive integer, or as the string 'auto'."
+                    f" However, received {repr(threads_per_actor)}."
+                )
+            threads_per_actor = int(threads_per_actor)
+        if pin_actors:
+            if threads_per_actor is None:
+                raise ValueError("`pin_actors` can only be used together with `threads_per_actor`.")
+            if not hasattr(os, "sched_setaffinity"):
+                raise ValueError("`pin_actors` is not supported on this platform (`os.sched_setaffinity` is missing).")
+        if (parallel_backend == "socket") and (pin_actors or (threads_per_actor == "auto")):
+            raise ValueError(
+                "With the `socket` parallelization backend, the workers run on other hosts, so, `pin_actors` and"
+                " `threads_per_actor='auto'` are not supported. `threads_per_actor` can be given as an integer."
+            )
+        self._threads_per_actor: Optional[Union[int, str]] = threads_per_actor
+        self._pin_actors = bool(pin_actors)
+
+        # The number of threads each remote actor is allowed to use, determined when the actors are created
+        self._actor_num_threads: Optional[int] = None
+
+        # The identity of the main process, recorded when the actors are created
+        self._main_process: Optional[tuple] = None
+
+        # Store the policy which resizes the set of actors between generations (if any)
+        if (scaling_policy is not None) and ((parallel_backend != "ray") or (actor_pool is not None)):
+            raise ValueError(
+                "`scaling_policy` is supported only by the `ray` parallelization backend,"
+                " and cannot be used together with `actor_pool`."
+            )
+        self._scaling_policy: Optional[Callable[[dict], Optional[int]]] = scaling_policy
+
+        # The gradient tasks started via `start_gradient_task(...)` which are not yet collected (the actors cannot
+        # be resized while there are such tasks)
+        self._running_gradient_tasks: set = set()
+
+        # Store the name of the pool of reusable actors (if any)
+        self._actor_pool_name: Optional[str] = None if actor_pool is None else actor_pool.name
+
+        # Store the addresses and the authentication key of the standalone workers (used only by the `socket` backend)
+        self._worker_addresses: Optional[list] = None if worker_addresses is None else list(worker_addresses)
+        self._worker_authkey: Optional[Union[str, bytes]] = worker_authkey
+
+        # Store the maximum number of outstanding tasks per actor
+        if int(tasks_per_actor) < 1:
+            raise ValueError(f"`tasks_per_actor` was expected as a positive integer, but got {tasks_per_actor}")
+        self._tasks_per_actor = int(tasks_per_actor)
+
+        # Store the configuration of the throughput-aware work splitting
+        self._throughput_aware = bool(throughput_aware)
+        if self._throughput_aware and (parallel_backend != "ray"):
+            raise ValueError(
+                f"`throughput_aware` is supported only by the `ray` parallelization backend,"
+                f" but the parallelization backend is {repr(parallel_backend)}."
+            )
+        self._throughput_smoothing = float(throughput_smoothing)
+        if not (0.0 < self._throughput_smoothing <= 1.0):
+            raise ValueError(
+                f"`throughput_smoothing` was expected as a number within (0, 1], but got {throughput_smoothing}"
+            )
+
+        # Exponential moving averages of the solutions per second and the interactions per second of the actors.
+        # These lists are created when the actors are created.
+        self._actor_solution_rates: Optional[list] = None
+        self._actor_interaction_rates: Optional[list] = None
+
+        # Store the configuration of the straggler mitigation
+        self._speculative_execution = bool(speculative_execution)
+        self._eval_deadline: Optional[float] = None if eval_deadline is None else float(eval_deadline)
+        if (self._eval_deadline is not None) and (self._eval_deadline <= 0):
+            raise ValueError(f"`eval_deadline` was expected as a positive number, but got {eval_deadline}")
+        if (self._speculative_execution or (self._eval_deadline is not None)) and (
+            (parallel_backend != "ray") or self._throughput_aware
+        ):
+            raise ValueError(
+                "`speculative_execution` and `eval_deadline` are supported only by the `ray` parallelization backend,"
+                " and cannot be used together with `throughput_aware`."
+            )
+        if (self._eval_deadline is not None) and (eval_cache_size is not None):
+            raise ValueError("`eval_deadline` cannot be used together with `eval_cache_size`.")
+        if (deadline_penalty is not None) and (self._eval_deadline is None):
+            raise ValueError("`deadline_penalty` can only be used together with `eval_deadline`.")
+        self._deadline_penalty = deadline_penalty
+
+        # Number of solutions which missed the evaluation deadline in the last operation
+        self._num_deadline_misses: int = 0
+
+        # Initialize the variable that might store the pool of workers which are not ray actors.
+        # If the problem is configured to be parallelized via the `multiprocessing` or the `socket` backend and the
+        # parallelization is triggered, then this variable will store the MultiprocessingPool or the SocketWorkerPool.
+        self._worker_pool: Optional[Union[MultiprocessingPool, SocketWorkerPool]] = None
+
+        # Initialize the variable that might store the pool of ray actors.
         # If the problem is configured to be parallelized and the parallelization is triggered, then this variable
-        # will store the ray ActorPool that is generated out of the remote actors.
-        self._actor_pool: Optional[ActorPool] = None
+        # will store the PipelinedActorPool that is generated out of the remote actors.
+        self._actor_pool: Optional[PipelinedActorPool] = None
+
+        # Initialize the dictionary which will store the most recent synchronization data received from each remote
+        # actor, when the remote actors are working asynchronously (see `start_gradient_task(...)`).
+        self._latest_sync_data_from_actors: dict = {}
+
+        # Initialize the variables which might store a NoiseTable shared via the ray object store.
+        # In the main process, `_shared_noise_table` stores the tuple (noise_table, object_ref).
+        # In a remote actor, `_received_noise_table` stores the tuple (object_ref, noise_table).
+        self._shared_noise_table: Optional[tuple] = None
+        self._received_noise_table: Optional[tuple] = None
 
         # Store the ray actor configuration dictionary provided by the user (if any).
         # When (or if) the parallelization is triggered, each actor will be created with this given configuration.
@@ -829,7 +2161,20 @@ class Problem(TensorMakerMixin):
                 f" Having both of them as values other than None cannot be accepted."
             )
         self._num_subbatches: Optional[int] = None if num_subbatches is None else int(num_subbatches)
-        self._subbatch_size: Optional[int] = None if subbatch_size is None else int(subbatch_size)
+        if isinstance(subbatch_size, str):
+            # The sub-batch size is to be tuned automatically
+            if subbatch_size != "auto":
+                raise ValueError(
+                    f"The only acceptable string value for `subbatch_size` is 'auto'. However, received"
+                    f" {repr(subbatch_size)}."
+                )
+            if self._throughput_aware:
+                raise ValueError("`subbatch_size='auto'` cannot be used together with `throughput_aware=True`.")
+            self._subbatch_size: Optional[int] = None
+            self._subbatch_tuner: Optional[SubbatchSizeTuner] = SubbatchSizeTuner()
+        else:
+            self._subbatch_size: Optional[int] = None if subbatch_size is None else int(subbatch_size)
+            self._subbatch_tuner: Optional[SubbatchSizeTuner] = None
 
         # Initialize the additional states to be loaded by the remote actor as None.
         # If there are such additional states for remote actors, the inheriting class can fill this as a list
@@ -868,7 +2213,11 @@ class Problem(TensorMakerMixin):
                 # If the `num_actors` argument was given as "max" or as "num_cpus", then we first read how many CPUs
                 # are available in the ray cluster, then convert it to integer (via computing its ceil value), and
                 # finally set `_num_actors` as this integer.
-                self._num_actors = math.ceil(get_ray_resource("CPU"))
+                # With the `multiprocessing` backend, the number of CPUs of the local computer is used instead.
+                if self._parallel_backend == "multiprocessing":
+                    self._num_actors = os.cpu_count()
+                else:
+                    self._num_actors = math.ceil(get_ray_resource("CPU"))
             elif num_actors == "num_gpus":
                 # If the `num_actors` argument was given as "num_gpus", then we first read how many GPUs are
                 # available in the ray cluster.
@@ -978,8 +2327,10 @@ class Problem(TensorMakerMixin):
             # number of actors.
             self._num_actors = int(num_actors)
 
-        if self._num_actors == 1:
+        if (self._num_actors == 1) and (self._parallel_backend != "socket") and (self._actor_pool_name is None):
             # Creating a single actor does not bring any benefit of parallelization.
+            # (With the `socket` backend, however, a single remote copy of the problem still makes sense, since its
+            # purpose might be to move the evaluations to another host.)
             # Therefore, at the end of all the computations above regarding the number of actors, if it turns out
             # that the target number of actors is 1, we reduce it to 0 (meaning that no actor will be initialized).
             self._num_actors = 0
@@ -1050,10 +2401,37 @@ class Problem(TensorMakerMixin):
         self._before_eval_hook: Hook = Hook()
         self._after_eval_hook: Hook = Hook([self._get_best_and_worst])
         self._after_eval_status: dict = {}
+
+        # Initialize the evaluation cache, if requested
+        if eval_cache_size is None:
+            self._eval_cache: Optional[EvaluationCache] = None
+        else:
+            self._eval_cache: Optional[EvaluationCache] = EvaluationCache(eval_cache_size)
+            self._after_eval_hook.append(self._get_eval_cache_status)
         self._remote_hook: Hook = Hook()
         self._before_grad_hook: Hook = Hook()
         self._after_grad_hook: Hook = Hook()
 
+        # Report the throughputs of the actors, if they are tracked
+        if self._throughput_aware:
+            self._after_eval_hook.append(self._get_throughput_status)
+            self._after_grad_hook.append(self._get_throughput_status)
+
+        # Report the decisions of the sub-batch size tuner, if there is one
+        if self._subbatch_tuner is not None:
+            self._after_eval_hook.append(self._get_subbatch_tuner_status)
+            self._after_grad_hook.append(self._get_subbatch_tuner_status)
+
+        # Report the number of solutions missing the evaluation deadline, if there is one
+        if self._eval_deadline is not None:
+            self._after_eval_hook.append(self._get_deadline_status)
+            self._after_grad_hook.append(self._get_deadline_status)
+
+        # Report the measurements which drive the scaling policy, if there is one
+        if self._scaling_policy is not None:
+            self._after_eval_hook.append(self._get_scaling_status)
+            self._after_grad_hook.append(self._get_scaling_status)
+
         # Initialize various stats regarding the solutions encountered by this Problem instance.
         self._store_solution_stats = None if store_solution_stats is None else bool(store_solution_stats)
         self._best: Optional[list] = None
@@ -1426,17 +2804,77 @@ class Problem(TensorMakerMixin):
         if self._actor_index is not None:
             return
 
-        # If the actors list is not None, then this means
-        # that the initialization of the parallelization mechanism
-        # was already completed. So, leave this function.
-        if self._actors is not None:
+        # If the actors list (or the pool of worker processes) is not None,
+        # then this means that the initialization of the parallelization
+        # mechanism was already completed. So, leave this function.
+        if self._has_actors():
             return
 
-        # Make sure that ray is initialized
-        ensure_ray()
         number_of_actors = self._num_actors
 
-        # numpy's RandomState uses 32-bit unsigned integers
+        all_seeds = self._make_actor_seeds(number_of_actors)
+        self._main_process = _process_identity()
+
+        # Determine the CPU thread budget of each remote actor (to be applied by the actors themselves)
+        self._actor_num_threads = self._compute_actor_num_threads(number_of_actors)
+
+        if self._remote_states is None:
+            remote_states = [{} for _ in range(number_of_actors)]
+        else:
+            remote_states = self._remote_states
+
+        if self._parallel_backend == "multiprocessing":
+            # Create the worker processes, each with a unique seed.
+            self._worker_pool = MultiprocessingPool(self, all_seeds, remote_states)
+            self._remote_states = None
+            return
+
+        if self._parallel_backend == "socket":
+            # Connect to the standalone workers, distributing the remote copies across the addresses.
+            addresses = [self._worker_addresses[i % len(self._worker_addresses)] for i in range(number_of_actors)]
+            self._worker_pool = SocketWorkerPool(
+                self,
+                addresses,
+                all_seeds,
+                remote_states,
+                authkey=self._worker_authkey,
+                max_in_flight=self._tasks_per_actor,
+            )
+            self._remote_states = None
+            return
+
+        # Make sure that ray is initialized
+        ensure_ray()
+
+        # Prepare the necessary actor config
+        config_per_actor = self._make_actor_options()
+
+        if self._actor_pool_name is not None:
+            # Reuse the actors of the pool, which only have to load this problem and reseed themselves
+            actors = WarmActorPool.get(self._actor_pool_name)._attach(self, all_seeds, remote_states)
+        else:
+            # The problem object is serialized and put into the ray object store only once, and all the actors
+            # receive it from there (instead of receiving their own serialized copies).
+            problem_ref = ray.put(self)
+
+            # Generate the actors, each with a unique seed.
+            actors = [
+                EvaluationActor.options(**config_per_actor).remote(problem_ref, i, all_seeds[i], remote_states[i])
+                for i in range(number_of_actors)
+            ]
+
+        self._actors = actors
+        self._actor_pool = PipelinedActorPool(self._actors, tasks_per_actor=self._tasks_per_actor)
+        self._remote_states = None
+
+        if self._throughput_aware:
+            self._actor_solution_rates = [None] * number_of_actors
+            self._actor_interaction_rates = [None] * number_of_actors
+
+    def _make_actor_seeds(self, num_actors: int) -> list:
+        # Generate the seeds (see `ActorSeeds`) of the given number of remote actors
+
+        # numpy's RandomState uses 32-bit unsigned integers
         # for random seeds.
         # So, the following value is the exclusive upper bound
         # for a random seed.
@@ -1456,37 +2894,206 @@ class Problem(TensorMakerMixin):
 
         all_seeds = []
         j = 0
-        for i in range(number_of_actors):
+        for i in range(num_actors):
             actor_seeds = []
             for _ in range(4):
                 actor_seeds.append(generate_actor_seed(j))
                 j += 1
             all_seeds.append(tuple(actor_seeds))
 
-        if self._remote_states is None:
-            remote_states = [{} for _ in range(number_of_actors)]
-        else:
-            remote_states = self._remote_states
+        return all_seeds
 
-        # Prepare the necessary actor config
+    def _compute_actor_num_threads(self, number_of_actors: int) -> Optional[int]:
+        # Compute the CPU thread budget of each remote actor, dividing the available CPUs equally among the actors
+        # if `threads_per_actor` is "auto"
+        if self._threads_per_actor != "auto":
+            return self._threads_per_actor
+        if self._parallel_backend == "ray":
+            ensure_ray()
+            num_cpus = ray.cluster_resources().get("CPU", os.cpu_count())
+        else:
+            num_cpus = os.cpu_count()
+        return max(1, int(num_cpus) // number_of_actors)
+
+    def _use_thread_budget(self, num_threads: int):
+        # Adopt a new CPU thread budget in this remote copy of the problem (see `resize_actors(...)`).
+        # As in `_initialize_remote_problem(...)`, the budget is not applied if this copy lives in the main process.
+        self._actor_num_threads = num_threads
+        if _process_identity() != self._main_process:
+            _apply_thread_budget(num_threads, self._actor_index if self._pin_actors else None)
+
+    def _make_actor_options(self) -> dict:
+        # Prepare the keyword arguments to be passed to the options(...) used when creating the ray actors
         config_per_actor = {}
         if self._actor_config is not None:
             config_per_actor.update(self._actor_config)
         if isinstance(self._num_gpus_per_actor, (int, float)):
             config_per_actor["num_gpus"] = self._num_gpus_per_actor
+        if self._actor_num_threads is not None:
+            # Let the thread-related environment variables be in effect already when the actor imports its libraries
+            runtime_env = dict(config_per_actor.get("runtime_env", {}))
+            env_vars = dict(runtime_env.get("env_vars", {}))
+            for var in _THREAD_ENV_VARS:
+                env_vars.setdefault(var, str(self._actor_num_threads))
+            runtime_env["env_vars"] = env_vars
+            config_per_actor["runtime_env"] = runtime_env
+        return config_per_actor
+
+    def resize_actors(self, num_actors: int):
+        """
+        Grow or shrink the set of remote actors.
+
+        This method is meant to be called between generations, for example
+        when the cluster gains or loses CPUs during a long run. It is also
+        called automatically (before each generation) when the problem
+        is configured with a `scaling_policy`.
+
+        When growing, the new actors receive a copy of this problem object
+        (put into the ray object store once), their own seeds (see
+        `ActorSeeds`), and the current synchronization data (see
+        `_make_sync_data_for_actors()`).
+        When shrinking, the actors with the highest indices are retired:
+        their unfinished tasks (e.g. the tasks which were abandoned because
+        of `eval_deadline`) are waited for, their final synchronization
+        data is passed to `_use_sync_data_from_retired_actors(...)`, and
+        then they are killed.
+
+        If `threads_per_actor` is "auto", the thread budget is recomputed
+        for the new number of actors. The new actors start with the new
+        budget, and the remaining actors adopt it via
+        `torch.set_num_threads(...)` (and are re-pinned to their new blocks
+        of cores, if `pin_actors` is True). The libraries which read the
+        thread-related environment variables only once, when they are
+        imported, keep the budget with which their actor was started.
+
+        The actors cannot be resized while there are gradient tasks
+        started via `start_gradient_task(...)` which are not yet collected
+        via `wait_gradient_tasks(...)` or `drain_gradient_tasks(...)`.
+        Therefore, resizing is not possible in the middle of an
+        asynchronous search.
+
+        Supported only by the "ray" parallelization backend, and not
+        supported when the actors belong to a `WarmActorPool`.
+
+        Args:
+            num_actors: The new number of actors, as a positive integer.
+        """
+        if not self.is_main:
+            raise RuntimeError(
+                "The method `resize_actors()` can only be used on the main (i.e. non-remote) Problem instance."
+                " However, this Problem instance is on a remote actor."
+            )
+        if (self._parallel_backend != "ray") or (self._actor_pool_name is not None):
+            raise RuntimeError(
+                "The method `resize_actors()` is supported only by the `ray` parallelization backend,"
+                " and only when the actors do not belong to a WarmActorPool."
+            )
+        num_actors = int(num_actors)
+        if num_actors < 1:
+            raise ValueError(f"`num_actors` was expected as a positive integer, but got {num_actors}")
+        if len(self._running_gradient_tasks) > 0:
+            raise RuntimeError(
+                f"The actors cannot be resized while there are gradient tasks running on them"
+                f" (number of running gradient tasks: {len(self._running_gradient_tasks)})."
+                f" Such tasks exist, for example, in the middle of an asynchronous search."
+            )
 
-        # Generate the actors, each with a unique seed.
-        if config_per_actor is None:
-            actors = [EvaluationActor.remote(self, i, all_seeds[i], remote_states[i]) for i in range(number_of_actors)]
+        self._parallelize()
+        if self._actors is None:
+            raise RuntimeError(
+                "The method `resize_actors()` can only be used on a parallelized Problem instance."
+                " Please make sure that the problem is created with `num_actors` greater than 0."
+            )
+
+        current = len(self._actors)
+        if num_actors == current:
+            return
+
+        previous_num_threads = self._actor_num_threads
+        self._actor_num_threads = self._compute_actor_num_threads(num_actors)
+
+        if num_actors > current:
+            self._update_thread_budget_of_actors(previous_num_threads)
+            self._add_actors(num_actors - current)
         else:
-            actors = [
-                EvaluationActor.options(**config_per_actor).remote(self, i, all_seeds[i], remote_states[i])
-                for i in range(number_of_actors)
-            ]
+            self._retire_actors(current - num_actors)
+            self._update_thread_budget_of_actors(previous_num_threads)
+
+        self._num_actors = len(self._actors)
+        if self._actor_solution_rates is not None:
+            self._actor_solution_rates = (self._actor_solution_rates + [None] * num_actors)[:num_actors]
+            self._actor_interaction_rates = (self._actor_interaction_rates + [None] * num_actors)[:num_actors]
+
+        # The measurements made with the previous set of actors are not relevant anymore
+        self._actor_pool.clear_metrics()
+
+    def _update_thread_budget_of_actors(self, previous_num_threads: Optional[int]):
+        # Let the existing actors adopt the current thread budget, if it has changed
+        if self._actor_num_threads != previous_num_threads:
+            ray.get(_call_on_actors(self._actors, "_use_thread_budget", [self._actor_num_threads], {}))
+
+    def _add_actors(self, n: int):
+        first_index = len(self._actors)
+        all_seeds = self._make_actor_seeds(n)
+
+        # While the actors list is detached from this object, pickling does not query the existing actors for their
+        # states. The new actors start with the state given by `_make_pickle_data_for_new_actor()`.
+        actors, self._actors = self._actors, None
+        try:
+            problem_ref = ray.put(self)
+        finally:
+            self._actors = actors
+        state = self._make_pickle_data_for_new_actor()
+
+        config_per_actor = self._make_actor_options()
+        new_actors = [
+            EvaluationActor.options(**config_per_actor).remote(problem_ref, first_index + i, all_seeds[i], state)
+            for i in range(n)
+        ]
+
+        # The new actors receive the current synchronization data
+        to_send = self._make_sync_data_for_actors()
+        if (to_send is not NotImplemented) and (to_send is not None):
+            ray.get(_call_on_actors(new_actors, "_use_sync_data_from_main", [to_send], {}))
+
+        self._actors = self._actors + new_actors
+        self._actor_pool.add_actors(new_actors)
+
+    def _retire_actors(self, n: int):
+        first_retired = len(self._actors) - n
+        retired = self._actor_pool.remove_actors(n)
+        self._actors = self._actors[:first_retired]
+
+        # The final synchronization data of the retired actors is received once, so that their contributions
+        # (e.g. their counters) are not lost
+        received = ray.get(_call_on_actors(retired, "_make_sync_data_for_main", [], {}))
+        if received[0] is not NotImplemented:
+            self._use_sync_data_from_retired_actors(received)
+        for actor_index in range(first_retired, first_retired + n):
+            self._latest_sync_data_from_actors.pop(actor_index, None)
+
+        for actor in retired:
+            ray.kill(actor)
 
-        self._actors = actors
-        self._actor_pool = ActorPool(self._actors)
-        self._remote_states = None
+    def _apply_scaling_policy(self):
+        # Before a generation, let the scaling policy (if any) decide the number of actors according to the
+        # measurements of the previous generation
+        if (self._scaling_policy is None) or (not self.is_main) or (self._actor_pool is None):
+            return
+        metrics = self._actor_pool.metrics
+        if metrics is None:
+            return
+        target = self._scaling_policy(dict(metrics, num_actors=len(self._actors)))
+        if (target is not None) and (int(target) != len(self._actors)):
+            self.resize_actors(int(target))
+
+    def _get_scaling_status(self, result: Any) -> dict:
+        metrics = None if self._actor_pool is None else self._actor_pool.metrics
+        return {
+            "num_actors": None if self._actors is None else len(self._actors),
+            "actor_utilization": None if metrics is None else metrics["utilization"],
+            "actor_queue_wait": None if metrics is None else metrics["queue_wait"],
+        }
 
     def all_remote_problems(self) -> AllRemoteProblems:
         """
@@ -1514,6 +3121,10 @@ class Problem(TensorMakerMixin):
                 " Problem instance."
                 " However, this Problem instance is on a remote actor."
             )
+        if self._worker_pool is not None:
+            raise RuntimeError(
+                f"The method `all_remote_problems()` is not supported by the {repr(self._parallel_backend)} backend."
+            )
         return AllRemoteProblems(self._actors)
 
     def all_remote_envs(self) -> AllRemoteEnvs:
@@ -1549,6 +3160,10 @@ class Problem(TensorMakerMixin):
                 " Problem instance."
                 " However, this Problem instance is on a remote actor."
             )
+        if self._worker_pool is not None:
+            raise RuntimeError(
+                f"The method `all_remote_envs()` is not supported by the {repr(self._parallel_backend)} backend."
+            )
         return AllRemoteEnvs(self._actors)
 
     def kill_actors(self):
@@ -1557,6 +3172,8 @@ class Problem(TensorMakerMixin):
 
         One might use this method to release the resources used by the
         remote actors.
+        The event loop used for evaluating asynchronous objectives (if any)
+        is also stopped.
         """
         if not self.is_main:
             raise RuntimeError(
@@ -1564,10 +3181,37 @@ class Problem(TensorMakerMixin):
                 " Problem instance."
                 " However, this Problem instance is on a remote actor."
             )
-        for actor in self._actors:
-            ray.kill(actor)
+        if self._worker_pool is not None:
+            self._worker_pool.shutdown()
+            self._worker_pool = None
+        if self._actors is not None:
+            if self._actor_pool_name is not None:
+                # The actors belong to a WarmActorPool. We do not kill them, we only detach from them.
+                WarmActorPool.get(self._actor_pool_name)._detach(self)
+            else:
+                for actor in self._actors:
+                    ray.kill(actor)
         self._actors = None
         self._actor_pool = None
+        self._actor_solution_rates = None
+        self._actor_interaction_rates = None
+        self._close_event_loop()
+
+    def warm_up(self):
+        """
+        Prepare the problem for evaluation before the first generation.
+
+        If the problem is configured to be parallelized, the remote actors
+        are created (or, if `actor_pool` was given, the problem attaches
+        itself to the actors of the pool), and each remote copy of the
+        problem is prepared (e.g. a reinforcement learning problem creates
+        its environments). Without this call, these preparations happen
+        while the first population is being evaluated.
+        """
+        self._parallelize()
+        if self.is_main and self._has_actors():
+            self._call_on_all_actors("_start_preparations", [], {})
+        self._start_preparations()
 
     @property
     def num_actors(self) -> int:
@@ -1578,6 +3222,13 @@ class Problem(TensorMakerMixin):
         """
         return self._num_actors
 
+    @property
+    def parallel_backend(self) -> str:
+        """
+        The parallelization backend of the problem, "ray" or "multiprocessing"
+        """
+        return self._parallel_backend
+
     @property
     def actors(self) -> Optional[list]:
         """
@@ -1722,6 +3373,54 @@ class Problem(TensorMakerMixin):
         """
         pass
 
+    def _use_sync_data_from_actor(self, actor_index: int, received: Any):
+        """
+        Override this function for providing synchronization between
+        the main process and the remote actors, when the remote actors
+        are working asynchronously (see `start_gradient_task(...)`).
+
+        The responsibility of this function is to update the state
+        of the main Problem object according to the synchronization
+        data received from a single remote actor.
+
+        The default implementation keeps the most recent synchronization
+        data of each actor, and passes them all to
+        `_use_sync_data_from_actors(...)`.
+        This is correct for problems whose synchronization data is
+        cumulative. Problems whose synchronization data is incremental
+        should override this function.
+        """
+        self._latest_sync_data_from_actors[actor_index] = received
+        self._use_sync_data_from_actors(list(self._latest_sync_data_from_actors.values()))
+
+    def _use_sync_data_from_retired_actors(self, received: list):
+        """
+        Override this function for providing synchronization between
+        the main process and the remote actors, when the number of
+        remote actors is reduced (see `resize_actors(...)`).
+
+        The responsibility of this function is to update the state
+        of the main Problem object according to the final synchronization
+        data received from the actors which are being retired, so that
+        their contributions are not lost.
+        This function is called only once for each retired actor.
+
+        The default implementation does nothing.
+        """
+        pass
+
+    def _make_pickle_data_for_new_actor(self) -> dict:
+        """
+        Override this function for preparing the initial state of a remote
+        actor which is added to an already parallelized problem (see
+        `resize_actors(...)`).
+
+        The returned state dictionary is loaded by the new remote problem
+        via `_use_pickle_data_from_main(...)`.
+        The default implementation returns an empty dictionary.
+        """
+        return {}
+
     def _make_pickle_data_for_main(self) -> dict:
         """
         Override this function for preserving the state of a remote
@@ -1747,8 +3446,19 @@ class Problem(TensorMakerMixin):
         """
         pass
 
+    def _has_actors(self) -> bool:
+        # Return True if the remote copies of this problem (in ray actors or in worker processes) are created
+        return (self._actors is not None) or (self._worker_pool is not None)
+
+    def _call_on_all_actors(self, method_name: str, args: list, kwargs: dict) -> list:
+        # Call a method on all the remote copies of this problem, regardless of the parallelization backend
+        if self._worker_pool is not None:
+            return self._worker_pool.call_all(method_name, args, kwargs)
+        else:
+            return ray.get(_call_on_actors(self._actors, method_name, args, kwargs))
+
     def _sync_before(self) -> bool:
-        if self._actors is None:
+        if not self._has_actors():
             return False
 
         to_send = self._make_sync_data_for_actors()
@@ -1756,15 +3466,15 @@ class Problem(TensorMakerMixin):
             return False
 
         if to_send is not None:
-            ray.get([actor.call.remote("_use_sync_data_from_main", [to_send], {}) for actor in self._actors])
+            self._call_on_all_actors("_use_sync_data_from_main", [to_send], {})
 
         return True
 
     def _sync_after(self):
-        if self._actors is None:
+        if not self._has_actors():
             return
 
-        received = ray.get([actor.call.remote("_make_sync_data_for_main", [], {}) for actor in self._actors])
+        received = self._call_on_all_actors("_make_sync_data_for_main", [], {})
 
         self._use_sync_data_from_actors(received)
 
@@ -1779,6 +3489,11 @@ class Problem(TensorMakerMixin):
         senses = self.senses
         nobjs = len(senses)
 
+        # The unevaluated solutions (e.g. the ones which missed the evaluation deadline) are not considered
+        evaluated = ~torch.any(torch.isnan(batch._evdata[:, :nobjs]), dim=-1)
+        if not bool(torch.all(evaluated)):
+            batch = batch.take(torch.nonzero(evaluated).flatten().tolist())
+
         if self._best is None:
             self._best_evals = self.make_empty(nobjs, device=batch.device, use_eval_dtype=True)
             self._worst_evals = self.make_empty(nobjs, device=batch.device, use_eval_dtype=True)
@@ -1810,10 +3525,13 @@ class Problem(TensorMakerMixin):
             else:
                 raise ValueError(f"Invalid sense: {senses[i_obj]}")
 
-        best_sln_indices = [batch.argbest(i) for i in range(nobjs)]
-        worst_sln_indices = [batch.argworst(i) for i in range(nobjs)]
+        if len(batch) == 0:
+            best_sln_indices = worst_sln_indices = []
+        else:
+            best_sln_indices = [batch.argbest(i) for i in range(nobjs)]
+            worst_sln_indices = [batch.argworst(i) for i in range(nobjs)]
 
-        for i_obj in range(nobjs):
+        for i_obj in range(len(best_sln_indices)):
             best_sln_index = best_sln_indices[i_obj]
             worst_sln_index = worst_sln_indices[i_obj]
             scores = batch.access_evals(i_obj)
@@ -1828,7 +3546,10 @@ class Problem(TensorMakerMixin):
 
         result = {}
 
-        if len(senses) == 1:
+        if any(sln is None for sln in self._best):
+            # No evaluated solution has been encountered yet
+            return result
+        elif len(senses) == 1:
             return dict(
                 best=self._best[0],
                 worst=self._worst[0],
@@ -1912,7 +3633,7 @@ class Problem(TensorMakerMixin):
         """Prepare the problem for evaluation. Calls self._prepare() if the self._prepared flag is not True."""
         if not self._prepared:
 
-            if self.actors is None or self._num_actors == 0:
+            if (not self._has_actors()) or self._num_actors == 0:
                 # Call prepare method for any problem class that is expected to do work
                 self._prepare()
             if self.is_main:
@@ -1926,7 +3647,10 @@ class Problem(TensorMakerMixin):
         return []
 
     def _share_attributes(self) -> None:
-        if (self._actors is not None) and (len(self._actors) > 0):
+        if self._worker_pool is not None:
+            for attrib_name in self._shared_attribs:
+                self._worker_pool.call_all("__setattr__", [attrib_name, getattr(self, attrib_name)], {})
+        elif (self._actors is not None) and (len(self._actors) > 0):
             for attrib_name in self._shared_attribs:
                 obj_ref = ray.put(getattr(self, attrib_name))
                 for actor in self.actors:
@@ -1958,6 +3682,12 @@ class Problem(TensorMakerMixin):
             )
 
         self._parallelize()
+        self._evaluate_with_hooks(batch)
+
+    def _evaluate_with_hooks(self, batch: "SolutionBatch", noise_source: Optional[tuple] = None):
+        # Evaluate the batch, surrounded by the evaluation hooks and the synchronization steps.
+        # If `noise_source` is given (see `evaluate_from_noise_table(...)`), it is passed on to `_evaluate_all(...)`.
+        self._apply_scaling_policy()
 
         if self.is_main:
             self.before_eval_hook(batch)
@@ -1966,7 +3696,10 @@ class Problem(TensorMakerMixin):
 
         self._start_preparations()
 
-        self._evaluate_all(batch)
+        if self.is_main and (self._eval_cache is not None):
+            self._evaluate_all_with_cache(batch)
+        else:
+            self._evaluate_all(batch, noise_source)
 
         if must_sync_after:
             self._sync_after()
@@ -1974,39 +3707,348 @@ class Problem(TensorMakerMixin):
         if self.is_main:
             self._after_eval_status = self.after_eval_hook.accumulate_dict(batch)
 
-    def _evaluate_all(self, batch: "SolutionBatch"):
-        if self._actors is None:
-            self._evaluate_batch(batch)
+    def _evaluate_all(self, batch: "SolutionBatch", noise_source: Optional[tuple] = None):
+        # If `noise_source` is given as a tuple `(distribution, noise_table, noise_offsets, noise_signs)`, the ray
+        # actors receive the noise offsets and signs instead of the decision values, and reconstruct the solutions.
+        if not self._has_actors():
+            if (self._num_threads is None) or (len(batch) <= 1):
+                self._evaluate_batch(batch)
+            else:
+                self._evaluate_batch_in_threads(batch)
         else:
+            if noise_source is None:
+                if self._throughput_aware and (self._num_subbatches is None) and (self._subbatch_size is None):
+                    self._evaluate_all_by_throughput(batch)
+                    return
+
+                if self._subbatch_tuner is not None:
+                    self._evaluate_all_with_tuned_subbatches(batch)
+                    return
+
             if self._num_subbatches is not None:
                 pieces = batch.split(self._num_subbatches)
             elif self._subbatch_size is not None:
                 pieces = batch.split(max_size=self._subbatch_size)
+            elif self._subbatch_tuner is not None:
+                pieces = batch.split(max_size=self._subbatch_tuner.suggest(len(batch), len(self._actors)))
+            else:
+                pieces = batch.split(len(self._worker_pool) if self._worker_pool is not None else len(self._actors))
+
+            if self._worker_pool is not None:
+                self._worker_pool.evaluate(batch, pieces)
+                return
+
+            evaluated_pieces = set()
+            if noise_source is None:
+                mapresult = self._actor_pool.map_unordered(
+                    lambda a, piece_ref: a.evaluate_batch.remote(piece_ref),
+                    list(pieces),
+                    prefetch=True,
+                    **self._straggler_options(),
+                )
             else:
-                pieces = batch.split(len(self._actors))
-            # mapresult = self._actor_pool.map(lambda a, v: a.evaluate_batch.remote(v), list(pieces))
-            # for i, evals in enumerate(mapresult):
-            #    row_begin, row_end = pieces.indices_of(i)
-            #    batch._evdata[row_begin:row_end, :] = evals
+                mapresult = self._map_noise_table_pieces(pieces, *noise_source)
+            for i, evals in mapresult:
+                row_begin, row_end = pieces.indices_of(i)
+                batch._evdata[row_begin:row_end, :] = evals
+                evaluated_pieces.add(i)
+            self._handle_deadline_misses(batch, pieces, evaluated_pieces)
+
+    def _straggler_options(self) -> dict:
+        # Keyword arguments for the `map_unordered(...)` method of the actor pool, according to the configuration
+        # of the straggler mitigation. At least one result is always waited for.
+        return {
+            "speculative": self._speculative_execution,
+            "deadline": None if self._eval_deadline is None else time.perf_counter() + self._eval_deadline,
+            "min_results": 1,
+        }
 
+    def _handle_deadline_misses(self, batch: "SolutionBatch", pieces: "SolutionBatchPieces", evaluated_pieces: set):
+        # The solutions of the pieces which missed the deadline receive the penalty (or are left unevaluated)
+        self._num_deadline_misses = 0
+        for i in range(len(pieces)):
+            if i not in evaluated_pieces:
+                row_begin, row_end = pieces.indices_of(i)
+                batch._evdata[row_begin:row_end, :] = float("nan")
+                if self._deadline_penalty is not None:
+                    batch._evdata[row_begin:row_end, : len(self.senses)] = torch.as_tensor(
+                        self._deadline_penalty, dtype=batch._evdata.dtype, device=batch._evdata.device
+                    )
+                self._num_deadline_misses += row_end - row_begin
+
+    def _get_deadline_status(self, result: Any) -> dict:
+        return {"eval_deadline_misses": self._num_deadline_misses}
+
+    def _evaluate_all_by_throughput(self, batch: "SolutionBatch"):
+        # Give each actor a piece whose size is proportional to the actor's throughput
+        weights = self._throughput_weights()
+        piece_sizes = split_workload(len(batch), len(self._actors), weights=weights)
+        pieces = batch.split(piece_sizes=piece_sizes)
+
+        # Submit the pieces with the longest expected durations first
+        order = sorted(range(len(pieces)), key=lambda i: piece_sizes[i] / weights[i], reverse=True)
+        assignments = [(i, pieces[i]) for i in order if piece_sizes[i] > 0]
+
+        mapresult = self._actor_pool.map_on_actors(
+            lambda a, piece: a.timed.remote("evaluate_batch", piece), assignments
+        )
+        for j, (evals, elapsed, num_interactions) in mapresult:
+            i = assignments[j][0]
+            row_begin, row_end = pieces.indices_of(i)
+            batch._evdata[row_begin:row_end, :] = evals
+            self._record_throughput(i, piece_sizes[i], elapsed, num_interactions)
+
+    def _evaluate_all_with_tuned_subbatches(self, batch: "SolutionBatch"):
+        num_workers = len(self._worker_pool) if self._worker_pool is not None else len(self._actors)
+        subbatch_size = self._subbatch_tuner.suggest(len(batch), num_workers)
+        pieces = batch.split(max_size=subbatch_size)
+
+        time_at_first = time.perf_counter()
+        if self._worker_pool is not None:
+            # The worker pools do not report how long each task takes on the worker side.
+            # Therefore, only the wall-clock time is measured.
+            self._worker_pool.evaluate(batch, pieces)
+            compute_times = None
+        else:
+            compute_times = []
+            evaluated_pieces = set()
             mapresult = self._actor_pool.map_unordered(
-                lambda a, v: a.evaluate_batch_piece.remote(v[0], v[1]), list(enumerate(pieces))
+                lambda a, piece_ref: a.timed.remote("evaluate_batch", piece_ref),
+                list(pieces),
+                prefetch=True,
+                **self._straggler_options(),
             )
-            for i, evals in mapresult:
+            for i, (evals, elapsed, _) in mapresult:
                 row_begin, row_end = pieces.indices_of(i)
                 batch._evdata[row_begin:row_end, :] = evals
+                compute_times.append(elapsed)
+                evaluated_pieces.add(i)
+            self._handle_deadline_misses(batch, pieces, evaluated_pieces)
+
+        self._subbatch_tuner.record(
+            subbatch_size, len(batch), num_workers, time.perf_counter() - time_at_first, compute_times
+        )
+
+    def _get_subbatch_tuner_status(self, result: Any) -> dict:
+        return self._subbatch_tuner.status
+
+    def _throughput_weights(self) -> list:
+        # The actors whose throughputs are not measured yet are assumed to be as fast as the average actor
+        known_rates = [rate for rate in self._actor_solution_rates if rate is not None]
+        default_rate = 1.0 if len(known_rates) == 0 else sum(known_rates) / len(known_rates)
+        return [default_rate if rate is None else rate for rate in self._actor_solution_rates]
+
+    def _record_throughput(
+        self, actor_index: int, num_solutions: int, elapsed: float, num_interactions: Optional[int] = None
+    ):
+        elapsed = max(float(elapsed), 1e-9)
+        smoothing = self._throughput_smoothing
+
+        def moving_average(previous: Optional[float], current: float) -> float:
+            return current if previous is None else (1.0 - smoothing) * previous + smoothing * current
+
+        if num_solutions > 0:
+            self._actor_solution_rates[actor_index] = moving_average(
+                self._actor_solution_rates[actor_index], num_solutions / elapsed
+            )
+        if num_interactions is not None:
+            self._actor_interaction_rates[actor_index] = moving_average(
+                self._actor_interaction_rates[actor_index], num_interactions / elapsed
+            )
+
+    def _get_throughput_status(self, result: Any) -> dict:
+        if self._actor_solution_rates is None:
+            return {}
+        return {
+            "actor_solutions_per_sec": list(self._actor_solution_rates),
+            "actor_interactions_per_sec": list(self._actor_interaction_rates),
+        }
+
+    def _evaluate_batch_in_threads(self, batch: "SolutionBatch"):
+        if self._thread_pool is None:
+            self._thread_pool = ThreadPoolExecutor(max_workers=self._num_threads)
+
+        if self._is_async():
+            # Make sure that the event loop is created before the threads start sharing it
+            self._ensure_event_loop()
+
+        # The number of intra-op threads of PyTorch is a process-wide setting. Therefore, it is lowered only while
+        # the evaluating threads are working, and then restored.
+        original_intra_op_threads = torch.get_num_threads()
+        if self._intra_op_threads is None:
+            intra_op_threads = max(1, original_intra_op_threads // self._num_threads)
+        else:
+            intra_op_threads = self._intra_op_threads
+
+        torch.set_num_threads(intra_op_threads)
+        try:
+            # Each thread works on its own piece of the batch. Since the pieces are views of disjoint rows of the
+            # batch, the threads can write their evaluation results without interfering with each other.
+            pieces = batch.split(min(len(batch), self._num_threads))
+            futures = [self._thread_pool.submit(self._evaluate_batch, piece) for piece in pieces]
+
+            # Wait for all the threads, and re-raise the first error encountered by any of them (if any)
+            for future in futures:
+                future.result()
+        finally:
+            torch.set_num_threads(original_intra_op_threads)
+
+    @property
+    def num_threads(self) -> Optional[int]:
+        """
+        Number of threads used for evaluating the solutions within the
+        evaluating process, or None if the evaluations are not
+        multi-threaded.
+        """
+        return self._num_threads
+
+    def _evaluate_all_with_cache(self, batch: "SolutionBatch"):
+        cache = self._eval_cache
+
+        # Row indices of the solutions whose evaluations are found in the cache, and the cached evaluations
+        hit_indices = []
+        hit_evdata = []
+
+        # Row indices of the solutions which are duplicates of other solutions within this batch which are to be
+        # evaluated, and the row indices of the solutions which they duplicate
+        duplicate_indices = []
+        duplicate_sources = []
+
+        # Mapping from the fingerprints of the solutions to be evaluated to their row indices
+        to_evaluate = {}
+
+        for i, key in enumerate(cache.fingerprints(batch._data)):
+            if key in to_evaluate:
+                duplicate_indices.append(i)
+                duplicate_sources.append(to_evaluate[key])
+            else:
+                cached = cache.get(key)
+                if cached is None:
+                    to_evaluate[key] = i
+                else:
+                    hit_indices.append(i)
+                    hit_evdata.append(cached)
+
+        indices_to_evaluate = list(to_evaluate.values())
+        if len(indices_to_evaluate) == len(batch):
+            self._evaluate_all(batch)
+        elif len(indices_to_evaluate) > 0:
+            piece = batch.take(indices_to_evaluate)
+            self._evaluate_all(piece)
+            batch._evdata[indices_to_evaluate] = piece._evdata
+
+        if len(hit_indices) > 0:
+            batch._evdata[hit_indices] = torch.stack(hit_evdata).to(batch._evdata.device)
+
+        if len(duplicate_indices) > 0:
+            batch._evdata[duplicate_indices] = batch._evdata[duplicate_sources]
+
+        for key, i in to_evaluate.items():
+            cache.put(key, batch._evdata[i].clone())
+
+        cache.record(hits=len(hit_indices) + len(duplicate_indices), misses=len(indices_to_evaluate))
+
+    def _get_eval_cache_status(self, batch: "SolutionBatch") -> dict:
+        return self._eval_cache.status
+
+    @property
+    def eval_cache(self) -> Optional[EvaluationCache]:
+        """
+        The evaluation cache of this problem object, or None if the
+        problem object was initialized without an `eval_cache_size`.
+        """
+        return self._eval_cache
 
     def _evaluate_batch(self, batch: "SolutionBatch"):
         if self._vectorized and (self._objective_func is not None):
             result = self._objective_func(batch.values)
+            if inspect.isawaitable(result):
+                result = self._run_async(self._with_timeout(result))
             if isinstance(result, tuple):
                 batch.set_evals(*result)
             else:
                 batch.set_evals(result)
+        elif self._is_async():
+            self._run_async(self._evaluate_batch_async(batch))
         else:
             for sln in batch:
                 self._evaluate(sln)
 
+    def _is_async(self) -> bool:
+        # Return True if the solutions are to be evaluated via `_evaluate_async(...)`
+        return inspect.iscoroutinefunction(self._objective_func) or (
+            type(self)._evaluate_async is not Problem._evaluate_async
+        )
+
+    def _ensure_event_loop(self) -> asyncio.AbstractEventLoop:
+        # Create (if not created yet) the event loop of this problem object, which runs in its own daemon thread.
+        # Running the loop in its own thread allows the evaluations to be triggered from any thread, even from a
+        # thread which is already running another event loop (e.g. within a notebook).
+        # The loop and its thread are stopped via `_close_event_loop()`, or when this problem object is garbage
+        # collected.
+        if self._event_loop is None:
+            loop = asyncio.new_event_loop()
+            thread = threading.Thread(target=loop.run_forever, daemon=True)
+            thread.start()
+            self._event_loop = loop
+            self._event_loop_finalizer = weakref.finalize(self, _stop_event_loop, loop, thread)
+        return self._event_loop
+
+    def _close_event_loop(self):
+        # Stop and close the event loop of this problem object (if it exists), and end the thread running it
+        if self._event_loop_finalizer is not None:
+            self._event_loop_finalizer()
+        self._event_loop = None
+        self._event_loop_finalizer = None
+        self._async_semaphore = None
+
+    def _run_async(self, coroutine) -> Any:
+        # Run the given coroutine on the event loop of this problem object, and wait for its result
+        return asyncio.run_coroutine_threadsafe(coroutine, self._ensure_event_loop()).result()
+
+    async def _with_timeout(self, awaitable) -> Any:
+        if self._eval_timeout is None:
+            return await awaitable
+        else:
+            return await asyncio.wait_for(awaitable, self._eval_timeout)
+
+    async def _evaluate_batch_async(self, batch: "SolutionBatch"):
+        if (self._max_concurrency is not None) and (self._async_semaphore is None):
+            # The semaphore is created here, so that it belongs to the event loop of this problem object
+            self._async_semaphore = asyncio.Semaphore(self._max_concurrency)
+
+        async def evaluate_solution(solution: "Solution"):
+            if self._async_semaphore is None:
+                await self._with_timeout(self._evaluate_async(solution))
+            else:
+                async with self._async_semaphore:
+                    await self._with_timeout(self._evaluate_async(solution))
+
+        await asyncio.gather(*[evaluate_solution(sln) for sln in batch])
+
+    async def _evaluate_async(self, solution: "Solution"):
+        """
+        Evaluate a single solution asynchronously.
+
+        The default implementation awaits the `async def` objective function
+        given via the argument `objective_func`. Override this method to
+        define an asynchronous evaluation procedure (e.g. one which sends
+        the decision values to a simulation service and awaits its reply).
+        Once this method is overriden, the solutions are evaluated via this
+        method, concurrently (with the concurrency limit `max_concurrency`).
+
+        Args:
+            solution: The solution to be evaluated.
+        """
+        if self._objective_func is not None:
+            result = await self._objective_func(solution.values)
+            if isinstance(result, tuple):
+                solution.set_evals(*result)
+            else:
+                solution.set_evals(result)
+        else:
+            raise NotImplementedError
+
     def _evaluate(self, solution: "Solution"):
         if self._objective_func is not None:
             result = self._objective_func(solution.values)
@@ -2107,15 +4149,27 @@ class Problem(TensorMakerMixin):
 
     def __getstate__(self):
         # Collect the inner states of the remote Problem clones
-        if self._actors is not None:
-            self._remote_states = ray.get(
-                [actor.call.remote("_make_pickle_data_for_main", [], {}) for actor in self._actors]
-            )
+        if self._has_actors():
+            self._remote_states = self._call_on_all_actors("_make_pickle_data_for_main", [], {})
 
         # Prepare the main state dictionary
         result = {}
         for k, v in self.__dict__.items():
-            if k in ("_actors", "_actor_pool") or k in self._nonserialized_attribs:
+            if k in (
+                "_actors",
+                "_actor_pool",
+                "_worker_pool",
+                "_thread_pool",
+                "_event_loop",
+                "_event_loop_finalizer",
+                "_async_semaphore",
+                "_shared_noise_table",
+                "_received_noise_table",
+            ):
+                result[k] = None
+            elif k == "_running_gradient_tasks":
+                result[k] = set()
+            elif k in self._nonserialized_attribs:
                 result[k] = None
             else:
                 result[k] = v
@@ -2167,6 +4221,9 @@ class Problem(TensorMakerMixin):
         ranking_method: Optional[str] = None,
         with_stats: bool = True,
         ensure_even_popsize: bool = False,
+        noise_table: Optional[NoiseTable] = None,
+        tree_reduction: bool = False,
+        popsize_weighted_grad_avg: bool = True,
     ) -> Union[list, dict]:
         """
         Sample new solutions from the distribution and compute gradients.
@@ -2261,6 +4318,31 @@ class Problem(TensorMakerMixin):
                 When the provided `distribution` is a symmetric (or
                 "mirrored", or "antithetic"), then this argument must be
                 given as True.
+            noise_table: Optionally a NoiseTable. If given, and if the
+                problem is parallelized, then the noise table is shared
+                with the remote actors via the ray object store, and each
+                remote actor, instead of its gradients, sends back only the
+                offsets and the signs of its noise vectors, and the
+                fitnesses. The gradients are then reconstructed by the main
+                process. This reduces the interprocess communication from
+                `O(popsize * n)` to `O(popsize)`, `n` being the solution
+                length. The provided `distribution` must support
+                `transform_noise(...)`.
+            tree_reduction: If given as True, and if the problem is
+                parallelized, then the gradients computed by the remote
+                actors are not collected one by one. Instead, they are
+                averaged by a tree of pairwise reduction tasks running in
+                the ray cluster (close to where the gradients are stored),
+                and the main process receives only the final averaged
+                gradients. In this case, the result is a list which contains
+                only one results dictionary, whose `num_solutions` is the
+                total number of solutions, and whose `mean_eval` is the
+                overall mean of the evaluations.
+                Tree reduction cannot be used together with a `noise_table`.
+            popsize_weighted_grad_avg: Only relevant when `tree_reduction`
+                is True. If True, each remote gradient is weighted by its
+                number of solutions during the averaging. If False, all the
+                remote gradients have equal weights.
         Returns:
             A results dictionary when the problem is not parallelized,
             or list of results dictionaries when the problem is parallelized.
@@ -2285,9 +4367,27 @@ class Problem(TensorMakerMixin):
         if self.is_main:
             self._before_grad_hook()
 
-        if self.is_main and (self._actors is not None) and (len(self._actors) > 0):
+        if tree_reduction and (noise_table is not None):
+            raise ValueError("The tree reduction cannot be used together with a noise table.")
+
+        if self.is_main and (self._worker_pool is not None) and (tree_reduction or (noise_table is not None)):
+            raise ValueError(
+                f"Tree reduction and noise tables rely on the ray object store,"
+                f" and therefore they are not supported by the {repr(self._parallel_backend)} parallelization backend."
+            )
+
+        if self.is_main and self._has_actors():
             # If this is the main process and the problem is parallelized, then we need to split the request
             # into multiple tasks, and then execute those tasks in parallel using the problem's actor pool.
+            self._apply_scaling_policy()
+
+            # The objective index is normalized before being sent to the remote actors
+            # (as done by `_gradient_computation_helper(...)`).
+            obj_index = self.normalize_obj_index(obj_index)
+
+            # When the work is split according to the throughputs of the actors, each task is bound to the actor
+            # whose throughput determined the task's size.
+            by_throughput = self._throughput_aware and (self._subbatch_size is None) and (self._num_subbatches is None)
 
             if self._subbatch_size is not None:
                 # If `subbatch_size` is provided, then we first make sure that `popsize` is divisible by
@@ -2304,14 +4404,25 @@ class Problem(TensorMakerMixin):
                 # we are going to have n tasks, each task imposing a sample size of `subbatch_size`.
                 n = int(popsize // self._subbatch_size)
                 popsize_per_task = [self._subbatch_size for _ in range(n)]
+            elif self._subbatch_tuner is not None:
+                # If the sub-batch size is tuned automatically, then we ask the tuner for the sample size of a task.
+                num_workers = len(self._worker_pool) if self._worker_pool is not None else len(self._actors)
+                tuned_subbatch_size = self._subbatch_tuner.suggest(popsize, num_workers)
+                popsize_per_task = split_workload(popsize, math.ceil(popsize / tuned_subbatch_size))
             elif self._num_subbatches is not None:
                 # If `num_subbatches` is provided, then we are going to have n tasks where n is equal to the given
                 # `num_subbatches`.
                 popsize_per_task = split_workload(popsize, self._num_subbatches)
+            elif by_throughput:
+                # Each actor receives a share of the workload proportional to its throughput
+                throughput_weights = self._throughput_weights()
+                popsize_per_task = split_workload(popsize, len(self._actors), weights=throughput_weights)
             else:
                 # If neither `subbatch_size` nor `num_subbatches` is given, then we will split the workload in such
                 # a way that each actor will have its share.
-                popsize_per_task = split_workload(popsize, len(self._actors))
+                popsize_per_task = split_workload(
+                    popsize, len(self._worker_pool) if self._worker_pool is not None else len(self._actors)
+                )
 
             if ensure_even_popsize:
                 # If `ensure_even_popsize` argument is True, then we need to make sure that each tasks's popsize is
@@ -2354,11 +4465,91 @@ class Problem(TensorMakerMixin):
             # (unless it is already on cpu)
             dist_on_cpu = distribution.to("cpu")
 
-            # Here, we use our actor pool to execute our tasks in parallel.
-            result = list(
-                self._actor_pool.map_unordered(
+            # The wall-clock time of the parallel tasks, and (when available) the time each task spent on its actor,
+            # are measured for the sub-batch size tuner.
+            time_at_first = time.perf_counter()
+            compute_times = None
+
+            # Indices of the tasks which finished. The branches below which do not enforce the evaluation deadline
+            # mark all the tasks as finished.
+            finished_tasks = set()
+
+            if self._worker_pool is not None:
+                # Here, we use the worker processes to execute our tasks in parallel.
+                result = self._worker_pool.map_calls(
+                    "_sample_and_compute_gradients",
+                    [
+                        (
+                            [dist_on_cpu, task_popsize],
+                            {
+                                "obj_index": obj_index,
+                                "num_interactions": task_num_interactions,
+                                "popsize_max": task_popsize_max,
+                                "ranking_method": ranking_method,
+                            },
+                        )
+                        for task_popsize, task_num_interactions, task_popsize_max in zip(
+                            popsize_per_task, num_inter_per_task, popsize_max_per_task
+                        )
+                    ],
+                )
+                finished_tasks.update(range(num_tasks))
+            elif (noise_table is None) and tree_reduction:
+                # Here, we give the tasks to the actors in a round-robin manner, without waiting for their results.
+                # The results are then reduced within the ray cluster, and only the final result is fetched.
+                num_actors = len(self._actors)
+                tasks = [
+                    self._actors[i % num_actors].call.remote(
+                        "_sample_and_compute_gradients",
+                        [dist_on_cpu, task_popsize],
+                        {
+                            "obj_index": obj_index,
+                            "num_interactions": task_num_interactions,
+                            "popsize_max": task_popsize_max,
+                            "ranking_method": ranking_method,
+                        },
+                    )
+                    for i, (task_popsize, task_num_interactions, task_popsize_max) in enumerate(
+                        zip(popsize_per_task, num_inter_per_task, popsize_max_per_task)
+                    )
+                ]
+                result = [_tree_reduce_gradient_results(tasks, popsize_weighted=popsize_weighted_grad_avg)]
+                finished_tasks.update(range(num_tasks))
+            elif (noise_table is None) and by_throughput:
+                # Here, each task is run on its own actor (the tasks with the longest expected durations being
+                # submitted first), and the throughputs of the actors are measured.
+                expected_durations = [popsize_per_task[i] / throughput_weights[i] for i in range(num_tasks)]
+                order = sorted(range(num_tasks), key=lambda i: expected_durations[i], reverse=True)
+                assignments = [(i, i) for i in order if popsize_per_task[i] > 0]
+                mapresult = self._actor_pool.map_on_actors(
                     (
-                        lambda a, v: a.call.remote(
+                        lambda a, i: a.timed.remote(
+                            "call",
+                            "_sample_and_compute_gradients",
+                            [dist_on_cpu, popsize_per_task[i]],
+                            {
+                                "obj_index": obj_index,
+                                "num_interactions": num_inter_per_task[i],
+                                "popsize_max": popsize_max_per_task[i],
+                                "ranking_method": ranking_method,
+                            },
+                        )
+                    ),
+                    assignments,
+                )
+                result = []
+                for j, (task_result, elapsed, task_num_interactions) in mapresult:
+                    self._record_throughput(
+                        assignments[j][0], task_result["num_solutions"], elapsed, task_num_interactions
+                    )
+                    result.append(task_result)
+                finished_tasks.update(range(num_tasks))
+            elif noise_table is None:
+                # Here, we use our actor pool to execute our tasks in parallel.
+                mapresult = self._actor_pool.map_unordered(
+                    (
+                        lambda a, v: a.timed.remote(
+                            "call",
                             "_sample_and_compute_gradients",
                             [dist_on_cpu, v[0]],
                             {
@@ -2370,14 +4561,57 @@ class Problem(TensorMakerMixin):
                         )
                     ),
                     list(zip(popsize_per_task, num_inter_per_task, popsize_max_per_task)),
+                    **self._straggler_options(),
                 )
-            )
+                result = []
+                compute_times = []
+                for i, (task_result, elapsed, _) in mapresult:
+                    result.append(task_result)
+                    compute_times.append(elapsed)
+                    finished_tasks.add(i)
+            else:
+                # If a noise table is given, we ask the actors to send back only the indices of their noise vectors
+                # and their fitnesses. The gradients are then computed here, from these compact results.
+                noise_table_ref = self._share_noise_table(noise_table)
+                mapresult = self._actor_pool.map_unordered(
+                    (
+                        lambda a, v: a.call.remote(
+                            "_sample_and_evaluate_from_noise_table",
+                            [dist_on_cpu, v[0], noise_table_ref],
+                            {
+                                "obj_index": obj_index,
+                                "num_interactions": v[1],
+                                "popsize_max": v[2],
+                            },
+                        )
+                    ),
+                    list(zip(popsize_per_task, num_inter_per_task, popsize_max_per_task)),
+                    **self._straggler_options(),
+                )
+                compact_results = []
+                for i, compact_result in mapresult:
+                    compact_results.append(compact_result)
+                    finished_tasks.add(i)
+                result = [
+                    self._gradients_from_noise_table(
+                        distribution, noise_table, compact_result, obj_index=obj_index, ranking_method=ranking_method
+                    )
+                    for compact_result in compact_results
+                ]
+
+            if self._subbatch_tuner is not None:
+                self._subbatch_tuner.record(
+                    tuned_subbatch_size, popsize, num_workers, time.perf_counter() - time_at_first, compute_times
+                )
+
+            # The gradients of the tasks which missed the evaluation deadline (if any) are left out
+            self._num_deadline_misses = sum(popsize_per_task[i] for i in range(num_tasks) if i not in finished_tasks)
 
             # At this point, all the tensors within our collected results are on the CPU.
 
             if torch.device(self.device) != torch.device("cpu"):
                 # If the main device of this problem instance is not CPU, then we move the tensors to the main device.
-                result = cast_tensors_in_container(mapresult, device=device)
+                result = cast_tensors_in_container(result, device=self.device)
 
             if must_sync_after:
                 # If a post-gradient synchronization is required, we trigger the synchronization operations.
@@ -2502,40 +4736,255 @@ class Problem(TensorMakerMixin):
             ranking_method=ranking_method,
         )
 
-        if move_results_to_device is not None:
-            # If `move_results_to_device` is provided, move the results to the desired device
-            result = cast_tensors_in_container(result, device=move_results_to_device)
+        if move_results_to_device is not None:
+            # If `move_results_to_device` is provided, move the results to the desired device
+            result = cast_tensors_in_container(result, device=move_results_to_device)
+
+        # Finally, return the result
+        if with_stats:
+            return result
+        else:
+            return result["gradients"]
+
+    def start_gradient_task(
+        self,
+        actor_index: int,
+        distribution,
+        popsize: int,
+        *,
+        num_interactions: Optional[int] = None,
+        popsize_max: Optional[int] = None,
+        obj_index: Optional[int] = None,
+        ranking_method: Optional[str] = None,
+    ) -> ray.ObjectRef:
+        """
+        Ask a remote actor to sample solutions and compute gradients,
+        without waiting for the result.
+
+        This method is meant to be used by search algorithms which work
+        asynchronously, i.e. which update their search distributions as soon
+        as a gradient arrives from any remote actor, instead of waiting for
+        all the remote actors to finish.
+        The started task can be waited for via `wait_gradient_tasks(...)`.
+
+        If the problem has synchronization data (see
+        `_make_sync_data_for_actors()`), the synchronization data is sent to
+        the actor along with the task, and the actor's synchronization data
+        is sent back along with the result, so that no blocking
+        synchronization step is needed.
+
+        Args:
+            actor_index: Index of the remote actor which will run the task.
+            distribution: The search distribution from which the solutions
+                will be sampled, and according to which the gradients will
+                be computed.
+            popsize: The number of solutions which will be sampled.
+            num_interactions: Number of simulator interactions that must
+                be completed (more solutions will be sampled until this
+                threshold is reached). Can be left as None.
+            popsize_max: Maximum population size, to be used along with
+                `num_interactions`. Can be left as None.
+            obj_index: Index of the objective according to which the
+                gradients will be computed. Can be left as None if the
+                problem has only one objective.
+            ranking_method: The solution ranking method to be used when
+                computing the gradients.
+        Returns:
+            A reference to the started task.
+        """
+        self._parallelize()
+
+        if (self._actors is None) or (len(self._actors) == 0):
+            raise ValueError(
+                "Gradient tasks can only be started when the problem is parallelized."
+                " Please make sure that the problem is created with `num_actors` greater than 0."
+            )
+
+        task = self._actors[actor_index].call.remote(
+            "_gradient_task",
+            [self._make_sync_data_for_actors(), distribution.to("cpu"), popsize],
+            {
+                "obj_index": obj_index,
+                "num_interactions": num_interactions,
+                "popsize_max": popsize_max,
+                "ranking_method": ranking_method,
+            },
+        )
+        self._running_gradient_tasks.add(task)
+        return task
+
+    def wait_gradient_tasks(self, tasks: Mapping, *, timeout: Optional[float] = None) -> list:
+        """
+        Wait until at least one of the given gradient tasks is complete.
+
+        Among the given tasks, the ones which are already complete (at the
+        moment at least one task is complete) are collected.
+
+        Args:
+            tasks: A dictionary which maps the task references (as returned
+                by `start_gradient_task(...)`) to the indices of the actors
+                running them.
+            timeout: Maximum number of seconds to wait. If no task completes
+                within this duration, the result will be an empty list.
+                If left as None, there is no time limit.
+        Returns:
+            A list of tuples, each tuple being `(task, actor_index, result)`,
+            where `result` is a dictionary in the same form as the
+            dictionaries returned by `sample_and_compute_gradients(...)`.
+        """
+        if self.is_main:
+            self._before_grad_hook()
+
+        task_refs = list(tasks.keys())
+        ready, remaining = ray.wait(task_refs, num_returns=1, timeout=timeout)
+        if len(ready) == 0:
+            return []
+        if len(remaining) > 0:
+            also_ready, _ = ray.wait(remaining, num_returns=len(remaining), timeout=0)
+            ready = ready + also_ready
+
+        collected = []
+        results = []
+        self._running_gradient_tasks.difference_update(ready)
+        for task, (result, sync_data) in zip(ready, ray.get(ready)):
+            actor_index = tasks[task]
+            if sync_data is not NotImplemented:
+                self._use_sync_data_from_actor(actor_index, sync_data)
+            if torch.device(self.device) != torch.device("cpu"):
+                result = cast_tensors_in_container(result, device=self.device)
+            collected.append((task, actor_index, result))
+            results.append(result)
+
+        if self.is_main:
+            self._after_eval_status = self._after_grad_hook.accumulate_dict(results)
+
+        return collected
+
+    def drain_gradient_tasks(self, tasks: Optional[Mapping]):
+        """
+        Wait until all the given gradient tasks are over, ignoring their
+        results (and their errors, if any).
+
+        This is meant to be used by asynchronous search algorithms when a
+        step fails, so that no gradient task keeps running in the background.
+
+        Args:
+            tasks: A dictionary which maps the task references (as returned
+                by `start_gradient_task(...)`) to the indices of the actors
+                running them. Can also be None, in which case this method
+                does nothing.
+        """
+        if (tasks is None) or (len(tasks) == 0):
+            return
+        task_refs = list(tasks.keys())
+        ray.wait(task_refs, num_returns=len(task_refs))
+        self._running_gradient_tasks.difference_update(task_refs)
+
+    def _gradient_task(self, sync_data: Any, distribution, popsize: int, **kwargs) -> tuple:
+        # This method runs on a remote actor, as started by `start_gradient_task(...)`.
+        # The synchronization data is received along with the task, and the synchronization data of this actor
+        # is sent back along with the result.
+        if (sync_data is not NotImplemented) and (sync_data is not None):
+            self._use_sync_data_from_main(sync_data)
+
+        result = self._gradient_computation_helper(distribution, popsize, move_results_to_device="cpu", **kwargs)
+
+        if sync_data is NotImplemented:
+            return result, NotImplemented
+        else:
+            return result, self._make_sync_data_for_main()
+
+    @property
+    def _grad_device(self) -> Device:
+        """
+        Get the device in which new solutions will be made in distributed mode.
+
+        In more details, in distributed mode, each actor creates its own
+        sub-populations, evaluates them, and computes its own gradient
+        (all such actor gradients eventually being collected by the
+        distribution-based search algorithm in the main process).
+        For some problem types, it can make sense for the remote actors to
+        create their temporary sub-populations on another device
+        (e.g. on the GPU that is allocated specifically for them).
+        For such situations, one is encouraged to override this property
+        and make it return whatever device is to be used.
+
+        Note that this property is used by the default implementation of the
+        method named `_sample_and_compute_grad(...)`. If the method named
+        `_sample_and_compute_grad(...)` is overriden, this property might not
+        be called at all.
+
+        This is the not-yet-overriden implementation in the Problem class,
+        and returns the main device.
+        """
+        return self.device
+
+    def _evaluate_adaptively(
+        self,
+        sample_evaluated_batch: Callable,
+        popsize: int,
+        *,
+        num_interactions: Optional[int] = None,
+        popsize_max: Optional[int] = None,
+    ) -> "SolutionBatch":
+        # Call `sample_evaluated_batch()` (which is expected to return a newly sampled and evaluated SolutionBatch of
+        # size `popsize`) until the `num_interactions` and `popsize_max` thresholds are satisfied, and return all the
+        # sampled solutions as a single SolutionBatch.
+
+        # Annotate the variable which will store the resulting SolutionBatch.
+        resulting_batch: SolutionBatch
+
+        if num_interactions is None:
+            # If a `num_interactions` threshold is not given (i.e. is left as None), then we assume that an adaptive
+            # population is not desired.
+            # We therefore simply sample and evaluate a single SolutionBatch, and declare it as our main batch.
+            resulting_batch = sample_evaluated_batch()
+        else:
+            # If we have a `num_interactions` threshold, then we might have to sample more than one SolutionBatch
+            # (until `num_interactions` is reached).
+            # We start by defining a list (`batches`) which is to store all the batches we will sample.
+            batches = []
+
+            # We will have to count the number of all simulator interactions that we have encountered during the
+            # execution of this method. So, to count it correctly, we first get the interaction count that we already
+            # have before sampling and evaluating our new solutions.
+            interaction_count_at_first = self._get_local_interaction_count()
+
+            # Below is an inner function which returns how many simulator interactions we have done so far.
+            # It makes use of the variable `interaction_count_at_first` defined above.
+            def current_num_interactions() -> int:
+                return self._get_local_interaction_count() - interaction_count_at_first
+
+            # We also keep track of the total number of solutions.
+            # We might need this if there is a `popsize_max` threshold.
+            current_popsize = 0
 
-        # Finally, return the result
-        if with_stats:
-            return result
-        else:
-            return result["gradients"]
+            # The main loop of the adaptive sampling.
+            while True:
+                # Sample and evaluate a new SolutionBatch, and add it to our batches list.
+                batches.append(sample_evaluated_batch())
 
-    @property
-    def _grad_device(self) -> Device:
-        """
-        Get the device in which new solutions will be made in distributed mode.
+                # Increase our total population size by the size of the most recent batch.
+                current_popsize += popsize
 
-        In more details, in distributed mode, each actor creates its own
-        sub-populations, evaluates them, and computes its own gradient
-        (all such actor gradients eventually being collected by the
-        distribution-based search algorithm in the main process).
-        For some problem types, it can make sense for the remote actors to
-        create their temporary sub-populations on another device
-        (e.g. on the GPU that is allocated specifically for them).
-        For such situations, one is encouraged to override this property
-        and make it return whatever device is to be used.
+                if current_num_interactions() > num_interactions:
+                    # If the number of interactions has reached or exceeded the `num_interactions` threshold,
+                    # we exit the loop.
+                    break
+                if (popsize_max is not None) and (current_popsize >= popsize_max):
+                    # If we have `popsize_max` threshold and our total population size have reached or exceeded
+                    # the `popsize_max` threshold, we exit the loop.
+                    break
 
-        Note that this property is used by the default implementation of the
-        method named `_sample_and_compute_grad(...)`. If the method named
-        `_sample_and_compute_grad(...)` is overriden, this property might not
-        be called at all.
+            if len(batches) == 1:
+                # If we have only one batch in our batches list, that batch can be declared as our main batch.
+                resulting_batch = batches[0]
+            else:
+                # If we have multiple batches in our batches list, we concatenate all those batches and
+                # declare the result of the concatenation as our main batch.
+                resulting_batch = SolutionBatch.cat(batches)
 
-        This is the not-yet-overriden implementation in the Problem class,
-        and returns the main device.
-        """
-        return self.device
+        return resulting_batch
 
     def _sample_and_compute_gradients(
         self,
@@ -2600,9 +5049,6 @@ class Problem(TensorMakerMixin):
             items (if customized to do so).
         """
 
-        # Annotate the variable which will store the temporary SolutionBatch for computing the local gradient.
-        resulting_batch: SolutionBatch
-
         # Get the device in which the new solutions will be made.
         grad_device = torch.device(self._grad_device)
         distribution = distribution.to(grad_device)
@@ -2615,55 +5061,10 @@ class Problem(TensorMakerMixin):
             self.evaluate(batch)
             return batch
 
-        if num_interactions is None:
-            # If a `num_interactions` threshold is not given (i.e. is left as None), then we assume that an adaptive
-            # population is not desired.
-            # We therefore simply sample and evaluate a single SolutionBatch, and declare it as our main batch.
-            resulting_batch = sample_evaluated_batch()
-        else:
-            # If we have a `num_interactions` threshold, then we might have to sample more than one SolutionBatch
-            # (until `num_interactions` is reached).
-            # We start by defining a list (`batches`) which is to store all the batches we will sample.
-            batches = []
-
-            # We will have to count the number of all simulator interactions that we have encountered during the
-            # execution of this method. So, to count it correctly, we first get the interaction count that we already
-            # have before sampling and evaluating our new solutions.
-            interaction_count_at_first = self._get_local_interaction_count()
-
-            # Below is an inner function which returns how many simulator interactions we have done so far.
-            # It makes use of the variable `interaction_count_at_first` defined above.
-            def current_num_interactions() -> int:
-                return self._get_local_interaction_count() - interaction_count_at_first
-
-            # We also keep track of the total number of solutions.
-            # We might need this if there is a `popsize_max` threshold.
-            current_popsize = 0
-
-            # The main loop of the adaptive sampling.
-            while True:
-                # Sample and evaluate a new SolutionBatch, and add it to our batches list.
-                batches.append(sample_evaluated_batch())
-
-                # Increase our total population size by the size of the most recent batch.
-                current_popsize += popsize
-
-                if current_num_interactions() > num_interactions:
-                    # If the number of interactions has reached or exceeded the `num_interactions` threshold,
-                    # we exit the loop.
-                    break
-                if (popsize_max is not None) and (current_popsize >= popsize_max):
-                    # If we have `popsize_max` threshold and our total population size have reached or exceeded
-                    # the `popsize_max` threshold, we exit the loop.
-                    break
-
-            if len(batches) == 1:
-                # If we have only one batch in our batches list, that batch can be declared as our main batch.
-                resulting_batch = batches[0]
-            else:
-                # If we have multiple batches in our batches list, we concatenate all those batches and
-                # declare the result of the concatenation as our main batch.
-                resulting_batch = SolutionBatch.cat(batches)
+        # Sample and evaluate the solutions (more than once if the population size is adaptive)
+        resulting_batch = self._evaluate_adaptively(
+            sample_evaluated_batch, popsize, num_interactions=num_interactions, popsize_max=popsize_max
+        )
 
         # We take the solutions (`samples`) and the fitnesses from our main batch.
         samples = resulting_batch.access_values(keep_evals=True)
@@ -2684,6 +5085,180 @@ class Problem(TensorMakerMixin):
             "mean_eval": float(torch.mean(resulting_batch.access_evals(obj_index))),
         }
 
+    def _share_noise_table(self, noise_table: NoiseTable) -> ray.ObjectRef:
+        # Put the noise table into the ray object store (only once), so that the actors on the same node can share
+        # a single copy of it.
+        if (self._shared_noise_table is None) or (self._shared_noise_table[0] is not noise_table):
+            self._shared_noise_table = (noise_table, ray.put(noise_table))
+        return self._shared_noise_table[1]
+
+    def _noise_table_from_ref(self, noise_table_ref: ray.ObjectRef) -> NoiseTable:
+        # Get the noise table shared by the main process (only once).
+        if (self._received_noise_table is None) or (self._received_noise_table[0] != noise_table_ref):
+            self._received_noise_table = (noise_table_ref, ray.get(noise_table_ref))
+        return self._received_noise_table[1]
+
+    def _sample_and_evaluate_from_noise_table(
+        self,
+        distribution,
+        popsize: int,
+        noise_table_ref: ray.ObjectRef,
+        *,
+        obj_index: Optional[int] = None,
+        num_interactions: Optional[int] = None,
+        popsize_max: Optional[int] = None,
+    ) -> dict:
+        # This method runs on a remote actor. It samples solutions via the shared noise table, evaluates them,
+        # and returns only the offsets and the signs of the noise vectors, and the fitnesses.
+        obj_index = self.normalize_obj_index(obj_index)
+        noise_table = self._noise_table_from_ref(noise_table_ref)
+
+        grad_device = torch.device(self._grad_device)
+        distribution = distribution.modified_copy(dtype=self.dtype, device=grad_device)
+
+        offsets = []
+        signs = []
+
+        def sample_evaluated_batch() -> SolutionBatch:
+            batch_offsets, batch_signs = noise_table.sample_indices(
+                popsize, self.solution_length, symmetric=distribution.SYMMETRIC_SAMPLING, generator=self.generator
+            )
+            noise = noise_table.noise(
+                batch_offsets, batch_signs, self.solution_length, dtype=self.dtype, device=grad_device
+            )
+            batch = SolutionBatch(self, popsize, device=grad_device, empty=True)
+            batch.access_values()[:] = distribution.transform_noise(noise)
+            self.evaluate(batch)
+            offsets.append(batch_offsets)
+            signs.append(batch_signs)
+            return batch
+
+        resulting_batch = self._evaluate_adaptively(
+            sample_evaluated_batch, popsize, num_interactions=num_interactions, popsize_max=popsize_max
+        )
+        fitnesses = resulting_batch.access_evals(obj_index)
+
+        return {
+            "noise_offsets": torch.cat(offsets),
+            "noise_signs": torch.cat(signs),
+            "fitnesses": fitnesses.to("cpu"),
+            "num_solutions": len(resulting_batch),
+            "mean_eval": float(torch.mean(fitnesses)),
+        }
+
+    def _gradients_from_noise_table(
+        self,
+        distribution,
+        noise_table: NoiseTable,
+        compact_result: dict,
+        *,
+        obj_index: Optional[int] = None,
+        ranking_method: Optional[str] = None,
+    ) -> dict:
+        # Reconstruct the solutions out of the offsets and the signs of their noise vectors, and compute the gradients.
+        obj_index = self.normalize_obj_index(obj_index)
+        noise = noise_table.noise(
+            compact_result["noise_offsets"],
+            compact_result["noise_signs"],
+            self.solution_length,
+            dtype=distribution.dtype,
+            device=distribution.device,
+        )
+        samples = distribution.transform_noise(noise)
+        fitnesses = torch.as_tensor(compact_result["fitnesses"], device=distribution.device)
+        grads = distribution.compute_gradients(
+            samples, fitnesses, objective_sense=self.senses[obj_index], ranking_method=ranking_method
+        )
+        return {
+            "gradients": grads,
+            "num_solutions": compact_result["num_solutions"],
+            "mean_eval": compact_result["mean_eval"],
+        }
+
+    def evaluate_from_noise_table(
+        self,
+        batch: "SolutionBatch",
+        distribution,
+        noise_table: NoiseTable,
+        noise_offsets: torch.Tensor,
+        noise_signs: torch.Tensor,
+    ):
+        """
+        Evaluate a SolutionBatch whose solutions were generated from a
+        NoiseTable.
+
+        It is assumed that the decision values of the i-th solution of the
+        batch were computed as
+        `distribution.transform_noise(noise_table.noise(offsets, signs, n))`,
+        `n` being the solution length.
+        If the problem is parallelized, then the noise table is shared
+        with the remote actors via the ray object store, and instead of the
+        decision values, only the distribution and the offsets and the signs
+        of the noise vectors are sent to the remote actors, which
+        reconstruct the solutions on their side. This reduces the
+        interprocess communication from `O(popsize * n)` to `O(popsize)`.
+        If the problem is not parallelized (or has an evaluation cache),
+        this method falls back to `evaluate(...)`.
+
+        Args:
+            batch: The SolutionBatch to be evaluated.
+            distribution: The search distribution from which the solutions
+                were generated.
+            noise_table: The noise table used for generating the solutions.
+            noise_offsets: The offsets of the noise vectors, as a
+                1-dimensional tensor.
+            noise_signs: The signs of the noise vectors, as a 1-dimensional
+                tensor.
+        """
+        self._parallelize()
+
+        if (self._actors is None) or (len(self._actors) == 0) or (self._eval_cache is not None):
+            self.evaluate(batch)
+        else:
+            self._evaluate_with_hooks(batch, (distribution, noise_table, noise_offsets, noise_signs))
+
+    def _map_noise_table_pieces(
+        self,
+        pieces: "SolutionBatchPieces",
+        distribution,
+        noise_table: NoiseTable,
+        noise_offsets: torch.Tensor,
+        noise_signs: torch.Tensor,
+    ) -> Iterable[tuple]:
+        # Send the noise offsets and signs of each piece to the ray actors (see `evaluate_from_noise_table(...)`)
+        dist_on_cpu = distribution.to("cpu")
+        noise_table_ref = self._share_noise_table(noise_table)
+        noise_offsets = torch.as_tensor(noise_offsets, device="cpu")
+        noise_signs = torch.as_tensor(noise_signs, device="cpu")
+
+        def piece_task(i: int) -> tuple:
+            row_begin, row_end = pieces.indices_of(i)
+            return noise_offsets[row_begin:row_end].clone(), noise_signs[row_begin:row_end].clone()
+
+        return self._actor_pool.map_unordered(
+            lambda a, v: a.call.remote("_evaluate_from_noise_table", [dist_on_cpu, noise_table_ref, v[0], v[1]], {}),
+            [piece_task(i) for i in range(len(pieces))],
+            **self._straggler_options(),
+        )
+
+    def _evaluate_from_noise_table(
+        self,
+        distribution,
+        noise_table_ref: ray.ObjectRef,
+        noise_offsets: torch.Tensor,
+        noise_signs: torch.Tensor,
+    ) -> tuple:
+        # This method runs on a remote actor. It reconstructs the solutions from their noise vectors and evaluates them.
+        noise_table = self._noise_table_from_ref(noise_table_ref)
+        distribution = distribution.modified_copy(dtype=self.dtype, device=self.device)
+        noise = noise_table.noise(
+            noise_offsets, noise_signs, self.solution_length, dtype=self.dtype, device=self.device
+        )
+        batch = SolutionBatch(self, len(noise_offsets), empty=True)
+        batch.access_values()[:] = distribution.transform_noise(noise)
+        self.evaluate(batch)
+        return _compact_tensor(batch.access_evals())
+
     def __copy__(self):
         return self.clone()
 
@@ -2700,206 +5275,261 @@ class Problem(TensorMakerMixin):
 SolutionBatchSliceInfo = NamedTuple("SolutionBatchSliceInfo", source="SolutionBatch", slice=IndicesOrSlice)
 
 
-def _opt_bool(x: Optional[bool], default: bool) -> bool:
-    result = default
-    if x is not None:
-        result = bool(x)
-    return result
+def _as_gradient_sum(result: dict, popsize_weighted: bool) -> dict:
+    # Convert a gradient computation result (as returned by `_sample_and_compute_gradients(...)`) to a weighted sum,
+    # which can be added to other weighted sums. A result which is already a weighted sum is returned as it is.
+    if "total_weight" in result:
+        return result
+    num_solutions = result["num_solutions"]
+    weight = num_solutions if popsize_weighted else 1
+    return {
+        "gradient_sums": {key: weight * grad for key, grad in result["gradients"].items()},
+        "total_weight": weight,
+        "num_solutions": num_solutions,
+        "eval_sum": num_solutions * result["mean_eval"],
+    }
 
 
-@njit
-def _dominates(i: int, j: int, utils: np.ndarray) -> bool:
-    return np.all(utils[i, :] >= utils[j, :]) and np.any(utils[i, :] > utils[j, :])
+@ray.remote
+def _reduce_gradient_results(popsize_weighted: bool, *results: dict) -> dict:
+    # Add the weighted sums of the given gradient computation results
+    sums = [_as_gradient_sum(result, popsize_weighted) for result in results]
+    return {
+        "gradient_sums": {key: sum(s["gradient_sums"][key] for s in sums) for key in sums[0]["gradient_sums"].keys()},
+        "total_weight": sum(s["total_weight"] for s in sums),
+        "num_solutions": sum(s["num_solutions"] for s in sums),
+        "eval_sum": sum(s["eval_sum"] for s in sums),
+    }
+
+
+def _tree_reduce_gradient_results(tasks: list, *, popsize_weighted: bool) -> dict:
+    # Reduce the results of the given remote gradient computation tasks via a tree of pairwise reduction tasks,
+    # and return the averaged result.
+    level = list(tasks)
+    while len(level) > 1:
+        next_level = [
+            _reduce_gradient_results.remote(popsize_weighted, *level[i : i + 2]) for i in range(0, len(level) - 1, 2)
+        ]
+        if (len(level) % 2) != 0:
+            next_level.append(level[-1])
+        level = next_level
+
+    reduced = _as_gradient_sum(ray.get(level[0]), popsize_weighted)
+    total_weight = reduced["total_weight"]
+    return {
+        "gradients": {key: grad_sum / total_weight for key, grad_sum in reduced["gradient_sums"].items()},
+        "num_solutions": reduced["num_solutions"],
+        "mean_eval": reduced["eval_sum"] / reduced["num_solutions"],
+    }
+
+
+def _stop_event_loop(loop: asyncio.AbstractEventLoop, thread: threading.Thread):
+    # Stop the given event loop, wait for the thread running it to end, and close the loop
+    loop.call_soon_threadsafe(loop.stop)
+    if thread is not threading.current_thread():
+        thread.join()
+        loop.close()
+
+
+def _storage_of(t: Union[torch.Tensor, ObjectArray]) -> Any:
+    # Get the underlying storage of the tensor (or of the ObjectArray).
+    # `untyped_storage()` exists only since torch 2.0, so, with older versions, `storage()` is used instead.
+    if hasattr(t, "untyped_storage"):
+        return t.untyped_storage()
+    else:
+        return t.storage()
 
 
-# TODO: test _crowding_distance_assignment(...)
-@njit
-def _crowding_distance_assignment(pareto_set: np.ndarray, utils: np.ndarray) -> np.ndarray:
-    l = len(pareto_set)
-    distances = np.zeros(l, dtype="float32")
-    for m in range(utils.shape[1]):
-        # U = utils[pareto_set][:, m]
-        U = utils[pareto_set, m]
-        I = np.argsort(U)[::-1]
+def _storage_nbytes(t: torch.Tensor) -> int:
+    # Get the size of the underlying storage of the tensor, in bytes
+    storage = _storage_of(t)
+    if hasattr(storage, "nbytes"):
+        return storage.nbytes()
+    else:
+        # A typed storage of an older torch version reports its size in number of elements
+        return storage.size() * t.element_size()
 
-        # e.g. pareto_set = [1,   7,  3]
-        # e.g.          U = [20, 14, 15]
 
-        # I = [0, 2, 1]
+def _compact_tensor(t: torch.Tensor) -> torch.Tensor:
+    # If the tensor is a view which does not span its entire storage (or is not contiguous), make a compact copy,
+    # so that pickling it does not serialize the entire underlying storage.
+    if (not t.is_contiguous()) or (t.numel() * t.element_size() != _storage_nbytes(t)):
+        t = t.clone(memory_format=torch.contiguous_format)
+    return t
 
-        distances[I[0]] = np.inf
-        distances[I[-1]] = np.inf
 
-        fmax = np.max(U)
-        fmin = np.min(U)
+def _tensor_to_wire(t: torch.Tensor) -> Union[torch.Tensor, np.ndarray]:
+    # Make a compact copy of the tensor (if needed), and, if possible, expose it as a numpy array.
+    # Unlike a PyTorch tensor, a numpy array is pickled with out-of-band buffers when pickle protocol 5 is used,
+    # which allows ray to put the data into its shared-memory object store without an extra serialization copy.
+    t = _compact_tensor(t.detach())
+    if (t.device.type == "cpu") and (t.dtype != torch.bfloat16):
+        return t.numpy()
+    else:
+        return t
 
-        for i in range(1, l - 1):
-            denom = fmax - fmin
-            if denom < 1e-8:
-                denom = 1e-8
-            distances[I[i]] += (U[I[i - 1]] - U[I[i + 1]]) / denom
 
-    return distances
+def _tensor_from_wire(x: Union[torch.Tensor, np.ndarray]) -> torch.Tensor:
+    # Convert the object produced by `_tensor_to_wire(...)` back to a tensor.
+    if isinstance(x, np.ndarray):
+        if not x.flags.writeable:
+            # Arrays received via the shared-memory object store of ray are read-only, but the tensors of a
+            # SolutionBatch must be mutable.
+            x = x.copy()
+        return torch.from_numpy(x)
+    else:
+        return x
 
 
-@njit
-def _pareto_sort_np(utils: np.ndarray, crowdsort: bool, crowdsort_upto: int) -> Tuple[List[np.ndarray], np.ndarray]:
-    count: int = 0
-
-    n = int(len(utils))
-    dominated_by: List[List[int]] = [[0 for __ in range(0)] for _ in range(n)]
-    domination_counter: List[int] = [0 for _ in range(n)]
-    rank = np.zeros(n, dtype="int64")
-    fronts: List[np.ndarray] = [np.array([0], dtype="int64") for _ in range(0)]
-
-    first_front: List[int] = []
-    for p in range(n):
-        for q in range(n):
-            if _dominates(p, q, utils):
-                dominated_by[p].append(q)
-            elif _dominates(q, p, utils):
-                domination_counter[p] += 1
-        if domination_counter[p] == 0:
-            rank[p] = 0
-            # fronts[0].append(p)
-            first_front.append(p)
-
-    first_front_array = np.array(first_front, "int64")
-    if not crowdsort:
-        fronts.append(first_front_array)
-    else:
-        fronts.append(first_front_array[_crowding_distance_assignment(first_front_array, utils).argsort()[::-1]])
-    count += len(fronts[-1])
+def _opt_bool(x: Optional[bool], default: bool) -> bool:
+    result = default
+    if x is not None:
+        result = bool(x)
+    return result
 
-    i = 0
-    while True:
-        next_front: List[int] = []
-        for p in fronts[-1]:
-            for q in dominated_by[p]:
-                domination_counter[q] -= 1
-                if domination_counter[q] == 0:
-                    rank[q] = i + 1
-                    next_front.append(q)
-        i += 1
-
-        if len(next_front) == 0:
-            break
-        else:
-            next_front_array = np.array(next_front, "int64")
-            if (not crowdsort) or (count > crowdsort_upto):
-                fronts.append(next_front_array)
+
+@njit
+def _pareto_ranks_2d_sweep(u0: np.ndarray, u1: np.ndarray, order: np.ndarray) -> np.ndarray:
+    # Compute the pareto ranks of the solutions of a 2-objective problem in O(N log N) time.
+    # The solutions are visited in the given `order`, which is expected to sort them by their first utilities in
+    # descending order (ties being broken by the second utilities, again in descending order).
+    # With this visiting order, the solutions within a front are visited in the order of increasing second utilities,
+    # and therefore, the most recently visited solution of a front is enough to decide whether or not a solution is
+    # dominated by that front. The most recently visited solutions of the fronts are monotonic across the fronts,
+    # which allows us to find the front of each solution via binary search.
+    n = len(order)
+    ranks = np.zeros(n, dtype=np.int64)
+    last_u0 = np.zeros(n, dtype=np.float64)
+    last_u1 = np.zeros(n, dtype=np.float64)
+    num_fronts = 0
+
+    for i in range(n):
+        j = order[i]
+        a = u0[j]
+        b = u1[j]
+
+        lo = 0
+        hi = num_fronts
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if (last_u1[mid] > b) or ((last_u1[mid] == b) and (last_u0[mid] > a)):
+                # The solution is dominated by the front `mid`
+                lo = mid + 1
             else:
-                fronts.append(next_front_array[_crowding_distance_assignment(next_front_array, utils).argsort()[::-1]])
-            count += len(fronts[-1])
+                hi = mid
+
+        ranks[j] = lo
+        last_u0[lo] = a
+        last_u1[lo] = b
+        if lo == num_fronts:
+            num_fronts += 1
+
+    return ranks
+
+
+def _pareto_ranks_2d(utils: torch.Tensor) -> torch.Tensor:
+    # Sort by the first utilities in descending order, ties broken by the second utilities in descending order.
+    # This is done via two stable sorting operations, the last one being according to the primary key.
+    order = torch.sort(utils[:, 1], descending=True, stable=True)[1]
+    order = order[torch.sort(utils[order, 0], descending=True, stable=True)[1]]
+
+    u = utils.to(device="cpu", dtype=torch.float64).numpy()
+    ranks = _pareto_ranks_2d_sweep(u[:, 0], u[:, 1], torch.as_tensor(order, device="cpu").numpy())
+    return torch.as_tensor(torch.from_numpy(ranks), device=utils.device)
+
+
+def _domination_matrix(utils: torch.Tensor, max_chunk_elements: int = 2**24) -> torch.Tensor:
+    # Compute a boolean matrix `D` where `D[i, j]` is True if the i-th solution dominates the j-th solution.
+    # The matrix is computed in chunks of rows, so that the temporary (chunk_size, n, num_objs) comparison
+    # tensors stay reasonably small.
+    n, m = utils.shape
+    result = torch.empty((n, n), dtype=torch.bool, device=utils.device)
+    chunk_size = max(1, max_chunk_elements // max(1, n * m))
+    for begin in range(0, n, chunk_size):
+        end = min(n, begin + chunk_size)
+        lhs = utils[begin:end, None, :]
+        rhs = utils[None, :, :]
+        result[begin:end] = torch.all(lhs >= rhs, dim=-1) & torch.any(lhs > rhs, dim=-1)
+    return result
 
-    return fronts, rank
 
+def _pareto_ranks_by_domination_matrix(utils: torch.Tensor, upto: Optional[int] = None) -> Tuple[torch.Tensor, int]:
+    # Compute the pareto ranks by peeling the fronts one by one, using a domination matrix.
+    # If `upto` is given as an integer, the peeling stops as soon as the fronts found so far contain at least
+    # `upto` solutions. In that case, the solutions which are not in any front found so far get their ranks as
+    # the number of found fronts.
+    n = len(utils)
+    domination = _domination_matrix(utils)
+    domination_counter = torch.sum(domination, dim=0)
+    remaining = torch.ones(n, dtype=torch.bool, device=utils.device)
+
+    ranks = torch.empty(n, dtype=torch.int64, device=utils.device)
+    num_fronts = 0
+    count = 0
+    while count < n:
+        front = torch.nonzero(remaining & (domination_counter == 0)).reshape(-1)
+        ranks[front] = num_fronts
+        remaining[front] = False
+        domination_counter -= torch.sum(domination[front], dim=0)
+        num_fronts += 1
+        count += len(front)
+        if (upto is not None) and (count >= upto):
+            ranks[remaining] = num_fronts
+            break
 
-def _pareto_sort(utils: torch.Tensor, crowdsort: bool, crowdsort_upto: int) -> Tuple[List[torch.Tensor], torch.Tensor]:
-    device = utils.device
-    utils = torch.as_tensor(utils, device="cpu").numpy()
-    fronts, ranks = _pareto_sort_np(utils, crowdsort, crowdsort_upto)
+    return ranks, num_fronts
 
-    for i in range(len(fronts)):
-        fronts[i] = torch.as_tensor(torch.from_numpy(fronts[i]), device=device)
 
-    ranks = torch.as_tensor(torch.from_numpy(ranks), device=device)
+def _crowding_distance_assignment(pareto_set: torch.Tensor, utils: torch.Tensor) -> torch.Tensor:
+    U = utils[pareto_set]
+    l, m = U.shape
+    distances = torch.zeros(l, dtype=torch.float32, device=utils.device)
 
-    return fronts, ranks
+    if l > 2:
+        # Sort the solutions of the front according to each objective (all objectives at once)
+        I = torch.argsort(U, dim=0, descending=True)
+        sorted_U = torch.gather(U, 0, I)
 
+        denom = torch.clamp(torch.amax(U, dim=0) - torch.amin(U, dim=0), min=1e-8)
+        gaps = (sorted_U[:-2, :] - sorted_U[2:, :]) / denom
 
-# @torch.jit.script
-# def _dominates(i: int, j: int, utils: torch.Tensor) -> bool:
-#     return torch.all(utils[i, :] >= utils[j, :]) and torch.any(utils[i, :] > utils[j, :])
+        distances.index_add_(0, I[1:-1, :].reshape(-1), gaps.reshape(-1).to(torch.float32))
+        distances[I[0, :]] = float("inf")
+        distances[I[-1, :]] = float("inf")
+    else:
+        distances[:] = float("inf")
 
+    return distances
 
-# @torch.jit.script
-# def _crowding_distance_assignment(pareto_set: torch.Tensor, utils: torch.Tensor) -> torch.Tensor:
-#     l = len(pareto_set)
-#     distances = torch.zeros(l, dtype=torch.float32, device=utils.device)
-#     for m in range(utils.shape[1]):
-#         # U = utils[pareto_set][:, m]
-#         U = utils[pareto_set, m]
-#         I = torch.argsort(U, descending=True)
-#
-#         # e.g. pareto_set = [1,   7,  3]
-#         # e.g.          U = [20, 14, 15]
-#
-#         # I = [0, 2, 1]
-#
-#         distances[I[0]] = float("inf")
-#         distances[I[-1]] = float("inf")
-#
-#         fmax = torch.max(U)
-#         fmin = torch.min(U)
-#
-#         for i in range(1, l - 1):
-#             denom = fmax - fmin
-#             if denom < 1e-8:
-#                 denom = 1e-8
-#             distances[I[i]] += (U[I[i - 1]] - U[I[i + 1]]) / denom
-#             # distances[I[i]] += (U[I[i - 1]] - U[I[i + 1]]) / (fmax - fmin)
-#
-#     return distances
 
+def _pareto_sort(
+    utils: torch.Tensor, crowdsort: bool, crowdsort_upto: int, upto: Optional[int] = None
+) -> Tuple[List[torch.Tensor], torch.Tensor]:
+    n, m = utils.shape
 
-# @torch.jit.script
-# def _pareto_sort(utils: torch.Tensor, crowdsort: bool, crowdsort_upto: int) -> Tuple[List[torch.Tensor], torch.Tensor]:
-#
-#     count: int = 0
-#
-#     n = int(len(utils))
-#     dominated_by: List[List[int]] = [torch.jit.annotate(List[int], []) for _ in range(n)]
-#     domination_counter: List[int] = [0 for _ in range(n)]
-#     rank = torch.zeros(n, dtype=torch.int64, device=utils.device)
-#     # fronts: List[List[int]] = [torch.jit.annotate(List[int], [])]
-#     fronts: List[torch.Tensor] = []
-#
-#     first_front: List[int] = []
-#     for p in range(n):
-#         for q in range(n):
-#             if _dominates(p, q, utils):
-#                 dominated_by[p].append(q)
-#             elif _dominates(q, p, utils):
-#                 domination_counter[p] += 1
-#         if domination_counter[p] == 0:
-#             rank[p] = 0
-#             # fronts[0].append(p)
-#             first_front.append(p)
-#
-#     first_front_tensor = torch.tensor(first_front, dtype=torch.int64, device=utils.device)
-#     if not crowdsort:
-#         fronts.append(first_front_tensor)
-#     else:
-#         fronts.append(
-#             first_front_tensor[_crowding_distance_assignment(first_front_tensor, utils).argsort(descending=True)]
-#         )
-#     count += len(fronts[-1])
-#
-#     i = 0
-#     while True:
-#         next_front: List[int] = []
-#         for p in fronts[-1]:
-#             for q in dominated_by[p]:
-#                 domination_counter[q] -= 1
-#                 if domination_counter[q] == 0:
-#                     rank[q] = i + 1
-#                     next_front.append(q)
-#         i += 1
-#
-#         if len(next_front) == 0:
-#             break
-#         else:
-#             next_front_tensor = torch.tensor(next_front, dtype=torch.int64, device=utils.device)
-#             if (not crowdsort) or (count > crowdsort_upto):
-#                 fronts.append(next_front_tensor)
-#             else:
-#                 fronts.append(
-#                     next_front_tensor[_crowding_distance_assignment(next_front_tensor, utils).argsort(descending=True)]
-#                 )
-#             count += len(fronts[-1])
-#
-#     return fronts, rank
+    if m == 2:
+        ranks = _pareto_ranks_2d(utils)
+        num_fronts = int(torch.max(ranks)) + 1 if n > 0 else 0
+    else:
+        ranks, num_fronts = _pareto_ranks_by_domination_matrix(utils, upto=upto)
+
+    # Group the solution indices by their ranks, in ascending order of the indices within each front.
+    # If the peeling of the fronts was stopped early (because of `upto`), the solutions which are not in any of the
+    # found fronts are at the end of `order`, and they are left out.
+    sorted_ranks, order = torch.sort(ranks, stable=True)
+    front_sizes = torch.bincount(sorted_ranks, minlength=num_fronts)[:num_fronts].tolist()
+
+    fronts = []
+    count = 0
+    for front in torch.split(order[: sum(front_sizes)], front_sizes):
+        if crowdsort and (len(fronts) == 0 or count <= crowdsort_upto):
+            front = front[torch.argsort(_crowding_distance_assignment(front, utils), descending=True)]
+        fronts.append(front)
+        count += len(front)
+        if (upto is not None) and (count >= upto):
+            break
+
+    return fronts, ranks
 
 
 ParetoInfo = NamedTuple("ParetoInfo", fronts=list, ranks=torch.Tensor)
@@ -2973,6 +5603,13 @@ class SolutionBatch:
         self._descending: Iterable[bool]
         self._slice: Optional[IndicesOrSlice] = None
 
+        # Memo for the results derived from the evaluations (sorting, ranking, pareto-sorting),
+        # valid only as long as the evaluation tensor is not modified
+        self._memo: dict = {}
+        self._memo_version: Optional[tuple] = None
+        self._memo_hits: int = 0
+        self._memo_misses: int = 0
+
         if slice_of is not None:
             expect_none(
                 "While making a new SolutionBatch via slicing",
@@ -3008,7 +5645,7 @@ class SolutionBatch:
             self._slice = slice_info
             self._descending = source._descending
 
-            shares_storage = self._data.storage().data_ptr() == source._data.storage().data_ptr()
+            shares_storage = _storage_of(self._data).data_ptr() == _storage_of(source._data).data_ptr()
 
             if not shares_storage:
                 self._descending = deepcopy(self._descending)
@@ -3159,7 +5796,54 @@ class SolutionBatch:
         descending = self._descending[obj_index]
         ev_col = self._evdata[:, obj_index]
 
-        return torch.argsort(ev_col, descending=descending)
+        return self._memoized(("argsort", obj_index), lambda: torch.argsort(ev_col, descending=descending))
+
+    def _evdata_version(self) -> Optional[tuple]:
+        # The version counter of a tensor is increased by every in-place modification on it (or on any view of it),
+        # including the modifications made through the tensors returned by `access_evals(...)` and
+        # `access_values(...)`. Therefore, a memoized result is valid as long as the version does not change.
+        try:
+            return id(self._evdata), self._evdata._version
+        except RuntimeError:
+            # Inference tensors do not track versions. In such cases, we do not memoize.
+            return None
+
+    def _memoized(self, key: tuple, compute: Callable) -> Any:
+        version = self._evdata_version()
+        if version is None:
+            self._memo_misses += 1
+            return compute()
+
+        if version != self._memo_version:
+            self._memo.clear()
+            self._memo_version = version
+
+        if key in self._memo:
+            self._memo_hits += 1
+        else:
+            self._memo_misses += 1
+            self._memo[key] = compute()
+
+        # The callers receive copies, so that in-place modifications on the returned results do not corrupt the memo
+        result = self._memo[key]
+        if isinstance(result, ParetoInfo):
+            return ParetoInfo(fronts=[front.clone() for front in result.fronts], ranks=result.ranks.clone())
+        else:
+            return result.clone()
+
+    @property
+    def memo_stats(self) -> dict:
+        """
+        Number of memo hits and misses of this SolutionBatch.
+
+        The results of `argsort(...)`, `argbest(...)`, `argworst(...)`,
+        `utility(...)`, `utils(...)`, `arg_pareto_sort(...)` and the sorting
+        done by `take_best(...)` are memoized, and re-used as long as the
+        evaluation results of the solutions are not modified.
+        A memo hit means that a result was re-used instead of being
+        re-computed.
+        """
+        return {"hits": self._memo_hits, "misses": self._memo_misses}
 
     @torch.no_grad()
     def arg_pareto_sort(self, crowdsort: bool = True, crowdsort_upto: Optional[int] = None) -> ParetoInfo:
@@ -3202,11 +5886,17 @@ class SolutionBatch:
         Returns:
             A ParetoInfo instance
         """
-        if not NumbaLib.is_found:
-            NumbaLib.warn("arg_pareto_sort")
+        return self._memoized(
+            ("arg_pareto_sort", bool(crowdsort), crowdsort_upto),
+            lambda: self._arg_pareto_sort(crowdsort, crowdsort_upto),
+        )
 
+    def _arg_pareto_sort(self, crowdsort: bool, crowdsort_upto: Optional[int]) -> ParetoInfo:
         utils = self.utils()
 
+        if (not NumbaLib.is_found) and (utils.shape[1] == 2):
+            NumbaLib.warn("arg_pareto_sort")
+
         if not crowdsort:
             if crowdsort_upto is not None:
                 raise ValueError(
@@ -3237,7 +5927,7 @@ class SolutionBatch:
         obj_index = self._optionally_get_obj_index(obj_index)
         descending = self._descending[obj_index]
         argf = torch.argmax if descending else torch.argmin
-        return argf(self._evdata[:, obj_index])
+        return self._memoized(("argbest", obj_index), lambda: argf(self._evdata[:, obj_index]))
 
     @torch.no_grad()
     def argworst(self, obj_index: Optional[int] = None) -> torch.Tensor:
@@ -3253,7 +5943,7 @@ class SolutionBatch:
         obj_index = self._optionally_get_obj_index(obj_index)
         descending = self._descending[obj_index]
         argf = torch.argmin if descending else torch.argmax
-        return argf(self._evdata[:, obj_index])
+        return self._memoized(("argworst", obj_index), lambda: argf(self._evdata[:, obj_index]))
 
     def _get_objective_sign(self, i_obj: int) -> float:
         if self._descending[i_obj]:
@@ -3574,6 +6264,23 @@ class SolutionBatch:
         Returns:
             Utility scores, in a PyTorch tensor.
         """
+        if obj_index is not None:
+            obj_index = self._normalize_obj_index(obj_index)
+        return self._memoized(
+            ("utility", obj_index, ranking_method, bool(check_nans), bool(using_values_dtype)),
+            lambda: self._utility(
+                obj_index, ranking_method=ranking_method, check_nans=check_nans, using_values_dtype=using_values_dtype
+            ),
+        )
+
+    def _utility(
+        self,
+        obj_index: Optional[int],
+        *,
+        ranking_method: Optional[str],
+        check_nans: bool,
+        using_values_dtype: bool,
+    ) -> torch.Tensor:
         if obj_index is not None:
             obj_index = self._normalize_obj_index(obj_index)
 
@@ -3656,10 +6363,17 @@ class SolutionBatch:
             result = result.view(len(result), 1)
         return result
 
-    def split(self, num_pieces: Optional[int] = None, *, max_size: Optional[int] = None) -> "SolutionBatchPieces":
+    def split(
+        self,
+        num_pieces: Optional[int] = None,
+        *,
+        max_size: Optional[int] = None,
+        piece_sizes: Optional[Iterable[int]] = None,
+    ) -> "SolutionBatchPieces":
         """Split this SolutionBatch into a specified number of pieces,
         or into an unspecified number of pieces where the maximum
-        size of each piece is specified.
+        size of each piece is specified, or into pieces of the specified
+        sizes.
 
         Args:
             num_pieces: Can be provided as an integer n, which means
@@ -3671,12 +6385,16 @@ class SolutionBatch:
                 pieces, each piece containing n solutions at most.
                 Alternatively, can be left as None if the user intends
                 to set num_pieces as an integer instead.
+            piece_sizes: Can be provided as a sequence of integers, which
+                means that this SolutionBatch will be split into pieces
+                of these sizes (the sum of the sizes being expected to be
+                equal to the length of this SolutionBatch).
         Returns:
             A SolutionBatchPieces object, which behaves like a list of
             SolutionBatch objects, each object in the list being a
             slice view of this SolutionBatch object.
         """
-        return SolutionBatchPieces(self, num_pieces=num_pieces, max_size=max_size)
+        return SolutionBatchPieces(self, num_pieces=num_pieces, max_size=max_size, piece_sizes=piece_sizes)
 
     @torch.no_grad()
     def concat(self, other: Union["SolutionBatch", Iterable]) -> "SolutionBatch":
@@ -3731,7 +6449,10 @@ class SolutionBatch:
             The new SolutionBatch.
         """
         if obj_index is None and self._num_objs >= 2:
-            fronts, _ = self.arg_pareto_sort(crowdsort=True, crowdsort_upto=n)
+            # Pareto fronts are peeled only until they contain at least n solutions
+            fronts, _ = self._memoized(
+                ("take_best_pareto_sort", n), lambda: ParetoInfo(*_pareto_sort(self.utils(), True, n, upto=n))
+            )
             indices = torch.cat(fronts)[:n]
         else:
             indices = self.argsort(obj_index)[:n]
@@ -3746,6 +6467,32 @@ class SolutionBatch:
     def __copy__(self):
         return deepcopy(self)
 
+    def __getstate__(self) -> dict:
+        # The state of a SolutionBatch contains only the solutions it refers to, even when the SolutionBatch is a
+        # slice of a bigger SolutionBatch (in which case, pickling its tensors as they are would cause the storage
+        # of the entire bigger SolutionBatch to be pickled). This keeps the amount of data sent to (and received
+        # from) a remote actor proportional to the size of the batch piece that the actor is responsible for.
+        # The ObjectArray, on the other hand, takes care of its own compact pickling.
+        state = dict(self.__dict__)
+        if isinstance(self._data, torch.Tensor):
+            state["_data"] = _tensor_to_wire(self._data)
+        state["_evdata"] = _tensor_to_wire(self._evdata)
+        state["_slice"] = None
+        state["_memo"] = {}
+        state["_memo_version"] = None
+        return state
+
+    def __setstate__(self, state: dict):
+        state = dict(state)
+        if not isinstance(state["_data"], ObjectArray):
+            state["_data"] = _tensor_from_wire(state["_data"])
+        state["_evdata"] = _tensor_from_wire(state["_evdata"])
+        state.setdefault("_memo", {})
+        state.setdefault("_memo_version", None)
+        state.setdefault("_memo_hits", 0)
+        state.setdefault("_memo_misses", 0)
+        self.__dict__.update(state)
+
     def clone(self, memo: Optional[dict] = None) -> "SolutionBatch":
         """
         Get a deepcopy of the SolutionBatch.
@@ -3890,7 +6637,14 @@ class SolutionBatchPieces(Sequence):
     """
 
     @torch.no_grad()
-    def __init__(self, batch: SolutionBatch, *, num_pieces: Optional[int] = None, max_size: Optional[int] = None):
+    def __init__(
+        self,
+        batch: SolutionBatch,
+        *,
+        num_pieces: Optional[int] = None,
+        max_size: Optional[int] = None,
+        piece_sizes: Optional[Iterable[int]] = None,
+    ):
         """
         `__init__(...)`: Initialize the SolutionBatchPieces.
 
@@ -3910,6 +6664,10 @@ class SolutionBatchPieces(Sequence):
                 pieces, each piece containing n solutions at most.
                 Alternatively, can be left as None if the user intends
                 to set num_pieces as an integer instead.
+            piece_sizes: Can be provided as a sequence of integers, which
+                means that the main SolutionBatch will be split into
+                pieces of these sizes. The sum of the sizes is expected
+                to be equal to the length of the main SolutionBatch.
         """
 
         self._batch = batch
@@ -3920,7 +6678,16 @@ class SolutionBatchPieces(Sequence):
 
         total_size = len(self._batch)
 
-        if max_size is None and num_pieces is not None:
+        if piece_sizes is not None:
+            if (num_pieces is not None) or (max_size is not None):
+                raise ValueError("Expected only one of num_pieces, max_size, or piece_sizes, received more.")
+            self._piece_sizes = [int(size) for size in piece_sizes]
+            if any(size < 0 for size in self._piece_sizes) or (sum(self._piece_sizes) != total_size):
+                raise ValueError(
+                    f"The piece sizes were expected as non-negative integers summing up to {total_size},"
+                    f" but got {self._piece_sizes}."
+                )
+        elif max_size is None and num_pieces is not None:
             num_pieces = int(num_pieces)
             # divide to pieces
             base_size = total_size // num_pieces
@@ -34,6 +34,10 @@ class Distribution(TensorMakerMixin):
     MANDATORY_PARAMETERS = set()
     OPTIONAL_PARAMETERS = set()
 
+    # Whether or not the solutions are sampled in a symmetric (i.e. antithetic) manner, the (2i)-th and the (2i+1)-th
+    # solutions being generated from the same noise vector, with opposite signs
+    SYMMETRIC_SAMPLING = False
+
     def __init__(
         self, *, solution_length: int, parameters: dict, dtype: Optional[DType] = None, device: Optional[Device] = None
     ):
@@ -200,6 +204,29 @@ class Distribution(TensorMakerMixin):
         self._fill(out, generator=generator)
         return out
 
+    def transform_noise(self, noise: torch.Tensor) -> torch.Tensor:
+        """
+        Transform the given standard normal noise vectors into solutions.
+
+        This is the deterministic part of the sampling procedure of this
+        search distribution, i.e. sampling from this distribution is
+        equivalent to transforming noise vectors drawn from `N(0, I)`.
+        It allows the solutions to be reconstructed from their noise
+        vectors (e.g. from the offsets and the signs stored by a
+        `NoiseTable`).
+
+        Inheriting classes whose sampling procedure can be expressed in
+        this form are expected to implement this method.
+
+        Args:
+            noise: The noise vectors, as a 2-dimensional tensor.
+        Returns:
+            The solutions, as a 2-dimensional tensor.
+        """
+        raise NotImplementedError(
+            f"The distribution {type(self).__name__} does not support sampling from given noise vectors"
+        )
+
     def _compute_gradients(self, samples: torch.Tensor, weights: torch.Tensor, ranking_used: Optional[str]) -> dict:
         """
         Compute the gradients out of the samples (sampled solutions)
@@ -447,6 +474,9 @@ class SeparableGaussian(Distribution):
     def _fill(self, out: torch.Tensor, *, generator: Optional[torch.Generator] = None):
         self.make_gaussian(out=out, center=self.mu, stdev=self.sigma, generator=generator)
 
+    def transform_noise(self, noise: torch.Tensor) -> torch.Tensor:
+        return self.mu + self.sigma * noise
+
     def _divide_grad(self, param_name: str, grad: torch.Tensor, weights: torch.Tensor) -> torch.Tensor:
         option = f"divide_{param_name}_grad_by"
         if option in self.parameters:
@@ -554,6 +584,7 @@ class SymmetricSeparableGaussian(SeparableGaussian):
 
     MANDATORY_PARAMETERS = {"mu", "sigma"}
     OPTIONAL_PARAMETERS = {"divide_mu_grad_by", "divide_sigma_grad_by", "parenthood_ratio"}
+    SYMMETRIC_SAMPLING = True
 
     def _fill(self, out: torch.Tensor, *, generator: Optional[torch.Generator] = None):
         self.make_gaussian(out=out, center=self.mu, stdev=self.sigma, symmetric=True, generator=generator)
@@ -811,6 +842,9 @@ class ExpGaussian(Distribution):
         # Map local coordinates to global coordinate system
         out[:] = self.to_global_coordinates(out)
 
+    def transform_noise(self, noise: torch.Tensor) -> torch.Tensor:
+        return self.to_global_coordinates(noise)
+
     def _compute_gradients(self, samples: torch.Tensor, weights: torch.Tensor, ranking_used: Optional[str]) -> dict:
         """Compute the gradients with respect to a given set of samples and weights
         Args:
@@ -829,10 +863,9 @@ class ExpGaussian(Distribution):
             weights = weights - torch.mean(weights)
 
         d_grad = total(dot(weights, local_coordinates))
-        local_coordinates_outer = local_coordinates.unsqueeze(1) * local_coordinates.unsqueeze(2)
-        M_grad = torch.sum(
-            weights.unsqueeze(-1).unsqueeze(-1) * (local_coordinates_outer - self.eye.unsqueeze(0)), dim=0
-        )
+        # The gradient on M is sum_i w_i (z_i z_i^T - I), which we compute as the weighted Gram matrix Z^T diag(w) Z
+        # minus sum(w) I, so that no per-sample d x d matrix is ever materialized
+        M_grad = (local_coordinates.T * weights) @ local_coordinates - torch.sum(weights) * self.eye
 
         return {
             "d": d_grad,
@@ -865,3 +898,332 @@ class ExpGaussian(Distribution):
 
         # Return modified distribution
         return self.modified_copy(mu=new_mu, sigma=new_A, sigma_inv=new_A_inv)
+
+
+class LowRankGaussian(Distribution):
+    """
+    Multivariate Gaussian whose covariance matrix is represented as
+    diagonal plus low-rank.
+
+    The covariance matrix of this distribution is
+    `diag(sigma) @ (I + V @ V.T) @ diag(sigma)`, where `sigma` is a vector
+    of length `d` and `V` is a matrix of shape `(d, k)`, `d` being the
+    solution length, and `k` being the rank.
+    In addition to the separable scaling of SNES, this allows the search
+    distribution to capture `k` directions of correlation, while the costs
+    of sampling, gradient computation, and updating are `O(n * k * d)`
+    (instead of the `O(d^3)` cost of `ExpGaussian`).
+
+    The gradients for `mu` and `sigma` are computed in the same manner
+    as done by SNES (they reduce to the SNES gradients when `V` is 0).
+    The gradient for `V` is the gradient of the expected utility with
+    respect to `V`, computed via the Woodbury identity.
+    """
+
+    MANDATORY_PARAMETERS = {"mu", "sigma"}
+    OPTIONAL_PARAMETERS = {"V", "rank"}
+
+    def __init__(
+        self,
+        parameters: dict,
+        *,
+        solution_length: Optional[int] = None,
+        device: Optional[Device] = None,
+        dtype: Optional[DType] = None,
+    ):
+        [mu_length] = parameters["mu"].shape
+        [sigma_length] = parameters["sigma"].shape
+
+        if solution_length is None:
+            solution_length = mu_length
+        else:
+            if solution_length != mu_length:
+                raise ValueError(
+                    f"The argument `solution_length` does not match the length of `mu` provided in `parameters`."
+                    f" solution_length={solution_length},"
+                    f' parameters["mu"]={mu_length}.'
+                )
+
+        if mu_length != sigma_length:
+            raise ValueError(
+                f"The tensors `mu` and `sigma` provided within `parameters` have mismatching lengths."
+                f' parameters["mu"]={mu_length},'
+                f' parameters["sigma"]={sigma_length}.'
+            )
+
+        parameters = copy(parameters)
+        if "V" not in parameters:
+            if "rank" not in parameters:
+                raise ValueError("Expected either `V` or `rank` within `parameters`, but neither was found.")
+            # Initialize the low-rank factor with small random values.
+            # Because the gradient with respect to `V` is proportional to `V`, a zero-filled `V` would never move.
+            rank = int(parameters["rank"])
+            parameters["V"] = torch.randn(
+                (mu_length, rank), dtype=parameters["mu"].dtype, device=parameters["mu"].device
+            ) * (0.1 / math.sqrt(mu_length))
+
+        [v_length, _] = parameters["V"].shape
+        if v_length != mu_length:
+            raise ValueError(
+                f"The number of rows of `V` does not match the length of `mu`."
+                f' parameters["mu"]={mu_length},'
+                f' parameters["V"] has the shape {parameters["V"].shape}.'
+            )
+        parameters["rank"] = int(parameters["V"].shape[1])
+
+        super().__init__(
+            solution_length=solution_length,
+            parameters=parameters,
+            device=device,
+            dtype=dtype,
+        )
+
+    @property
+    def mu(self) -> torch.Tensor:
+        return self.parameters["mu"]
+
+    @property
+    def sigma(self) -> torch.Tensor:
+        return self.parameters["sigma"]
+
+    @property
+    def V(self) -> torch.Tensor:
+        """The low-rank factor of the covariance matrix, of shape `(d, k)`"""
+        return self.parameters["V"]
+
+    @property
+    def rank(self) -> int:
+        return self.parameters["rank"]
+
+    def _fill(self, out: torch.Tensor, *, generator: Optional[torch.Generator] = None):
+        [num_solutions, _] = out.shape
+        self.make_gaussian(out=out, generator=generator)
+        low_rank_noise = self.make_gaussian(num_solutions, self.rank, generator=generator)
+        out.addmm_(low_rank_noise, self.V.T)
+        out.mul_(self.sigma).add_(self.mu)
+
+    def _inverse_scaled(self, u: torch.Tensor) -> torch.Tensor:
+        # Compute (I + V V^T)^(-1) u for each row u, via the Woodbury identity
+        V = self.V
+        K = torch.eye(self.rank, dtype=V.dtype, device=V.device) + V.T @ V
+        return u - torch.linalg.solve(K, (u @ V).T).T @ V.T
+
+    def _compute_gradients(self, samples: torch.Tensor, weights: torch.Tensor, ranking_used: Optional[str]) -> dict:
+        if ranking_used != "nes":
+            weights = weights / torch.sum(torch.abs(weights))
+
+        V = self.V
+        scaled_noises = samples - self.mu
+        u = scaled_noises / self.sigma
+        s = self._inverse_scaled(u)
+
+        mu_grad = total(dot(weights, scaled_noises))
+        sigma_grad = total(dot(weights, (u * s) - 1))
+
+        # Gradient with respect to V: sum_i w_i * (s_i s_i^T - (I + V V^T)^(-1)) V
+        K = torch.eye(self.rank, dtype=V.dtype, device=V.device) + V.T @ V
+        V_grad = dot(weights, s).T @ (s @ V) - torch.sum(weights) * torch.linalg.solve(K, V.T).T
+
+        return {"mu": mu_grad, "sigma": sigma_grad, "V": V_grad}
+
+    def update_parameters(
+        self,
+        gradients: dict,
+        *,
+        learning_rates: Optional[dict] = None,
+        optimizers: Optional[dict] = None,
+    ) -> "LowRankGaussian":
+        learning_rates = {} if learning_rates is None else dict(learning_rates)
+        if ("V" not in learning_rates) and ("sigma" in learning_rates):
+            learning_rates["V"] = learning_rates["sigma"]
+
+        mu_grad = gradients["mu"]
+        sigma_grad = gradients["sigma"]
+        V_grad = gradients["V"]
+
+        new_mu = self.mu + self._follow_gradient("mu", mu_grad, learning_rates=learning_rates, optimizers=optimizers)
+        new_sigma = self.sigma * torch.exp(
+            0.5 * self._follow_gradient("sigma", sigma_grad, learning_rates=learning_rates, optimizers=optimizers)
+        )
+        new_V = self.V + self._follow_gradient("V", V_grad, learning_rates=learning_rates, optimizers=optimizers)
+
+        return self.modified_copy(mu=new_mu, sigma=new_sigma, V=new_V)
+
+
+class LimitedMemoryGaussian(Distribution):
+    """
+    Multivariate Gaussian whose covariance matrix is represented implicitly
+    by a limited number of direction vectors, in the style of LM-MA-ES.
+
+    A sample is generated as `mu + sigma * T(z)` where `z` is drawn from
+    `N(0, I)` and `T` is a sequence of rank-one transformations, each of
+    them being `y <- y + c_j * m_j * (m_j^T y)`, `m_j` being the
+    j-th direction vector and `c_j` being its transformation rate.
+    Differently from LM-MA-ES, the transformations do not shrink `y` by
+    the factor `(1 - c_j)`, so that the overall scale of the search
+    distribution is controlled by `sigma` alone, and `T` is the identity
+    when all direction vectors are 0.
+    With `m` direction vectors, the costs of sampling and of computing
+    the gradients are `O(n * m * d)`, and no `d x d` matrix is ever stored.
+
+    The gradients for `mu` and `sigma` are computed in the same manner
+    as done by SNES (they reduce to the SNES gradients when all direction
+    vectors are 0). The direction vectors are updated as evolution paths
+    (with different rates, so that they capture the search directions of
+    different time horizons), accumulating the weighted average of the
+    untransformed noise vectors.
+
+    Reference:
+
+        Ilya Loshchilov, Tobias Glasmachers, Hans-Georg Beyer (2018).
+        Large Scale Black-box Optimization by Limited-Memory Matrix
+        Adaptation.
+    """
+
+    MANDATORY_PARAMETERS = {"mu", "sigma"}
+    OPTIONAL_PARAMETERS = {"directions", "num_directions", "transform_rates", "path_rates"}
+
+    def __init__(
+        self,
+        parameters: dict,
+        *,
+        solution_length: Optional[int] = None,
+        device: Optional[Device] = None,
+        dtype: Optional[DType] = None,
+    ):
+        [mu_length] = parameters["mu"].shape
+        [sigma_length] = parameters["sigma"].shape
+
+        if solution_length is None:
+            solution_length = mu_length
+        else:
+            if solution_length != mu_length:
+                raise ValueError(
+                    f"The argument `solution_length` does not match the length of `mu` provided in `parameters`."
+                    f" solution_length={solution_length},"
+                    f' parameters["mu"]={mu_length}.'
+                )
+
+        if mu_length != sigma_length:
+            raise ValueError(
+                f"The tensors `mu` and `sigma` provided within `parameters` have mismatching lengths."
+                f' parameters["mu"]={mu_length},'
+                f' parameters["sigma"]={sigma_length}.'
+            )
+
+        parameters = copy(parameters)
+        mu = parameters["mu"]
+        d = mu_length
+
+        if "directions" not in parameters:
+            num_directions = int(parameters.get("num_directions", 4 + math.floor(3 * math.log(d))))
+            parameters["directions"] = torch.zeros((num_directions, d), dtype=mu.dtype, device=mu.device)
+
+        [num_directions, directions_length] = parameters["directions"].shape
+        if directions_length != d:
+            raise ValueError(
+                f"The direction vectors do not match the length of `mu`."
+                f' parameters["mu"]={mu_length},'
+                f' parameters["directions"] has the shape {parameters["directions"].shape}.'
+            )
+        parameters["num_directions"] = num_directions
+
+        # Default rates as suggested by Loshchilov et al. (2018), assuming the default population size
+        j = torch.arange(num_directions, dtype=mu.dtype, device=mu.device)
+        if "transform_rates" not in parameters:
+            parameters["transform_rates"] = 1 / ((1.5**j) * d)
+        if "path_rates" not in parameters:
+            default_popsize = 4 + math.floor(3 * math.log(d))
+            parameters["path_rates"] = torch.clamp(default_popsize / ((4.0**j) * d), max=1.0)
+
+        super().__init__(
+            solution_length=solution_length,
+            parameters=parameters,
+            device=device,
+            dtype=dtype,
+        )
+
+    @property
+    def mu(self) -> torch.Tensor:
+        return self.parameters["mu"]
+
+    @property
+    def sigma(self) -> torch.Tensor:
+        return self.parameters["sigma"]
+
+    @property
+    def directions(self) -> torch.Tensor:
+        """The direction vectors, as a tensor of shape `(m, d)`"""
+        return self.parameters["directions"]
+
+    def _transform(self, z: torch.Tensor) -> torch.Tensor:
+        y = z
+        for m_j, c_j in zip(self.directions, self.parameters["transform_rates"]):
+            y = y + c_j * torch.outer(y @ m_j, m_j)
+        return y
+
+    def _inverse_transform(self, y: torch.Tensor, *, transposed: bool = False) -> torch.Tensor:
+        # Each rank-one transformation I + c m m^T is inverted via the Sherman-Morrison formula:
+        # (I + c m m^T)^(-1) = I - (c / (1 + c |m|^2)) m m^T
+        # Because each of these matrices is symmetric, the inverse of the transposed transformation is obtained
+        # by applying the inverted transformations in the reverse order.
+        pairs = list(zip(self.directions, self.parameters["transform_rates"]))
+        if not transposed:
+            pairs = reversed(pairs)
+        z = y
+        for m_j, c_j in pairs:
+            b = c_j / (1 + c_j * torch.dot(m_j, m_j))
+            z = z - b * torch.outer(z @ m_j, m_j)
+        return z
+
+    def _fill(self, out: torch.Tensor, *, generator: Optional[torch.Generator] = None):
+        self.make_gaussian(out=out, generator=generator)
+        out[:] = self.transform_noise(out)
+
+    def transform_noise(self, noise: torch.Tensor) -> torch.Tensor:
+        return self.mu + self.sigma * self._transform(noise)
+
+    def _compute_gradients(self, samples: torch.Tensor, weights: torch.Tensor, ranking_used: Optional[str]) -> dict:
+        if ranking_used != "nes":
+            weights = weights / torch.sum(torch.abs(weights))
+
+        scaled_noises = samples - self.mu
+        y = scaled_noises / self.sigma
+
+        # Recover the untransformed noise vectors
+        z = self._inverse_transform(y)
+
+        # (T T^T)^(-1) y, which is needed for the gradient with respect to sigma
+        s = self._inverse_transform(z, transposed=True)
+
+        mu_grad = total(dot(weights, scaled_noises))
+        sigma_grad = total(dot(weights, (y * s) - 1))
+
+        # Weighted average of the untransformed noise vectors, normalized such that it would be distributed
+        # according to N(0, I) under random selection
+        weight_norm = torch.clamp(torch.linalg.norm(weights), min=1e-8)
+        directions_grad = total(dot(weights, z)) / weight_norm
+
+        return {"mu": mu_grad, "sigma": sigma_grad, "directions": directions_grad}
+
+    def update_parameters(
+        self,
+        gradients: dict,
+        *,
+        learning_rates: Optional[dict] = None,
+        optimizers: Optional[dict] = None,
+    ) -> "LimitedMemoryGaussian":
+        mu_grad = gradients["mu"]
+        sigma_grad = gradients["sigma"]
+
+        new_mu = self.mu + self._follow_gradient("mu", mu_grad, learning_rates=learning_rates, optimizers=optimizers)
+        new_sigma = self.sigma * torch.exp(
+            0.5 * self._follow_gradient("sigma", sigma_grad, learning_rates=learning_rates, optimizers=optimizers)
+        )
+
+        # Each direction vector is updated as an evolution path with its own rate
+        path_rates = self.parameters["path_rates"].unsqueeze(-1)
+        direction = torch.as_tensor(gradients["directions"], dtype=self.dtype, device=self.device)
+        new_directions = (1 - path_rates) * self.directions + torch.sqrt(path_rates * (2 - path_rates)) * direction
+
+        return self.modified_copy(mu=new_mu, sigma=new_sigma, directions=new_directions)
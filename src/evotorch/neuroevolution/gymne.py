@@ -14,7 +14,10 @@
 
 """This namespace contains the `GymNE` class."""
 
+import threading
+from collections import deque
 from collections.abc import Mapping
+from contextlib import nullcontext
 from copy import deepcopy
 from typing import Any, Callable, Iterable, List, Optional, Union
 
@@ -23,10 +26,11 @@ import numpy as np
 import torch
 from torch import nn
 
-from ..core import BoundsPairLike, SolutionBatch
+from ..core import BoundsPairLike, SolutionBatch, WarmActorPool
 from ..tools.misc import Device
 from .neproblem import NEProblem
 from .net import RunningStat
+from .net.batched import BatchedNetwork
 from .net.layers import reset_module_state
 from .net.rl import ActClipLayer, ObsNormLayer, _accumulate_all_across_dicts, reset_env, take_step_in_env
 
@@ -44,6 +48,29 @@ def ensure_space_types(env: gym.Env) -> None:
         )
 
 
+def _map_states(f: Callable, states: dict) -> dict:
+    # Apply the function `f` on each state tensor, where a state can be a tensor or a tuple of tensors
+    result = {}
+    for k, v in states.items():
+        if isinstance(v, tuple):
+            result[k] = tuple(f(x) for x in v)
+        else:
+            result[k] = f(v)
+    return result
+
+
+def _flatten_states(states: dict) -> List[torch.Tensor]:
+    # Get all the state tensors within a list, in a deterministic order
+    result = []
+    for k in sorted(states.keys()):
+        v = states[k]
+        if isinstance(v, tuple):
+            result.extend(v)
+        else:
+            result.append(v)
+    return result
+
+
 class GymNE(NEProblem):
     """
     Representation of a NeuroevolutionProblem where the goal is to maximize
@@ -66,6 +93,24 @@ class GymNE(NEProblem):
         num_subbatches: Optional[int] = None,
         subbatch_size: Optional[int] = None,
         initial_bounds: Optional[BoundsPairLike] = (-0.00001, 0.00001),
+        num_envs: Optional[int] = None,
+        compact_obs_sync: bool = False,
+        eval_cache_size: Optional[int] = None,
+        parallel_backend: str = "ray",
+        num_threads: Optional[int] = None,
+        intra_op_threads: Optional[int] = None,
+        worker_addresses: Optional[Iterable[str]] = None,
+        worker_authkey: Optional[Union[str, bytes]] = None,
+        tasks_per_actor: int = 2,
+        throughput_aware: bool = False,
+        throughput_smoothing: float = 0.2,
+        speculative_execution: bool = False,
+        eval_deadline: Optional[float] = None,
+        deadline_penalty: Optional[Union[float, Iterable[float]]] = None,
+        actor_pool: Optional[Union[str, WarmActorPool]] = None,
+        threads_per_actor: Optional[Union[int, str]] = None,
+        pin_actors: bool = False,
+        scaling_policy: Optional[Callable[[dict], Optional[int]]] = None,
     ):
         """
         `__init__(...)`: Initialize the GymNE.
@@ -152,7 +197,135 @@ class GymNE(NEProblem):
                 be given values other than None at the same time.
             initial_bounds: Specifies an interval from which the values of the
                 initial policy parameters will be drawn.
+            num_envs: Number of environment copies to be stepped together
+                when evaluating a batch of solutions. If left as None (which
+                is the default), the solutions are evaluated one by one, and
+                the episodes of a solution are run one after another.
+                If given as an integer K, then (within the main process or,
+                if the problem is parallelized, within each remote actor)
+                K environments are stepped at each tick, the actions for all
+                of them being computed with a single batched forward pass
+                of the policies (see `BatchedNetwork`). As soon as an
+                environment finishes its episode, it is assigned the next
+                pending episode (of the same solution or of the next one).
+                Recurrent policies (e.g. `RecurrentNet` and `LSTMNet`) are
+                supported, with their hidden states being tracked separately
+                for each environment. However, `BatchedNetwork` runs the
+                stateful policies one network at a time (see
+                `evotorch.neuroevolution.net.batched`), so, recurrent
+                policies do not benefit from a batched forward pass.
+            compact_obs_sync: Only meaningful when the problem is
+                parallelized and `observation_normalization` is True.
+                If left as False (which is the default), the complete
+                observation stats are sent to each actor at the beginning
+                of each generation, and each actor sends back its newly
+                collected observation stats as a `RunningStat` object.
+                If set as True, each actor accumulates the count, the sum,
+                and the sum of squares of its newly collected observations
+                into a preallocated float64 array, and sends back only this
+                array. The main process merges the arrays of all the actors
+                in a single vectorized reduction, and sends to the actors
+                only the mean and the standard deviation vectors to be used
+                for normalization. Within a generation, the actors then
+                normalize their observations with these fixed vectors,
+                instead of also taking their local observations into account.
+            eval_cache_size: If given as an integer `n`, the evaluation
+                results of the last `n` distinct solutions encountered are
+                cached and reused. Meant only for deterministic environments
+                and policies (and therefore, not to be used together with
+                `observation_normalization`, which changes the behavior of a
+                policy as the observation stats are updated).
+                See the documentation of `Problem` for details.
+            parallel_backend: The backend to be used for parallelization.
+                The default is "ray". Alternatively, "multiprocessing" can be
+                given, in which case the remote copies of the problem (each
+                with its own environment) live in local worker processes,
+                without ray. Another alternative is "socket", in which case
+                the remote copies live in standalone workers (see
+                `worker_addresses`).
+                See the documentation of `Problem` for details.
+            num_threads: If given as an integer `n` greater than 1, the
+                solutions are evaluated by a pool of `n` threads within the
+                evaluating process, each thread stepping its own environment
+                (or its own `num_envs` environments) with its own copy of the
+                policy network. The observation stats and the counters are
+                shared by the threads, and are updated under a lock.
+                This is useful only when the simulator releases the GIL.
+                See the documentation of `Problem` for details.
+            intra_op_threads: Only to be used together with `num_threads`.
+                Number of threads each evaluation thread can use for the
+                intra-op parallelism of PyTorch.
+                See the documentation of `Problem` for details.
+            worker_addresses: Required when `parallel_backend` is "socket",
+                i.e. when the remote copies of the problem are to live in
+                standalone workers started via `python -m evotorch.worker`
+                (possibly on other hosts), without ray. The addresses of the
+                workers, each in the form "host:port" or
+                "unix:/path/to/socket". With the "socket" backend,
+                `num_actors` is expected as None (for one remote copy per
+                address) or as an integer.
+                See the documentation of `Problem` for details.
+            worker_authkey: The authentication key of the standalone
+                workers (relevant only when `parallel_backend` is "socket").
+            tasks_per_actor: Maximum number of tasks (e.g. sub-batches to
+                evaluate) which can be outstanding per actor at the same
+                time. With the default value 2, an actor receives its next
+                task while it is still working on its current one.
+                See the documentation of `Problem` for details.
+            throughput_aware: If True, the throughput of each actor is
+                measured, and, when splitting the work without
+                `subbatch_size`, each actor is given a share of the work
+                proportional to its throughput. Along with the solutions per
+                second, the simulator interactions per second of each actor
+                are reported in the status dictionary, under the key
+                "actor_interactions_per_sec".
+                See the documentation of `Problem` for details.
+            throughput_smoothing: The coefficient of the exponential moving
+                average used for tracking the throughputs of the actors
+                (relevant only when `throughput_aware` is True).
+            speculative_execution: If True, when the last pieces of a
+                population are still being evaluated and some actors are
+                idle, copies of these outstanding pieces are given to the
+                idle actors, and whichever copy finishes first provides the
+                evaluation results.
+                See the documentation of `Problem` for details.
+            eval_deadline: Optionally a per-generation deadline, in seconds.
+                The pieces of a population which are not evaluated within
+                this many seconds (e.g. because a simulator hung) are
+                abandoned, and their solutions receive `deadline_penalty`
+                (or are left unevaluated, in which case the Gaussian search
+                algorithms such as PGPE and SNES leave them out of their
+                gradient estimates).
+                See the documentation of `Problem` for details.
+            deadline_penalty: The evaluation result to be assigned to the
+                solutions which miss `eval_deadline`.
+            actor_pool: A `WarmActorPool`, or the name of a `WarmActorPool`,
+                whose actors are to be reused instead of creating new ones.
+                This can save the cost of starting new actors when many
+                short experiments are run one after another. To create the
+                environments of the actors before the first generation,
+                one can call `warm_up()`.
+                See the documentation of `Problem` for details.
+            threads_per_actor: Number of CPU threads each remote actor is
+                allowed to use. With the default `num_actors="max"`, an
+                actor is created for each CPU, and therefore, it can be
+                beneficial to set this as 1 (or as "auto", which divides
+                the available CPUs equally among the actors), so that
+                the actors do not compete for the cores with their
+                intra-op threads.
+                See the documentation of `Problem` for details.
+            pin_actors: Whether or not to pin each remote actor to its own
+                block of `threads_per_actor` cores.
+            scaling_policy: Optionally a function which decides, before each
+                generation, how many actors the problem should have, from the
+                measurements of the previous generation.
+                See the documentation of `Problem` for details.
         """
+        if (num_envs is not None) and (int(num_envs) < 1):
+            raise ValueError(f"`num_envs` was expected as None or as a positive integer, but got {repr(num_envs)}")
+        if compact_obs_sync and (not observation_normalization):
+            raise ValueError("`compact_obs_sync` can only be set as True when `observation_normalization` is True")
+
         # Store various environment information
         self._env_name = env_name
         self._env_config = {} if env_config is None else deepcopy(dict(env_config))
@@ -165,9 +338,19 @@ class GymNE(NEProblem):
 
         self._env: Optional[gym.Env] = None
 
+        self._num_envs: Optional[int] = None if num_envs is None else int(num_envs)
+        self._envs: Optional[List[gym.Env]] = None
+
+        # The lock guarding the observation stats and the counters while multiple threads are evaluating solutions
+        self._stats_lock: Optional[threading.Lock] = None
+
         self._obs_stats: Optional[RunningStat] = None
         self._collected_stats: Optional[RunningStat] = None
 
+        self._compact_obs_sync = bool(compact_obs_sync)
+        self._obs_delta: Optional[np.ndarray] = None
+        self._obs_norm_vectors: Optional[tuple] = None
+
         # Create a temporary environment to read its dimensions
         tmp_env = gym.make(self._env_name, **(self._env_config))
 
@@ -187,12 +370,19 @@ class GymNE(NEProblem):
         if self._observation_normalization:
             self._obs_stats = RunningStat()
             self._collected_stats = RunningStat()
+            if self._compact_obs_sync:
+                # The count, the sum, and the sum of squares of the newly collected observations, in a single array
+                self._obs_delta = np.zeros(1 + 2 * int(np.prod(self._obs_shape)), dtype="float64")
         else:
             self._obs_stats = None
             self._collected_stats = None
         self._interaction_count: int = 0
         self._episode_count: int = 0
 
+        # The counters of the remote actors which were retired (see `resize_actors(...)`)
+        self._retired_interaction_count: int = 0
+        self._retired_episode_count: int = 0
+
         super().__init__(
             objective_sense="max",  # RL is maximization
             network=network,  # Using the policy as the network
@@ -202,6 +392,22 @@ class GymNE(NEProblem):
             actor_config=actor_config,
             subbatch_size=subbatch_size,
             device="cpu",
+            eval_cache_size=eval_cache_size,
+            parallel_backend=parallel_backend,
+            num_threads=num_threads,
+            intra_op_threads=intra_op_threads,
+            worker_addresses=worker_addresses,
+            worker_authkey=worker_authkey,
+            tasks_per_actor=tasks_per_actor,
+            throughput_aware=throughput_aware,
+            throughput_smoothing=throughput_smoothing,
+            speculative_execution=speculative_execution,
+            eval_deadline=eval_deadline,
+            deadline_penalty=deadline_penalty,
+            actor_pool=actor_pool,
+            threads_per_actor=threads_per_actor,
+            pin_actors=pin_actors,
+            scaling_policy=scaling_policy,
         )
 
         self.after_eval_hook.append(self._extra_status)
@@ -213,17 +419,63 @@ class GymNE(NEProblem):
     def _get_env(self) -> gym.Env:
         if self._env is None:
             self._env = gym.make(self._env_name, **(self._env_config))
-        return self._env
+        if self._thread_data is None:
+            return self._env
+
+        # Each evaluation thread steps its own environment
+        env = getattr(self._thread_data, "env", None)
+        if env is None:
+            env = gym.make(self._env_name, **(self._env_config))
+            self._thread_data.env = env
+        return env
+
+    def _get_envs(self) -> List[gym.Env]:
+        if self._thread_data is None:
+            if self._envs is None:
+                self._envs = [gym.make(self._env_name, **(self._env_config)) for _ in range(self._num_envs)]
+            return self._envs
+
+        # Each evaluation thread steps its own environments
+        envs = getattr(self._thread_data, "envs", None)
+        if envs is None:
+            envs = [gym.make(self._env_name, **(self._env_config)) for _ in range(self._num_envs)]
+            self._thread_data.envs = envs
+        return envs
+
+    def _stats_guard(self) -> Any:
+        # Get a context which makes the updates of the observation stats and of the counters exclusive, if multiple
+        # threads might be evaluating solutions
+        return nullcontext() if self._stats_lock is None else self._stats_lock
+
+    def _evaluate_batch_in_threads(self, batch: SolutionBatch):
+        # Make sure that the lock exists before the threads start sharing it
+        if self._stats_lock is None:
+            self._stats_lock = threading.Lock()
+        super()._evaluate_batch_in_threads(batch)
 
     def _normalize_observation(self, observation: Iterable, *, update_stats: bool = True) -> Iterable:
         observation = np.asarray(observation, dtype="float32")
-        if self.observation_normalization:
-            if update_stats:
+        if not self.observation_normalization:
+            return observation
+
+        with self._stats_guard():
+            if self._obs_delta is not None:
+                if update_stats:
+                    flat = observation.reshape(-1)
+                    n = len(flat)
+                    self._obs_delta[0] += 1
+                    self._obs_delta[1 : n + 1] += flat
+                    self._obs_delta[n + 1 :] += np.square(flat, dtype="float64")
+                if self._obs_norm_vectors is not None:
+                    # Normalize with the vectors received from the main process
+                    mean, stdev = self._obs_norm_vectors
+                    return (observation - mean) / stdev
+                elif update_stats:
+                    self._obs_stats.update(observation)
+            elif update_stats:
                 self._obs_stats.update(observation)
                 self._collected_stats.update(observation)
             return self._obs_stats.normalize(observation)
-        else:
-            return observation
 
     def _use_policy(self, observation: Iterable, policy: nn.Module) -> Iterable:
         with torch.no_grad():
@@ -235,9 +487,24 @@ class GymNE(NEProblem):
             result = np.clip(result, env.action_space.low, env.action_space.high)
         return result
 
+    def _use_batched_policy(self, observations: np.ndarray, policies: BatchedNetwork) -> np.ndarray:
+        with torch.no_grad():
+            result = policies(
+                torch.as_tensor(observations, dtype=torch.float32, device=self.network_device), batched_input=True
+            )
+        result = result.cpu().numpy()
+        env = self._get_env()
+        if isinstance(env.action_space, gym.spaces.Discrete):
+            result = np.argmax(result, axis=-1)
+        elif isinstance(env.action_space, gym.spaces.Box):
+            result = np.clip(result, env.action_space.low, env.action_space.high)
+        return result
+
     def _prepare(self) -> None:
         super()._prepare()
         self._get_env()
+        if self._num_envs is not None:
+            self._get_envs()
 
     def _rollout(
         self,
@@ -268,7 +535,8 @@ class GymNE(NEProblem):
             reward = raw_reward - decrease_rewards_by
             t += 1
             if update_stats:
-                self._interaction_count += 1
+                with self._stats_guard():
+                    self._interaction_count += 1
 
             if visualize:
                 env.render()
@@ -279,19 +547,175 @@ class GymNE(NEProblem):
 
             if done or ((self._episode_length is not None) and (t >= self._episode_length)):
                 if update_stats:
-                    self._episode_count += 1
+                    with self._stats_guard():
+                        self._episode_count += 1
+
+                return self._make_final_info(cumulative_reward, t, info)
+
+    def _make_final_info(self, cumulative_reward: float, t: int, info: dict) -> dict:
+        final_info = dict(cumulative_reward=cumulative_reward, interaction_count=t)
+
+        for k in self._info_keys:
+            if k not in final_info:
+                final_info[k] = info[k]
+
+        return final_info
+
+    def _use_batched_policy_with_states(
+        self,
+        policy: nn.Module,
+        parameters: torch.Tensor,
+        observations: np.ndarray,
+        *,
+        active_envs: List[int],
+        states: Optional[dict],
+        num_envs: int,
+    ) -> tuple:
+        """
+        Compute the actions of the policies serving the active environments.
+
+        Args:
+            policy: The network whose structure is shared by the policies.
+            parameters: The parameters of the policies, one row per
+                active environment.
+            observations: The latest observations of the active environments.
+            active_envs: Indices of the active environments.
+            states: The hidden states of the policies, stacked over all the
+                environments, or None if they are not allocated yet.
+            num_envs: The total number of environments.
+        Returns:
+            A tuple `(actions, states)` where `states` stores the updated
+            hidden states (or None if the policy is not recurrent).
+        """
+        policies = BatchedNetwork(policy, parameters)
+        if states is not None:
+            policies.states = _map_states(lambda state: state[active_envs], states)
+
+        actions = self._use_batched_policy(observations, policies)
+
+        if policies.is_stateful:
+            if states is None:
+                states = _map_states(
+                    lambda state: torch.zeros(
+                        (num_envs,) + tuple(state.shape[1:]), dtype=state.dtype, device=state.device
+                    ),
+                    policies.states,
+                )
+            for state, new_state in zip(_flatten_states(states), _flatten_states(policies.states)):
+                state[active_envs] = new_state
+
+        return actions, states
+
+    def _rollout_batch(
+        self,
+        parameters: torch.Tensor,
+        *,
+        num_episodes: Optional[int] = None,
+        update_stats: bool = True,
+        decrease_rewards_by: Optional[float] = None,
+    ) -> List[dict]:
+        """
+        Run the episodes of multiple policies on the vectorized environments.
+
+        Args:
+            parameters: A 2-dimensional tensor, each row storing the
+                parameters of a policy.
+            num_episodes: Number of episodes per policy.
+            update_stats: Whether or not to update the observation stats
+                and the interaction and episode counters.
+            decrease_rewards_by: Amount to be subtracted from each reward.
+        Returns:
+            A list of dictionaries, the i-th dictionary storing the
+            accumulated episode results of the i-th policy.
+        """
+        if num_episodes is None:
+            num_episodes = self._num_episodes
 
-                final_info = dict(cumulative_reward=cumulative_reward, interaction_count=t)
+        if decrease_rewards_by is None:
+            decrease_rewards_by = self._decrease_rewards_by
+        else:
+            decrease_rewards_by = float(decrease_rewards_by)
+
+        envs = self._get_envs()
+        num_envs = len(envs)
+        num_solutions = parameters.shape[0]
+
+        policy = self._get_network_of_thread()
+        parameters = parameters.to(self.network_device)
+
+        # Each pending episode is represented by the index of the solution to which it belongs
+        pending = deque(i_solution for i_solution in range(num_solutions) for _ in range(num_episodes))
+        episode_results = [[] for _ in range(num_solutions)]
+
+        # For each environment, we keep track of the solution that it is currently serving,
+        # the latest observation, the number of timesteps, and the cumulative reward.
+        solution_of_env: List[Optional[int]] = [None] * num_envs
+        observation_of_env: List[Optional[np.ndarray]] = [None] * num_envs
+        t_of_env = [0] * num_envs
+        cumulative_reward_of_env = [0.0] * num_envs
+
+        # The hidden states of the policies (if the policy is recurrent), stacked over the environments
+        states: Optional[dict] = None
+
+        def start_episode(i_env: int):
+            solution_of_env[i_env] = pending.popleft()
+            observation_of_env[i_env] = self._normalize_observation(reset_env(envs[i_env]), update_stats=update_stats)
+            t_of_env[i_env] = 0
+            cumulative_reward_of_env[i_env] = 0.0
+            if states is not None:
+                for state in _flatten_states(states):
+                    state[i_env] = 0.0
+
+        for i_env in range(num_envs):
+            if len(pending) > 0:
+                start_episode(i_env)
+
+        try:
+            policy.eval()
+            while True:
+                active_envs = [i_env for i_env in range(num_envs) if solution_of_env[i_env] is not None]
+                if len(active_envs) == 0:
+                    break
+
+                actions, states = self._use_batched_policy_with_states(
+                    policy,
+                    parameters[[solution_of_env[i_env] for i_env in active_envs]],
+                    np.stack([observation_of_env[i_env] for i_env in active_envs]),
+                    active_envs=active_envs,
+                    states=states,
+                    num_envs=num_envs,
+                )
 
-                for k in self._info_keys:
-                    if k not in final_info:
-                        final_info[k] = info[k]
+                for i_action, i_env in enumerate(active_envs):
+                    observation, raw_reward, done, info = take_step_in_env(envs[i_env], actions[i_action])
+                    t_of_env[i_env] += 1
+                    cumulative_reward_of_env[i_env] += raw_reward - decrease_rewards_by
+                    if update_stats:
+                        with self._stats_guard():
+                            self._interaction_count += 1
+
+                    t = t_of_env[i_env]
+                    if done or ((self._episode_length is not None) and (t >= self._episode_length)):
+                        if update_stats:
+                            with self._stats_guard():
+                                self._episode_count += 1
+
+                        episode_results[solution_of_env[i_env]].append(
+                            self._make_final_info(cumulative_reward_of_env[i_env], t, info)
+                        )
+                        solution_of_env[i_env] = None
+                        if len(pending) > 0:
+                            start_episode(i_env)
+                    else:
+                        observation_of_env[i_env] = self._normalize_observation(observation, update_stats=update_stats)
+        finally:
+            policy.train()
 
-                return final_info
+        return [_accumulate_all_across_dicts(results, self._info_keys) for results in episode_results]
 
     @property
     def _nonserialized_attribs(self) -> List[str]:
-        return super()._nonserialized_attribs + ["_env"]
+        return super()._nonserialized_attribs + ["_env", "_envs", "_stats_lock"]
 
     def run(
         self,
@@ -351,6 +775,15 @@ class GymNE(NEProblem):
 
     def _make_sync_data_for_actors(self) -> Any:
         if self.observation_normalization:
+            if self._compact_obs_sync:
+                stats = self.get_observation_stats()
+                if stats.count == 0:
+                    # Nothing to normalize with yet. The actors will use their local stats.
+                    return None
+                return dict(
+                    obs_mean=np.asarray(stats.mean, dtype="float32"),
+                    obs_stdev=np.asarray(stats.stdev, dtype="float32"),
+                )
             return dict(obs_stats=self.get_observation_stats())
         else:
             return None
@@ -365,6 +798,8 @@ class GymNE(NEProblem):
         for k, v in received.items():
             if k == "obs_stats":
                 self.set_observation_stats(v)
+            elif k == "obs_mean":
+                self._obs_norm_vectors = (v, received["obs_stdev"])
 
     def pop_observation_stats(self) -> RunningStat:
         """Get and clear the collected observation stats"""
@@ -377,7 +812,11 @@ class GymNE(NEProblem):
         result = dict(episode_count=self.episode_count, interaction_count=self.interaction_count)
 
         if self.observation_normalization:
-            result["obs_stats_delta"] = self.pop_observation_stats()
+            if self._obs_delta is not None:
+                result["obs_delta"] = self._obs_delta.copy()
+                self._obs_delta.fill(0.0)
+            else:
+                result["obs_stats_delta"] = self.pop_observation_stats()
 
         return result
 
@@ -386,6 +825,16 @@ class GymNE(NEProblem):
         self._ensure_obsnorm()
         self._obs_stats.update(rs)
 
+    def _update_observation_stats_with_deltas(self, deltas: List[np.ndarray]):
+        # Merge the compact observation stats deltas received from the actors with a single reduction
+        total = np.sum(np.stack(deltas), axis=0)
+        count = int(round(total[0]))
+        if count > 0:
+            n = (len(total) - 1) // 2
+            self._obs_stats.update_with_sums(
+                count, total[1 : n + 1].reshape(self._obs_shape), total[n + 1 :].reshape(self._obs_shape)
+            )
+
     def _use_sync_data_from_actors(self, received: list):
         total_episode_count = 0
         total_interaction_count = 0
@@ -394,11 +843,46 @@ class GymNE(NEProblem):
             data: dict
             total_episode_count += data["episode_count"]
             total_interaction_count += data["interaction_count"]
-            if self.observation_normalization:
+            if self.observation_normalization and (not self._compact_obs_sync):
                 self.update_observation_stats(data["obs_stats_delta"])
 
-        self.set_episode_count(total_episode_count)
-        self.set_interaction_count(total_interaction_count)
+        if self.observation_normalization and self._compact_obs_sync and (len(received) > 0):
+            self._update_observation_stats_with_deltas([data["obs_delta"] for data in received])
+
+        self.set_episode_count(total_episode_count + self._retired_episode_count)
+        self.set_interaction_count(total_interaction_count + self._retired_interaction_count)
+
+    def _use_sync_data_from_actor(self, actor_index: int, received: dict):
+        # The observation stats received from an actor are incremental, so they are applied only once.
+        # The counters, on the other hand, are cumulative, so the most recent counters of each actor are kept.
+        received = dict(received)
+        if self.observation_normalization:
+            if self._compact_obs_sync:
+                self._update_observation_stats_with_deltas([received.pop("obs_delta")])
+            else:
+                self.update_observation_stats(received.pop("obs_stats_delta"))
+
+        self._latest_sync_data_from_actors[actor_index] = received
+        latest = self._latest_sync_data_from_actors.values()
+        self.set_episode_count(sum(data["episode_count"] for data in latest) + self._retired_episode_count)
+        self.set_interaction_count(sum(data["interaction_count"] for data in latest) + self._retired_interaction_count)
+
+    def _use_sync_data_from_retired_actors(self, received: list):
+        # The last observation stats of the retired actors are applied, and their counters are kept, so that they
+        # are still included in the totals
+        for data in received:
+            self._retired_episode_count += data["episode_count"]
+            self._retired_interaction_count += data["interaction_count"]
+        if self.observation_normalization:
+            if self._compact_obs_sync:
+                self._update_observation_stats_with_deltas([data["obs_delta"] for data in received])
+            else:
+                for data in received:
+                    self.update_observation_stats(data["obs_stats_delta"])
+
+    def _make_pickle_data_for_new_actor(self) -> dict:
+        # An actor added to an already parallelized problem starts counting from zero
+        return dict(interaction_count=0, episode_count=0)
 
     def _make_pickle_data_for_main(self) -> dict:
         # For when the main Problem object (the non-remote one) gets pickled,
@@ -411,6 +895,11 @@ class GymNE(NEProblem):
         # this function restores the inner states specific to this remote
         # worker. In the case of GymNE, those inner states are episode
         # and interaction counters.
+        if self._obs_delta is not None:
+            # The remote copy starts with an empty (and writable) delta of observation stats, since the received
+            # copy could be a read-only view of the ray object store.
+            self._obs_delta = np.zeros_like(self._obs_delta)
+
         for k, v in state.items():
             if k == "episode_count":
                 self.set_episode_count(v)
@@ -461,6 +950,23 @@ class GymNE(NEProblem):
     def _get_local_interaction_count(self) -> int:
         return self.interaction_count
 
+    def _evaluate_batch(self, batch: SolutionBatch):
+        if self._num_envs is None:
+            super()._evaluate_batch(batch)
+            return
+
+        results = self._rollout_batch(
+            batch.access_values(keep_evals=True),
+            num_episodes=self._num_episodes,
+            update_stats=True,
+            decrease_rewards_by=self._decrease_rewards_by,
+        )
+        batch.set_evals(
+            torch.as_tensor(
+                [result["cumulative_reward"] for result in results], dtype=batch.eval_dtype, device=batch.device
+            )
+        )
+
     def _evaluate_network(self, policy: nn.Module) -> Union[float, torch.Tensor]:
         result = self.run(
             policy,
@@ -15,6 +15,7 @@
 """This namespace contains the `NeuroevolutionProblem` class."""
 
 import math
+import threading
 from copy import deepcopy
 from typing import Any, Callable, Iterable, List, Optional, Union
 
@@ -22,8 +23,9 @@ import ray
 import torch
 from torch import nn
 
-from ..core import BoundsPairLike, DType, ObjectiveSense, Problem, Solution
+from ..core import BoundsPairLike, DType, ObjectiveSense, Problem, Solution, SolutionBatch, WarmActorPool
 from ..tools.misc import Device, is_sequence
+from .net.batched import BatchedNetwork
 from .net.misc import count_parameters, fill_parameters
 from .net.parser import str_to_net
 
@@ -61,6 +63,29 @@ class NEProblem(Problem):
     a two-element tuple can be returned by `f` instead, where the first
     element is the fitness value(s) and the second element is a 1-dimensional
     tensor storing the additional data.
+
+    **Vectorized evaluation.**
+    When the networks are small, most of the evaluation time is spent on
+    Python-level dispatch rather than on arithmetic. For such cases,
+    an NEProblem can be created with `vectorized=True`, in which case
+    the solutions are not evaluated one by one. Instead, multiple solutions
+    are evaluated at once, via a
+    `evotorch.neuroevolution.net.BatchedNetwork` which runs the network
+    with all the parameter vectors within a single vectorized forward pass.
+    In vectorized mode, the evaluation function is expected to receive
+    a `BatchedNetwork` and to return the fitnesses of all the networks:
+
+    ```python
+    def f(networks: BatchedNetwork) -> Union[torch.Tensor, tuple]:
+        y = networks(x)  # y has an extra leftmost dimension of size len(networks)
+        fitnesses = ...  # compute a fitness for each network
+        return fitnesses
+
+    problem = NEProblem("min", MyTorchModuleClass, f, vectorized=True, ...)
+    ```
+
+    Instead of providing `f`, one can also override the method
+    `_evaluate_network_batch(self, networks: BatchedNetwork)`.
     """
 
     def __init__(
@@ -80,6 +105,24 @@ class NEProblem(Problem):
         num_subbatches: Optional[int] = None,
         subbatch_size: Optional[int] = None,
         device: Optional[Device] = None,
+        vectorized: bool = False,
+        vectorized_chunk_size: Optional[int] = None,
+        eval_cache_size: Optional[int] = None,
+        parallel_backend: str = "ray",
+        num_threads: Optional[int] = None,
+        intra_op_threads: Optional[int] = None,
+        worker_addresses: Optional[Iterable[str]] = None,
+        worker_authkey: Optional[Union[str, bytes]] = None,
+        tasks_per_actor: int = 2,
+        throughput_aware: bool = False,
+        throughput_smoothing: float = 0.2,
+        speculative_execution: bool = False,
+        eval_deadline: Optional[float] = None,
+        deadline_penalty: Optional[Union[float, Iterable[float]]] = None,
+        actor_pool: Optional[Union[str, WarmActorPool]] = None,
+        threads_per_actor: Optional[Union[int, str]] = None,
+        pin_actors: bool = False,
+        scaling_policy: Optional[Callable[[dict], Optional[int]]] = None,
     ):
         """
         `__init__(...)`: Initialize the NEProblem.
@@ -109,6 +152,13 @@ class NEProblem(Problem):
                 If this argument is left as None, it will be expected that
                 the method `_evaluate_network(...)` is overriden by the
                 inheriting class.
+                If `vectorized` is True, this function is expected to
+                receive a `BatchedNetwork` instead, and return the fitnesses
+                of all its networks (as a 1-dimensional tensor for
+                single-objective cases, or as a 2-dimensional tensor for
+                multi-objective cases), or a two-element tuple containing
+                the fitnesses and the additional evaluation data (as a
+                2-dimensional tensor).
             network_args: Optionally a dict-like object, storing keyword
                 arguments to be passed to the network while instantiating it.
             initial_bounds: Specifies an interval from which the values of the
@@ -206,7 +256,104 @@ class NEProblem(Problem):
             device: Default device in which a new population will be generated
                 and the neural networks will operate.
                 If not specified, "cpu" will be used.
+            vectorized: Set this as True if the networks are to be evaluated
+                in batches, via `BatchedNetwork` objects, instead of
+                one by one. In this mode, the evaluation is done by
+                `network_eval_func` (if provided) or by the method
+                `_evaluate_network_batch(...)`, each of which is expected to
+                receive a `BatchedNetwork`.
+                The default is False.
+            vectorized_chunk_size: Only to be used when `vectorized` is True.
+                The maximum number of networks to be run within a single
+                `BatchedNetwork`. If a batch of solutions is larger than this,
+                it will be evaluated in multiple chunks, which can be useful
+                for limiting the peak memory usage.
+                If left as None, all the solutions of a batch will be
+                evaluated at once.
+            eval_cache_size: If given as an integer `n`, the evaluation
+                results of the last `n` distinct solutions encountered are
+                cached and reused. Meant only for problems whose evaluation
+                results are deterministic.
+                See the documentation of `Problem` for details.
+            parallel_backend: The backend to be used for parallelization.
+                The default is "ray". Alternatively, "multiprocessing" can be
+                given, in which case the remote copies of the problem live in
+                local worker processes (without ray). With this backend,
+                `num_actors` is expected as an integer, or as "max" or
+                "num_cpus" (the default "num_devices" is not supported), and
+                the GPU-related arguments cannot be used. Another alternative
+                is "socket", in which case the remote copies live in
+                standalone workers (see `worker_addresses`).
+                See the documentation of `Problem` for details.
+            num_threads: If given as an integer `n` greater than 1, the
+                solutions are evaluated by a pool of `n` threads within the
+                evaluating process, each thread working with its own copy of
+                the network. This is useful when the evaluation is dominated
+                by PyTorch or NumPy kernels which release the GIL.
+                See the documentation of `Problem` for details.
+            intra_op_threads: Only to be used together with `num_threads`.
+                Number of threads each evaluation thread can use for the
+                intra-op parallelism of PyTorch.
+                See the documentation of `Problem` for details.
+            worker_addresses: Required when `parallel_backend` is "socket",
+                i.e. when the remote copies of the problem are to live in
+                standalone workers started via `python -m evotorch.worker`
+                (possibly on other hosts), without ray. The addresses of the
+                workers, each in the form "host:port" or
+                "unix:/path/to/socket". With the "socket" backend,
+                `num_actors` is expected as None (for one remote copy per
+                address) or as an integer.
+                See the documentation of `Problem` for details.
+            worker_authkey: The authentication key of the standalone
+                workers (relevant only when `parallel_backend` is "socket").
+            tasks_per_actor: Maximum number of tasks (e.g. sub-batches to
+                evaluate) which can be outstanding per actor at the same
+                time. With the default value 2, an actor receives its next
+                task while it is still working on its current one.
+                See the documentation of `Problem` for details.
+            throughput_aware: If True, the throughput of each actor is
+                measured, and, when splitting the work without
+                `subbatch_size` or `num_subbatches`, each actor is given a
+                share of the work proportional to its throughput.
+                See the documentation of `Problem` for details.
+            throughput_smoothing: The coefficient of the exponential moving
+                average used for tracking the throughputs of the actors
+                (relevant only when `throughput_aware` is True).
+            speculative_execution: If True, when the last pieces of a
+                population are still being evaluated and some actors are
+                idle, copies of these outstanding pieces are given to the
+                idle actors, and whichever copy finishes first provides the
+                evaluation results.
+                See the documentation of `Problem` for details.
+            eval_deadline: Optionally a per-generation deadline, in seconds.
+                The pieces of a population which are not evaluated within
+                this many seconds are abandoned, and their solutions receive
+                `deadline_penalty` (or are left unevaluated, in which case
+                the Gaussian search algorithms leave them out of their
+                gradient estimates).
+                See the documentation of `Problem` for details.
+            deadline_penalty: The evaluation result to be assigned to the
+                solutions which miss `eval_deadline`.
+            actor_pool: A `WarmActorPool`, or the name of a `WarmActorPool`,
+                whose actors are to be reused instead of creating new ones.
+                See the documentation of `Problem` for details.
+            threads_per_actor: Number of CPU threads each remote actor is
+                allowed to use, or "auto" for dividing the available CPUs
+                equally among the actors.
+                See the documentation of `Problem` for details.
+            pin_actors: Whether or not to pin each remote actor to its own
+                block of `threads_per_actor` cores.
+            scaling_policy: Optionally a function which decides, before each
+                generation, how many actors the problem should have, from the
+                measurements of the previous generation.
+                See the documentation of `Problem` for details.
         """
+        if (vectorized_chunk_size is not None) and (not vectorized):
+            raise ValueError(
+                "The argument `vectorized_chunk_size` can only be used when `vectorized` is True."
+                f" However, `vectorized` was received as {repr(vectorized)}."
+            )
+
         # Set the main device of the problem
         # Although the operation of setting the main device is done by the main Problem class,
         # here we need this at an earlier stage.
@@ -223,8 +370,18 @@ class NEProblem(Problem):
         # Store the function that will evaluate the network, if available
         self._network_eval_func: Optional[Callable] = network_eval_func
 
+        # Store the maximum number of networks to be evaluated at once in vectorized mode
+        self._vectorized_chunk_size: Optional[int] = (
+            None if vectorized_chunk_size is None else int(vectorized_chunk_size)
+        )
+
         self.instantiated_network: nn.Module = None
 
+        # When the solutions are evaluated by multiple threads (see the argument `num_threads`), each thread works
+        # with its own copy of the network (and, in the case of inheriting classes, with its own copies of the
+        # other objects which cannot be shared), stored by this thread-local object
+        self._thread_data: Optional[threading.local] = None
+
         # Create temporary network
         temp_network = self._instantiate_net(self._original_network, device="cpu")
 
@@ -244,6 +401,23 @@ class NEProblem(Problem):
             num_subbatches=num_subbatches,
             subbatch_size=subbatch_size,
             store_solution_stats=None,
+            vectorized=vectorized,
+            eval_cache_size=eval_cache_size,
+            parallel_backend=parallel_backend,
+            num_threads=num_threads,
+            intra_op_threads=intra_op_threads,
+            worker_addresses=worker_addresses,
+            worker_authkey=worker_authkey,
+            tasks_per_actor=tasks_per_actor,
+            throughput_aware=throughput_aware,
+            throughput_smoothing=throughput_smoothing,
+            speculative_execution=speculative_execution,
+            eval_deadline=eval_deadline,
+            deadline_penalty=deadline_penalty,
+            actor_pool=actor_pool,
+            threads_per_actor=threads_per_actor,
+            pin_actors=pin_actors,
+            scaling_policy=scaling_policy,
         )
 
     @property
@@ -276,7 +450,7 @@ class NEProblem(Problem):
 
     @property
     def _nonserialized_attribs(self) -> List[str]:
-        return ["instantiated_network"]
+        return ["instantiated_network", "_thread_data"]
 
     def _instantiate_net(self, network: Union[str, nn.Module, dict], device: Optional[Device] = None) -> nn.Module:
         """Instantiate the network on the target device, to be overridden by the user for custom behaviour
@@ -332,11 +506,7 @@ class NEProblem(Problem):
         Returns:
             instantiated_network (nn.Module): The network instantiated with the parameters
         """
-        # Check if network exists
-        if self.instantiated_network is None:
-            self.instantiated_network = self._instantiate_net(self._original_network)
-
-        network = self.instantiated_network
+        network = self._get_network_of_thread()
 
         # Move the parameters if needed
         if parameters.device != self.network_device:
@@ -390,6 +560,98 @@ class NEProblem(Problem):
         """
         raise NotImplementedError
 
+    def _evaluate_network_batch(self, networks: BatchedNetwork) -> Union[torch.Tensor, tuple]:
+        """
+        Evaluate multiple networks at once and return the evaluation results.
+
+        This method is used when the NEProblem is in vectorized mode
+        (i.e. when `__init__` of `NEProblem` was given `vectorized=True`)
+        and the `__init__` of `NEProblem` was not given a network evaluator
+        function (via the argument `network_eval_func`).
+        In such a case, it will be expected that the inheriting class
+        overrides this method.
+
+        Args:
+            networks (BatchedNetwork): The networks to evaluate, represented
+                by a single `BatchedNetwork`. Calling this object with an input
+                returns the outputs of all the networks, stacked along a new
+                leftmost dimension.
+        Returns:
+            fitnesses: The fitnesses of the networks, as a 1-dimensional tensor
+                for single-objective cases, or as a 2-dimensional tensor for
+                multi-objective cases. The returned value can also be a
+                two-element tuple where the first element is the fitnesses and
+                the second element is a 2-dimensional tensor storing the extra
+                evaluation data.
+        """
+        raise NotImplementedError
+
+    def parameterize_net_batch(self, parameters: torch.Tensor) -> BatchedNetwork:
+        """
+        Make a BatchedNetwork which runs the network with the given
+        parameter vectors.
+
+        Args:
+            parameters (torch.Tensor): A 2-dimensional tensor, each row
+                storing the parameters of a network.
+        Returns:
+            A `BatchedNetwork` built on top of the instantiated network.
+        """
+        network = self._get_network_of_thread()
+
+        # Move the parameters if needed
+        if parameters.device != self.network_device:
+            parameters = parameters.to(self.network_device)
+
+        return BatchedNetwork(network, parameters)
+
+    def _get_network_of_thread(self) -> nn.Module:
+        # Get the network to be parameterized by the current thread.
+        # Unless the solutions are being evaluated by multiple threads, this is the instantiated network itself.
+        # Otherwise, each thread gets its own copy, so that the threads do not overwrite each other's parameters.
+        if self.instantiated_network is None:
+            self.instantiated_network = self._instantiate_net(self._original_network)
+
+        if self._thread_data is None:
+            return self.instantiated_network
+
+        network = getattr(self._thread_data, "network", None)
+        if network is None:
+            network = deepcopy(self.instantiated_network)
+            self._thread_data.network = network
+        return network
+
+    def _evaluate_batch_in_threads(self, batch: SolutionBatch):
+        # Make sure that the network and the thread-local storage exist before the threads start sharing them
+        if self.instantiated_network is None:
+            self.instantiated_network = self._instantiate_net(self._original_network)
+        if self._thread_data is None:
+            self._thread_data = threading.local()
+        super()._evaluate_batch_in_threads(batch)
+
+    @torch.no_grad()
+    def _evaluate_batch(self, batch: SolutionBatch):
+        if not self._vectorized:
+            super()._evaluate_batch(batch)
+            return
+
+        if self._network_eval_func is None:
+            evaluator = self._evaluate_network_batch
+        else:
+            evaluator = self._network_eval_func
+
+        if self._vectorized_chunk_size is None:
+            chunks = [batch]
+        else:
+            chunks = batch.split(max_size=self._vectorized_chunk_size)
+
+        for chunk in chunks:
+            fitnesses = evaluator(self.parameterize_net_batch(chunk.access_values(keep_evals=True)))
+            if isinstance(fitnesses, tuple):
+                chunk.set_evals(*fitnesses)
+            else:
+                chunk.set_evals(fitnesses)
+
     def _evaluate(self, solution: Solution):
         """
         Evaluate a single solution.
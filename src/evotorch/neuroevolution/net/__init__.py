@@ -15,6 +15,7 @@
 """Utility classes and functions for neural networks"""
 
 __all__ = (
+    "BatchedNetwork",
     "count_parameters",
     "fill_parameters",
     "parameter_vector",
@@ -22,7 +23,8 @@ __all__ = (
     "RunningStat",
 )
 
-from . import layers, misc, parser
+from . import batched, layers, misc, parser
+from .batched import BatchedNetwork
 from .misc import count_parameters, fill_parameters, parameter_vector
 from .parser import str_to_net
 from .runningstat import RunningStat
@@ -0,0 +1,238 @@
+# Copyright 2022 NNAISENSE SA
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Utilities for running a neural network with a population of parameter vectors"""
+
+from typing import Any, Dict, Optional
+
+import torch
+from torch import nn
+
+from .layers import StatefulModule
+
+try:
+    from torch.func import functional_call, vmap
+except ImportError:
+    functional_call = None
+    vmap = None
+
+
+def stack_parameters(net: nn.Module, vectors: torch.Tensor) -> Dict[str, torch.Tensor]:
+    """
+    Split a batch of parameter vectors into per-parameter stacked tensors.
+
+    The parameter vectors are interpreted in the same order used by
+    `fill_parameters(...)` and `parameter_vector(...)`.
+    No copy is made: each returned tensor is a view of `vectors`
+    whenever the memory layout allows it.
+
+    Args:
+        net: The torch module whose parameter structure is to be followed.
+        vectors: A 2-D tensor, each row being a parameter vector.
+    Returns:
+        A dictionary which maps each parameter name of `net` to a tensor
+        of shape `(n, *p.shape)`, `n` being the number of rows of `vectors`.
+    """
+    if vectors.ndim != 2:
+        raise ValueError(
+            f"Expected a 2-dimensional tensor of parameter vectors, but got a tensor of shape {vectors.shape}"
+        )
+
+    num_vectors, vector_length = vectors.shape
+
+    result = {}
+    address = 0
+    for name, p in net.named_parameters():
+        n = p.numel()
+        result[name] = vectors[:, address : address + n].reshape(num_vectors, *p.shape)
+        address += n
+
+    if address != vector_length:
+        raise IndexError(
+            f"The length of the parameter vectors ({vector_length}) does not match"
+            f" the number of parameters of the network ({address})"
+        )
+
+    return result
+
+
+class BatchedNetwork:
+    """
+    A callable which runs a single network structure with many parameter
+    vectors at once.
+
+    Instead of filling the network with one parameter vector at a time and
+    doing one forward pass per parameter vector, a BatchedNetwork stacks
+    all the parameter vectors and runs a single vectorized forward pass
+    (via `torch.func.functional_call` and `torch.func.vmap`).
+    This removes most of the Python-level dispatch overhead, which tends
+    to dominate the evaluation time of small networks.
+
+    Let us assume that `net` is a network which maps inputs of shape
+    `(batch_size, m)` to outputs of shape `(batch_size, k)`, and that
+    `params` is a tensor of shape `(n, num_params)`. Then:
+
+    ```python
+    batched_net = BatchedNetwork(net, params)
+
+    # Feed the same input to all the n networks.
+    # `y` is of shape (n, batch_size, k).
+    y = batched_net(x)
+
+    # Feed the i-th slice of `xs` to the i-th network.
+    # `xs` is of shape (n, batch_size, m), `ys` is of shape (n, batch_size, k).
+    ys = batched_net(xs, batched_input=True)
+    ```
+
+    If the network contains stateful modules (i.e. instances of
+    `StatefulModule`, such as `RecurrentNet` and `LSTMNet`), then the
+    BatchedNetwork keeps a batched hidden state for each of them, one slice
+    per network, in the same way a `StatefulModule` keeps its own state.
+    This batched state is accessible via the property `states`, which can
+    also be set (e.g. for reordering the states or for resetting the states
+    of only some of the networks), and can be cleared via `reset()`.
+    Because `torch.func.vmap` does not support the recurrent kernels used by
+    these modules, the forward passes of a stateful network are done one
+    network after another (still via `torch.func.functional_call`, without
+    copying the parameters into the wrapped network).
+
+    Other than the stateful modules mentioned above, the wrapped network is
+    expected to be functional in the sense that its forward pass must not
+    mutate its own attributes.
+    """
+
+    def __init__(self, network: nn.Module, parameters: torch.Tensor):
+        """
+        `__init__(...)`: Initialize the BatchedNetwork.
+
+        Args:
+            network: The network whose structure is to be used.
+                The current parameter values of this network are ignored.
+            parameters: A 2-dimensional tensor, each row storing the
+                parameters of a network.
+        """
+        if vmap is None:
+            raise ImportError(
+                f"The class {type(self).__name__} is only available if the installed PyTorch provides `torch.func`"
+            )
+        self._network = network
+        self._parameters = stack_parameters(network, parameters)
+        self._num_networks = int(parameters.shape[0])
+        self._stateful_modules = {
+            name: module for name, module in network.named_modules() if isinstance(module, StatefulModule)
+        }
+        self._states: Optional[dict] = None
+
+    def __len__(self) -> int:
+        return self._num_networks
+
+    @property
+    def network(self) -> nn.Module:
+        """The network whose structure is used by this BatchedNetwork"""
+        return self._network
+
+    @property
+    def parameters(self) -> Dict[str, torch.Tensor]:
+        """The stacked parameters, as a dictionary mapping parameter names to tensors"""
+        return self._parameters
+
+    @property
+    def is_stateful(self) -> bool:
+        """Whether or not the network contains stateful modules"""
+        return len(self._stateful_modules) > 0
+
+    @property
+    def states(self) -> Optional[dict]:
+        """
+        The batched states of the stateful modules, as a dictionary mapping
+        the module names to the stacked states (each stacked state being
+        a tensor or a tuple of tensors whose leftmost dimension is for the
+        networks).
+        None means that the networks are in their initial states.
+        """
+        return self._states
+
+    @states.setter
+    def states(self, new_states: Optional[dict]):
+        self._states = new_states
+
+    def reset(self):
+        """Reset the states of the stateful modules of all the networks"""
+        self._states = None
+
+    def __call__(self, x: Any, *, batched_input: bool = False) -> Any:
+        """
+        Run all the networks.
+
+        Args:
+            x: The input. If `batched_input` is False, the same input
+                will be fed to all the networks. If `batched_input` is True,
+                the input is expected to have an extra leftmost dimension
+                whose size is equal to the number of networks, and the i-th
+                network will receive the i-th slice of the input.
+            batched_input: Whether or not the input has an extra leftmost
+                dimension for the networks.
+        Returns:
+            The outputs of the networks, with an extra leftmost dimension
+            whose size is equal to the number of networks.
+        """
+        network = self._network
+        x_dim = 0 if batched_input else None
+
+        if not self.is_stateful:
+
+            def run_single(params: dict, single_x: Any) -> Any:
+                return functional_call(network, params, (single_x,))
+
+            return vmap(run_single, in_dims=(0, x_dim))(self._parameters, x)
+
+        stateful_modules = self._stateful_modules
+
+        # The original states of the stateful modules are kept aside, so that running this BatchedNetwork
+        # does not interfere with the states of the wrapped network.
+        original_states = {name: module._state for name, module in stateful_modules.items()}
+
+        results = []
+        new_states = []
+        try:
+            for i in range(self._num_networks):
+                for name, module in stateful_modules.items():
+                    module._state = None if self._states is None else _map_state(lambda t: t[i], self._states[name])
+                params = {k: v[i] for k, v in self._parameters.items()}
+                results.append(functional_call(network, params, (x[i] if batched_input else x,)))
+                new_states.append({name: module._state for name, module in stateful_modules.items()})
+        finally:
+            for name, module in stateful_modules.items():
+                module._state = original_states[name]
+
+        self._states = {
+            name: _stack_states([states[name] for states in new_states]) for name in stateful_modules.keys()
+        }
+        return torch.stack(results)
+
+
+def _map_state(f, state: Any) -> Any:
+    # Apply the function `f` on a state, which can be a tensor or a tuple of tensors
+    if isinstance(state, tuple):
+        return tuple(f(x) for x in state)
+    else:
+        return f(state)
+
+
+def _stack_states(states: list) -> Any:
+    # Stack the states of multiple networks, each state being a tensor or a tuple of tensors
+    if isinstance(states[0], tuple):
+        return tuple(torch.stack(parts) for parts in zip(*states))
+    else:
+        return torch.stack(states)
@@ -128,6 +128,15 @@ class RunningStat:
         else:
             self._increment(x, np.square(x), 1)
 
+    def update_with_sums(self, count: int, sum: np.ndarray, sum_of_squares: np.ndarray):
+        """
+        Accumulate more data into the RunningStat object, the data being
+        given in the form of the number of arrays, their sum, and the sum
+        of their squares.
+        """
+        if count > 0:
+            self._increment(sum, sum_of_squares, count)
+
     def normalize(self, x: Union[np.ndarray, list]) -> np.ndarray:
         """
         Normalize the array x according to the accumulated stats.
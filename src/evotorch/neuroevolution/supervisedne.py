@@ -14,7 +14,7 @@
 
 from ast import Import
 from collections.abc import Mapping
-from typing import Any, Callable, List, Optional, Union
+from typing import Any, Callable, Iterable, List, Optional, Union
 from warnings import warn
 
 import numpy as np
@@ -22,9 +22,10 @@ import torch
 from torch import nn
 from torch.utils.data import DataLoader, Dataset
 
-from ..core import BoundsPairLike, SolutionBatch
+from ..core import BoundsPairLike, SolutionBatch, WarmActorPool
 from ..tools.misc import Device
 from .neproblem import NEProblem
+from .net.batched import BatchedNetwork, vmap
 
 
 class SupervisedNE(NEProblem):
@@ -72,6 +73,24 @@ class SupervisedNE(NEProblem):
         num_subbatches: Optional[int] = None,
         subbatch_size: Optional[int] = None,
         device: Optional[Device] = None,
+        vectorized: bool = False,
+        vectorized_chunk_size: Optional[int] = None,
+        eval_cache_size: Optional[int] = None,
+        parallel_backend: str = "ray",
+        num_threads: Optional[int] = None,
+        intra_op_threads: Optional[int] = None,
+        worker_addresses: Optional[Iterable[str]] = None,
+        worker_authkey: Optional[Union[str, bytes]] = None,
+        tasks_per_actor: int = 2,
+        throughput_aware: bool = False,
+        throughput_smoothing: float = 0.2,
+        speculative_execution: bool = False,
+        eval_deadline: Optional[float] = None,
+        deadline_penalty: Optional[Union[float, Iterable[float]]] = None,
+        actor_pool: Optional[Union[str, WarmActorPool]] = None,
+        threads_per_actor: Optional[Union[int, str]] = None,
+        pin_actors: bool = False,
+        scaling_policy: Optional[Callable[[dict], Optional[int]]] = None,
     ):
         """
         `__init__(...)`: Initialize the SupervisedNE.
@@ -195,7 +214,115 @@ class SupervisedNE(NEProblem):
             device: Default device in which a new population will be generated
                 and the neural networks will operate.
                 If not specified, "cpu" will be used.
+            vectorized: Set this as True if the solutions are to be evaluated
+                in batches, each batch of networks being run within a single
+                vectorized forward pass (see `BatchedNetwork`), instead of
+                one by one. The vectorized mode requires `common_minibatch`
+                to be True, and requires the loss function to be compatible
+                with `torch.func.vmap` (which is the case for the loss
+                functions provided by PyTorch).
+                If the inheriting class overrides `_evaluate_using_minibatch(...)`
+                or `_evaluate_network(...)`, but does not override
+                `_evaluate_batched_network_using_minibatch(...)` (or
+                `_evaluate_network_batch(...)`), the solutions are still
+                evaluated one by one, so that the customized evaluation
+                is respected.
+                The default is False.
+            vectorized_chunk_size: Only to be used when `vectorized` is True.
+                The maximum number of networks to be run at once.
+                If left as None, all the solutions of a batch will be
+                evaluated at once.
+            eval_cache_size: If given as an integer `n`, the evaluation
+                results of the last `n` distinct solutions encountered are
+                cached and reused. Because the losses depend on the sampled
+                minibatches, this is meant only for the cases where a
+                solution is always evaluated on the same data.
+                See the documentation of `Problem` for details.
+            parallel_backend: The backend to be used for parallelization.
+                The default is "ray". Alternatively, "multiprocessing" can be
+                given, in which case the remote copies of the problem live in
+                local worker processes (without ray). With this backend,
+                `num_actors` is expected as an integer, or as "max" or
+                "num_cpus" (the default "num_devices" is not supported), and
+                the GPU-related arguments cannot be used. Another alternative
+                is "socket", in which case the remote copies live in
+                standalone workers (see `worker_addresses`).
+                See the documentation of `Problem` for details.
+            num_threads: If given as an integer `n` greater than 1, the
+                solutions are evaluated by a pool of `n` threads within the
+                evaluating process, each thread working with its own copy of
+                the network. The common minibatches are drawn once per batch,
+                before the threads start, and therefore, this requires
+                `common_minibatch` to be True.
+                See the documentation of `Problem` for details.
+            intra_op_threads: Only to be used together with `num_threads`.
+                Number of threads each evaluation thread can use for the
+                intra-op parallelism of PyTorch.
+                See the documentation of `Problem` for details.
+            worker_addresses: Required when `parallel_backend` is "socket",
+                i.e. when the remote copies of the problem are to live in
+                standalone workers started via `python -m evotorch.worker`
+                (possibly on other hosts), without ray. The addresses of the
+                workers, each in the form "host:port" or
+                "unix:/path/to/socket". With the "socket" backend,
+                `num_actors` is expected as None (for one remote copy per
+                address) or as an integer.
+                See the documentation of `Problem` for details.
+            worker_authkey: The authentication key of the standalone
+                workers (relevant only when `parallel_backend` is "socket").
+            tasks_per_actor: Maximum number of tasks (e.g. sub-batches to
+                evaluate) which can be outstanding per actor at the same
+                time. With the default value 2, an actor receives its next
+                task while it is still working on its current one.
+                See the documentation of `Problem` for details.
+            throughput_aware: If True, the throughput of each actor is
+                measured, and, when splitting the work without
+                `subbatch_size` or `num_subbatches`, each actor is given a
+                share of the work proportional to its throughput.
+                See the documentation of `Problem` for details.
+            throughput_smoothing: The coefficient of the exponential moving
+                average used for tracking the throughputs of the actors
+                (relevant only when `throughput_aware` is True).
+            speculative_execution: If True, when the last pieces of a
+                population are still being evaluated and some actors are
+                idle, copies of these outstanding pieces are given to the
+                idle actors, and whichever copy finishes first provides the
+                evaluation results.
+                See the documentation of `Problem` for details.
+            eval_deadline: Optionally a per-generation deadline, in seconds.
+                The pieces of a population which are not evaluated within
+                this many seconds are abandoned, and their solutions receive
+                `deadline_penalty` (or are left unevaluated, in which case
+                the Gaussian search algorithms leave them out of their
+                gradient estimates).
+                See the documentation of `Problem` for details.
+            deadline_penalty: The evaluation result to be assigned to the
+                solutions which miss `eval_deadline`.
+            actor_pool: A `WarmActorPool`, or the name of a `WarmActorPool`,
+                whose actors are to be reused instead of creating new ones.
+                See the documentation of `Problem` for details.
+            threads_per_actor: Number of CPU threads each remote actor is
+                allowed to use, or "auto" for dividing the available CPUs
+                equally among the actors.
+                See the documentation of `Problem` for details.
+            pin_actors: Whether or not to pin each remote actor to its own
+                block of `threads_per_actor` cores.
+            scaling_policy: Optionally a function which decides, before each
+                generation, how many actors the problem should have, from the
+                measurements of the previous generation.
+                See the documentation of `Problem` for details.
         """
+        if vectorized and (not common_minibatch):
+            raise ValueError(
+                "The vectorized mode of SupervisedNE requires `common_minibatch` to be True."
+                f" However, `common_minibatch` was received as {repr(common_minibatch)}."
+            )
+        if (num_threads is not None) and (not common_minibatch):
+            raise ValueError(
+                "The multi-threaded evaluation of SupervisedNE requires `common_minibatch` to be True."
+                f" However, `common_minibatch` was received as {repr(common_minibatch)}."
+            )
+
         super().__init__(
             objective_sense="min",
             network=network,
@@ -207,6 +334,24 @@ class SupervisedNE(NEProblem):
             num_subbatches=num_subbatches,
             subbatch_size=subbatch_size,
             device=device,
+            vectorized=vectorized,
+            vectorized_chunk_size=vectorized_chunk_size,
+            eval_cache_size=eval_cache_size,
+            parallel_backend=parallel_backend,
+            num_threads=num_threads,
+            intra_op_threads=intra_op_threads,
+            worker_addresses=worker_addresses,
+            worker_authkey=worker_authkey,
+            tasks_per_actor=tasks_per_actor,
+            throughput_aware=throughput_aware,
+            throughput_smoothing=throughput_smoothing,
+            speculative_execution=speculative_execution,
+            eval_deadline=eval_deadline,
+            deadline_penalty=deadline_penalty,
+            actor_pool=actor_pool,
+            threads_per_actor=threads_per_actor,
+            pin_actors=pin_actors,
+            scaling_policy=scaling_policy,
         )
 
         self.dataset = dataset
@@ -218,6 +363,9 @@ class SupervisedNE(NEProblem):
         self._common_minibatch = common_minibatch
         self._current_minibatches: Optional[list] = None
 
+        # True while the common minibatches are already drawn for the batch being evaluated by multiple threads
+        self._minibatches_drawn: bool = False
+
     def _make_dataloader(self) -> DataLoader:
         """
         Make a new DataLoader.
@@ -267,6 +415,23 @@ class SupervisedNE(NEProblem):
             yhat = network(x)
             return self.loss(yhat, y)
 
+    def _evaluate_batched_network_using_minibatch(self, networks: BatchedNetwork, batch: Any) -> torch.Tensor:
+        """
+        Pass a minibatch through multiple networks at once, and compute
+        the loss of each network.
+
+        Args:
+            networks: The networks using which the losses will be computed,
+                represented by a single `BatchedNetwork`.
+            batch: The minibatch that will be used as data.
+        Returns:
+            The losses, as a 1-dimensional tensor.
+        """
+        with torch.no_grad():
+            x, y = batch
+            yhat = networks(x)
+            return vmap(lambda single_yhat: self.loss(single_yhat, y))(yhat)
+
     def _loss(self, y_hat: Any, y: Any) -> Union[float, torch.Tensor]:
         """
         The loss function.
@@ -335,14 +500,50 @@ class SupervisedNE(NEProblem):
         loss = 0.0
         for batch_idx in range(self._num_minibatches):
             if not self._common_minibatch:
-                self._current_minibatch = self.get_minibatch()
+                minibatch = self.get_minibatch()
             else:
-                self._current_minibatch = self._current_minibatches[batch_idx]
-            loss += self._evaluate_using_minibatch(network, self._current_minibatch) / self._num_minibatches
+                minibatch = self._current_minibatches[batch_idx]
+            self._current_minibatch = minibatch
+            loss += self._evaluate_using_minibatch(network, minibatch) / self._num_minibatches
         return loss
 
+    def _evaluate_network_batch(self, networks: BatchedNetwork) -> torch.Tensor:
+        loss = 0.0
+        for batch_idx in range(self._num_minibatches):
+            loss = loss + (
+                self._evaluate_batched_network_using_minibatch(networks, self._current_minibatches[batch_idx])
+                / self._num_minibatches
+            )
+        return loss
+
+    def _has_custom_single_network_evaluation(self) -> bool:
+        # Return True if the inheriting class customizes how a single network is evaluated, without customizing
+        # how a batch of networks is evaluated. In such cases, the vectorized mode is not to bypass the
+        # customization.
+        cls = type(self)
+        single_customized = (cls._evaluate_using_minibatch is not SupervisedNE._evaluate_using_minibatch) or (
+            cls._evaluate_network is not SupervisedNE._evaluate_network
+        )
+        batched_customized = (
+            cls._evaluate_batched_network_using_minibatch is not SupervisedNE._evaluate_batched_network_using_minibatch
+        ) or (cls._evaluate_network_batch is not SupervisedNE._evaluate_network_batch)
+        return single_customized and (not batched_customized)
+
+    def _evaluate_batch_in_threads(self, batch: SolutionBatch):
+        # The common minibatches are drawn only once, before the threads start evaluating their pieces of the batch
+        self._current_minibatches = [self.get_minibatch() for _ in range(self._num_minibatches)]
+        self._minibatches_drawn = True
+        try:
+            super()._evaluate_batch_in_threads(batch)
+        finally:
+            self._minibatches_drawn = False
+
     def _evaluate_batch(self, batch: SolutionBatch):
-        if self._common_minibatch:
+        if self._common_minibatch and (not self._minibatches_drawn):
             # If using a common data batch, generate them now and use them for the entire batch of solutions
             self._current_minibatches = [self.get_minibatch() for _ in range(self._num_minibatches)]
+        if self._vectorized and self._has_custom_single_network_evaluation():
+            for solution in batch:
+                self._evaluate(solution)
+            return
         return super()._evaluate_batch(batch)
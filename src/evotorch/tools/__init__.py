@@ -18,7 +18,9 @@ This namespace contains various utility functions, classes, and type aliases.
 
 
 __all__ = (
+    "EvaluationCache",
     "Hook",
+    "NoiseTable",
     "as_immutable",
     "mutable_copy",
     "Device",
@@ -77,10 +79,12 @@ __all__ = (
     "ReadOnlyTensor",
     "as_read_only_tensor",
     "read_only_tensor",
+    "SubbatchSizeTuner",
 )
 
 
-from . import hook, immutable, objectarray, ranking, readonlytensor, tensormaker
+from . import evalcache, hook, immutable, noisetable, objectarray, ranking, readonlytensor, subbatchtuner, tensormaker
+from .evalcache import EvaluationCache
 from .hook import Hook
 from .immutable import as_immutable, mutable_copy
 from .misc import (
@@ -136,6 +140,8 @@ from .misc import (
     to_stdev_init,
     to_torch_dtype,
 )
+from .noisetable import NoiseTable
 from .objectarray import ObjectArray
 from .ranking import rank
 from .readonlytensor import ReadOnlyTensor, as_read_only_tensor, read_only_tensor
+from .subbatchtuner import SubbatchSizeTuner
@@ -0,0 +1,166 @@
+# Copyright 2022 NNAISENSE SA
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+This module contains the EvaluationCache class, which stores the evaluation
+results of already encountered solutions.
+"""
+
+import pickle
+from collections import OrderedDict
+from typing import Hashable, List, Optional, Union
+
+import torch
+
+from .objectarray import ObjectArray
+
+
+class EvaluationCache:
+    """
+    A size-bounded cache of evaluation results, with least-recently-used
+    (LRU) eviction.
+
+    Each solution is identified by a fingerprint, which is the raw byte
+    representation of its decision values (or, for problems with `object`
+    dtype, the pickled representation of its decision values).
+    Two solutions are considered identical only if their fingerprints are
+    exactly equal, so no approximate matching is performed.
+
+    Each cached entry is a row of evaluation data (i.e. the fitness(es)
+    followed by the extra evaluation data, if any).
+
+    An EvaluationCache is meant to be used only for problems whose
+    evaluation results are deterministic.
+
+    When an EvaluationCache is pickled (e.g. when the problem object
+    owning it is sent to a remote actor), its entries are not included.
+    """
+
+    def __init__(self, max_size: int):
+        """
+        `__init__(...)`: Initialize the EvaluationCache.
+
+        Args:
+            max_size: Maximum number of entries to be stored.
+                When this number is exceeded, the least recently used
+                entry is discarded.
+        """
+        max_size = int(max_size)
+        if max_size < 1:
+            raise ValueError(f"`max_size` was expected as a positive integer, but got {max_size}")
+        self._max_size = max_size
+        self._entries: OrderedDict = OrderedDict()
+        self._hits: int = 0
+        self._misses: int = 0
+
+    @staticmethod
+    def fingerprints(values: Union[torch.Tensor, ObjectArray]) -> List[Hashable]:
+        """
+        Compute the fingerprints of the given decision values.
+
+        Args:
+            values: A 2-dimensional tensor, or an ObjectArray.
+        Returns:
+            A list containing the fingerprint of each row of the given
+            tensor (or of each element of the given ObjectArray).
+        """
+        if isinstance(values, ObjectArray):
+            return [pickle.dumps(x) for x in values]
+        else:
+            rows = values.detach().to("cpu").contiguous().view(torch.uint8).numpy()
+            return [row.tobytes() for row in rows]
+
+    def get(self, key: Hashable) -> Optional[torch.Tensor]:
+        """
+        Get the evaluation data associated with the given fingerprint.
+
+        Args:
+            key: The fingerprint.
+        Returns:
+            The cached evaluation data, or None if the fingerprint is not
+            in the cache.
+        """
+        result = self._entries.get(key, None)
+        if result is not None:
+            self._entries.move_to_end(key)
+        return result
+
+    def put(self, key: Hashable, evdata: torch.Tensor):
+        """
+        Store the evaluation data associated with the given fingerprint.
+
+        Args:
+            key: The fingerprint.
+            evdata: The evaluation data, as a 1-dimensional tensor.
+        """
+        self._entries[key] = evdata
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_size:
+            self._entries.popitem(last=False)
+
+    def record(self, *, hits: int = 0, misses: int = 0):
+        """
+        Update the hit and miss counters.
+
+        Args:
+            hits: Number of solutions whose evaluations were reused.
+            misses: Number of solutions which had to be evaluated.
+        """
+        self._hits += int(hits)
+        self._misses += int(misses)
+
+    def clear(self):
+        """
+        Remove all the entries, and reset the counters.
+        """
+        self._entries.clear()
+        self._hits = 0
+        self._misses = 0
+
+    @property
+    def max_size(self) -> int:
+        """Maximum number of entries"""
+        return self._max_size
+
+    @property
+    def hits(self) -> int:
+        """Total number of solutions whose evaluations were reused"""
+        return self._hits
+
+    @property
+    def misses(self) -> int:
+        """Total number of solutions which had to be evaluated"""
+        return self._misses
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._entries
+
+    @property
+    def status(self) -> dict:
+        """
+        Status dictionary containing the counters of the cache.
+        """
+        return {
+            "eval_cache_hits": self._hits,
+            "eval_cache_misses": self._misses,
+            "eval_cache_size": len(self._entries),
+        }
+
+    def __getstate__(self) -> dict:
+        state = dict(self.__dict__)
+        state["_entries"] = OrderedDict()
+        return state
@@ -864,7 +864,7 @@ def rowwise_sum(x: torch.Tensor) -> torch.Tensor:
     return torch.sum(x, 0)
 
 
-def split_workload(workload: int, num_actors: int) -> list:
+def split_workload(workload: int, num_actors: int, *, weights: Optional[Iterable[float]] = None) -> list:
     """
     Split a workload among actors.
 
@@ -877,10 +877,42 @@ def split_workload(workload: int, num_actors: int) -> list:
         workload: Total amount of work, as an integer.
         num_actors: Number of actors (i.e. remote workers) among
             which the workload will be distributed.
+        weights: Optionally a sequence of positive numbers, one per actor,
+            expressing the relative speeds of the actors. If given, the
+            workload is split proportionally to these weights (while still
+            giving each actor at least 1 unit of work if the workload is
+            large enough). If left as None, the workload is split evenly.
     Returns:
         A list of integers. The i-th item of the returned list
         expresses the suggested workload for the i-th actor.
     """
+    if weights is not None:
+        weights = [float(w) for w in weights]
+        if len(weights) != num_actors:
+            raise ValueError(f"Expected {num_actors} weights (one per actor), but got {len(weights)} weights")
+        if any((not math.isfinite(w)) or (w <= 0) for w in weights):
+            raise ValueError(f"The weights were expected as positive finite numbers, but got {weights}")
+
+        total_weight = sum(weights)
+        shares = [(workload * w) / total_weight for w in weights]
+        result = [int(math.floor(share)) for share in shares]
+
+        # Distribute the remaining units of work to the actors with the largest fractional shares
+        remaining = workload - sum(result)
+        by_fraction = sorted(range(num_actors), key=lambda i: shares[i] - result[i], reverse=True)
+        for i in by_fraction[:remaining]:
+            result[i] += 1
+
+        # Make sure that no actor is left without work (so that its speed can still be measured)
+        if workload >= num_actors:
+            for i in range(num_actors):
+                if result[i] == 0:
+                    donor = max(range(num_actors), key=lambda j: result[j])
+                    result[donor] -= 1
+                    result[i] += 1
+
+        return result
+
     base_workload = workload // num_actors
     extra_workload = workload % num_actors
     result = [base_workload] * num_actors
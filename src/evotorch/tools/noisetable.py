@@ -0,0 +1,190 @@
+# Copyright 2022 NNAISENSE SA
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+This module contains the NoiseTable class, which allows the solutions sampled
+from a Gaussian search distribution to be communicated as compact indices
+instead of full decision vectors.
+"""
+
+import warnings
+from typing import Any, Optional, Tuple
+
+import torch
+
+from .misc import Device, DType, make_randint, to_torch_dtype
+
+
+class NoiseTable:
+    """
+    A large, read-only, 1-dimensional table of standard normal noise.
+
+    A noise vector of length `d` is represented by an offset `i` and
+    a sign `s`, and is `s * table[i:i+d]`. This allows a population sampled
+    from a Gaussian search distribution to be communicated as
+    `(offset, sign)` pairs (and the evaluation results), as done by the
+    evolution strategy of Salimans et al. (2017), instead of being
+    communicated as full decision vectors.
+    Both ends of the communication are then able to reconstruct the
+    solutions, as long as they have the same noise table and the same
+    search distribution.
+
+    When a NoiseTable is pickled, its noise is represented by a numpy array.
+    Therefore, when a NoiseTable is put into the ray object store (e.g. via
+    `ray.put(...)`), the actors on the same node share a single copy of
+    the noise in shared memory, instead of having their own copies.
+
+    Reference:
+
+        Tim Salimans, Jonathan Ho, Xi Chen, Szymon Sidor, Ilya Sutskever (2017).
+        Evolution Strategies as a Scalable Alternative to Reinforcement Learning.
+    """
+
+    def __init__(self, size: int, *, seed: Optional[int] = None, dtype: DType = torch.float32):
+        """
+        `__init__(...)`: Initialize the NoiseTable.
+
+        Args:
+            size: Number of noise values to be stored.
+                A noise table with a size much larger than the solution
+                length is recommended, so that the sampled noise vectors do
+                not overlap much.
+            seed: Seed of the random number generator used for generating
+                the noise. If left as None, a non-deterministic seed is used.
+            dtype: dtype of the noise values. The default is float32.
+        """
+        size = int(size)
+        if size < 1:
+            raise ValueError(f"`size` was expected as a positive integer, but got {size}")
+
+        generator = torch.Generator()
+        if seed is None:
+            generator.seed()
+        else:
+            generator.manual_seed(int(seed))
+
+        self._noise = torch.randn(size, generator=generator, dtype=to_torch_dtype(dtype))
+
+    @property
+    def size(self) -> int:
+        """Number of noise values stored by this NoiseTable"""
+        return self._noise.shape[0]
+
+    @property
+    def dtype(self) -> torch.dtype:
+        """dtype of the noise values"""
+        return self._noise.dtype
+
+    def sample_indices(
+        self,
+        num_solutions: int,
+        solution_length: int,
+        *,
+        symmetric: bool = False,
+        generator: Any = None,
+    ) -> Tuple[torch.Tensor, torch.Tensor]:
+        """
+        Sample the offsets and the signs of new noise vectors.
+
+        Args:
+            num_solutions: Number of noise vectors to sample.
+            solution_length: Length of each noise vector.
+            symmetric: If True, the noise vectors are sampled in a
+                symmetric (i.e. antithetic) manner, the (2i)-th and the
+                (2i+1)-th noise vectors sharing the same offset but having
+                the opposite signs. In this case, `num_solutions` must be
+                an even number.
+            generator: Pseudo-random number generator to be used when
+                sampling the offsets. Can be a `torch.Generator`, or an
+                object with a `generator` attribute (such as `Problem`).
+        Returns:
+            A tuple `(offsets, signs)`, both being 1-dimensional tensors
+            of length `num_solutions`, stored on the cpu.
+        """
+        num_solutions = int(num_solutions)
+        solution_length = int(solution_length)
+
+        if solution_length > self.size:
+            raise ValueError(
+                f"The solution length ({solution_length}) is larger than the size of the noise table ({self.size})"
+            )
+
+        if symmetric:
+            if (num_solutions % 2) != 0:
+                raise ValueError(
+                    f"In symmetric mode, `num_solutions` was expected as an even number, but got {num_solutions}"
+                )
+            num_offsets = num_solutions // 2
+        else:
+            num_offsets = num_solutions
+
+        generator = getattr(generator, "generator", generator)
+        device = "cpu" if generator is None else generator.device
+        num_choices = self.size - solution_length + 1
+        offsets = make_randint(num_offsets, n=num_choices, device=device, generator=generator).to("cpu")
+
+        if symmetric:
+            offsets = offsets.repeat_interleave(2)
+            signs = torch.tensor([1, -1], dtype=torch.int8).repeat(num_offsets)
+        else:
+            signs = torch.ones(num_offsets, dtype=torch.int8)
+
+        return offsets, signs
+
+    def noise(
+        self,
+        offsets: torch.Tensor,
+        signs: torch.Tensor,
+        solution_length: int,
+        *,
+        dtype: Optional[DType] = None,
+        device: Optional[Device] = None,
+    ) -> torch.Tensor:
+        """
+        Get the noise vectors represented by the given offsets and signs.
+
+        Args:
+            offsets: Offsets of the noise vectors, as a 1-dimensional tensor.
+            signs: Signs of the noise vectors (each sign being 1 or -1),
+                as a 1-dimensional tensor.
+            solution_length: Length of each noise vector.
+            dtype: dtype of the resulting tensor. If left as None, the dtype
+                of this NoiseTable is used.
+            device: Device of the resulting tensor. If left as None, the
+                noise vectors are returned on the cpu.
+        Returns:
+            The noise vectors, as a tensor of shape
+            `(len(offsets), solution_length)`.
+        """
+        # Each row of the unfolded view is a window of the table, so, only the selected rows get copied
+        windows = self._noise.unfold(0, int(solution_length), 1)
+        rows = windows[torch.as_tensor(offsets, dtype=torch.int64, device="cpu")]
+        rows *= torch.as_tensor(signs, device="cpu").reshape(-1, 1).to(rows.dtype)
+
+        cast_kwargs = {}
+        if dtype is not None:
+            cast_kwargs["dtype"] = to_torch_dtype(dtype)
+        if device is not None:
+            cast_kwargs["device"] = device
+        return rows.to(**cast_kwargs)
+
+    def __getstate__(self) -> dict:
+        return {"_noise": self._noise.numpy()}
+
+    def __setstate__(self, state: dict):
+        with warnings.catch_warnings():
+            # The numpy array can be read-only (e.g. when it lives in the ray object store).
+            # This is not a problem, because the noise table is never modified.
+            warnings.simplefilter("ignore")
+            self._noise = torch.from_numpy(state["_noise"])
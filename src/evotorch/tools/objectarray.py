@@ -412,6 +412,9 @@ class ObjectArray(Sequence):
     def storage(self) -> ObjectArrayStorage:
         return ObjectArrayStorage(self)
 
+    def untyped_storage(self) -> ObjectArrayStorage:
+        return ObjectArrayStorage(self)
+
     def _to_string(self) -> str:
         inside = []
         for ind in self._indices:
@@ -0,0 +1,198 @@
+# Copyright 2022 NNAISENSE SA
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+This module contains the SubbatchSizeTuner class, which chooses the size
+of the sub-batches sent to the remote actors of a parallelized problem.
+"""
+
+import math
+from typing import Iterable, Optional
+
+
+class SubbatchSizeTuner:
+    """
+    An adaptive chooser of the sub-batch size, used by a Problem which was
+    initialized with `subbatch_size="auto"`.
+
+    The sub-batch size is a trade-off: sub-batches which are too big cause
+    stragglers (some actors stay idle while the others are finishing their
+    big sub-batches), and sub-batches which are too small drown in the
+    overhead of dispatching a task.
+
+    In the first generation, the population is split into one piece per
+    actor. From the time measurements of this generation, the per-task
+    dispatch overhead and the per-solution evaluation time are estimated,
+    and the initial sub-batch size is chosen as the smallest size whose
+    dispatch overhead stays within `target_overhead` (a fraction) of the
+    time spent on evaluating the sub-batch.
+    From then on, the wall-clock time per solution is tracked (as an
+    exponential moving average) for each tried sub-batch size, and the
+    tuner keeps moving to the best one among the current size, its half,
+    and its double. Every `reexplore_interval` generations, the
+    measurements of the neighboring sizes are forgotten, so that they are
+    measured again, and the tuner keeps adapting to the changing costs.
+    """
+
+    def __init__(self, *, target_overhead: float = 0.1, smoothing: float = 0.3, reexplore_interval: int = 10):
+        """
+        `__init__(...)`: Initialize the SubbatchSizeTuner.
+
+        Args:
+            target_overhead: The initial sub-batch size is chosen such that
+                the estimated dispatch overhead of a task is at most this
+                fraction of the estimated evaluation time of the task.
+            smoothing: The coefficient of the exponential moving averages
+                of the measured wall-clock times per solution.
+            reexplore_interval: Number of generations after which the
+                neighbors of the current sub-batch size are measured again.
+        """
+        if not (float(target_overhead) > 0):
+            raise ValueError(f"`target_overhead` was expected as a positive number, but got {target_overhead}")
+        if not (0.0 < float(smoothing) <= 1.0):
+            raise ValueError(f"`smoothing` was expected as a number within (0, 1], but got {smoothing}")
+        if int(reexplore_interval) < 1:
+            raise ValueError(f"`reexplore_interval` was expected as a positive integer, but got {reexplore_interval}")
+        self._target_overhead = float(target_overhead)
+        self._smoothing = float(smoothing)
+        self._reexplore_interval = int(reexplore_interval)
+
+        self._size: Optional[int] = None
+        self._costs: dict = {}
+        self._task_overhead: Optional[float] = None
+        self._seconds_per_solution: Optional[float] = None
+        self._last_size: Optional[int] = None
+        self._generations_since_exploration: int = 0
+
+    def suggest(self, workload: int, num_workers: int) -> int:
+        """
+        Suggest a sub-batch size for the next generation.
+
+        Args:
+            workload: Number of solutions to be evaluated (or sampled)
+                in the next generation.
+            num_workers: Number of actors (or worker processes).
+        Returns:
+            The suggested sub-batch size, as an integer.
+        """
+        max_size = max(1, math.ceil(workload / max(1, num_workers)))
+        if self._size is None:
+            # No measurement yet. We give each actor a single piece.
+            return max_size
+
+        current = min(self._size, max_size)
+
+        # Try the neighboring sizes which are not measured yet
+        for candidate in (max(1, current // 2), min(max_size, current * 2)):
+            if (candidate != current) and (candidate not in self._costs):
+                return candidate
+
+        return current
+
+    def record(
+        self,
+        size: int,
+        workload: int,
+        num_workers: int,
+        wall_time: float,
+        compute_times: Optional[Iterable[float]] = None,
+    ):
+        """
+        Record the measurements of a generation.
+
+        Args:
+            size: The sub-batch size used in the generation.
+            workload: Number of solutions evaluated (or sampled) in the
+                generation.
+            num_workers: Number of actors (or worker processes).
+            wall_time: Wall-clock time of the generation, in seconds,
+                as measured by the main process.
+            compute_times: Optionally, the time (in seconds) each task
+                spent on the actor side. If given, the dispatch overhead
+                per task is estimated from these measurements.
+        """
+        size = int(size)
+        workload = int(workload)
+        if workload <= 0:
+            return
+
+        wall_time = max(float(wall_time), 1e-9)
+        num_tasks = math.ceil(workload / size)
+        self._last_size = size
+        self._seconds_per_solution = wall_time / workload
+
+        compute_times = None if compute_times is None else [float(t) for t in compute_times]
+        if (compute_times is not None) and (len(compute_times) > 0):
+            # The time budget of the busy actors, minus the time they spent on actual work, is considered
+            # as the overhead (dispatching, serialization, waiting) and divided across the tasks.
+            busy_workers = min(num_workers, num_tasks)
+            total_compute = sum(compute_times)
+            overhead = max(0.0, (wall_time * busy_workers - total_compute) / len(compute_times))
+            compute_per_solution = total_compute / workload
+        else:
+            overhead = None
+            compute_per_solution = None
+
+        previous = self._costs.get(size)
+        current_cost = self._seconds_per_solution
+        self._costs[size] = (
+            current_cost if previous is None else (1.0 - self._smoothing) * previous + self._smoothing * current_cost
+        )
+
+        if self._size is None:
+            # This is the first measurement. We choose the initial sub-batch size from the estimated overhead.
+            max_size = max(1, math.ceil(workload / max(1, num_workers)))
+            if (overhead is None) or (compute_per_solution is None) or (compute_per_solution <= 0):
+                self._size = max_size
+            else:
+                self._task_overhead = overhead
+                overhead_bound = math.ceil(overhead / (self._target_overhead * compute_per_solution))
+                self._size = min(max_size, max(1, overhead_bound))
+            return
+
+        if overhead is not None:
+            self._task_overhead = (
+                overhead
+                if self._task_overhead is None
+                else (1.0 - self._smoothing) * self._task_overhead + self._smoothing * overhead
+            )
+
+        # Move to the best known size among the current size and its neighbors
+        neighborhood = [s for s in (self._size, max(1, self._size // 2), self._size * 2) if s in self._costs]
+        if len(neighborhood) > 0:
+            self._size = min(neighborhood, key=lambda s: self._costs[s])
+
+        # Periodically forget the measurements of the neighbors, so that the tuner keeps adapting
+        self._generations_since_exploration += 1
+        if self._generations_since_exploration >= self._reexplore_interval:
+            self._generations_since_exploration = 0
+            self._costs = {self._size: self._costs[self._size]} if self._size in self._costs else {}
+
+    @property
+    def size(self) -> Optional[int]:
+        """The currently chosen sub-batch size, or None if nothing was measured yet"""
+        return self._size
+
+    @property
+    def status(self) -> dict:
+        """
+        Status dictionary containing the decisions and the measurements
+        of the tuner.
+        """
+        return {
+            "subbatch_size": self._last_size,
+            "subbatch_size_chosen": self._size,
+            "subbatch_task_overhead": self._task_overhead,
+            "subbatch_seconds_per_solution": self._seconds_per_solution,
+        }
@@ -0,0 +1,604 @@
+# Copyright 2022 NNAISENSE SA
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""
+A lightweight socket-based transport, which allows a Problem to be
+parallelized across standalone worker processes (possibly running on
+multiple hosts) without the ray runtime.
+
+A worker is started from the command line as follows:
+
+    python -m evotorch.worker --host 0.0.0.0 --port 5555
+
+or, for listening on a Unix socket:
+
+    python -m evotorch.worker --unix /tmp/evotorch-worker.sock
+
+A Problem can then use the workers as follows:
+
+    problem = MyProblem(
+        ...,
+        parallel_backend="socket",
+        worker_addresses=["host1:5555", "host2:5555", "unix:/tmp/evotorch-worker.sock"],
+    )
+
+Each connection made to a worker hosts its own copy of the Problem object
+(so, a single worker can serve multiple connections, e.g. when `num_actors`
+is greater than the number of addresses).
+
+The messages are pickled with protocol 5, and the tensors and numpy arrays
+they contain are sent as raw out-of-band buffers (i.e. without being
+embedded into the pickled data).
+Since unpickling can execute arbitrary code, the workers must only be
+reachable from trusted networks. To prevent unauthorized clients from
+sending messages, an authentication key can be given to the workers
+(via `--authkey`, or via the environment variable `EVOTORCH_WORKER_AUTHKEY`),
+and to the Problem (via `worker_authkey`).
+"""
+
+import argparse
+import hashlib
+import hmac
+import io
+import os
+import pickle
+import queue
+import select
+import socket
+import struct
+import threading
+import time
+import traceback
+import weakref
+from collections import deque
+from typing import Any, Iterable, Optional, Union
+
+import numpy as np
+import torch
+from ray import cloudpickle
+
+__all__ = ("SocketWorkerPool", "WorkerServer", "recv_message", "send_message")
+
+
+# Header of a message: the length of the pickled data, and the number of out-of-band buffers
+_MESSAGE_HEADER = struct.Struct("!QI")
+
+# Header of an out-of-band buffer: its length
+_BUFFER_HEADER = struct.Struct("!Q")
+
+# Length of the authentication challenge, and of its response (i.e. the length of a SHA-256 digest)
+_CHALLENGE_LENGTH = 32
+
+# The request methods which can be served by a worker (these are the methods of `EvaluationWorker`)
+_ALLOWED_METHODS = ("call", "call_on_env", "evaluate_batch", "evaluate_batch_piece", "get", "set")
+
+
+def _tensor_from_array(x: np.ndarray) -> torch.Tensor:
+    return torch.from_numpy(x)
+
+
+class _MessagePickler(pickle.Pickler):
+    # A pickler which converts the cpu tensors to numpy arrays, so that their data are sent as out-of-band buffers
+    def reducer_override(self, obj: Any) -> Any:
+        if (
+            (type(obj) is torch.Tensor)
+            and (obj.device.type == "cpu")
+            and (obj.dtype != torch.bfloat16)
+            and (not obj.requires_grad)
+        ):
+            return _tensor_from_array, (obj.contiguous().numpy(),)
+        return NotImplemented
+
+
+def _recv_exactly(sock: socket.socket, num_bytes: int) -> bytearray:
+    result = bytearray(num_bytes)
+    view = memoryview(result)
+    received = 0
+    while received < num_bytes:
+        n = sock.recv_into(view[received:], num_bytes - received)
+        if n == 0:
+            raise ConnectionError("The connection was closed by the other side")
+        received += n
+    return result
+
+
+def send_message(sock: socket.socket, obj: Any):
+    """
+    Send an object over a socket.
+
+    Args:
+        sock: The socket.
+        obj: The object to be sent. It must be picklable.
+    """
+    buffers = []
+    data = io.BytesIO()
+    _MessagePickler(data, protocol=5, buffer_callback=buffers.append).dump(obj)
+    raw_buffers = [buffer.raw() for buffer in buffers]
+    sock.sendall(_MESSAGE_HEADER.pack(data.getbuffer().nbytes, len(raw_buffers)))
+    sock.sendall(data.getbuffer())
+    for raw_buffer in raw_buffers:
+        sock.sendall(_BUFFER_HEADER.pack(raw_buffer.nbytes))
+        sock.sendall(raw_buffer)
+
+
+def recv_message(sock: socket.socket) -> Any:
+    """
+    Receive an object sent via `send_message(...)`.
+
+    Args:
+        sock: The socket.
+    Returns:
+        The received object.
+    """
+    data_length, num_buffers = _MESSAGE_HEADER.unpack(_recv_exactly(sock, _MESSAGE_HEADER.size))
+    data = _recv_exactly(sock, data_length)
+    buffers = []
+    for _ in range(num_buffers):
+        (buffer_length,) = _BUFFER_HEADER.unpack(_recv_exactly(sock, _BUFFER_HEADER.size))
+        buffers.append(_recv_exactly(sock, buffer_length))
+    return pickle.loads(data, buffers=buffers)
+
+
+def _parse_address(address: str) -> tuple:
+    # Parse an address in the form "unix:/path/to/socket" or "host:port"
+    if address.startswith("unix:"):
+        return socket.AF_UNIX, address[len("unix:") :]
+    host, sep, port = address.rpartition(":")
+    if sep == "":
+        raise ValueError(f"Expected an address in the form 'host:port' or 'unix:/path', but got {repr(address)}")
+    return socket.AF_INET, (host, int(port))
+
+
+def _auth_digest(authkey: Optional[bytes], challenge: bytes) -> bytes:
+    if authkey is None:
+        return bytes(_CHALLENGE_LENGTH)
+    return hmac.new(authkey, challenge, hashlib.sha256).digest()
+
+
+def _as_authkey(authkey: Optional[Union[str, bytes]]) -> Optional[bytes]:
+    if (authkey is None) or isinstance(authkey, bytes):
+        return authkey
+    return str(authkey).encode("utf-8")
+
+
+class WorkerServer:
+    """
+    A standalone worker, which hosts remote copies of Problem objects,
+    and serves the requests of their main Problem objects over a socket.
+
+    Usually, a worker is started from the command line via
+    `python -m evotorch.worker`. Alternatively, it can be started from
+    within Python as follows:
+
+        server = WorkerServer("127.0.0.1:5555")
+        server.serve_forever()
+    """
+
+    def __init__(self, address: str, *, authkey: Optional[Union[str, bytes]] = None):
+        """
+        `__init__(...)`: Initialize the WorkerServer and start listening.
+
+        Args:
+            address: The address to listen to, in the form "host:port"
+                or "unix:/path/to/socket". If the port is given as 0,
+                a free port is chosen (see the property `address`).
+            authkey: Optionally a key, which the clients must also know
+                to be able to connect.
+        """
+        family, bind_address = _parse_address(address)
+        self._family = family
+        self._authkey = _as_authkey(authkey)
+        self._listener = socket.socket(family, socket.SOCK_STREAM)
+        if family == socket.AF_INET:
+            self._listener.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        elif os.path.exists(bind_address):
+            os.unlink(bind_address)
+        self._listener.bind(bind_address)
+        self._listener.listen()
+        self._closed = False
+
+    @property
+    def address(self) -> str:
+        """The address this worker is listening to"""
+        if self._family == socket.AF_UNIX:
+            return "unix:" + self._listener.getsockname()
+        host, port = self._listener.getsockname()[:2]
+        return f"{host}:{port}"
+
+    def serve_forever(self):
+        """
+        Accept connections until the server is closed, serving each
+        connection in its own thread.
+        """
+        while not self._closed:
+            try:
+                connection, _ = self._listener.accept()
+            except OSError:
+                if self._closed:
+                    break
+                raise
+            threading.Thread(target=self._serve_connection, args=(connection,), daemon=True).start()
+
+    def close(self):
+        """Stop accepting new connections"""
+        self._closed = True
+        self._listener.close()
+
+    def _authenticate(self, connection: socket.socket) -> bool:
+        challenge = os.urandom(_CHALLENGE_LENGTH)
+        connection.sendall(challenge)
+        response = bytes(_recv_exactly(connection, _CHALLENGE_LENGTH))
+        accepted = (self._authkey is None) or hmac.compare_digest(response, _auth_digest(self._authkey, challenge))
+        connection.sendall(b"\x01" if accepted else b"\x00")
+        return accepted
+
+    def _serve_connection(self, connection: socket.socket):
+        from .core import EvaluationWorker
+
+        with connection:
+            if self._family == socket.AF_INET:
+                connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+
+            try:
+                if not self._authenticate(connection):
+                    return
+                pickled_problem, index, seeds, state = recv_message(connection)
+            except Exception:
+                return
+
+            try:
+                worker = EvaluationWorker(pickle.loads(pickled_problem), index, seeds, state)
+            except Exception:
+                send_message(connection, (False, traceback.format_exc()))
+                return
+            send_message(connection, (True, None))
+
+            # The requests are read by a separate thread, so that a client which sends multiple requests without
+            # waiting (i.e. which pipelines its requests) is never blocked by a worker which is sending a reply.
+            requests = queue.Queue()
+
+            def read_requests():
+                try:
+                    while True:
+                        requests.put(recv_message(connection))
+                except Exception:
+                    # Either the connection is broken, or a message could not be read (e.g. it could not be
+                    # unpickled), after which the stream cannot be trusted anymore. In both cases, the serving loop
+                    # is told to stop, and the connection is closed.
+                    requests.put(None)
+
+            threading.Thread(target=read_requests, daemon=True).start()
+
+            while True:
+                request = requests.get()
+                if request is None:
+                    break
+                method_name, args, kwargs = request
+                try:
+                    if method_name not in _ALLOWED_METHODS:
+                        raise ValueError(f"Unknown request method: {repr(method_name)}")
+                    reply = (True, getattr(worker, method_name)(*args, **kwargs))
+                except Exception:
+                    reply = (False, traceback.format_exc())
+                try:
+                    send_message(connection, reply)
+                except (ConnectionError, OSError):
+                    break
+
+
+class _WorkerConnection:
+    # A connection to a worker, which hosts a single remote copy of the problem
+
+    def __init__(self, address: str, authkey: Optional[bytes], init_message: tuple, timeout: Optional[float]):
+        self.address = address
+        self._authkey = authkey
+        self._init_message = init_message
+        self._timeout = timeout
+        self.sock: Optional[socket.socket] = None
+
+        # Requests sent but not yet replied, as (task_id, request) tuples, in the order they were sent
+        self.in_flight: deque = deque()
+
+    def connect(self):
+        family, connect_address = _parse_address(self.address)
+        sock = socket.socket(family, socket.SOCK_STREAM)
+        try:
+            sock.settimeout(self._timeout)
+            sock.connect(connect_address)
+            if family == socket.AF_INET:
+                sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            challenge = bytes(_recv_exactly(sock, _CHALLENGE_LENGTH))
+            sock.sendall(_auth_digest(self._authkey, challenge))
+            if bytes(_recv_exactly(sock, 1)) != b"\x01":
+                raise PermissionError(f"The worker at {self.address} rejected the authentication key")
+            sock.settimeout(None)
+            send_message(sock, self._init_message)
+            success, payload = recv_message(sock)
+        except BaseException:
+            sock.close()
+            raise
+        if not success:
+            sock.close()
+            raise RuntimeError(
+                f"The following error occurred while initializing the worker at {self.address}:\n{payload}"
+            )
+        self.sock = sock
+
+    def close(self):
+        if self.sock is not None:
+            self.sock.close()
+            self.sock = None
+
+    def send(self, task_id: int, request: tuple):
+        self.in_flight.append((task_id, request))
+        send_message(self.sock, request)
+
+    def receive(self) -> tuple:
+        reply = recv_message(self.sock)
+        task_id, _ = self.in_flight.popleft()
+        return task_id, reply
+
+
+class SocketWorkerPool:
+    """
+    A pool of connections to standalone workers (see `WorkerServer`),
+    serving as an alternative to the ray actors for parallelizing the
+    evaluations of a Problem.
+
+    Each connection hosts a remote copy of the Problem object, which is
+    prepared in the same way a ray actor prepares its copy (i.e. the seeds
+    are set, the remote states are loaded, and the `remote_hook` is called).
+    Multiple requests can be in flight on a connection at the same time
+    (see `max_in_flight`), which hides the network latency between the
+    consecutive requests.
+    If a connection breaks, the pool reconnects to the same address,
+    re-initializes the remote copy of the problem (with the same seeds),
+    sends the current synchronization data of the problem (see
+    `Problem._make_sync_data_for_actors()`), and re-sends the requests
+    which were in flight.
+
+    An instance of this class is not meant to be created manually.
+    Instead, a Problem object creates it when it is initialized with
+    `parallel_backend="socket"`, and when its parallelization is triggered.
+    """
+
+    def __init__(
+        self,
+        problem: Any,
+        addresses: Iterable[str],
+        seeds: list,
+        states: list,
+        *,
+        authkey: Optional[Union[str, bytes]] = None,
+        max_in_flight: int = 2,
+        timeout: Optional[float] = 30.0,
+        max_reconnect_attempts: int = 5,
+    ):
+        """
+        `__init__(...)`: Initialize the SocketWorkerPool, and connect to the workers.
+
+        Args:
+            problem: The Problem object to be copied into the workers.
+            addresses: The addresses of the workers, one address per
+                connection, each address being in the form "host:port"
+                or "unix:/path/to/socket".
+            seeds: A list of seed tuples, one per connection.
+            states: A list of state dictionaries, one per connection,
+                to be loaded by the remote copies of the problem.
+            authkey: The authentication key of the workers, if any.
+            max_in_flight: Maximum number of requests which can be sent
+                over a connection without waiting for their replies.
+            timeout: Number of seconds to wait while connecting to a worker.
+            max_reconnect_attempts: How many times the pool should try to
+                reconnect to a worker whose connection broke, before
+                giving up and raising an error.
+        """
+        if int(max_in_flight) < 1:
+            raise ValueError(f"`max_in_flight` was expected as a positive integer, but got {max_in_flight}")
+
+        addresses = list(addresses)
+        pickled_problem = cloudpickle.dumps(problem)
+        authkey = _as_authkey(authkey)
+
+        self._max_in_flight = int(max_in_flight)
+        self._max_reconnect_attempts = int(max_reconnect_attempts)
+        self._connections = [
+            _WorkerConnection(addresses[i], authkey, (pickled_problem, i, tuple(seeds[i]), states[i]), timeout)
+            for i in range(len(addresses))
+        ]
+        self._next_task_id = 0
+
+        # The pool is owned by the problem, so, the problem is referred to weakly, for getting its most recent
+        # synchronization data when a remote copy has to be re-initialized
+        self._make_sync_data = weakref.WeakMethod(problem._make_sync_data_for_actors)
+
+        try:
+            for connection in self._connections:
+                connection.connect()
+        except BaseException:
+            self.shutdown()
+            raise
+
+    def __len__(self) -> int:
+        return len(self._connections)
+
+    def _reconnect(self, connection: _WorkerConnection):
+        # Reconnect to the worker, and re-send the requests which were in flight
+        connection.close()
+        for attempt in range(self._max_reconnect_attempts):
+            time.sleep(min(2.0**attempt * 0.1, 5.0))
+            try:
+                connection.connect()
+                break
+            except (ConnectionError, OSError):
+                pass
+        else:
+            raise ConnectionError(
+                f"Could not reconnect to the worker at {connection.address}"
+                f" after {self._max_reconnect_attempts} attempts"
+            )
+        to_resend = list(connection.in_flight)
+        connection.in_flight.clear()
+
+        # The re-initialized remote copy has the state it had at startup, so, the current synchronization data is
+        # sent before the requests which were in flight. Its reply is ignored, since its task id is not waited for.
+        make_sync_data = self._make_sync_data()
+        sync_data = NotImplemented if make_sync_data is None else make_sync_data()
+        if (sync_data is not NotImplemented) and (sync_data is not None):
+            connection.send(self._new_task_id(), ("call", ("_use_sync_data_from_main", [sync_data], {}), {}))
+
+        for task_id, request in to_resend:
+            connection.send(task_id, request)
+
+    def _new_task_id(self) -> int:
+        task_id = self._next_task_id
+        self._next_task_id += 1
+        return task_id
+
+    def _send(self, connection: _WorkerConnection, request: tuple) -> int:
+        task_id = self._new_task_id()
+        try:
+            connection.send(task_id, request)
+        except (ConnectionError, OSError):
+            # The request was recorded as in flight, so, it is re-sent after reconnecting
+            self._reconnect(connection)
+        return task_id
+
+    def _receive(self, connection: _WorkerConnection) -> Optional[tuple]:
+        # Receive a reply, and return it as a tuple (task_id, result).
+        # If the connection broke, reconnect, and return None.
+        try:
+            task_id, (success, payload) = connection.receive()
+        except (ConnectionError, OSError):
+            self._reconnect(connection)
+            return None
+        if not success:
+            raise RuntimeError(f"The following error occurred in the worker at {connection.address}:\n{payload}")
+        return task_id, payload
+
+    def _run(self, requests: list) -> list:
+        # Run the given requests, keeping up to `max_in_flight` requests in flight on each connection.
+        # The results are returned in the order of the requests.
+        results = [None] * len(requests)
+        pending = deque(enumerate(requests))
+        index_of_task = {}
+        while (len(pending) > 0) or (len(index_of_task) > 0):
+            for connection in self._connections:
+                while (len(pending) > 0) and (len(connection.in_flight) < self._max_in_flight):
+                    i, request = pending.popleft()
+                    index_of_task[self._send(connection, request)] = i
+
+            busy = [connection for connection in self._connections if len(connection.in_flight) > 0]
+            readable, _, _ = select.select([connection.sock for connection in busy], [], [])
+            for connection in busy:
+                if connection.sock in readable:
+                    received = self._receive(connection)
+                    if received is not None:
+                        task_id, result = received
+                        # Replies of the requests which are not waited for (e.g. the requests which were in flight
+                        # when an earlier run failed) are ignored
+                        if task_id in index_of_task:
+                            results[index_of_task.pop(task_id)] = result
+        return results
+
+    def call_all(self, method_name: str, args: list, kwargs: dict) -> list:
+        """
+        Call a method on each remote copy of the problem.
+
+        Args:
+            method_name: Name of the method.
+            args: Positional arguments to be passed to the method.
+            kwargs: Keyword arguments to be passed to the method.
+        Returns:
+            A list whose i-th element is the result of the i-th connection.
+        """
+        request = ("call", (method_name, args, kwargs), {})
+        task_ids = [self._send(connection, request) for connection in self._connections]
+        results = []
+        for connection, task_id in zip(self._connections, task_ids):
+            while True:
+                received = self._receive(connection)
+                if (received is not None) and (received[0] == task_id):
+                    results.append(received[1])
+                    break
+        return results
+
+    def map_calls(self, method_name: str, args_and_kwargs: list) -> list:
+        """
+        Call a method of the remote copies of the problem, once for each
+        given pair of arguments, distributing the calls across the
+        connections.
+
+        Args:
+            method_name: Name of the method.
+            args_and_kwargs: A list of tuples, each tuple being in the form
+                `(args, kwargs)`, `args` being a list of positional arguments
+                and `kwargs` being a dictionary of keyword arguments.
+        Returns:
+            A list whose i-th element is the result of the i-th call.
+        """
+        return self._run([("call", (method_name, args, kwargs), {}) for args, kwargs in args_and_kwargs])
+
+    def evaluate(self, batch: Any, pieces: Any):
+        """
+        Evaluate the given SolutionBatch using the workers.
+
+        Args:
+            batch: The SolutionBatch to be evaluated.
+            pieces: The pieces of the batch, each piece to be evaluated
+                by a worker.
+        """
+        results = self._run([("evaluate_batch_piece", (i, piece), {}) for i, piece in enumerate(pieces)])
+        for piece_index, evals in results:
+            row_begin, row_end = pieces.indices_of(piece_index)
+            batch._evdata[row_begin:row_end, :] = evals
+
+    def shutdown(self):
+        """Close all the connections"""
+        for connection in self._connections:
+            connection.close()
+
+
+def main(argv: Optional[list] = None):
+    """
+    Entry point of `python -m evotorch.worker`.
+
+    Args:
+        argv: The command line arguments. If left as None, the arguments
+            of the current process are used.
+    """
+    parser = argparse.ArgumentParser(description="Start an evotorch worker which serves Problem objects over a socket")
+    parser.add_argument("--host", default="127.0.0.1", help="The host to listen to (default: 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=5555, help="The TCP port to listen to (default: 5555)")
+    parser.add_argument("--unix", default=None, help="Listen to the given Unix socket path instead of a TCP port")
+    parser.add_argument(
+        "--authkey",
+        default=os.environ.get("EVOTORCH_WORKER_AUTHKEY"),
+        help="The authentication key (default: the environment variable EVOTORCH_WORKER_AUTHKEY, if set)",
+    )
+    args = parser.parse_args(argv)
+
+    address = f"unix:{args.unix}" if args.unix is not None else f"{args.host}:{args.port}"
+    server = WorkerServer(address, authkey=args.authkey)
+    print(f"evotorch worker listening on {server.address}", flush=True)
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,195 @@
+# Copyright 2022 NNAISENSE SA
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pytest
+import torch
+
+import evotorch as et
+from evotorch.algorithms import PGPE, SNES, LimitedMemoryXNES, LowRankXNES, TorchCMAES
+from evotorch.distributions import ExpGaussian, ExpSeparableGaussian, LimitedMemoryGaussian, LowRankGaussian
+from evotorch.tools.ranking import rank
+
+
+def _sphere(x: torch.Tensor) -> torch.Tensor:
+    return torch.sum(x**2, dim=-1)
+
+
+@pytest.mark.parametrize("separable", [False, True])
+def test_torch_cmaes(separable: bool):
+    problem = et.Problem(
+        "min", _sphere, solution_length=8, initial_bounds=(-3.0, 3.0), vectorized=True, seed=1, dtype="float64"
+    )
+    searcher = TorchCMAES(problem, stdev_init=1.0, separable=separable)
+
+    for status_key in ("center", "pop_best", "pop_best_eval", "mean_eval", "median_eval"):
+        assert status_key in searcher.status
+
+    searcher.run(200)
+
+    assert len(searcher.population) == 4 + 6
+    assert float(_sphere(searcher.status["center"])) < 1e-6
+
+
+def test_exp_gaussian_gradients():
+    d = 5
+    dist = ExpGaussian({"mu": torch.randn(d, dtype=torch.float64), "sigma": torch.rand(d, dtype=torch.float64) + 0.5})
+    samples = dist.sample(12)
+    fitnesses = torch.sum(samples**2, dim=-1)
+    grads = dist.compute_gradients(samples, fitnesses, objective_sense="min", ranking_method="nes")
+
+    # Reference computation which explicitly builds the per-sample matrices
+    z = dist.to_local_coordinates(samples)
+    weights = rank(fitnesses, ranking_method="nes", higher_is_better=False)
+    weights = weights - torch.mean(weights)
+    expected_M_grad = torch.sum(
+        weights.reshape(-1, 1, 1) * (z.unsqueeze(1) * z.unsqueeze(2) - torch.eye(d, dtype=torch.float64)), dim=0
+    )
+
+    torch.testing.assert_close(grads["M"], expected_M_grad)
+
+
+@pytest.mark.parametrize("dist_cls", [LowRankGaussian, LimitedMemoryGaussian])
+def test_structured_gaussian_reduces_to_separable(dist_cls):
+    d = 6
+    mu = torch.linspace(-1.0, 1.0, d, dtype=torch.float64)
+    sigma = torch.linspace(0.5, 2.0, d, dtype=torch.float64)
+    if dist_cls is LowRankGaussian:
+        extra = {"V": torch.zeros(d, 2, dtype=torch.float64)}
+    else:
+        extra = {"num_directions": 3}
+    dist = dist_cls({"mu": mu, "sigma": sigma, **extra})
+    separable = ExpSeparableGaussian({"mu": mu, "sigma": sigma})
+
+    samples = dist.sample(20)
+    fitnesses = torch.sum(samples**2, dim=-1)
+    grads = dist.compute_gradients(samples, fitnesses, objective_sense="min", ranking_method="nes")
+    expected = separable.compute_gradients(samples, fitnesses, objective_sense="min", ranking_method="nes")
+
+    torch.testing.assert_close(grads["mu"], expected["mu"])
+    torch.testing.assert_close(grads["sigma"], expected["sigma"])
+
+
+def test_limited_memory_gaussian_inverse_transform():
+    d = 5
+    dist = LimitedMemoryGaussian(
+        {
+            "mu": torch.zeros(d, dtype=torch.float64),
+            "sigma": torch.ones(d, dtype=torch.float64),
+            "directions": torch.randn(3, d, dtype=torch.float64),
+            "transform_rates": torch.tensor([0.3, 0.2, 0.1], dtype=torch.float64),
+        }
+    )
+    z = torch.randn(4, d, dtype=torch.float64)
+    torch.testing.assert_close(dist._inverse_transform(dist._transform(z)), z)
+
+
+@pytest.mark.parametrize("searcher_cls", [LowRankXNES, LimitedMemoryXNES])
+def test_structured_xnes(searcher_cls):
+    problem = et.Problem(
+        "min", _sphere, solution_length=8, initial_bounds=(-3.0, 3.0), vectorized=True, seed=1, dtype="float64"
+    )
+    searcher = searcher_cls(problem, stdev_init=1.0)
+    initial_loss = float(_sphere(searcher.status["center"]))
+
+    searcher.run(300)
+
+    assert float(_sphere(searcher.status["center"])) < 1e-3 * initial_loss
+
+
+def test_asynchronous_snes():
+    problem = et.Problem(
+        "min", _sphere, solution_length=5, initial_bounds=(-3.0, 3.0), vectorized=True, seed=1, num_actors=2
+    )
+    searcher = SNES(
+        problem, stdev_init=1.0, popsize=20, distributed=True, asynchronous=True, max_staleness=4, staleness_decay=0.9
+    )
+    initial_loss = float(_sphere(searcher.status["center"]))
+
+    searcher.run(100)
+
+    assert searcher.status["staleness"] <= 4
+    assert float(_sphere(searcher.status["center"])) < initial_loss
+
+
+def _failing_fitness(x: torch.Tensor) -> torch.Tensor:
+    raise RuntimeError("Evaluation failed")
+
+
+def test_asynchronous_snes_failed_step():
+    problem = et.Problem(
+        "min", _failing_fitness, solution_length=5, initial_bounds=(-3.0, 3.0), vectorized=True, num_actors=2
+    )
+    searcher = SNES(problem, stdev_init=1.0, popsize=20, distributed=True, asynchronous=True)
+
+    with pytest.raises(Exception):
+        searcher.step()
+
+    # No gradient task is left running after the failed step
+    assert searcher._async_tasks is None
+
+
+def test_asynchronous_requires_distributed():
+    problem = et.Problem("min", _sphere, solution_length=5, initial_bounds=(-3.0, 3.0), vectorized=True)
+    with pytest.raises(ValueError):
+        SNES(problem, stdev_init=1.0, asynchronous=True)
+
+
+class _PartiallyEvaluatedProblem(et.Problem):
+    # Only the first `num_evaluated` solutions of each population are evaluated, the others are left with NaN
+    # evaluation results (like the solutions which miss the evaluation deadline of a parallelized problem)
+    def __init__(self, num_evaluated: int):
+        super().__init__("min", solution_length=5, initial_bounds=(-3.0, 3.0), seed=1)
+        self.num_evaluated = num_evaluated
+
+    def _evaluate_batch(self, batch: et.SolutionBatch):
+        evals = _sphere(batch.values.clone())
+        evals[self.num_evaluated :] = float("nan")
+        batch.set_evals(evals)
+
+
+def _make_gaussian_searcher(algorithm: str, problem: et.Problem):
+    if algorithm == "snes":
+        return SNES(problem, stdev_init=1.0, popsize=10)
+    else:
+        return PGPE(problem, popsize=10, center_learning_rate=0.2, stdev_learning_rate=0.1, stdev_init=1.0)
+
+
+@pytest.mark.parametrize("algorithm", ["snes", "pgpe"])
+def test_gaussian_search_ignores_unevaluated_solutions(algorithm: str):
+    problem = _PartiallyEvaluatedProblem(num_evaluated=6)
+    searcher = _make_gaussian_searcher(algorithm, problem)
+    searcher.step()
+    initial_center = searcher.status["center"].clone()
+
+    searcher.run(100)
+
+    center = searcher.status["center"]
+    assert torch.all(torch.isfinite(center))
+    assert float(_sphere(center)) < float(_sphere(initial_center))
+
+
+@pytest.mark.parametrize("algorithm", ["snes", "pgpe"])
+def test_gaussian_search_keeps_distribution_without_usable_solutions(algorithm: str):
+    # With a single evaluated solution (which, with symmetric sampling, is also left out together with its mirrored
+    # counterpart), no gradient can be estimated, and the distribution must be kept as it is
+    problem = _PartiallyEvaluatedProblem(num_evaluated=1)
+    searcher = _make_gaussian_searcher(algorithm, problem)
+    searcher.step()
+    center = searcher.status["center"].clone()
+    stdev = searcher.status["stdev"].clone()
+
+    searcher.step()
+
+    torch.testing.assert_close(searcher.status["center"], center)
+    torch.testing.assert_close(searcher.status["stdev"], stdev)
@@ -12,6 +12,9 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
+import pickle
+import threading
 from copy import copy, deepcopy
 from itertools import product
 from typing import Callable, Iterable, Optional, Union
@@ -480,6 +483,48 @@ def test_multiobj():
         assert torch.all(second_obj_sorted == torch.LongTensor([1, 2, 4, 3, 0]))
 
 
+def _reference_pareto_ranks(utils: torch.Tensor) -> torch.Tensor:
+    n = len(utils)
+    ranks = torch.full((n,), -1, dtype=torch.int64)
+    remaining = set(range(n))
+    current_rank = 0
+    while len(remaining) > 0:
+        front = [
+            i
+            for i in remaining
+            if not any(
+                bool(torch.all(utils[j] >= utils[i]) and torch.any(utils[j] > utils[i])) for j in remaining if j != i
+            )
+        ]
+        for i in front:
+            ranks[i] = current_rank
+            remaining.remove(i)
+        current_rank += 1
+    return ranks
+
+
+@pytest.mark.parametrize("senses", [["min", "max"], ["max", "max", "min"]])
+def test_pareto_sort(senses: list):
+    problem = et.Problem(senses, DummyProblems._sum, solution_length=3, initial_bounds=(-1.0, 1.0))
+    popsize = 40
+    batch = problem.generate_batch(popsize)
+
+    # Integer-valued evaluations, so that there are ties and duplicates
+    batch.set_evals(torch.randint(0, 5, (popsize, len(senses))).to(problem.eval_dtype))
+
+    fronts, ranks = batch.arg_pareto_sort()
+    assert torch.all(ranks == _reference_pareto_ranks(batch.utils()))
+    assert len(fronts) == int(torch.max(ranks)) + 1
+    for i, front in enumerate(fronts):
+        assert torch.all(ranks[front] == i)
+    assert sorted(torch.cat(fronts).tolist()) == list(range(popsize))
+
+    # Taking the best n solutions must be consistent with the pareto ranks
+    best = batch.take_best(10)
+    assert len(best) == 10
+    testing.assert_allclose(best.evals, batch.evals[torch.cat(fronts)[:10]], atol=1e-8)
+
+
 def test_prob_with_dtype_object():
     prob = DummyProblems.OptimizeStrings()
 
@@ -729,3 +774,216 @@ def test_set_evals(problem_cls: Callable, eval_data_length: Optional[int]):
         # This must fail
         with pytest.raises(ValueError):
             batch.set_evals(f)
+
+
+def test_eval_cache():
+    evaluated_rows = []
+
+    def f(x: torch.Tensor) -> torch.Tensor:
+        evaluated_rows.append(x.shape[0])
+        return torch.sum(x**2, dim=-1)
+
+    problem = et.Problem("min", f, solution_length=3, initial_bounds=(-1.0, 1.0), vectorized=True, eval_cache_size=8)
+
+    batch = problem.generate_batch(4)
+    values = batch.access_values()
+    values[2] = values[0]
+    problem.evaluate(batch)
+
+    # The duplicate row must not be evaluated
+    assert evaluated_rows == [3]
+    assert problem.status["eval_cache_hits"] == 1
+    assert problem.status["eval_cache_misses"] == 3
+    testing.assert_allclose(batch.evals[:, 0], torch.sum(batch.values**2, dim=-1), atol=1e-5)
+
+    # Re-evaluating the same solutions, together with new ones, must only evaluate the new ones
+    new_batch = problem.generate_batch(2)
+    merged = et.SolutionBatch(merging_of=[batch, new_batch])
+    merged.forget_evals()
+    problem.evaluate(merged)
+
+    assert evaluated_rows == [3, 2]
+    assert problem.status["eval_cache_hits"] == 5
+    assert problem.status["eval_cache_misses"] == 5
+    assert problem.status["eval_cache_size"] == 5
+    testing.assert_allclose(merged.evals[:, 0], torch.sum(merged.values**2, dim=-1), atol=1e-5)
+
+    # The least recently used entries must be evicted when the cache is full
+    problem.evaluate(problem.generate_batch(6))
+    assert len(problem.eval_cache) == 8
+
+
+def test_pickling_batch_piece():
+    problem = DummyProblems.Batched()
+    batch = problem.generate_batch(100)
+    problem.evaluate(batch)
+
+    piece = batch[10:15]
+    pickled_piece = pickle.dumps(piece, protocol=pickle.HIGHEST_PROTOCOL)
+
+    # Only the rows of the piece must be serialized, not the entire storage of the original batch
+    assert len(pickled_piece) < len(pickle.dumps(batch, protocol=pickle.HIGHEST_PROTOCOL)) / 4
+
+    unpickled_piece = pickle.loads(pickled_piece)
+    assert len(unpickled_piece) == 5
+    testing.assert_allclose(unpickled_piece.values, batch.values[10:15], atol=1e-8)
+    testing.assert_allclose(unpickled_piece.evals, batch.evals[10:15], atol=1e-8)
+
+    # The unpickled piece must be mutable, and independent of the original batch
+    unpickled_piece.access_values()[:] = 0.0
+    assert not torch.all(batch.values[10:15] == 0.0)
+
+
+def test_batch_memo():
+    problem = DummyProblems.Batched()
+    batch = problem.generate_batch(10)
+    problem.evaluate(batch)
+
+    # The status hooks of the problem may already have queried the batch, so we only look at the differences
+    stats_before = dict(batch.memo_stats)
+    first = batch.argsort()
+    second = batch.argsort()
+    assert torch.all(first == second)
+    assert batch.memo_stats["hits"] - stats_before["hits"] == 1
+    assert batch.memo_stats["misses"] - stats_before["misses"] == 1
+
+    # Modifying a returned result must not affect the memo
+    second[:] = 0
+    assert torch.all(batch.argsort() == first)
+
+    utility = batch.utility(ranking_method="centered")
+    testing.assert_allclose(batch.utility(ranking_method="centered"), utility, atol=1e-8)
+    hits = batch.memo_stats["hits"]
+
+    # Writing through `access_evals()` must invalidate the memo
+    batch.access_evals()[:, 0] = -batch.access_evals()[:, 0]
+    assert torch.all(batch.argsort() == torch.flip(first, dims=(0,)))
+    assert batch.memo_stats["hits"] == hits
+
+    # So must `set_evals(...)` and `forget_evals()`
+    batch.set_evals(torch.arange(10, dtype=problem.eval_dtype))
+    assert torch.all(batch.argbest() == 0)
+    batch.forget_evals()
+    with pytest.raises(ValueError):
+        batch.utility()
+
+
+_EVALUATING_THREADS = set()
+
+
+def _sum_of_squares_recording_thread(x: torch.Tensor) -> torch.Tensor:
+    _EVALUATING_THREADS.add(threading.get_ident())
+    return torch.sum(x**2)
+
+
+def test_threaded_evaluation():
+    f = _sum_of_squares_recording_thread
+    problem = et.Problem("min", f, solution_length=3, initial_bounds=(-1.0, 1.0), num_threads=4, intra_op_threads=1)
+    assert problem.num_threads == 4
+
+    _EVALUATING_THREADS.clear()
+    num_threads_before = torch.get_num_threads()
+    batch = problem.generate_batch(20)
+    problem.evaluate(batch)
+
+    testing.assert_allclose(batch.evals[:, 0], torch.sum(batch.values**2, dim=-1), atol=1e-5)
+    assert len(_EVALUATING_THREADS) > 0
+    assert threading.get_ident() not in _EVALUATING_THREADS
+
+    # The intra-op thread count of the process is restored after the threaded evaluation
+    assert torch.get_num_threads() == num_threads_before
+
+    # The thread pool must not prevent the problem from being pickled
+    unpickled_problem = pickle.loads(pickle.dumps(problem))
+    assert unpickled_problem.num_threads == 4
+
+    with pytest.raises(ValueError):
+        et.Problem("min", f, solution_length=3, initial_bounds=(-1.0, 1.0), intra_op_threads=2)
+
+
+def test_async_objective():
+    state = {"running": 0, "max_running": 0}
+
+    async def f(x: torch.Tensor) -> torch.Tensor:
+        state["running"] += 1
+        state["max_running"] = max(state["max_running"], state["running"])
+        await asyncio.sleep(0.01)
+        state["running"] -= 1
+        return torch.sum(x**2)
+
+    problem = et.Problem("min", f, solution_length=3, initial_bounds=(-1.0, 1.0), max_concurrency=4)
+    batch = problem.generate_batch(20)
+    problem.evaluate(batch)
+
+    testing.assert_allclose(batch.evals[:, 0], torch.sum(batch.values**2, dim=-1), atol=1e-5)
+    assert 1 < state["max_running"] <= 4
+
+    # The event loop is stopped when the problem is torn down, and a new one is created if needed
+    loop = problem._event_loop
+    num_threads = threading.active_count()
+    problem.kill_actors()
+    assert loop.is_closed()
+    assert threading.active_count() == num_threads - 1
+    problem.evaluate(batch)
+    assert problem._event_loop is not loop
+    problem.kill_actors()
+
+
+def test_async_objective_timeout():
+    async def f(x: torch.Tensor) -> torch.Tensor:
+        await asyncio.sleep(10.0)
+        return torch.sum(x**2)
+
+    problem = et.Problem("min", f, solution_length=3, initial_bounds=(-1.0, 1.0), eval_timeout=0.05)
+    with pytest.raises(asyncio.TimeoutError):
+        problem.evaluate(problem.generate_batch(2))
+
+
+class _SumOfSquaresServer:
+    # A local stand-in for a simulation service, which receives a line of numbers and replies with the sum of their
+    # squares
+
+    def __init__(self):
+        self.loop = asyncio.new_event_loop()
+        threading.Thread(target=self.loop.run_forever, daemon=True).start()
+        starting = asyncio.run_coroutine_threadsafe(asyncio.start_server(self._handle, "127.0.0.1", 0), self.loop)
+        self.server = starting.result()
+        self.port = self.server.sockets[0].getsockname()[1]
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        while True:
+            line = await reader.readline()
+            if not line:
+                break
+            numbers = [float(x) for x in line.decode().split()]
+            writer.write(f"{sum(x**2 for x in numbers)}\n".encode())
+            await writer.drain()
+        writer.close()
+
+    def close(self):
+        self.loop.call_soon_threadsafe(self.server.close)
+
+
+class _RemoteSumOfSquares(et.Problem):
+    def __init__(self, port: int):
+        super().__init__("min", solution_length=3, initial_bounds=(-1.0, 1.0), max_concurrency=3)
+        self.port = port
+
+    async def _evaluate_async(self, solution: et.Solution):
+        reader, writer = await asyncio.open_connection("127.0.0.1", self.port)
+        writer.write((" ".join(str(float(x)) for x in solution.values) + "\n").encode())
+        await writer.drain()
+        result = float((await reader.readline()).decode())
+        writer.close()
+        solution.set_evals(result)
+
+
+def test_async_evaluation_against_server():
+    server = _SumOfSquaresServer()
+    try:
+        problem = _RemoteSumOfSquares(server.port)
+        batch = problem.generate_batch(10)
+        problem.evaluate(batch)
+        testing.assert_allclose(batch.evals[:, 0], torch.sum(batch.values**2, dim=-1), atol=1e-4)
+    finally:
+        server.close()
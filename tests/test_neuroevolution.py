@@ -0,0 +1,506 @@
+# Copyright 2022 NNAISENSE SA
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import threading
+from typing import Optional
+
+import gym
+import numpy as np
+import pytest
+import torch
+from torch import nn
+from torch.utils.data import TensorDataset
+
+from evotorch import testing
+from evotorch.neuroevolution import GymNE, NEProblem, SupervisedNE
+from evotorch.neuroevolution.net import BatchedNetwork, RunningStat, count_parameters, fill_parameters
+from evotorch.neuroevolution.net.layers import RecurrentNet, reset_module_state
+from evotorch.worker import WorkerServer
+
+
+def _make_net() -> nn.Module:
+    return nn.Sequential(nn.Linear(3, 4), nn.Tanh(), nn.Linear(4, 2))
+
+
+_INPUT = torch.linspace(-1.0, 1.0, 15).reshape(5, 3)
+
+
+def _eval_single(net: nn.Module) -> torch.Tensor:
+    return torch.sum(net(_INPUT))
+
+
+def _eval_batched(networks: BatchedNetwork) -> torch.Tensor:
+    return torch.sum(networks(_INPUT), dim=(-2, -1))
+
+
+@pytest.mark.parametrize("chunk_size", [None, 3])
+def test_vectorized_neproblem(chunk_size: Optional[int]):
+    plain_problem = NEProblem("max", _make_net, _eval_single, num_actors=0, initial_bounds=(-1.0, 1.0))
+    vectorized_problem = NEProblem(
+        "max",
+        _make_net,
+        _eval_batched,
+        num_actors=0,
+        initial_bounds=(-1.0, 1.0),
+        vectorized=True,
+        vectorized_chunk_size=chunk_size,
+    )
+
+    batch = plain_problem.generate_batch(10)
+    vectorized_batch = vectorized_problem.generate_batch(10)
+    vectorized_batch.set_values(batch.values.clone())
+
+    plain_problem.evaluate(batch)
+    vectorized_problem.evaluate(vectorized_batch)
+
+    testing.assert_allclose(vectorized_batch.evals, batch.evals, atol=1e-5)
+
+
+def test_vectorized_supervisedne():
+    x = torch.randn(20, 3)
+    y = torch.randn(20, 2)
+    dataset = TensorDataset(x, y)
+
+    def make_problem(vectorized: bool) -> SupervisedNE:
+        return SupervisedNE(
+            dataset,
+            _make_net,
+            nn.functional.mse_loss,
+            minibatch_size=20,
+            num_actors=0,
+            initial_bounds=(-1.0, 1.0),
+            vectorized=vectorized,
+        )
+
+    plain_problem = make_problem(False)
+    vectorized_problem = make_problem(True)
+
+    batch = plain_problem.generate_batch(6)
+    vectorized_batch = vectorized_problem.generate_batch(6)
+    vectorized_batch.set_values(batch.values.clone())
+
+    plain_problem.evaluate(batch)
+    vectorized_problem.evaluate(vectorized_batch)
+
+    testing.assert_allclose(vectorized_batch.evals, batch.evals, atol=1e-5)
+
+
+def test_vectorized_supervisedne_respects_custom_minibatch_evaluation():
+    x = torch.randn(20, 3)
+    y = torch.randn(20, 2)
+    dataset = TensorDataset(x, y)
+
+    class CustomSupervisedNE(SupervisedNE):
+        def _evaluate_using_minibatch(self, network: nn.Module, batch) -> torch.Tensor:
+            x, y = batch
+            return torch.mean(torch.abs(network(x) - y))
+
+    def make_problem(vectorized: bool) -> SupervisedNE:
+        return CustomSupervisedNE(
+            dataset,
+            _make_net,
+            nn.functional.mse_loss,
+            minibatch_size=20,
+            num_actors=0,
+            initial_bounds=(-1.0, 1.0),
+            vectorized=vectorized,
+        )
+
+    plain_problem = make_problem(False)
+    vectorized_problem = make_problem(True)
+
+    batch = plain_problem.generate_batch(6)
+    vectorized_batch = vectorized_problem.generate_batch(6)
+    vectorized_batch.set_values(batch.values.clone())
+
+    plain_problem.evaluate(batch)
+    vectorized_problem.evaluate(vectorized_batch)
+
+    testing.assert_allclose(vectorized_batch.evals, batch.evals, atol=1e-5)
+
+
+def test_neproblem_eval_cache():
+    evaluated = []
+
+    def f(net: nn.Module) -> torch.Tensor:
+        evaluated.append(1)
+        return _eval_single(net)
+
+    problem = NEProblem("max", _make_net, f, num_actors=0, initial_bounds=(-1.0, 1.0), eval_cache_size=8)
+    batch = problem.generate_batch(4)
+    problem.evaluate(batch)
+    first_evals = batch.evals.clone()
+
+    batch.forget_evals()
+    problem.evaluate(batch)
+
+    assert len(evaluated) == 4
+    assert problem.status["eval_cache_hits"] == 4
+    testing.assert_allclose(batch.evals, first_evals, atol=1e-5)
+
+
+@pytest.mark.parametrize("vectorized", [False, True])
+def test_threaded_neproblem(vectorized: bool):
+    def make_problem(num_threads: Optional[int]) -> NEProblem:
+        return NEProblem(
+            "max",
+            _make_net,
+            _eval_batched if vectorized else _eval_single,
+            num_actors=0,
+            initial_bounds=(-1.0, 1.0),
+            vectorized=vectorized,
+            num_threads=num_threads,
+        )
+
+    plain_problem = make_problem(None)
+    threaded_problem = make_problem(4)
+
+    batch = plain_problem.generate_batch(20)
+    threaded_batch = threaded_problem.generate_batch(20)
+    threaded_batch.set_values(batch.values.clone())
+
+    plain_problem.evaluate(batch)
+    threaded_problem.evaluate(threaded_batch)
+
+    # Each thread parameterizes its own copy of the network, so, the threads must not overwrite each other
+    testing.assert_allclose(threaded_batch.evals, batch.evals, atol=1e-5)
+
+
+def test_threaded_supervisedne():
+    x = torch.randn(20, 3)
+    y = torch.randn(20, 2)
+    dataset = TensorDataset(x, y)
+
+    problem = SupervisedNE(
+        dataset,
+        _make_net,
+        nn.functional.mse_loss,
+        minibatch_size=5,
+        num_actors=0,
+        initial_bounds=(-1.0, 1.0),
+        num_threads=3,
+    )
+    batch = problem.generate_batch(9)
+    problem.evaluate(batch)
+
+    # All the threads must have used the same minibatch
+    [(x_used, y_used)] = problem._current_minibatches
+    with torch.no_grad():
+        expected = torch.stack(
+            [nn.functional.mse_loss(problem.make_net(solution.values)(x_used), y_used) for solution in batch]
+        )
+    testing.assert_allclose(batch.evals[:, 0], expected, atol=1e-5)
+
+    with pytest.raises(ValueError):
+        SupervisedNE(
+            dataset,
+            _make_net,
+            nn.functional.mse_loss,
+            minibatch_size=5,
+            num_actors=0,
+            common_minibatch=False,
+            num_threads=3,
+        )
+
+
+def test_vectorized_chunk_size_requires_vectorized():
+    with pytest.raises(ValueError):
+        NEProblem("max", _make_net, _eval_single, num_actors=0, vectorized_chunk_size=4)
+
+
+def test_neproblem_forwards_tasks_per_actor():
+    problem = NEProblem("max", _make_net, _eval_single, num_actors=2, subbatch_size=2, tasks_per_actor=3)
+    try:
+        batch = problem.generate_batch(10)
+        problem.evaluate(batch)
+        assert problem._tasks_per_actor == 3
+        assert not torch.any(torch.isnan(batch.evals))
+    finally:
+        problem.kill_actors()
+
+    with pytest.raises(ValueError):
+        NEProblem("max", _make_net, _eval_single, num_actors=2, tasks_per_actor=0)
+
+
+def test_batched_network_with_recurrent_state():
+    net = nn.Sequential(RecurrentNet(input_size=3, hidden_size=4), nn.Linear(4, 2))
+    num_networks = 3
+    parameters = torch.randn(num_networks, count_parameters(net))
+    inputs = torch.randn(5, num_networks, 3)
+
+    networks = BatchedNetwork(net, parameters)
+    assert networks.is_stateful
+    batched_outputs = [networks(x, batched_input=True) for x in inputs]
+
+    with torch.no_grad():
+        for i in range(num_networks):
+            fill_parameters(net, parameters[i])
+            reset_module_state(net)
+            for t, x in enumerate(inputs):
+                testing.assert_allclose(batched_outputs[t][i], net(x[i]), atol=1e-5)
+
+
+def test_running_stat_update_with_sums():
+    data = np.random.randn(10, 3)
+
+    expected = RunningStat()
+    for x in data:
+        expected.update(x)
+
+    actual = RunningStat()
+    actual.update_with_sums(0, np.zeros(3), np.zeros(3))
+    assert actual.count == 0
+    actual.update_with_sums(4, data[:4].sum(axis=0), np.square(data[:4]).sum(axis=0))
+    actual.update_with_sums(6, data[4:].sum(axis=0), np.square(data[4:]).sum(axis=0))
+
+    assert actual.count == expected.count
+    assert np.allclose(actual.mean, expected.mean, atol=1e-5)
+    assert np.allclose(actual.stdev, expected.stdev, atol=1e-5)
+
+
+class _CountingEnv(gym.Env):
+    # A deterministic environment, whose observations depend only on the timestep
+    episode_length = 5
+    observation_space = gym.spaces.Box(-np.inf, np.inf, shape=(3,), dtype=np.float32)
+    action_space = gym.spaces.Box(-1.0, 1.0, shape=(1,), dtype=np.float32)
+
+    def reset(self, *, seed: Optional[int] = None, options: Optional[dict] = None):
+        super().reset(seed=seed)
+        self._t = 0
+        return self._observation(), {}
+
+    def step(self, action):
+        self._t += 1
+        return self._observation(), 1.0, self._t >= self.episode_length, False, {}
+
+    def _observation(self) -> np.ndarray:
+        return np.array([self._t, self._t**2, 1.0], dtype=np.float32)
+
+
+if "EvoTorchCountingEnv-v0" not in gym.envs.registry:
+    gym.register("EvoTorchCountingEnv-v0", entry_point=_CountingEnv)
+
+# The module prefix lets the remote actors (which might not have imported this module) register the environment
+_COUNTING_ENV = f"{__name__}:EvoTorchCountingEnv-v0"
+
+
+class _ActionRewardEnv(_CountingEnv):
+    # A deterministic environment whose rewards depend on the actions, and therefore on the policy
+    def step(self, action):
+        observation, _, terminated, truncated, info = super().step(action)
+        return observation, float(np.asarray(action).reshape(-1)[0]) * self._t, terminated, truncated, info
+
+
+if "EvoTorchActionRewardEnv-v0" not in gym.envs.registry:
+    gym.register("EvoTorchActionRewardEnv-v0", entry_point=_ActionRewardEnv)
+
+_ACTION_REWARD_ENV = f"{__name__}:EvoTorchActionRewardEnv-v0"
+
+
+@pytest.mark.parametrize("recurrent", [False, True])
+def test_gymne_with_num_envs(recurrent: bool):
+    network = (
+        "RecurrentNet(input_size=obs_length, hidden_size=4) >> Linear(4, act_length)"
+        if recurrent
+        else "Linear(obs_length, act_length)"
+    )
+    popsize = 5
+    num_episodes = 2
+
+    def make_problem(num_envs: Optional[int]) -> GymNE:
+        return GymNE(
+            _ACTION_REWARD_ENV,
+            network,
+            num_actors=0,
+            num_episodes=num_episodes,
+            initial_bounds=(-0.1, 0.1),
+            num_envs=num_envs,
+        )
+
+    plain_problem = make_problem(None)
+    vectorized_problem = make_problem(3)
+
+    batch = plain_problem.generate_batch(popsize)
+    vectorized_batch = vectorized_problem.generate_batch(popsize)
+    vectorized_batch.set_values(batch.values.clone())
+
+    plain_problem.evaluate(batch)
+    vectorized_problem.evaluate(vectorized_batch)
+
+    # Each solution collects its own rewards, so, the results would differ if the actions (or the hidden states)
+    # of the solutions were mixed up across the environments
+    assert torch.unique(batch.evals).numel() == popsize
+    testing.assert_allclose(vectorized_batch.evals, batch.evals, atol=1e-5)
+    assert vectorized_problem.episode_count == plain_problem.episode_count == popsize * num_episodes
+    assert vectorized_problem.interaction_count == popsize * num_episodes * _CountingEnv.episode_length
+
+
+@pytest.mark.parametrize("num_envs", [None, 2])
+def test_threaded_gymne(num_envs: Optional[int]):
+    popsize = 8
+
+    def make_problem(num_threads: Optional[int]) -> GymNE:
+        return GymNE(
+            _ACTION_REWARD_ENV,
+            "Linear(obs_length, act_length)",
+            num_actors=0,
+            num_episodes=2,
+            initial_bounds=(-0.1, 0.1),
+            observation_normalization=True,
+            num_envs=num_envs,
+            num_threads=num_threads,
+        )
+
+    plain_problem = make_problem(None)
+    threaded_problem = make_problem(4)
+
+    batch = plain_problem.generate_batch(popsize)
+    threaded_batch = threaded_problem.generate_batch(popsize)
+    threaded_batch.set_values(batch.values.clone())
+
+    # The observation stats are shared by the threads, so, the normalized observations (and therefore the
+    # rewards) can differ from the ones of a sequential evaluation. The totals, however, must be the same.
+    plain_problem.evaluate(batch)
+    threaded_problem.evaluate(threaded_batch)
+
+    assert not torch.any(torch.isnan(threaded_batch.evals))
+    assert threaded_problem.episode_count == plain_problem.episode_count == popsize * 2
+    assert threaded_problem.interaction_count == plain_problem.interaction_count
+    assert threaded_problem.get_observation_stats().count == plain_problem.get_observation_stats().count
+    testing.assert_allclose(
+        threaded_problem.get_observation_stats().mean, plain_problem.get_observation_stats().mean, atol=1e-4
+    )
+
+
+def _expected_counting_env_stats(num_episodes: int) -> RunningStat:
+    expected = RunningStat()
+    for _ in range(num_episodes):
+        for t in range(_CountingEnv.episode_length + 1):
+            expected.update(np.array([t, t**2, 1.0]))
+    return expected
+
+
+@pytest.mark.parametrize("parallel_backend", ["ray", "multiprocessing"])
+@pytest.mark.parametrize("compact_obs_sync", [False, True])
+def test_gymne_obs_sync_with_actors(compact_obs_sync: bool, parallel_backend: str):
+    popsize = 6
+    problem = GymNE(
+        _COUNTING_ENV,
+        "Linear(obs_length, act_length)",
+        num_actors=2,
+        observation_normalization=True,
+        compact_obs_sync=compact_obs_sync,
+        parallel_backend=parallel_backend,
+    )
+    try:
+        for generation in range(1, 3):
+            problem.evaluate(problem.generate_batch(popsize))
+
+            # The observation stats collected by the actors are merged into the stats of the main problem
+            expected = _expected_counting_env_stats(generation * popsize)
+            stats = problem.get_observation_stats()
+            assert stats.count == expected.count
+            assert np.allclose(stats.mean, expected.mean, atol=1e-4)
+            assert np.allclose(stats.stdev, expected.stdev, atol=1e-4)
+            assert problem.episode_count == generation * popsize
+            assert problem.interaction_count == generation * popsize * _CountingEnv.episode_length
+    finally:
+        problem.kill_actors()
+
+
+def test_gymne_throughput_aware():
+    problem = GymNE(
+        _COUNTING_ENV,
+        "Linear(obs_length, act_length)",
+        num_actors=2,
+        throughput_aware=True,
+    )
+    try:
+        for _ in range(2):
+            problem.evaluate(problem.generate_batch(6))
+
+        # GymNE counts its simulator interactions, so, the interaction throughputs of the actors are measured too
+        interaction_rates = problem.status["actor_interactions_per_sec"]
+        assert len(interaction_rates) == 2
+        assert all((rate is not None) and (rate > 0) for rate in interaction_rates)
+        assert problem.interaction_count == 12 * _CountingEnv.episode_length
+    finally:
+        problem.kill_actors()
+
+
+def test_gymne_with_socket_workers():
+    server = WorkerServer("127.0.0.1:0", authkey="test-key")
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    popsize = 6
+    problem = GymNE(
+        _COUNTING_ENV,
+        "Linear(obs_length, act_length)",
+        num_actors=2,
+        observation_normalization=True,
+        parallel_backend="socket",
+        worker_addresses=[server.address],
+        worker_authkey="test-key",
+    )
+    try:
+        problem.evaluate(problem.generate_batch(popsize))
+        expected = _expected_counting_env_stats(popsize)
+        assert problem.get_observation_stats().count == expected.count
+        assert problem.episode_count == popsize
+        assert problem.interaction_count == popsize * _CountingEnv.episode_length
+    finally:
+        problem.kill_actors()
+        server.close()
+
+
+@pytest.mark.parametrize("compact_obs_sync", [False, True])
+def test_gymne_resize_actors(compact_obs_sync: bool):
+    popsize = 6
+    problem = GymNE(
+        _COUNTING_ENV,
+        "Linear(obs_length, act_length)",
+        num_actors=3,
+        observation_normalization=True,
+        compact_obs_sync=compact_obs_sync,
+    )
+
+    def assert_totals(num_episodes: int):
+        expected = _expected_counting_env_stats(num_episodes)
+        stats = problem.get_observation_stats()
+        assert stats.count == expected.count
+        assert np.allclose(stats.mean, expected.mean, atol=1e-4)
+        assert np.allclose(stats.stdev, expected.stdev, atol=1e-4)
+        assert problem.episode_count == num_episodes
+        assert problem.interaction_count == num_episodes * _CountingEnv.episode_length
+
+    try:
+        problem.evaluate(problem.generate_batch(popsize))
+        assert_totals(popsize)
+
+        # The counters and the observation stats of the retired actors survive the shrinking
+        problem.resize_actors(1)
+        assert problem._retired_episode_count > 0
+        assert problem._retired_interaction_count == problem._retired_episode_count * _CountingEnv.episode_length
+        assert_totals(popsize)
+
+        # A new actor starts with the current observation stats of the main problem
+        problem.resize_actors(2)
+        new_actor_stats = problem.all_remote_problems().get_observation_stats()[1]
+        assert new_actor_stats.count == problem.get_observation_stats().count
+        assert np.allclose(new_actor_stats.mean, problem.get_observation_stats().mean)
+
+        problem.evaluate(problem.generate_batch(popsize))
+        assert_totals(2 * popsize)
+    finally:
+        problem.kill_actors()
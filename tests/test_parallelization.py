@@ -12,10 +12,21 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import gc
+import os
+import socket
+import threading
+import time
+
 import pytest
+import ray
 import torch
 
 import evotorch as et
+from evotorch.algorithms import SNES
+from evotorch.distributions import SymmetricSeparableGaussian
+from evotorch.tools import NoiseTable
+from evotorch.worker import _MESSAGE_HEADER, WorkerServer
 
 
 class MyProblem(et.Problem):
@@ -35,6 +46,12 @@ class MyProblem(et.Problem):
     def get_actor_index(self) -> int:
         return self.actor_index
 
+    def set_offset(self, offset: torch.Tensor):
+        self.offset = offset
+
+    def get_shifted_actor_index(self) -> float:
+        return float(self.offset.sum()) + self.actor_index
+
     def get_env(self):
         class DummyEnv:
             def __init__(self, actor_index: int):
@@ -56,3 +73,720 @@ def test_remote_access():
     assert all_actor_indices == expected_indices
     assert all_env_actor_indices == expected_indices
     assert len(problem.actors) == num_actors
+
+
+def test_broadcast_and_gather():
+    num_actors = 3
+    problem = MyProblem(num_actors=num_actors)
+    remote_problems = problem.all_remote_problems()
+    remote_problems.broadcast("set_offset", torch.ones(1000))
+    shifted = sorted(remote_problems.gather("get_shifted_actor_index"))
+    torch.testing.assert_close(torch.tensor(shifted), torch.tensor([1000.0, 1001.0, 1002.0]))
+
+
+def test_evaluate_from_noise_table():
+    problem = MyProblem(num_actors=2)
+    table = NoiseTable(1000, seed=1)
+    distribution = SymmetricSeparableGaussian({"mu": torch.ones(5), "sigma": torch.ones(5)})
+
+    offsets, signs = table.sample_indices(8, 5, symmetric=True)
+    batch = problem.generate_batch(8, empty=True)
+    batch.set_values(distribution.transform_noise(table.noise(offsets, signs, 5)))
+    problem.evaluate_from_noise_table(batch, distribution, table, offsets, signs)
+
+    torch.testing.assert_close(batch.evals[:, 0], torch.linalg.norm(batch.values, dim=-1))
+
+
+@pytest.mark.parametrize("distributed", [False, True])
+def test_search_with_noise_table(distributed: bool):
+    problem = MyProblem(num_actors=2)
+    searcher = SNES(problem, stdev_init=1.0, popsize=20, distributed=distributed, noise_table=100000)
+    initial_norm = float(torch.linalg.norm(searcher.status["center"]))
+
+    searcher.run(50)
+
+    assert float(torch.linalg.norm(searcher.status["center"])) < initial_norm
+
+
+def test_tree_reduction():
+    problem = MyProblem(num_actors=3)
+    distribution = SymmetricSeparableGaussian({"mu": torch.ones(5), "sigma": torch.ones(5)})
+
+    results = problem.sample_and_compute_gradients(distribution, 20, ensure_even_popsize=True, tree_reduction=True)
+    assert len(results) == 1
+    assert results[0]["num_solutions"] >= 20
+    assert set(results[0]["gradients"].keys()) == {"mu", "sigma"}
+
+    searcher = SNES(problem, stdev_init=1.0, popsize=20, distributed=True, tree_reduction=True)
+    initial_norm = float(torch.linalg.norm(searcher.status["center"]))
+    searcher.run(50)
+    assert float(torch.linalg.norm(searcher.status["center"])) < initial_norm
+
+    with pytest.raises(ValueError):
+        problem.sample_and_compute_gradients(
+            distribution, 20, noise_table=NoiseTable(1000, seed=1), tree_reduction=True
+        )
+    with pytest.raises(ValueError):
+        SNES(problem, stdev_init=1.0, popsize=20, distributed=True, tree_reduction=True, noise_table=1000)
+
+
+@pytest.mark.parametrize("tasks_per_actor", [1, 3])
+def test_pipelined_evaluation(tasks_per_actor: int):
+    problem = et.Problem(
+        "min",
+        lambda x: torch.linalg.norm(x),
+        solution_length=5,
+        initial_bounds=(-10.0, 10.0),
+        num_actors=2,
+        subbatch_size=3,
+        tasks_per_actor=tasks_per_actor,
+    )
+    batch = problem.generate_batch(20)
+    problem.evaluate(batch)
+    torch.testing.assert_close(batch.evals[:, 0], torch.linalg.norm(batch.values, dim=-1))
+
+    with pytest.raises(ValueError):
+        et.Problem("min", solution_length=5, initial_bounds=(-1, 1), num_actors=2, tasks_per_actor=0)
+
+
+def test_throughput_aware_splitting():
+    problem = et.Problem(
+        "min",
+        lambda x: torch.linalg.norm(x),
+        solution_length=5,
+        initial_bounds=(-10.0, 10.0),
+        num_actors=2,
+        throughput_aware=True,
+    )
+    for _ in range(2):
+        batch = problem.generate_batch(20)
+        problem.evaluate(batch)
+        torch.testing.assert_close(batch.evals[:, 0], torch.linalg.norm(batch.values, dim=-1))
+
+    rates = problem.status["actor_solutions_per_sec"]
+    assert len(rates) == 2
+    assert all(rate > 0 for rate in rates)
+
+    searcher = SNES(problem, stdev_init=1.0, popsize=20, distributed=True)
+    initial_norm = float(torch.linalg.norm(searcher.status["center"]))
+    searcher.run(50)
+    assert float(torch.linalg.norm(searcher.status["center"])) < initial_norm
+    assert len(searcher.status["actor_solutions_per_sec"]) == 2
+
+
+class MySlowSecondActorProblem(et.Problem):
+    # The actor with index 1 is five times slower than the actor with index 0.
+    # The index of the evaluating actor is stored as the evaluation data of each solution.
+    # (The best/worst solution stats are not stored, because they can not report a scalar evaluation result when
+    # there is evaluation data.)
+    def __init__(self):
+        super().__init__(
+            "min",
+            solution_length=5,
+            initial_bounds=(-10.0, 10.0),
+            num_actors=2,
+            eval_data_length=1,
+            store_solution_stats=False,
+            throughput_aware=True,
+            throughput_smoothing=1.0,
+        )
+
+    def _evaluate_batch(self, batch: et.SolutionBatch):
+        time.sleep(0.002 * len(batch) * (5 if self.actor_index == 1 else 1))
+        batch.set_evals(
+            torch.linalg.norm(batch.values, dim=-1),
+            torch.full((len(batch), 1), float(self.actor_index), dtype=batch.eval_dtype),
+        )
+
+
+def test_throughput_aware_splitting_favors_faster_actor():
+    problem = MySlowSecondActorProblem()
+
+    # The first evaluation measures the throughputs, the second one uses them
+    problem.evaluate(problem.generate_batch(40))
+    rates = problem.status["actor_solutions_per_sec"]
+    assert rates[1] < rates[0]
+
+    batch = problem.generate_batch(40)
+    problem.evaluate(batch)
+    torch.testing.assert_close(batch.evals[:, 0], torch.linalg.norm(batch.values, dim=-1))
+    num_evaluated_by_slow_actor = int(torch.sum(batch.evals[:, 1] == 1.0))
+    assert 0 < num_evaluated_by_slow_actor < 20
+
+
+def test_auto_subbatch_size():
+    problem = et.Problem(
+        "min",
+        lambda x: torch.linalg.norm(x),
+        solution_length=5,
+        initial_bounds=(-10.0, 10.0),
+        num_actors=2,
+        subbatch_size="auto",
+    )
+    for _ in range(3):
+        batch = problem.generate_batch(20)
+        problem.evaluate(batch)
+        torch.testing.assert_close(batch.evals[:, 0], torch.linalg.norm(batch.values, dim=-1))
+        assert 1 <= problem.status["subbatch_size"] <= 10
+
+    searcher = SNES(problem, stdev_init=1.0, popsize=20, distributed=True)
+    searcher.run(5)
+    assert searcher.status["subbatch_size_chosen"] >= 1
+
+    with pytest.raises(ValueError):
+        et.Problem("min", solution_length=5, initial_bounds=(-1, 1), num_actors=2, subbatch_size="fastest")
+
+
+class MyStragglingProblem(et.Problem):
+    def __init__(self, straggler: int = 0, **kwargs):
+        super().__init__(objective_sense="min", initial_bounds=(-10.0, 10.0), solution_length=5, num_actors=2, **kwargs)
+        self.straggler = straggler
+
+    def _evaluate_batch(self, batch: et.SolutionBatch):
+        if self.actor_index == self.straggler:
+            time.sleep(3.0)
+        batch.set_evals(torch.linalg.norm(batch.values, dim=-1))
+
+
+def _actors_run_in_driver() -> bool:
+    # In local mode (as configured in conftest.py), the ray actors run one after another within the driver process
+    return ray._private.worker.global_worker.mode == ray.LOCAL_MODE
+
+
+def _skip_if_actors_run_in_driver():
+    # The straggler mitigation (which needs actors working at the same time) cannot be observed in local mode
+    if _actors_run_in_driver():
+        pytest.skip("This test needs ray actors which run concurrently (i.e. ray not in local mode)")
+
+
+class _FakeObjectRef:
+    # The result of a task submitted to a `_FakeActor`
+    def __init__(self, value, done: bool):
+        self.value = value
+        self.done = done
+
+
+class _FakeActor:
+    # An actor whose tasks either finish immediately, or never finish (unless finished manually)
+    def __init__(self, hangs: bool = False):
+        self.hangs = hangs
+        self.submitted = []
+
+    def submit(self, value) -> _FakeObjectRef:
+        ref = _FakeObjectRef(value * 10, done=not self.hangs)
+        self.submitted.append(ref)
+        return ref
+
+
+class _FakeRay:
+    # Replaces the ray functions used by `PipelinedActorPool`, so that its deadline and speculative execution
+    # mechanisms can be tested without concurrently running actors
+    @staticmethod
+    def wait(refs: list, *, num_returns: int = 1, timeout=None) -> tuple:
+        ready = [ref for ref in refs if ref.done][:num_returns]
+        if len(ready) < num_returns:
+            if timeout is None:
+                raise AssertionError("The pool waited without a timeout for a task which never finishes")
+            time.sleep(timeout)
+        return ready, [ref for ref in refs if ref not in ready]
+
+    @staticmethod
+    def get(ref: _FakeObjectRef):
+        return ref.value
+
+
+def _submit_to_fake_actor(actor: _FakeActor, value) -> _FakeObjectRef:
+    return actor.submit(value)
+
+
+def test_actor_pool_deadline(monkeypatch):
+    monkeypatch.setattr(et.core, "ray", _FakeRay)
+    fast, hung = _FakeActor(), _FakeActor(hangs=True)
+    pool = et.core.PipelinedActorPool([fast, hung], tasks_per_actor=1)
+
+    deadline = time.perf_counter() + 0.2
+    results = dict(pool.map_unordered(_submit_to_fake_actor, range(4), deadline=deadline, min_results=1))
+
+    # The task of the hung actor is abandoned, the others are completed by the fast actor
+    assert results == {0: 0, 2: 20, 3: 30}
+    assert list(pool._abandoned.values()) == [1]
+
+    # The hung actor is not given a new task while its abandoned task is still running
+    results = dict(pool.map_unordered(_submit_to_fake_actor, range(2), deadline=time.perf_counter() + 0.2))
+    assert results == {0: 0, 1: 10}
+    assert len(hung.submitted) == 1
+
+    # Once it finishes, the abandoned task is forgotten, and the actor can be removed
+    hung.submitted[0].done = True
+    assert pool.remove_actors(1) == [hung]
+    assert len(pool._abandoned) == 0
+
+
+def test_actor_pool_speculative_execution(monkeypatch):
+    monkeypatch.setattr(et.core, "ray", _FakeRay)
+    fast, hung = _FakeActor(), _FakeActor(hangs=True)
+    pool = et.core.PipelinedActorPool([fast, hung], tasks_per_actor=1)
+
+    # The task given to the hung actor is copied to the idle fast actor, whose copy provides the result
+    results = dict(pool.map_unordered(_submit_to_fake_actor, range(2), speculative=True))
+    assert results == {0: 0, 1: 10}
+    assert [ref.value for ref in fast.submitted] == [0, 10]
+
+    # The leftover copy is remembered as abandoned, so that the hung actor is not considered free
+    assert list(pool._abandoned.values()) == [1]
+
+
+def test_speculative_execution():
+    _skip_if_actors_run_in_driver()
+    problem = MyStragglingProblem(num_subbatches=2, speculative_execution=True)
+    for _ in range(2):
+        batch = problem.generate_batch(10)
+        time_at_first = time.perf_counter()
+        problem.evaluate(batch)
+        torch.testing.assert_close(batch.evals[:, 0], torch.linalg.norm(batch.values, dim=-1))
+
+    # By the second evaluation, the actors are ready, and the straggler does not slow down the evaluation
+    assert time.perf_counter() - time_at_first < 3.0
+
+
+@pytest.mark.parametrize("deadline_penalty", [None, 1000.0])
+def test_eval_deadline(deadline_penalty):
+    with pytest.raises(ValueError):
+        et.Problem("min", solution_length=5, initial_bounds=(-1, 1), num_actors=2, deadline_penalty=1000.0)
+
+    _skip_if_actors_run_in_driver()
+    problem = MyStragglingProblem(eval_deadline=1.0, deadline_penalty=deadline_penalty)
+    batch = problem.generate_batch(10)
+    problem.evaluate(batch)
+    assert problem.status["eval_deadline_misses"] == 5
+
+    evals = batch.evals[:, 0]
+    if deadline_penalty is None:
+        assert int(torch.count_nonzero(torch.isnan(evals))) == 5
+    else:
+        assert int(torch.count_nonzero(evals == deadline_penalty)) == 5
+
+
+class MyPooledProblem(MyProblem):
+    def __init__(self, actor_pool: str):
+        et.Problem.__init__(
+            self,
+            objective_sense="min",
+            initial_bounds=(-10.0, 10.0),
+            solution_length=5,
+            actor_pool=actor_pool,
+        )
+
+    def get_pid(self) -> int:
+        return os.getpid()
+
+
+def test_warm_actor_pool():
+    pool = et.core.WarmActorPool("test_warm_actor_pool", 2)
+    try:
+        first = MyPooledProblem("test_warm_actor_pool")
+        first.warm_up()
+        assert first.num_actors == 2
+        first_pids = set(first.all_remote_problems().get_pid())
+
+        # The pool can be used only by one problem at a time
+        second = MyPooledProblem("test_warm_actor_pool")
+        with pytest.raises(RuntimeError):
+            second.warm_up()
+
+        first.kill_actors()
+
+        # After the first problem detaches, the second one reuses the same actor processes
+        batch = second.generate_batch(10)
+        second.evaluate(batch)
+        torch.testing.assert_close(batch.evals[:, 0], torch.linalg.norm(batch.values, dim=-1))
+        assert set(second.all_remote_problems().get_pid()) == first_pids
+        assert set(second.all_remote_problems().get_actor_index()) == {0, 1}
+        second.kill_actors()
+
+        # The pool does not keep a problem alive. If a problem is garbage collected without detaching,
+        # the pool becomes available again.
+        third = MyPooledProblem("test_warm_actor_pool")
+        third.warm_up()
+        assert pool.attached_problem is third
+        del third
+        gc.collect()
+        assert pool.attached_problem is None
+        fourth = MyPooledProblem("test_warm_actor_pool")
+        fourth.warm_up()
+        fourth.kill_actors()
+    finally:
+        pool.shutdown()
+
+    with pytest.raises(ValueError):
+        MyPooledProblem("test_warm_actor_pool")
+
+
+class MyThreadLimitedProblem(MyProblem):
+    def __init__(self, num_actors: int, pin_actors: bool, parallel_backend: str = "ray"):
+        et.Problem.__init__(
+            self,
+            objective_sense="min",
+            initial_bounds=(-10.0, 10.0),
+            solution_length=5,
+            num_actors=int(num_actors),
+            threads_per_actor=1,
+            pin_actors=pin_actors,
+            parallel_backend=parallel_backend,
+        )
+
+    def get_thread_budget(self) -> tuple:
+        affinity = len(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else None
+        return torch.get_num_threads(), os.environ.get("OMP_NUM_THREADS"), affinity
+
+
+def _get_thread_budget() -> tuple:
+    affinity = sorted(os.sched_getaffinity(0)) if hasattr(os, "sched_getaffinity") else None
+    return torch.get_num_threads(), os.environ.get("OMP_NUM_THREADS"), affinity
+
+
+@pytest.mark.parametrize("pin_actors", [False, True])
+def test_threads_per_actor(pin_actors: bool):
+    if pin_actors and (not hasattr(os, "sched_setaffinity")):
+        pytest.skip("This platform does not support `os.sched_setaffinity`")
+
+    # The worker processes of the multiprocessing backend apply the thread budget
+    problem = MyThreadLimitedProblem(num_actors=2, pin_actors=pin_actors, parallel_backend="multiprocessing")
+    try:
+        problem.evaluate(problem.generate_batch(4))
+        for num_threads, omp_num_threads, affinity in problem._worker_pool.call_all("get_thread_budget", [], {}):
+            assert num_threads == 1
+            assert omp_num_threads == "1"
+            if pin_actors:
+                assert affinity == 1
+    finally:
+        problem.kill_actors()
+
+    with pytest.raises(ValueError):
+        et.Problem("min", solution_length=5, initial_bounds=(-1, 1), num_actors=2, threads_per_actor=0)
+    with pytest.raises(ValueError):
+        et.Problem("min", solution_length=5, initial_bounds=(-1, 1), num_actors=2, pin_actors=True)
+
+
+@pytest.mark.parametrize("pin_actors", [False, True])
+def test_threads_per_actor_in_main_process(pin_actors: bool):
+    if pin_actors and (not hasattr(os, "sched_setaffinity")):
+        pytest.skip("This platform does not support `os.sched_setaffinity`")
+
+    # When the remote copies live in the main process (as in ray's local mode), the thread settings of the main
+    # process must not be touched
+    budget_before = _get_thread_budget()
+    problem = MyThreadLimitedProblem(num_actors=2, pin_actors=pin_actors)
+    remote_budgets = problem.all_remote_problems().get_thread_budget()
+    assert len(remote_budgets) == 2
+    if _actors_run_in_driver():
+        assert _get_thread_budget() == budget_before
+    else:
+        for num_threads, omp_num_threads, affinity in remote_budgets:
+            assert num_threads == 1
+            assert omp_num_threads == "1"
+            if pin_actors:
+                assert affinity == 1
+    problem.kill_actors()
+
+
+class MyResizedProblem(MyProblem):
+    def __init__(self, num_actors: int):
+        et.Problem.__init__(
+            self,
+            objective_sense="min",
+            initial_bounds=(-10.0, 10.0),
+            solution_length=5,
+            num_actors=int(num_actors),
+            seed=1,
+        )
+        self.shift = 0.0
+
+    def _make_sync_data_for_actors(self) -> dict:
+        return {"shift": self.shift}
+
+    def _use_sync_data_from_main(self, received: dict):
+        self.shift = received["shift"]
+
+    def get_shift(self) -> float:
+        return self.shift
+
+    def get_seed(self) -> int:
+        return self.generator.initial_seed()
+
+
+def test_resize_actors():
+    problem = MyResizedProblem(num_actors=2)
+    problem.shift = 5.0
+    problem.evaluate(problem.generate_batch(10))
+    assert len(problem.all_remote_problems().get_actor_index()) == 2
+
+    # The new actors receive the current synchronization data, and seeds which differ from the existing actors
+    problem.shift = 7.0
+    problem.resize_actors(4)
+    assert len(problem.actors) == 4
+    assert set(problem.all_remote_problems().get_actor_index()) == {0, 1, 2, 3}
+    assert problem.all_remote_problems().get_shift() == [5.0, 5.0, 7.0, 7.0]
+    assert len(set(problem.all_remote_problems().get_seed())) == 4
+    batch = problem.generate_batch(20)
+    problem.evaluate(batch)
+    torch.testing.assert_close(batch.evals[:, 0], torch.linalg.norm(batch.values, dim=-1))
+
+    problem.resize_actors(1)
+    assert set(problem.all_remote_problems().get_actor_index()) == {0}
+    batch = problem.generate_batch(20)
+    problem.evaluate(batch)
+    torch.testing.assert_close(batch.evals[:, 0], torch.linalg.norm(batch.values, dim=-1))
+
+
+class MyAutoThreadedProblem(MyProblem):
+    def __init__(self, num_actors: int):
+        et.Problem.__init__(
+            self,
+            objective_sense="min",
+            initial_bounds=(-10.0, 10.0),
+            solution_length=5,
+            num_actors=int(num_actors),
+            threads_per_actor="auto",
+        )
+
+    def get_actor_num_threads(self) -> int:
+        return self._actor_num_threads
+
+
+def test_resize_actors_recomputes_auto_thread_budget(monkeypatch):
+    monkeypatch.setattr(ray, "cluster_resources", lambda: {"CPU": 8.0})
+    problem = MyAutoThreadedProblem(num_actors=2)
+    try:
+        problem.evaluate(problem.generate_batch(10))
+        assert problem.all_remote_problems().get_actor_num_threads() == [4, 4]
+
+        # When growing, the existing actors and the new ones share the CPUs
+        problem.resize_actors(4)
+        assert problem.all_remote_problems().get_actor_num_threads() == [2, 2, 2, 2]
+
+        # When shrinking, the remaining actor can use the freed CPUs
+        problem.resize_actors(1)
+        assert problem.all_remote_problems().get_actor_num_threads() == [8]
+
+        batch = problem.generate_batch(10)
+        problem.evaluate(batch)
+        torch.testing.assert_close(batch.evals[:, 0], torch.linalg.norm(batch.values, dim=-1))
+    finally:
+        problem.kill_actors()
+
+
+def test_resize_actors_drains_abandoned_tasks():
+    _skip_if_actors_run_in_driver()
+    problem = MyStragglingProblem(straggler=1, eval_deadline=1.0)
+    time_at_first = time.perf_counter()
+    problem.evaluate(problem.generate_batch(10))
+    assert list(problem._actor_pool._abandoned.values()) == [1]
+
+    # The abandoned task of the straggler is waited for before the straggler is retired
+    problem.resize_actors(1)
+    assert time.perf_counter() - time_at_first >= 3.0
+    assert len(problem._actor_pool._abandoned) == 0
+
+    batch = problem.generate_batch(10)
+    problem.evaluate(batch)
+    torch.testing.assert_close(batch.evals[:, 0], torch.linalg.norm(batch.values, dim=-1))
+
+
+def test_resize_actors_rejected_during_async_search():
+    problem = MyProblem(num_actors=2)
+    searcher = SNES(problem, stdev_init=1.0, popsize=20, distributed=True, asynchronous=True)
+    searcher.step()
+
+    # The gradient tasks of the asynchronous search are still running on the actors
+    with pytest.raises(RuntimeError):
+        problem.resize_actors(3)
+    assert len(problem.actors) == 2
+
+    # Once the running tasks are collected, resizing is possible again
+    problem.drain_gradient_tasks(searcher._async_tasks)
+    searcher._async_tasks = None
+    problem.resize_actors(3)
+    searcher.step()
+    assert len(searcher._async_tasks) == 3
+
+
+class MyScaledProblem(MyProblem):
+    def __init__(self, num_actors: int, scaling_policy):
+        et.Problem.__init__(
+            self,
+            objective_sense="min",
+            initial_bounds=(-10.0, 10.0),
+            solution_length=5,
+            num_actors=int(num_actors),
+            scaling_policy=scaling_policy,
+        )
+
+
+def test_scaling_policy():
+    def grow_to_three(metrics: dict) -> int:
+        assert 0.0 <= metrics["utilization"] <= 1.0
+        assert metrics["queue_wait"] >= 0.0
+        return 3
+
+    problem = MyScaledProblem(num_actors=2, scaling_policy=grow_to_three)
+
+    # The first evaluation is done by the initial actors, and the policy is applied before the next one
+    problem.evaluate(problem.generate_batch(10))
+    assert len(problem.actors) == 2
+    assert problem.status["num_actors"] == 2
+    assert problem.status["actor_utilization"] is not None
+
+    batch = problem.generate_batch(10)
+    problem.evaluate(batch)
+    assert len(problem.actors) == 3
+    torch.testing.assert_close(batch.evals[:, 0], torch.linalg.norm(batch.values, dim=-1))
+
+    with pytest.raises(ValueError):
+        et.Problem(
+            "min",
+            solution_length=5,
+            initial_bounds=(-1, 1),
+            num_actors=2,
+            parallel_backend="multiprocessing",
+            scaling_policy=grow_to_three,
+        )
+
+
+class MyMultiprocessingProblem(MyProblem):
+    def __init__(self, num_actors: int):
+        et.Problem.__init__(
+            self,
+            objective_sense="min",
+            initial_bounds=(-10.0, 10.0),
+            solution_length=5,
+            num_actors=int(num_actors),
+            parallel_backend="multiprocessing",
+        )
+
+
+def test_multiprocessing_backend():
+    problem = MyMultiprocessingProblem(num_actors=2)
+    try:
+        batch = problem.generate_batch(10)
+        problem.evaluate(batch)
+        torch.testing.assert_close(batch.evals[:, 0], torch.linalg.norm(batch.values, dim=-1))
+
+        # A bigger batch should make the shared buffers grow
+        batch = problem.generate_batch(25)
+        problem.evaluate(batch)
+        torch.testing.assert_close(batch.evals[:, 0], torch.linalg.norm(batch.values, dim=-1))
+
+        searcher = SNES(problem, stdev_init=1.0, popsize=20, distributed=True)
+        initial_norm = float(torch.linalg.norm(searcher.status["center"]))
+        searcher.run(50)
+        assert float(torch.linalg.norm(searcher.status["center"])) < initial_norm
+    finally:
+        problem.kill_actors()
+
+
+def test_multiprocessing_backend_rejects_ray_features():
+    with pytest.raises(ValueError):
+        et.Problem("min", solution_length=5, initial_bounds=(-1, 1), num_actors=2, parallel_backend="threads")
+
+    problem = MyMultiprocessingProblem(num_actors=2)
+    with pytest.raises(ValueError):
+        SNES(problem, stdev_init=1.0, popsize=20, distributed=True, tree_reduction=True)
+
+
+class MySocketProblem(MyProblem):
+    def __init__(self, num_actors: int, worker_addresses: list):
+        et.Problem.__init__(
+            self,
+            objective_sense="min",
+            initial_bounds=(-10.0, 10.0),
+            solution_length=5,
+            num_actors=int(num_actors),
+            parallel_backend="socket",
+            worker_addresses=worker_addresses,
+            worker_authkey="test-key",
+        )
+
+
+def test_socket_backend():
+    server = WorkerServer("127.0.0.1:0", authkey="test-key")
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    problem = MySocketProblem(num_actors=2, worker_addresses=[server.address])
+    try:
+        batch = problem.generate_batch(10)
+        problem.evaluate(batch)
+        torch.testing.assert_close(batch.evals[:, 0], torch.linalg.norm(batch.values, dim=-1))
+
+        searcher = SNES(problem, stdev_init=1.0, popsize=20, distributed=True)
+        initial_norm = float(torch.linalg.norm(searcher.status["center"]))
+        searcher.run(50)
+        assert float(torch.linalg.norm(searcher.status["center"])) < initial_norm
+    finally:
+        problem.kill_actors()
+        server.close()
+
+
+class MySyncedSocketProblem(MySocketProblem):
+    def __init__(self, num_actors: int, worker_addresses: list):
+        super().__init__(num_actors, worker_addresses)
+        self.shift = 0.0
+
+    def _make_sync_data_for_actors(self) -> dict:
+        return {"shift": self.shift}
+
+    def _use_sync_data_from_main(self, received: dict):
+        self.shift = received["shift"]
+
+    def get_shift(self) -> float:
+        return self.shift
+
+
+def test_socket_backend_reconnect():
+    server = WorkerServer("127.0.0.1:0", authkey="test-key")
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    problem = MySyncedSocketProblem(num_actors=2, worker_addresses=[server.address])
+    try:
+        problem.evaluate(problem.generate_batch(4))
+        problem.shift = 5.0
+        problem.evaluate(problem.generate_batch(4))
+
+        # Break the connections. The pool reconnects, and the re-initialized remote copies receive the current
+        # synchronization data (instead of keeping the state they had at startup).
+        for connection in problem._worker_pool._connections:
+            connection.sock.shutdown(socket.SHUT_RDWR)
+        assert problem._worker_pool.call_all("get_shift", [], {}) == [5.0, 5.0]
+
+        batch = problem.generate_batch(10)
+        problem.evaluate(batch)
+        torch.testing.assert_close(batch.evals[:, 0], torch.linalg.norm(batch.values, dim=-1))
+    finally:
+        problem.kill_actors()
+        server.close()
+
+
+def test_socket_worker_closes_connection_on_unreadable_message():
+    server = WorkerServer("127.0.0.1:0", authkey="test-key")
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    problem = MySocketProblem(num_actors=1, worker_addresses=[server.address])
+    try:
+        problem.evaluate(problem.generate_batch(4))
+        [connection] = problem._worker_pool._connections
+
+        # Send a message which cannot be unpickled. The worker must close the connection instead of waiting forever.
+        data = b"this is not a pickle"
+        connection.sock.sendall(_MESSAGE_HEADER.pack(len(data), 0) + data)
+        connection.sock.settimeout(30.0)
+        assert connection.sock.recv(1) == b""
+    finally:
+        problem.kill_actors()
+        server.close()
+
+
+def test_socket_backend_requires_addresses():
+    with pytest.raises(ValueError):
+        et.Problem("min", solution_length=5, initial_bounds=(-1, 1), parallel_backend="socket")
+    with pytest.raises(ValueError):
+        et.Problem("min", solution_length=5, initial_bounds=(-1, 1), worker_addresses=["127.0.0.1:5555"])
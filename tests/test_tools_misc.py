@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import pickle
 from typing import Any
 
 import numpy as np
@@ -20,7 +21,7 @@ import torch
 from torch import FloatTensor
 
 from evotorch.testing import assert_allclose, assert_dtype_matches
-from evotorch.tools import misc
+from evotorch.tools import NoiseTable, SubbatchSizeTuner, misc
 from evotorch.tools.objectarray import ObjectArray
 
 
@@ -793,3 +794,59 @@ def test_numpy_copy(x):
 
         assert_allclose(x, FloatTensor([1, 2, 3]), atol=0.00001)
         assert_dtype_matches(copied, type_)
+
+
+def test_noise_table():
+    table = NoiseTable(1000, seed=1)
+    offsets, signs = table.sample_indices(6, 10, symmetric=True)
+    assert offsets.shape == (6,)
+    assert torch.all(offsets[0::2] == offsets[1::2])
+    assert torch.all(signs[0::2] == 1) and torch.all(signs[1::2] == -1)
+
+    noise = table.noise(offsets, signs, 10)
+    assert noise.shape == (6, 10)
+    assert_allclose(noise[0::2], -noise[1::2], atol=0.0)
+
+    unpickled = pickle.loads(pickle.dumps(table))
+    assert_allclose(unpickled.noise(offsets, signs, 10), noise, atol=0.0)
+
+    with pytest.raises(ValueError):
+        table.sample_indices(5, 10, symmetric=True)
+
+
+def test_split_workload():
+    assert misc.split_workload(10, 3) == [4, 3, 3]
+
+    weighted = misc.split_workload(12, 3, weights=[1.0, 2.0, 3.0])
+    assert weighted == [2, 4, 6]
+
+    # Even the slowest actor receives some work, so that its throughput can still be measured
+    weighted = misc.split_workload(10, 3, weights=[1000.0, 1.0, 1.0])
+    assert sum(weighted) == 10
+    assert min(weighted) >= 1
+
+    with pytest.raises(ValueError):
+        misc.split_workload(10, 3, weights=[1.0, 2.0])
+    with pytest.raises(ValueError):
+        misc.split_workload(10, 2, weights=[1.0, 0.0])
+
+
+def test_subbatch_size_tuner():
+    tuner = SubbatchSizeTuner(target_overhead=0.1)
+
+    # Without any measurement, each worker receives a single piece
+    assert tuner.suggest(100, 4) == 25
+
+    # Each solution costs 0.01 seconds, and each task has an overhead of 0.05 seconds
+    tuner.record(25, 100, 4, wall_time=0.30, compute_times=[0.25, 0.25, 0.25, 0.25])
+    assert tuner.size == 25
+    assert tuner.status["subbatch_task_overhead"] == pytest.approx(0.05)
+
+    # The neighboring sizes are tried, and the tuner moves to the best one
+    assert tuner.suggest(100, 4) == 12
+    tuner.record(12, 100, 4, wall_time=0.20)
+    assert tuner.size == 12
+    assert tuner.status["subbatch_size_chosen"] == 12
+
+    with pytest.raises(ValueError):
+        SubbatchSizeTuner(smoothing=0.0)